@@ -1,59 +1,337 @@
 """
-Curves API v1 endpoints — Ellipse and Cycloid computation.
+Curves API v1 endpoints — Ellipse, Cycloid and roulette computation.
 
 Same philosophy as projections: accepts parameters, returns pre-computed
 render instructions. The frontend just draws.
+
+The curve engines are the heaviest computations in the API, so they run
+on the process pool of the compute executor. Like projections, both
+endpoints answer in the binary wire format when the client sends
+``Accept: application/x-eg-render``.
+
+Each compute endpoint has a GET variant taking the request as query
+parameters, with a strong ETag and Cache-Control so repeats can be served
+by browsers and reverse proxies.
+
+Each curve also has an ``export.svg`` endpoint (GET with query parameters,
+or POST with the usual body) that streams the drawing as SVG.
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated, Callable, Iterator
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from app.api.v1.params import (
+    CONDITIONAL_WIRE_RESPONSES, SVG_RESPONSES, WIRE_RESPONSES, cache_headers,
+    compute_etag, compute_request, etag_matches, export_step, render_response,
+    step_selection, svg_response, wire_format,
+)
+from app.core.coalesce import request_coalescer
+from app.core.executor import ExecutorSaturated, Pool, compute_executor
+from app.engine.spans import mark, span
 from app.schemas.curve_schemas import (
-    EllipseRequest, CycloidRequest, CurveResponse,
+    EllipseRequest, CycloidRequest, CurveResponse, CurveDeltaResponse,
+    RouletteRequest, EllipseExportQuery, CycloidExportQuery, RouletteExportQuery,
+    EllipseComputeQuery, CycloidComputeQuery, RouletteComputeQuery,
+)
+from app.schemas.projection import StepEncoding
+from app.services.curve_service import (
+    curve_key, cycloid_json, cycloid_svg, ellipse_json, ellipse_svg,
+    roulette_json, roulette_svg,
 )
-from app.engine.curves.ellipse_engine import compute_ellipse
-from app.engine.curves.cycloid_engine import compute_cycloid
 
 router = APIRouter()
 
-
-@router.post(
-    "/ellipse/compute",
-    response_model=CurveResponse,
-    summary="Compute ellipse (focus-directrix conic) render instructions",
+_ENCODING_QUERY = Query(
+    default=StepEncoding.FULL,
+    description="'full' (cumulative steps) or 'delta' (per-step changes)",
 )
-async def compute_ellipse_endpoint(request: EllipseRequest) -> CurveResponse:
-    """Compute 11-step focus-directrix conic construction."""
+
+
+async def _compute(
+    name: str,
+    compute: Callable[..., bytes],
+    request: EllipseRequest | CycloidRequest | RouletteRequest,
+    encoding: StepEncoding,
+    steps: list[int] | None,
+    binary: bool,
+) -> Response:
+    """
+    Run a curve engine on the process pool and wrap its bytes.
+
+    Identical requests arriving while one is computed share its result.
+    Curves run on the process pool, so only the whole computation is
+    timed (``compute``), not its phases.
+    """
+    mark("validate")
     try:
-        return compute_ellipse(
-            focus_dist=request.focus_dist,
-            eccentricity_str=request.eccentricity,
-            canvas_width=request.canvas_width,
-            canvas_height=request.canvas_height,
+        with span("compute"):
+            body = await request_coalescer.run(
+                curve_key(name, request, encoding, steps, binary),
+                lambda: compute_executor.run(
+                    name, Pool.PROCESS, compute, request, encoding, steps, binary,
+                ),
+            )
+        return render_response(body, binary)
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
         )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(
-            status_code=500, detail=f"Ellipse computation failed: {str(e)}"
+            status_code=500, detail=f"{name.capitalize()} computation failed: {str(e)}"
         )
 
 
+async def _compute_get(
+    name: str,
+    compute: Callable[..., bytes],
+    request: EllipseRequest | CycloidRequest | RouletteRequest,
+    query: EllipseComputeQuery | CycloidComputeQuery | RouletteComputeQuery,
+    binary: bool,
+    if_none_match: str | None,
+) -> Response:
+    """
+    GET variant of _compute: answer a current ``If-None-Match`` with 304
+    before computing, and mark the response cacheable.
+    """
+    steps = step_selection(query.step, query.steps)
+    encoding = StepEncoding.FULL if binary else query.encoding
+    headers = cache_headers(compute_etag(curve_key(name, request, encoding, steps, binary)))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response = await _compute(name, compute, request, encoding, steps, binary)
+    response.headers.update(headers)
+    return response
+
+
+_GET_DESCRIPTION = (
+    "Same as the POST endpoint, with the request and `encoding`/`step`/"
+    "`steps` in the query string, so responses can be cached by browsers "
+    "and reverse proxies. The strong `ETag` is derived from the canonical "
+    "request hash, the app version and the engine version; `If-None-Match` "
+    "is answered with 304 before computing."
+)
+
+
+@router.post(
+    "/ellipse/compute",
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=WIRE_RESPONSES,
+    summary="Compute ellipse (focus-directrix conic) render instructions",
+)
+async def compute_ellipse_endpoint(
+    request: EllipseRequest,
+    encoding: StepEncoding = _ENCODING_QUERY,
+    steps: list[int] | None = Depends(step_selection),
+    binary: bool = Depends(wire_format),
+) -> Response:
+    """Compute 11-step focus-directrix conic construction."""
+    return await _compute("ellipse", ellipse_json, request, encoding, steps, binary)
+
+
+@router.get(
+    "/ellipse/compute",
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=CONDITIONAL_WIRE_RESPONSES,
+    summary="Compute ellipse render instructions (query parameters)",
+    description=_GET_DESCRIPTION,
+)
+async def compute_ellipse_get(
+    query: Annotated[EllipseComputeQuery, Query()],
+    binary: bool = Depends(wire_format),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Compute the conic construction, with the request in the query string."""
+    request = compute_request(query, EllipseRequest)
+    return await _compute_get("ellipse", ellipse_json, request, query, binary, if_none_match)
+
+
 @router.post(
     "/cycloid/compute",
-    response_model=CurveResponse,
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=WIRE_RESPONSES,
     summary="Compute cycloid curve render instructions",
 )
-async def compute_cycloid_endpoint(request: CycloidRequest) -> CurveResponse:
+async def compute_cycloid_endpoint(
+    request: CycloidRequest,
+    encoding: StepEncoding = _ENCODING_QUERY,
+    steps: list[int] | None = Depends(step_selection),
+    binary: bool = Depends(wire_format),
+) -> Response:
     """Compute 10-step cycloid rolling circle construction."""
+    return await _compute("cycloid", cycloid_json, request, encoding, steps, binary)
+
+
+@router.get(
+    "/cycloid/compute",
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=CONDITIONAL_WIRE_RESPONSES,
+    summary="Compute cycloid curve render instructions (query parameters)",
+    description=_GET_DESCRIPTION,
+)
+async def compute_cycloid_get(
+    query: Annotated[CycloidComputeQuery, Query()],
+    binary: bool = Depends(wire_format),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Compute the cycloid construction, with the request in the query string."""
+    request = compute_request(query, CycloidRequest)
+    return await _compute_get("cycloid", cycloid_json, request, query, binary, if_none_match)
+
+
+@router.post(
+    "/roulette/compute",
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=WIRE_RESPONSES,
+    summary="Compute cycloid, epicycloid, hypocycloid or involute render instructions",
+    description=(
+        "Generalized rolling-circle construction with a configurable number "
+        "of divisions (4-720). Emits the same 10-step structure as the "
+        "cycloid endpoint."
+    ),
+)
+async def compute_roulette_endpoint(
+    request: RouletteRequest,
+    encoding: StepEncoding = _ENCODING_QUERY,
+    steps: list[int] | None = Depends(step_selection),
+    binary: bool = Depends(wire_format),
+) -> Response:
+    """Compute an N-division roulette construction."""
+    return await _compute("roulette", roulette_json, request, encoding, steps, binary)
+
+
+@router.get(
+    "/roulette/compute",
+    response_model=CurveResponse | CurveDeltaResponse,
+    responses=CONDITIONAL_WIRE_RESPONSES,
+    summary="Compute roulette render instructions (query parameters)",
+    description=_GET_DESCRIPTION,
+)
+async def compute_roulette_get(
+    query: Annotated[RouletteComputeQuery, Query()],
+    binary: bool = Depends(wire_format),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Compute a roulette construction, with the request in the query string."""
+    request = compute_request(query, RouletteRequest)
+    return await _compute_get("roulette", roulette_json, request, query, binary, if_none_match)
+
+
+# ============================================================
+# SVG export
+# ============================================================
+
+async def _export_svg(
+    name: str,
+    render: Callable[..., Iterator[bytes]],
+    request: EllipseRequest | CycloidRequest | RouletteRequest,
+    step: int | None,
+) -> Response:
+    """
+    Compute on the executor's thread pool, then stream the SVG.
+
+    The writer is a generator over the computed payload, so unlike the
+    compute endpoints it cannot come back from a worker process.
+    """
     try:
-        return compute_cycloid(
-            diameter=request.diameter,
-            canvas_width=request.canvas_width,
-            canvas_height=request.canvas_height,
+        chunks = await compute_executor.run(name, Pool.THREAD, render, request, step)
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
         )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(
-            status_code=500, detail=f"Cycloid computation failed: {str(e)}"
+            status_code=500, detail=f"{name.capitalize()} export failed: {str(e)}"
         )
+    filename = name if step is None else f"{name}-step-{step}"
+    return svg_response(chunks, f"{filename}.svg")
+
+
+@router.get(
+    "/ellipse/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export the ellipse construction as SVG (query parameters)",
+)
+async def export_ellipse_svg_get(
+    query: Annotated[EllipseExportQuery, Query()],
+) -> Response:
+    """Export the conic drawing; one step, or every step as a layer."""
+    return await _export_svg("ellipse", ellipse_svg, query, query.step)
+
+
+@router.post(
+    "/ellipse/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export the ellipse construction as SVG",
+)
+async def export_ellipse_svg(
+    request: EllipseRequest,
+    step: int | None = Depends(export_step),
+) -> Response:
+    """Export the conic drawing; one step, or every step as a layer."""
+    return await _export_svg("ellipse", ellipse_svg, request, step)
+
+
+@router.get(
+    "/cycloid/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export the cycloid construction as SVG (query parameters)",
+)
+async def export_cycloid_svg_get(
+    query: Annotated[CycloidExportQuery, Query()],
+) -> Response:
+    """Export the cycloid drawing; one step, or every step as a layer."""
+    return await _export_svg("cycloid", cycloid_svg, query, query.step)
+
+
+@router.post(
+    "/cycloid/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export the cycloid construction as SVG",
+)
+async def export_cycloid_svg(
+    request: CycloidRequest,
+    step: int | None = Depends(export_step),
+) -> Response:
+    """Export the cycloid drawing; one step, or every step as a layer."""
+    return await _export_svg("cycloid", cycloid_svg, request, step)
+
+
+@router.get(
+    "/roulette/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export a roulette construction as SVG (query parameters)",
+)
+async def export_roulette_svg_get(
+    query: Annotated[RouletteExportQuery, Query()],
+) -> Response:
+    """Export a roulette drawing; one step, or every step as a layer."""
+    return await _export_svg("roulette", roulette_svg, query, query.step)
+
+
+@router.post(
+    "/roulette/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export a roulette construction as SVG",
+)
+async def export_roulette_svg(
+    request: RouletteRequest,
+    step: int | None = Depends(export_step),
+) -> Response:
+    """Export a roulette drawing; one step, or every step as a layer."""
+    return await _export_svg("roulette", roulette_svg, request, step)
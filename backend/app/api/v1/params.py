@@ -0,0 +1,165 @@
+"""
+Query parameters and headers shared by the compute endpoints.
+"""
+
+import hashlib
+from typing import Iterator, TypeVar
+
+from fastapi import Header, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.config import settings
+from app.core.raster import PNG_MEDIA_TYPE
+from app.core.svg import SVG_MEDIA_TYPE
+from app.core.wire import WIRE_MEDIA_TYPE, accepts_wire
+from app.engine import ENGINE_VERSION
+from app.schemas.projection import ComputeQueryOptions
+
+RequestModel = TypeVar("RequestModel", bound=BaseModel)
+
+# OpenAPI entry for endpoints that can answer in the binary wire format
+WIRE_RESPONSES = {
+    200: {
+        "content": {WIRE_MEDIA_TYPE: {}},
+        "description": (
+            "Render instructions as JSON, or in the binary wire format "
+            f"(see app/core/wire.py) with `Accept: {WIRE_MEDIA_TYPE}`"
+        ),
+    },
+}
+
+# OpenAPI entry for the GET compute endpoints
+CONDITIONAL_WIRE_RESPONSES = {
+    **WIRE_RESPONSES,
+    304: {"description": "The `If-None-Match` ETag is still current"},
+}
+
+# OpenAPI entry for the SVG export endpoints
+SVG_RESPONSES = {
+    200: {
+        "content": {SVG_MEDIA_TYPE: {}},
+        "description": "The drawing as an SVG document, streamed",
+    },
+}
+
+# OpenAPI entry for the PNG thumbnail endpoints
+PNG_RESPONSES = {
+    200: {
+        "content": {PNG_MEDIA_TYPE: {}},
+        "description": "The drawing as a PNG image, with a strong `ETag`",
+    },
+    304: {"description": "The `If-None-Match` ETag is still current"},
+}
+
+
+def step_selection(
+    step: int | None = Query(
+        default=None,
+        ge=1,
+        description="Render only this step (1-based)",
+    ),
+    steps: list[int] | None = Query(
+        default=None,
+        description="Render only these steps, e.g. ?steps=3&steps=4",
+    ),
+) -> list[int] | None:
+    """
+    Combine ``step`` and ``steps`` into one selection.
+
+    Returns None (render every step) when neither is given. Range checks
+    happen in the engine, which knows its step count.
+    """
+    if step is None and not steps:
+        return None
+    selected = list(steps or [])
+    if step is not None:
+        selected.append(step)
+    return selected
+
+
+def wire_format(
+    accept: str | None = Header(default=None),
+) -> bool:
+    """True when the client asked for the binary wire format."""
+    return accepts_wire(accept)
+
+
+def render_response(body: bytes, binary: bool) -> Response:
+    """Wrap an encoded body; the response varies on the Accept header."""
+    return Response(
+        content=body,
+        media_type=WIRE_MEDIA_TYPE if binary else "application/json",
+        headers={"Vary": "Accept"},
+    )
+
+
+def export_step(
+    step: int | None = Query(
+        default=None,
+        ge=1,
+        description="Export only this step (1-based); all steps as layers by default",
+    ),
+) -> int | None:
+    """The step an SVG export draws, or None for every step as a layer."""
+    return step
+
+
+def svg_response(chunks: Iterator[bytes], filename: str) -> StreamingResponse:
+    """Stream an SVG document as it is written."""
+    return StreamingResponse(
+        chunks,
+        media_type=SVG_MEDIA_TYPE,
+        headers={"Content-Disposition": f'inline; filename="{filename}"'},
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    True when an If-None-Match header covers ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match: a
+    ``W/`` prefix is ignored, and ``*`` matches anything.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# ============================================================
+# HTTP caching (GET compute endpoints)
+# ============================================================
+
+def compute_request(query: BaseModel, model: type[RequestModel]) -> RequestModel:
+    """The compute request inside a GET query model, without its options."""
+    return model.model_validate(
+        query.model_dump(exclude=set(ComputeQueryOptions.model_fields)),
+    )
+
+
+def compute_etag(key: str) -> str:
+    """
+    Strong ETag for a compute response.
+
+    ``key`` is the canonical hash of the request and its response options
+    (result_cache.canonical_key); the app and engine versions are mixed in
+    so a deploy that changes the output also changes every ETag.
+    """
+    versioned = f"{key}:{settings.app_version}:{ENGINE_VERSION}"
+    return '"' + hashlib.sha256(versioned.encode("ascii")).hexdigest()[:32] + '"'
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    """Caching headers of a GET compute response (and its 304)."""
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.http_cache_max_age}, "
+            f"s-maxage={settings.http_cache_shared_max_age}"
+        ),
+        "Vary": "Accept",
+    }
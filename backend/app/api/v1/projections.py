@@ -5,25 +5,71 @@ Provides the core computation endpoint that the frontend calls
 to get pre-computed render instructions for projection drawing.
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
 
-from app.schemas.projection import ProjectionRequest, ProjectionResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from app.api.v1.params import (
+    CONDITIONAL_WIRE_RESPONSES, PNG_RESPONSES, SVG_RESPONSES, WIRE_RESPONSES,
+    cache_headers, compute_etag, compute_request, etag_matches, export_step,
+    render_response, step_selection, svg_response, wire_format,
+)
+from app.core.coalesce import request_coalescer
+from app.core.executor import ExecutorSaturated, Pool, compute_executor
+from app.core.metrics import label_request
+from app.core.pdf import PDF_MEDIA_TYPE
+from app.core.raster import PNG_MEDIA_TYPE
+from app.engine.spans import mark, span
+from app.schemas.projection import (
+    PdfLayout,
+    ProjectionBatchRequest,
+    ProjectionBatchResponse,
+    ProjectionComputeQuery,
+    ProjectionDeltaResponse,
+    ProjectionExportQuery,
+    ProjectionOutline,
+    ProjectionRequest,
+    ProjectionResponse,
+    ProjectionThumbnailQuery,
+    StepEncoding,
+)
+from app.services.answer_key_service import AnswerKey, problem_title
+from app.services.batch_service import ProjectionBatch
 from app.services.projection_service import ProjectionService
+from app.services.thumbnail_service import (
+    render_thumbnail, thumbnail_cache, thumbnail_etag, thumbnail_key,
+)
 
 router = APIRouter()
 
 
 @router.post(
     "/compute",
-    response_model=ProjectionResponse,
+    response_model=ProjectionResponse | ProjectionDeltaResponse,
+    responses=WIRE_RESPONSES,
     summary="Compute projection render instructions",
     description=(
         "Accepts solid type, case type, and parameters. Returns pre-computed "
         "pixel coordinates and drawing primitives for each step. The frontend "
-        "renders these instructions directly on canvas — zero math on client."
+        "renders these instructions directly on canvas — zero math on client. "
+        "With `encoding=delta`, each step carries only the elements added "
+        "since the previous step on top of a shared base layer. With `step` "
+        "or `steps`, only those steps are rendered (`total_steps` still "
+        "reports the full count). With `Accept: application/x-eg-render`, "
+        "the response uses the compact binary wire format instead of JSON "
+        "(`encoding` is ignored; the format always shares elements)."
     ),
 )
-async def compute_projection(request: ProjectionRequest) -> ProjectionResponse:
+async def compute_projection(
+    request: ProjectionRequest,
+    encoding: StepEncoding = Query(
+        default=StepEncoding.FULL,
+        description="'full' (cumulative steps) or 'delta' (per-step changes)",
+    ),
+    steps: list[int] | None = Depends(step_selection),
+    binary: bool = Depends(wire_format),
+) -> Response:
     """
     Compute orthographic projection and return render instructions.
 
@@ -31,10 +77,89 @@ async def compute_projection(request: ProjectionRequest) -> ProjectionResponse:
     projector lines, and step sequences. The response contains everything
     the frontend needs to draw each step using Canvas 2D API.
     """
+    return await _compute(request, encoding, steps, binary)
+
+
+@router.get(
+    "/compute",
+    response_model=ProjectionResponse | ProjectionDeltaResponse,
+    responses=CONDITIONAL_WIRE_RESPONSES,
+    summary="Compute projection render instructions (query parameters)",
+    description=(
+        "Same as `POST /compute`, with the request and `encoding`/`step`/"
+        "`steps` in the query string, so responses can be cached by "
+        "browsers and reverse proxies. The strong `ETag` is derived from "
+        "the canonical request hash, the app version and the engine "
+        "version; `If-None-Match` is answered with 304 before computing."
+    ),
+)
+async def compute_projection_get(
+    query: Annotated[ProjectionComputeQuery, Query()],
+    binary: bool = Depends(wire_format),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Compute a projection, with the request in the query string."""
+    request = compute_request(query, ProjectionRequest)
+    steps = step_selection(query.step, query.steps)
+    encoding = StepEncoding.FULL if binary else query.encoding
+    headers = cache_headers(
+        compute_etag(ProjectionService.cache_key(request, encoding, steps, binary)),
+    )
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response = await _compute(request, encoding, steps, binary)
+    response.headers.update(headers)
+    return response
+
+
+async def _compute(
+    request: ProjectionRequest,
+    encoding: StepEncoding,
+    steps: list[int] | None,
+    binary: bool,
+) -> Response:
+    """
+    Serve a compute request from the result cache or the executor.
+
+    Identical requests arriving while one is computed share its result.
+    """
+    mark("validate")
+    label_request(
+        case_type=request.case_type.value, solid_type=request.solid_type.value,
+    )
+    service = ProjectionService()
+    if binary:
+        encoding = StepEncoding.FULL
+
+    async def compute() -> bytes:
+        if binary:
+            body = await compute_executor.run(
+                "projections", Pool.THREAD,
+                service.render_wire, request, steps,
+            )
+        else:
+            body = await compute_executor.run(
+                "projections", Pool.THREAD,
+                service.render_json, request, encoding, steps,
+            )
+        service.store(key, body)
+        return body
+
     try:
-        service = ProjectionService()
-        result = service.compute(request)
-        return result
+        with span("lookup"):
+            key, body = service.lookup(request, encoding, steps, binary)
+        if body is None:
+            with span("compute"):
+                body = await request_coalescer.run(
+                    key or service.cache_key(request, encoding, steps, binary), compute,
+                )
+        return render_response(body, binary)
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
@@ -42,3 +167,263 @@ async def compute_projection(request: ProjectionRequest) -> ProjectionResponse:
             status_code=500,
             detail=f"Projection computation failed: {str(e)}",
         )
+
+
+@router.post(
+    "/outline",
+    response_model=ProjectionOutline,
+    summary="List the steps of a projection without computing geometry",
+    description=(
+        "Returns `total_steps`, each step's title and description, and the "
+        "metadata for a request. No geometry is computed, so this is cheap "
+        "enough to call before fetching steps one at a time."
+    ),
+)
+async def projection_outline(request: ProjectionRequest) -> ProjectionOutline:
+    """Return the step outline for a projection request."""
+    try:
+        return ProjectionService().outline(request)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Projection outline failed: {str(e)}",
+        )
+
+
+async def _export_svg(request: ProjectionRequest, step: int | None) -> Response:
+    """Compute on the executor, then stream the SVG as it is written."""
+    try:
+        chunks = await compute_executor.run(
+            "projections", Pool.THREAD,
+            ProjectionService().render_svg, request, step,
+        )
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Projection export failed: {str(e)}",
+        )
+    name = f"{request.solid_type.value}-case-{request.case_type.value.lower()}"
+    if step is not None:
+        name += f"-step-{step}"
+    return svg_response(chunks, f"{name}.svg")
+
+
+_EXPORT_DESCRIPTION = (
+    "Renders the projection as a printable SVG document, streamed as it is "
+    "written. With `step`, the document shows that step; otherwise every "
+    "step is an (Inkscape-compatible) layer holding what that step adds."
+)
+
+
+@router.get(
+    "/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export a projection as SVG (query parameters)",
+    description=_EXPORT_DESCRIPTION,
+)
+async def export_projection_svg_get(
+    query: Annotated[ProjectionExportQuery, Query()],
+) -> Response:
+    """Export a projection drawing, with the request in the query string."""
+    return await _export_svg(query, query.step)
+
+
+@router.post(
+    "/export.svg",
+    response_class=Response,
+    responses=SVG_RESPONSES,
+    summary="Export a projection as SVG",
+    description=_EXPORT_DESCRIPTION,
+)
+async def export_projection_svg(
+    request: ProjectionRequest,
+    step: int | None = Depends(export_step),
+) -> Response:
+    """Export a projection drawing."""
+    return await _export_svg(request, step)
+
+
+@router.get(
+    "/thumbnail.png",
+    response_class=Response,
+    responses=PNG_RESPONSES,
+    summary="Render a projection as a PNG thumbnail",
+    description=(
+        "Rasterizes one step (the finished drawing by default) at the "
+        "requested size, without labels. Thumbnails are cached on disk by "
+        "a hash of the request, size and step; that hash is the `ETag`, "
+        "so a browser revalidating with `If-None-Match` gets a 304 "
+        "without anything being rendered."
+    ),
+)
+async def projection_thumbnail(
+    query: Annotated[ProjectionThumbnailQuery, Query()],
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Return a PNG preview of a projection."""
+    request = ProjectionRequest.model_validate(
+        query.model_dump(exclude={"width", "height", "step"}),
+    )
+    key = thumbnail_key(request, query.width, query.height, query.step)
+    headers = {"ETag": thumbnail_etag(key), "Cache-Control": "public, no-cache"}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    png = thumbnail_cache.get(key) if thumbnail_cache is not None else None
+    if png is None:
+        try:
+            png = await compute_executor.run(
+                "projections-thumbnail", Pool.THREAD,
+                render_thumbnail, request, query.width, query.height, query.step,
+            )
+        except ExecutorSaturated as e:
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Projection thumbnail failed: {str(e)}",
+            )
+        if thumbnail_cache is not None:
+            thumbnail_cache.put(key, png)
+    return Response(content=png, media_type=PNG_MEDIA_TYPE, headers=headers)
+
+
+@router.post(
+    "/compute-batch",
+    response_model=ProjectionBatchResponse,
+    summary="Compute render instructions for a batch of projections",
+    description=(
+        "Accepts up to 256 projection requests. Identical requests are "
+        "computed once and the unique ones run in parallel on the worker "
+        "pool. Results are returned in request order; with `stream=true` "
+        "they are streamed as NDJSON (one item per line) as each finishes. "
+        "A failing item is reported inline with its status code and does "
+        "not fail the batch."
+    ),
+)
+async def compute_projection_batch(
+    batch: ProjectionBatchRequest,
+    encoding: StepEncoding = Query(
+        default=StepEncoding.FULL,
+        description="'full' (cumulative steps) or 'delta' (per-step changes)",
+    ),
+    stream: bool = Query(
+        default=False,
+        description="Stream results as NDJSON in completion order",
+    ),
+) -> Response:
+    """Compute every projection in a problem set."""
+    job = ProjectionBatch(batch.requests, encoding)
+    if stream:
+        return StreamingResponse(
+            job.ndjson(),
+            media_type="application/x-ndjson",
+        )
+    body = await job.response_json()
+    return Response(content=body, media_type="application/json")
+
+
+# ============================================================
+# PDF export
+# ============================================================
+
+_LAYOUT_QUERY = Query(
+    default=PdfLayout.PAGES,
+    description="'pages' (one step per page) or 'tiled' (every step on one sheet)",
+)
+
+_PDF_RESPONSES = {
+    200: {
+        "content": {PDF_MEDIA_TYPE: {}},
+        "description": (
+            "The PDF document. Per-page render times are reported in the "
+            "`Server-Timing` header."
+        ),
+    },
+}
+
+
+async def _pdf_response(key: AnswerKey, filename: str) -> Response:
+    """Render an answer key and wrap it with its timings."""
+    try:
+        result = await key.render()
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"PDF export failed: {str(e)}",
+        )
+    return Response(
+        content=result.pdf,
+        media_type=PDF_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Server-Timing": result.server_timing(),
+            "X-Page-Count": str(result.page_count),
+        },
+    )
+
+
+@router.post(
+    "/export.pdf",
+    response_class=Response,
+    responses=_PDF_RESPONSES,
+    summary="Export every step of a projection as PDF",
+    description=(
+        "Lays out the steps of one projection, one per page or tiled on a "
+        "single sheet. Rendered on the process pool."
+    ),
+)
+async def export_projection_pdf(
+    request: ProjectionRequest,
+    layout: PdfLayout = _LAYOUT_QUERY,
+) -> Response:
+    """Export one projection as a PDF."""
+    key = AnswerKey([request], layout, problem_title(request))
+    name = f"{request.solid_type.value}-case-{request.case_type.value.lower()}"
+    return await _pdf_response(key, f"{name}.pdf")
+
+
+@router.post(
+    "/answer-key.pdf",
+    response_class=Response,
+    responses=_PDF_RESPONSES,
+    summary="Export a problem set as a PDF answer key",
+    description=(
+        "Accepts up to 256 projection requests and returns one PDF with "
+        "every problem in order. Problems are rendered in parallel on the "
+        "process pool. A problem that cannot be computed gets a page "
+        "saying why instead of failing the key."
+    ),
+)
+async def export_answer_key_pdf(
+    batch: ProjectionBatchRequest,
+    layout: PdfLayout = _LAYOUT_QUERY,
+    title: str = Query(
+        default="Answer Key", max_length=200, description="Document title",
+    ),
+) -> Response:
+    """Export a whole problem set as one PDF."""
+    return await _pdf_response(AnswerKey(batch.requests, layout, title), "answer-key.pdf")
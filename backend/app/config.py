@@ -28,5 +28,53 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5173",
     ]
 
+    # Result cache (serialized compute responses)
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 512
+    result_cache_ttl_seconds: float = 900.0
+    result_cache_float_precision: int = 3  # decimals kept when hashing requests
+
+    # Per-phase corner cache for Case A/C/D (app/engine/phase_cache.py)
+    phase_cache_enabled: bool = True
+    phase_cache_max_entries: int = 256
+
+    # HTTP caching of GET compute responses; their ETags change with
+    # app_version and the engine version, so max-age bounds staleness
+    http_cache_max_age: int = 300         # browsers, seconds
+    http_cache_shared_max_age: int = 3600 # reverse proxies (s-maxage), seconds
+
+    # Precomputed responses (app/services/warehouse_service.py builds the
+    # file); empty = none, every request is computed live
+    warehouse_path: str = ""
+
+    # Thumbnail cache (PNG files on disk, content-addressed)
+    thumbnail_cache_enabled: bool = True
+    thumbnail_cache_dir: str = ""         # empty = <system temp dir>/eg-lab-thumbnails
+
+    # Server-Timing header and per-span aggregates (app/core/server_timing.py);
+    # when off, no request is timed and spans cost one context lookup
+    server_timing_enabled: bool = True
+
+    # Prometheus text-format /metrics endpoint (app/core/metrics.py)
+    metrics_enabled: bool = True
+
+    # Concurrent identical compute requests share one computation
+    # (app/core/coalesce.py)
+    coalesce_enabled: bool = True
+
+    # Compute executor — keeps CPU-bound geometry off the event loop
+    executor_thread_workers: int = 4
+    executor_process_workers: int = 2     # 0 = run curve engines on threads
+    executor_max_concurrency: int = 8     # running computations per endpoint
+    executor_max_queue: int = 32          # waiting computations per endpoint
+    executor_retry_after_seconds: int = 2
+
+    # Render backend: columnar element store (app/engine/packed.py) for
+    # full-encoding JSON responses; False falls back to per-element dicts
+    packed_render_store: bool = True
+
+    # Batch endpoint (/projections/compute-batch)
+    batch_max_parallel: int = 4           # unique items computed at once per batch
+
 
 settings = Settings()
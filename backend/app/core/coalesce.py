@@ -0,0 +1,115 @@
+"""
+Single-flight request coalescing.
+
+At the start of a lab session many students press "Compute" with the
+same default parameters within the same second. The result cache only
+helps once the first of them has finished; until then every request
+would run the engine on its own. This module lets concurrent requests
+with the same canonical key await one in-flight computation and share
+its serialized bytes.
+
+Only the first request (the leader) takes an executor slot. Every
+caller waits on a shielded future, so one whose client disconnects does
+not cancel the computation the others are waiting for; once the last
+waiter is gone the computation is cancelled, since nobody will read it.
+A failure is raised to every waiter; nothing is remembered once the
+computation finishes (the result cache does that).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable
+
+from app.config import settings
+
+
+class _Flight:
+    """One in-flight computation and how many callers are awaiting it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future[bytes]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    In-flight computations keyed by canonical request hash.
+
+    All bookkeeping happens on the event loop thread, so no locks are
+    needed.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.leaders = 0
+        self.coalesced = 0
+        self._in_flight: dict[str, _Flight] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _flights(self) -> dict[str, _Flight]:
+        """Futures bind to a loop — start over if the running loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._in_flight = {}
+            self._loop = loop
+        return self._in_flight
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Await ``compute()``, or the identical computation already running.
+
+        Args:
+            key: Canonical hash of the request (and its response variant).
+            compute: Coroutine factory producing the serialized response.
+
+        Returns:
+            The response bytes, shared by every coalesced caller.
+        """
+        if not self.enabled:
+            return await compute()
+        in_flight = self._flights()
+        flight = in_flight.get(key)
+        if flight is None:
+            self.leaders += 1
+            flight = in_flight[key] = _Flight(asyncio.ensure_future(compute()))
+            flight.future.add_done_callback(
+                lambda done: self._finish(in_flight, key, flight),
+            )
+        else:
+            self.coalesced += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.future.done():
+                # Every caller went away: stop computing for nobody, and
+                # let the next request for this key start afresh
+                self._forget(in_flight, key, flight)
+                flight.future.cancel()
+
+    @staticmethod
+    def _forget(in_flight: dict[str, _Flight], key: str, flight: _Flight) -> None:
+        if in_flight.get(key) is flight:
+            del in_flight[key]
+
+    @classmethod
+    def _finish(cls, in_flight: dict[str, _Flight], key: str, flight: _Flight) -> None:
+        """Forget a finished computation."""
+        cls._forget(in_flight, key, flight)
+        if not flight.future.cancelled():
+            # Mark a failure retrieved even if every waiter went away
+            flight.future.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._in_flight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+request_coalescer = RequestCoalescer(enabled=settings.coalesce_enabled)
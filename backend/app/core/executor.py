@@ -0,0 +1,209 @@
+"""
+Compute executor — runs CPU-bound geometry off the asyncio event loop.
+
+The API endpoints are ``async def`` but the engines are pure CPU work, so
+running them inline stalls every other request (including /health). This
+module provides:
+
+  - A thread pool for the light projection cases
+  - A process pool for the heavy curve engines (ellipse: ~1800 lines)
+  - Per-endpoint concurrency limits with bounded waiting queues
+
+When an endpoint's queue is full, ``run()`` raises ExecutorSaturated and
+the API layer answers HTTP 503 with a Retry-After header instead of
+letting latency grow without bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, TypeVar
+
+from app.config import Settings, settings
+
+T = TypeVar("T")
+
+
+class Pool(str, Enum):
+    """Worker pool a computation runs on."""
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ExecutorSaturated(Exception):
+    """Raised when an endpoint has no free slot and its queue is full."""
+
+    def __init__(self, endpoint: str, retry_after: int) -> None:
+        super().__init__(f"Compute capacity for '{endpoint}' is saturated")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded concurrency + bounded queue for one endpoint.
+
+    Up to ``max_concurrency`` computations run at once; up to ``max_queue``
+    more wait for a slot. Anything beyond that is rejected immediately.
+    All bookkeeping happens on the event loop thread, so no locks are needed.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphores bind to a loop — recreate if the running loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            self.in_flight = 0
+            self.waiting = 0
+        return self._semaphore
+
+    async def acquire(self, retry_after: int) -> None:
+        """Take a slot, waiting in the queue if needed; raise if the queue is full."""
+        semaphore = self._get_semaphore()
+        if self.in_flight >= self.max_concurrency and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorSaturated(self.name, retry_after)
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Give a slot back."""
+        self.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+
+class ComputeExecutor:
+    """
+    Thread/process pools plus per-endpoint limiters.
+
+    Pools are created lazily on first use so importing the app (tests,
+    OpenAPI generation, worker processes) never spawns workers.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int = 4,
+        process_workers: int = 2,
+        max_concurrency: int = 8,
+        max_queue: int = 32,
+        retry_after_seconds: int = 2,
+    ) -> None:
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(0, process_workers)
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.retry_after_seconds = retry_after_seconds
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+
+    @classmethod
+    def from_settings(cls, cfg: Settings) -> "ComputeExecutor":
+        return cls(
+            thread_workers=cfg.executor_thread_workers,
+            process_workers=cfg.executor_process_workers,
+            max_concurrency=cfg.executor_max_concurrency,
+            max_queue=cfg.executor_max_queue,
+            retry_after_seconds=cfg.executor_retry_after_seconds,
+        )
+
+    def limiter(self, endpoint: str) -> ConcurrencyLimiter:
+        """Get (or create) the limiter for an endpoint."""
+        limiter = self._limiters.get(endpoint)
+        if limiter is None:
+            limiter = ConcurrencyLimiter(endpoint, self.max_concurrency, self.max_queue)
+            self._limiters[endpoint] = limiter
+        return limiter
+
+    def _pool(self, pool: Pool) -> Executor:
+        if pool == Pool.PROCESS and self.process_workers > 0:
+            if self._process_pool is None:
+                # spawn, not fork: forking a multi-threaded server is unsafe
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="eg-compute",
+            )
+        return self._thread_pool
+
+    async def run(
+        self,
+        endpoint: str,
+        pool: Pool,
+        fn: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """
+        Run ``fn(*args)`` on a worker pool under the endpoint's limiter.
+
+        Raises:
+            ExecutorSaturated: If the endpoint's queue is full.
+        """
+        limiter = self.limiter(endpoint)
+        await limiter.acquire(self.retry_after_seconds)
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._pool(pool)
+            if isinstance(executor, ThreadPoolExecutor):
+                # Threads inherit the request's context variables
+                ctx = contextvars.copy_context()
+                call = functools.partial(ctx.run, fn, *args)
+            else:
+                call = functools.partial(fn, *args)
+            return await loop.run_in_executor(executor, call)
+        finally:
+            limiter.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "thread_workers": self.thread_workers,
+            "process_workers": self.process_workers,
+            "endpoints": {name: lim.stats() for name, lim in self._limiters.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Shut down worker pools (called on application shutdown)."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+
+compute_executor = ComputeExecutor.from_settings(settings)
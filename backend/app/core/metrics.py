@@ -0,0 +1,308 @@
+"""
+Prometheus metrics, without a client library or external services.
+
+``GET /metrics`` renders everything here in the Prometheus text format
+(version 0.0.4) for a local Prometheus to scrape:
+
+  - Request latency and response size histograms, labeled by endpoint,
+    case_type and solid_type
+  - Render element counts per projection, labeled by case and solid
+  - Responses by endpoint and status
+  - Result/phase cache hits and misses, coalesced requests
+  - Executor in-flight and queued computations, in-flight HTTP requests
+
+Observations are lock-free: every thread writes to its own shard (one
+lock per thread, taken once when the shard is created), and a scrape
+sums the shards. Counters already kept elsewhere (caches, executor,
+coalescer) are read at scrape time by collectors instead of being
+counted twice. A scrape can see a shard mid-update; at worst a sample
+is off by the observation in progress.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+# (metric type, help text, [(sample suffix, labels, value)])
+Family = tuple[str, str, list[tuple[str, dict[str, str], float]]]
+Collector = Callable[[], dict[str, Family]]
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+SIZE_BUCKETS = tuple(256.0 * 4 ** k for k in range(9))          # 256 B .. 16 MiB
+ELEMENT_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _ThreadShards:
+    """Per-thread dicts of samples; each thread only writes its own."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[dict[LabelValues, list[float]]] = []
+        self._lock = threading.Lock()
+
+    def mine(self) -> dict[LabelValues, list[float]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def merged(self, width: int) -> dict[LabelValues, list[float]]:
+        """Element-wise sum of every shard."""
+        with self._lock:
+            shards = list(self._shards)
+        total: dict[LabelValues, list[float]] = {}
+        for shard in shards:
+            for labels, values in list(shard.items()):
+                into = total.setdefault(labels, [0.0] * width)
+                for i, value in enumerate(values):
+                    into[i] += value
+        return total
+
+
+class Counter:
+    """Monotonic counter with labels (name it with the ``_total`` suffix)."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._shards = _ThreadShards()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        shard = self._shards.mine()
+        cell = shard.get(labelvalues)
+        if cell is None:
+            shard[labelvalues] = [amount]
+        else:
+            cell[0] += amount
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        return [
+            ("", dict(zip(self.labelnames, labels)), values[0])
+            for labels, values in sorted(self._shards.merged(1).items())
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: one count per bucket, the +Inf bucket, sum, count
+        self._width = len(self.buckets) + 3
+        self._shards = _ThreadShards()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        shard = self._shards.mine()
+        cell = shard.get(labelvalues)
+        if cell is None:
+            cell = shard[labelvalues] = [0.0] * self._width
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        out = []
+        for labels, values in sorted(self._shards.merged(self._width).items()):
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                out.append(("_bucket", {**base, "le": _format_value(bound)}, cumulative))
+            out.append(("_sum", base, values[-2]))
+            out.append(("_count", base, values[-1]))
+        return out
+
+
+class MetricsRegistry:
+    """Owned metrics plus collectors that read counters kept elsewhere."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+        self._collectors: list[Collector] = []
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a function returning {metric name: Family} at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Everything in the Prometheus text exposition format."""
+        families: dict[str, Family] = {
+            metric.name: (metric.type, metric.help, metric.samples())
+            for metric in self._metrics
+        }
+        for collector in self._collectors:
+            families.update(collector())
+        lines: list[str] = []
+        for name, (kind, help, samples) in families.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_LABELS = ("endpoint", "case_type", "solid_type")
+
+request_latency = registry.histogram(
+    "eg_lab_request_duration_seconds",
+    "HTTP request latency.",
+    REQUEST_LABELS,
+)
+response_size = registry.histogram(
+    "eg_lab_response_size_bytes",
+    "HTTP response body size.",
+    REQUEST_LABELS,
+    SIZE_BUCKETS,
+)
+responses = registry.counter(
+    "eg_lab_responses_total",
+    "HTTP responses by endpoint and status code.",
+    ("endpoint", "status"),
+)
+render_elements = registry.histogram(
+    "eg_lab_render_elements",
+    "Render elements built per projection computation.",
+    ("case_type", "solid_type"),
+    ELEMENT_BUCKETS,
+)
+
+
+# ============================================================
+# Per-request labels
+# ============================================================
+
+# Filled in by endpoints that know the request's case and solid
+request_labels: ContextVar[dict[str, str] | None] = ContextVar(
+    "eg_request_metric_labels", default=None,
+)
+
+
+def label_request(**labels: str) -> None:
+    """Attach labels (case_type, solid_type) to the current request's metrics."""
+    current = request_labels.get()
+    if current is not None:
+        current.update(labels)
+
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+# HTTP requests being handled; only touched on the event loop thread
+_in_flight = 0
+
+
+def requests_in_flight() -> int:
+    return _in_flight
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware observing latency, response size and status of
+    every HTTP request, and counting requests in flight.
+
+    The endpoint label is the request path when a route matched (no
+    route takes path parameters) and "unmatched" otherwise, so probes
+    for unknown paths cannot grow the label set.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        labels = {"case_type": "", "solid_type": ""}
+        token = request_labels.set(labels)
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_observed(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        global _in_flight
+        _in_flight += 1
+        try:
+            await self.app(scope, receive, send_observed)
+        finally:
+            _in_flight -= 1
+            request_labels.reset(token)
+            endpoint = scope["path"] if "endpoint" in scope else "unmatched"
+            values = (endpoint, labels["case_type"], labels["solid_type"])
+            request_latency.observe(time.perf_counter() - start, *values)
+            response_size.observe(size, *values)
+            responses.inc(endpoint, str(status))
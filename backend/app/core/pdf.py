@@ -0,0 +1,372 @@
+"""
+Minimal PDF writer for render instructions.
+
+Pure Python (stdlib zlib only), no external services: draws the element
+dicts the engines emit as PDF path operators, one content stream per page,
+and assembles the pages into a document. Only what answer keys need is
+implemented — strokes, dashes, filled dots, and text in the standard
+Helvetica font (WinAnsi encoding; Greek letters and subscripts the engines
+use are spelled out, see TRANSLITERATION).
+
+Element mapping follows frontend/src/lib/canvas-renderer.ts, the same as
+the SVG writer (app/core/svg.py). Engine coordinates are canvas pixels
+(y down); each drawing is fitted into a box on the page (PDF points, y up)
+through one ``cm`` transform, and text is counter-flipped so it reads
+upright.
+
+Page contents are built separately from the document (``page_*``
+functions return compressed content streams), so pages can be rendered
+on worker processes and assembled afterwards by ``PdfDocument``.
+"""
+
+from __future__ import annotations
+
+import math
+import textwrap
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from app.core.svg import _num
+from app.engine.config import DrawingConfig
+from app.engine.elements import Bounds, text_width
+
+PDF_MEDIA_TYPE = "application/pdf"
+
+# A4 landscape, in points
+PAGE_WIDTH = 841.89
+PAGE_HEIGHT = 595.28
+MARGIN = 36.0
+
+TITLE_FONT_SIZE = 14.0
+TEXT_FONT_SIZE = 10.0
+CAPTION_FONT_SIZE = 8.0
+LINE_GAP = 1.3  # line height as a multiple of the font size
+
+# Characters outside WinAnsi that engine text uses
+TRANSLITERATION = str.maketrans({
+    "α": "alpha", "β": "beta", "θ": "theta", "φ": "phi", "π": "pi",
+    "⊥": "perp.", "₀": "0", "₁": "1", "₂": "2", "₃": "3",
+    "≤": "<=", "≥": ">=", "√": "sqrt", "′": "'",
+})
+
+
+@dataclass(frozen=True)
+class Box:
+    """A rectangle on the page, in points from the bottom-left corner."""
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+def _rgb(color: str) -> str:
+    """'#rrggbb' as three PDF colour components."""
+    color = color.lstrip("#")
+    return " ".join(_num(int(color[i:i + 2], 16) / 255) for i in (0, 2, 4))
+
+
+def _string(text: str) -> str:
+    """A PDF literal string in WinAnsi encoding."""
+    raw = text.translate(TRANSLITERATION).encode("cp1252", errors="replace")
+    escaped = (
+        raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    )
+    return "(" + escaped.decode("latin-1") + ")"
+
+
+# ============================================================
+# Drawing
+# ============================================================
+
+def _arc_path(cx: float, cy: float, r: float, a0: float, sweep: float) -> list[str]:
+    """Path operators for an arc as cubic Béziers of at most 90° each."""
+    segments = max(1, math.ceil(abs(sweep) / (math.pi / 2) - 1e-9))
+    step = sweep / segments
+    k = 4.0 / 3.0 * math.tan(step / 4.0)
+    ops = [f"{_num(cx + r * math.cos(a0))} {_num(cy + r * math.sin(a0))} m"]
+    for i in range(segments):
+        t0 = a0 + i * step
+        t1 = t0 + step
+        c0, s0, c1, s1 = math.cos(t0), math.sin(t0), math.cos(t1), math.sin(t1)
+        ops.append(
+            f"{_num(cx + r * (c0 - k * s0))} {_num(cy + r * (s0 + k * c0))} "
+            f"{_num(cx + r * (c1 + k * s1))} {_num(cy + r * (s1 - k * c1))} "
+            f"{_num(cx + r * c1)} {_num(cy + r * s1)} c"
+        )
+    return ops
+
+
+def _text(x: float, y: float, text: str, size: float) -> str:
+    """Text at canvas (x, y), counter-flipped inside the y-down transform."""
+    return (
+        f"BT /F1 {_num(size)} Tf 1 0 0 -1 {_num(x)} {_num(y)} Tm "
+        f"{_string(text)} Tj ET"
+    )
+
+
+class _Pen:
+    """Emits stroke state changes only when they differ from the current ones."""
+
+    def __init__(self, config: DrawingConfig) -> None:
+        self.config = config
+        self.state: tuple | None = None
+
+    def style(self, style: str) -> str:
+        cfg = self.config
+        return self.set(
+            getattr(cfg, f"{style}_color"),
+            getattr(cfg, f"{style}_line_width"),
+            getattr(cfg, f"{style}_dash"),
+        )
+
+    def set(self, color: str, width: float, dash: tuple[float, ...] = ()) -> str:
+        state = (color, width, dash)
+        if state == self.state:
+            return ""
+        self.state = state
+        return (
+            f"{_rgb(color)} RG {_num(width)} w "
+            f"[{' '.join(_num(d) for d in dash)}] 0 d\n"
+        )
+
+
+def _element_ops(el: dict, pen: _Pen) -> str:
+    """PDF operators for one render element (canvas coordinates)."""
+    cfg = pen.config
+    match el["type"]:
+        case "line":
+            return pen.style(el["style"]) + (
+                f"{_num(el['x1'])} {_num(el['y1'])} m "
+                f"{_num(el['x2'])} {_num(el['y2'])} l S"
+            )
+        case "polygon":
+            points = el["points"]
+            if len(points) < 2:
+                return ""
+            ops = [f"{_num(points[0]['x'])} {_num(points[0]['y'])} m"]
+            ops += [f"{_num(p['x'])} {_num(p['y'])} l" for p in points[1:]]
+            ops.append("s" if el["closed"] else "S")
+            return pen.style(el["style"]) + " ".join(ops)
+        case "point":
+            r = el["radius"] or cfg.point_radius
+            ops = " ".join(_arc_path(el["x"], el["y"], r, 0.0, 2 * math.pi)) + " f"
+            if el["label"]:
+                # Label offset (core.js:471)
+                ops += " " + _text(el["x"] + 5, el["y"] - 5, el["label"], cfg.label_font_size)
+            return ops
+        case "label":
+            return _text(el["x"], el["y"], el["text"], el["font_size"] or cfg.label_font_size)
+        case "arc":
+            sweep = el["end_angle"] - el["start_angle"]
+            sweep = 360.0 if sweep >= 360.0 else sweep % 360.0
+            if sweep == 0.0:
+                return ""
+            # Arcs: visible colour, construction width (core.js:501-503)
+            return pen.set(cfg.visible_color, cfg.construction_line_width) + " ".join(
+                _arc_path(
+                    el["center_x"], el["center_y"], el["radius"],
+                    math.radians(el["start_angle"]), math.radians(sweep),
+                ),
+            ) + " S"
+        case "arrow":
+            tx, ty = el["to_x"], el["to_y"]
+            angle = math.atan2(ty - el["from_y"], tx - el["from_x"])
+            ops = []
+            head = cfg.arrow_head_length
+            for side in (angle - cfg.arrow_head_angle, angle + cfg.arrow_head_angle):
+                ops.append(
+                    f"{_num(tx)} {_num(ty)} m "
+                    f"{_num(tx - head * math.cos(side))} "
+                    f"{_num(ty - head * math.sin(side))} l"
+                )
+            return pen.set(cfg.visible_color, cfg.visible_line_width) + " ".join(ops) + " S"
+    raise ValueError(f"Unknown render element type: {el['type']}")
+
+
+def drawing_ops(
+    elements: Iterable[dict],
+    bounds: Bounds,
+    box: Box,
+    config: DrawingConfig,
+) -> str:
+    """
+    Operators drawing the elements fitted (and centred) into ``box``.
+
+    ``bounds`` is the canvas region to fit; the canvas y axis points down.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    width = max(max_x - min_x, 1e-9)
+    height = max(max_y - min_y, 1e-9)
+    scale = min(box.width / width, box.height / height)
+    tx = box.x + (box.width - width * scale) / 2 - min_x * scale
+    ty = box.y + box.height - (box.height - height * scale) / 2 + min_y * scale
+    pen = _Pen(config)
+    out = [
+        f"q {_num(box.x)} {_num(box.y)} {_num(box.width)} {_num(box.height)} re W n",
+        f"{_num(scale)} 0 0 {_num(-scale)} {_num(tx)} {_num(ty)} cm",
+        f"{_rgb(config.label_color)} rg",
+    ]
+    for el in elements:
+        ops = _element_ops(el, pen)
+        if ops:
+            out.append(ops)
+    out.append("Q")
+    return "\n".join(out)
+
+
+def text_lines(
+    x: float,
+    top: float,
+    lines: Sequence[str],
+    size: float,
+) -> tuple[str, float]:
+    """
+    Left-aligned lines of page text starting at ``top``.
+
+    Returns:
+        Tuple of (operators, y below the last line).
+    """
+    ops = []
+    y = top
+    for line in lines:
+        y -= size * LINE_GAP
+        ops.append(f"BT /F1 {_num(size)} Tf {_num(x)} {_num(y)} Td {_string(line)} Tj ET")
+    return "\n".join(ops), y
+
+
+def wrap(text: str, width: float, size: float) -> list[str]:
+    """Wrap text to a box width (see text_width())."""
+    return textwrap.wrap(text, max(10, int(width / text_width("x", size)))) or [""]
+
+
+# ============================================================
+# Pages
+# ============================================================
+
+def _compress(ops: str) -> bytes:
+    return zlib.compress(ops.encode("latin-1"))
+
+
+def page_step(
+    title: str,
+    step: dict,
+    bounds: Bounds,
+    config: DrawingConfig,
+) -> bytes:
+    """One step on its own page: heading, description, then the drawing."""
+    width = PAGE_WIDTH - 2 * MARGIN
+    top = PAGE_HEIGHT - MARGIN
+    heading, y = text_lines(MARGIN, top, [title], TITLE_FONT_SIZE)
+    body, y = text_lines(
+        MARGIN, y,
+        [step["title"], *wrap(step["description"], width, TEXT_FONT_SIZE)],
+        TEXT_FONT_SIZE,
+    )
+    box = Box(MARGIN, MARGIN, width, y - TEXT_FONT_SIZE - MARGIN)
+    return _compress("\n".join((
+        heading, body, drawing_ops(step["elements"], bounds, box, config),
+    )))
+
+
+def page_tiled(
+    title: str,
+    steps: Sequence[dict],
+    bounds: Bounds,
+    config: DrawingConfig,
+) -> bytes:
+    """Every step of a problem tiled on one sheet, captioned by step title."""
+    width = PAGE_WIDTH - 2 * MARGIN
+    heading, y = text_lines(MARGIN, PAGE_HEIGHT - MARGIN, [title], TITLE_FONT_SIZE)
+    columns = 2 if len(steps) <= 4 else 3 if len(steps) <= 9 else 4
+    rows = max(1, math.ceil(len(steps) / columns))
+    gap = TEXT_FONT_SIZE
+    cell_w = (width - gap * (columns - 1)) / columns
+    cell_h = (y - gap - MARGIN - gap * (rows - 1)) / rows
+    caption_h = CAPTION_FONT_SIZE * LINE_GAP + 2
+    parts = [heading]
+    for index, step in enumerate(steps):
+        row, col = divmod(index, columns)
+        x = MARGIN + col * (cell_w + gap)
+        cell_top = y - gap - row * (cell_h + gap)
+        caption, _ = text_lines(
+            x, cell_top, wrap(step["title"], cell_w, CAPTION_FONT_SIZE)[:1],
+            CAPTION_FONT_SIZE,
+        )
+        box = Box(x, cell_top - cell_h, cell_w, cell_h - caption_h)
+        parts.append(caption)
+        parts.append(
+            f"q 0.8 G 0.5 w [] 0 d {_num(box.x)} {_num(box.y)} "
+            f"{_num(box.width)} {_num(box.height)} re S Q"
+        )
+        parts.append(drawing_ops(step["elements"], bounds, box, config))
+    return _compress("\n".join(parts))
+
+
+def page_message(title: str, message: str) -> bytes:
+    """A text-only page (e.g. a problem that could not be computed)."""
+    width = PAGE_WIDTH - 2 * MARGIN
+    heading, y = text_lines(MARGIN, PAGE_HEIGHT - MARGIN, [title], TITLE_FONT_SIZE)
+    body, _ = text_lines(MARGIN, y, wrap(message, width, TEXT_FONT_SIZE), TEXT_FONT_SIZE)
+    return _compress(heading + "\n" + body)
+
+
+# ============================================================
+# Document
+# ============================================================
+
+class PdfDocument:
+    """
+    Collects compressed page content streams and writes the file.
+
+    Objects: 1 catalog, 2 page tree, 3 font, 4 info, then a page object
+    and its content stream per page.
+    """
+
+    def __init__(self, title: str = "") -> None:
+        self.title = title
+        self.pages: list[bytes] = []
+
+    def add_page(self, content: bytes) -> None:
+        """Append a page (a content stream from one of the page_* functions)."""
+        self.pages.append(content)
+
+    def to_bytes(self) -> bytes:
+        page_ids = [5 + 2 * i for i in range(len(self.pages))]
+        objects: list[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+                " ".join(f"{i} 0 R" for i in page_ids).encode(), len(page_ids),
+            ),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+            b"/Encoding /WinAnsiEncoding >>",
+            b"<< /Title %s /Producer (EG Virtual Lab) >>" % _string(self.title).encode("latin-1"),
+        ]
+        media_box = f"[0 0 {_num(PAGE_WIDTH)} {_num(PAGE_HEIGHT)}]".encode()
+        for page_id, content in zip(page_ids, self.pages):
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox %s "
+                b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                % (media_box, page_id + 1)
+            )
+            objects.append(
+                b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content)
+                + content + b"\nendstream"
+            )
+
+        out = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
+        offsets = []
+        position = len(out[0])
+        for number, body in enumerate(objects, start=1):
+            chunk = b"%d 0 obj\n" % number + body + b"\nendobj\n"
+            offsets.append(position)
+            out.append(chunk)
+            position += len(chunk)
+        xref = [b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)]
+        xref += [b"%010d 00000 n \n" % offset for offset in offsets]
+        out += xref
+        out.append(
+            b"trailer\n<< /Size %d /Root 1 0 R /Info 4 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(objects) + 1, position)
+        )
+        return b"".join(out)
@@ -0,0 +1,252 @@
+"""
+NumPy rasterizer for render instructions.
+
+Draws a step's element dicts into an RGB pixel array and encodes it as a
+PNG (stdlib zlib only). Meant for thumbnails: strokes are antialiased by
+coverage — each primitive computes, over its bounding box of pixels, the
+distance from every pixel centre to the shape and turns it into a 0-1
+coverage that is alpha-blended onto the image in one array operation.
+
+Styles follow DrawingConfig like the other exporters (app/core/svg.py,
+app/core/pdf.py). Line widths, dash lengths and point radii stay in image
+pixels whatever the zoom, so a small thumbnail is not a faint one. Text is not
+drawn: at thumbnail sizes labels are illegible, and there is no font
+renderer among the dependencies.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import zlib
+from typing import Iterable
+
+import numpy as np
+
+from app.engine.config import DrawingConfig
+from app.engine.elements import Bounds
+
+PNG_MEDIA_TYPE = "image/png"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _rgb(color: str) -> np.ndarray:
+    """'#rrggbb' as float RGB in 0-1."""
+    color = color.lstrip("#")
+    return np.array([int(color[i:i + 2], 16) / 255 for i in (0, 2, 4)], dtype=np.float32)
+
+
+class Raster:
+    """
+    An RGB image with antialiased drawing primitives.
+
+    Coordinates are image pixels, y down, with pixel (i, j) covering
+    [j, j + 1) × [i, i + 1).
+    """
+
+    def __init__(self, width: int, height: int, background: str = "#ffffff") -> None:
+        self.width = width
+        self.height = height
+        self.pixels = np.empty((height, width, 3), dtype=np.float32)
+        self.pixels[:] = _rgb(background)
+
+    def _window(
+        self, x0: float, y0: float, x1: float, y1: float,
+    ) -> tuple[slice, slice, np.ndarray, np.ndarray] | None:
+        """Pixel window covering a box, with its pixel-centre coordinates."""
+        j0 = max(0, math.floor(x0))
+        j1 = min(self.width, math.ceil(x1) + 1)
+        i0 = max(0, math.floor(y0))
+        i1 = min(self.height, math.ceil(y1) + 1)
+        if j0 >= j1 or i0 >= i1:
+            return None
+        px = np.arange(j0, j1, dtype=np.float32)[None, :] + 0.5
+        py = np.arange(i0, i1, dtype=np.float32)[:, None] + 0.5
+        return slice(i0, i1), slice(j0, j1), px, py
+
+    def _blend(self, rows: slice, cols: slice, coverage: np.ndarray, color: np.ndarray) -> None:
+        region = self.pixels[rows, cols]
+        region += (color - region) * coverage[..., None]
+
+    @staticmethod
+    def _stroke_coverage(distance: np.ndarray, width: float) -> np.ndarray:
+        """Coverage of a stroke; hairlines are drawn 1 px wide, lighter."""
+        half = max(width, 1.0) / 2
+        return np.clip(half + 0.5 - distance, 0.0, 1.0) * min(width, 1.0)
+
+    def line(
+        self,
+        x0: float, y0: float, x1: float, y1: float,
+        color: np.ndarray,
+        width: float = 1.0,
+        dash: tuple[float, ...] = (),
+    ) -> None:
+        """Antialiased segment, optionally dashed (on/off lengths in pixels)."""
+        pad = max(width, 1.0) / 2 + 1
+        window = self._window(
+            min(x0, x1) - pad, min(y0, y1) - pad, max(x0, x1) + pad, max(y0, y1) + pad,
+        )
+        if window is None:
+            return
+        rows, cols, px, py = window
+        dx, dy = x1 - x0, y1 - y0
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0.0:
+            distance = np.hypot(px - x0, py - y0)
+            along = None
+        else:
+            along = ((px - x0) * dx + (py - y0) * dy) / length_sq
+            t = np.clip(along, 0.0, 1.0)
+            distance = np.hypot(px - (x0 + t * dx), py - (y0 + t * dy))
+        coverage = self._stroke_coverage(distance, width)
+        if dash and along is not None:
+            period = float(sum(dash))
+            position = (along * math.sqrt(length_sq)) % period
+            coverage *= position < dash[0]
+        self._blend(rows, cols, coverage, color)
+
+    def ring(
+        self,
+        cx: float, cy: float, radius: float,
+        color: np.ndarray,
+        width: float = 1.0,
+        start: float = 0.0,
+        sweep: float = 360.0,
+    ) -> None:
+        """
+        Antialiased circle or arc. Angles in degrees, measured clockwise on
+        screen (canvas arc convention).
+        """
+        pad = radius + max(width, 1.0) / 2 + 1
+        window = self._window(cx - pad, cy - pad, cx + pad, cy + pad)
+        if window is None:
+            return
+        rows, cols, px, py = window
+        distance = np.abs(np.hypot(px - cx, py - cy) - radius)
+        coverage = self._stroke_coverage(distance, width)
+        if sweep < 360.0:
+            angle = np.degrees(np.arctan2(py - cy, px - cx))
+            coverage *= ((angle - start) % 360.0) <= sweep
+        self._blend(rows, cols, coverage, color)
+
+    def disk(self, cx: float, cy: float, radius: float, color: np.ndarray) -> None:
+        """Antialiased filled circle."""
+        window = self._window(cx - radius - 1, cy - radius - 1, cx + radius + 1, cy + radius + 1)
+        if window is None:
+            return
+        rows, cols, px, py = window
+        coverage = np.clip(radius + 0.5 - np.hypot(px - cx, py - cy), 0.0, 1.0)
+        self._blend(rows, cols, coverage, color)
+
+    def to_png(self) -> bytes:
+        """Encode as an 8-bit RGB PNG."""
+        return encode_png(np.rint(self.pixels * 255.0).astype(np.uint8))
+
+
+# ============================================================
+# Elements
+# ============================================================
+
+def rasterize(
+    elements: Iterable[dict],
+    bounds: Bounds,
+    width: int,
+    height: int,
+    config: DrawingConfig | None = None,
+) -> Raster:
+    """
+    Draw elements into a new image, fitting (and centring) ``bounds``.
+
+    Raises:
+        ValueError: If an element type is unknown.
+    """
+    config = config if config is not None else DrawingConfig()
+    raster = Raster(width, height)
+    min_x, min_y, max_x, max_y = bounds
+    scale = min(width / max(max_x - min_x, 1e-9), height / max(max_y - min_y, 1e-9))
+    ox = (width - (max_x - min_x) * scale) / 2 - min_x * scale
+    oy = (height - (max_y - min_y) * scale) / 2 - min_y * scale
+
+    styles = {
+        style: (
+            _rgb(getattr(config, f"{style}_color")),
+            getattr(config, f"{style}_line_width"),
+            getattr(config, f"{style}_dash"),
+        )
+        for style in ("visible", "hidden", "construction")
+    }
+    visible = _rgb(config.visible_color)
+    ink = _rgb(config.label_color)
+
+    for el in elements:
+        match el["type"]:
+            case "line":
+                color, line_width, dash = styles[el["style"]]
+                raster.line(
+                    el["x1"] * scale + ox, el["y1"] * scale + oy,
+                    el["x2"] * scale + ox, el["y2"] * scale + oy,
+                    color, line_width, dash,
+                )
+            case "polygon":
+                color, line_width, dash = styles[el["style"]]
+                points = [(p["x"] * scale + ox, p["y"] * scale + oy) for p in el["points"]]
+                if el["closed"] and len(points) > 2:
+                    points.append(points[0])
+                for (ax, ay), (bx, by) in zip(points, points[1:]):
+                    raster.line(ax, ay, bx, by, color, line_width, dash)
+            case "point":
+                radius = el["radius"] or config.point_radius
+                raster.disk(el["x"] * scale + ox, el["y"] * scale + oy, radius, ink)
+            case "label":
+                pass
+            case "arc":
+                sweep = el["end_angle"] - el["start_angle"]
+                sweep = 360.0 if sweep >= 360.0 else sweep % 360.0
+                # Arcs: visible colour, construction width (core.js:501-503)
+                raster.ring(
+                    el["center_x"] * scale + ox, el["center_y"] * scale + oy,
+                    el["radius"] * scale, visible,
+                    config.construction_line_width, el["start_angle"], sweep,
+                )
+            case "arrow":
+                tx, ty = el["to_x"] * scale + ox, el["to_y"] * scale + oy
+                angle = math.atan2(el["to_y"] - el["from_y"], el["to_x"] - el["from_x"])
+                head = config.arrow_head_length
+                for side in (angle - config.arrow_head_angle, angle + config.arrow_head_angle):
+                    raster.line(
+                        tx, ty,
+                        tx - head * math.cos(side),
+                        ty - head * math.sin(side),
+                        visible, config.visible_line_width,
+                    )
+            case _:
+                raise ValueError(f"Unknown render element type: {el['type']}")
+    return raster
+
+
+# ============================================================
+# PNG
+# ============================================================
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data)) + kind + data
+        + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """
+    Encode an (height, width, 3) uint8 array as a PNG.
+
+    Rows use filter type 0 (none); zlib does the rest.
+    """
+    height, width, _ = pixels.shape
+    scanlines = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(height, width * 3)
+    return b"".join((
+        PNG_SIGNATURE,
+        _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+        _chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6)),
+        _chunk(b"IEND", b""),
+    ))
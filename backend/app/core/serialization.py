@@ -0,0 +1,229 @@
+"""
+Fast JSON serialization for engine output.
+
+The engines produce plain element dicts. Letting FastAPI validate them
+against the ``LineElement | PolygonElement | ...`` union in StepInstruction
+tries each union member per element, which is pure overhead for output we
+generated ourselves. Instead, elements go through a typed encoder that
+dispatches on the ``type`` discriminator and the payload is written straight
+to JSON bytes (orjson when installed, stdlib json otherwise).
+
+The encoder tables are derived from the Pydantic element models, so the
+emitted JSON has the same shape as ``model_dump_json()`` and the OpenAPI
+schema (still declared via ``response_model``) stays accurate.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from app.schemas.projection import (
+    ArcElement,
+    ArrowElement,
+    LabelElement,
+    LineElement,
+    PointElement,
+    PolygonElement,
+)
+
+if TYPE_CHECKING:
+    from app.engine.packed import ElementStore
+
+try:  # Optional dependency: pip install ".[fast]"
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+# ============================================================
+# JSON bytes
+# ============================================================
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# ============================================================
+# Typed element encoder
+# ============================================================
+
+def _field_table(model: type) -> tuple[tuple[str, bool], ...]:
+    """(field name, is float) for every field of an element model, in order."""
+    return tuple(
+        (name, info.annotation is float)
+        for name, info in model.model_fields.items()
+    )
+
+
+_ELEMENT_FIELDS: dict[str, tuple[tuple[str, bool], ...]] = {
+    model.model_fields["type"].default: _field_table(model)
+    for model in (
+        LineElement, PolygonElement, PointElement,
+        LabelElement, ArcElement, ArrowElement,
+    )
+}
+
+
+def encode_element(element: dict) -> dict:
+    """
+    Normalize one engine element to its wire shape.
+
+    Dispatches on ``element["type"]`` and coerces numeric fields to float,
+    exactly as Pydantic would, without running validation.
+
+    Raises:
+        ValueError: If the element type is unknown.
+    """
+    fields = _ELEMENT_FIELDS.get(element["type"])
+    if fields is None:
+        raise ValueError(f"Unknown render element type: {element['type']}")
+    out = {}
+    for name, is_float in fields:
+        value = element[name]
+        out[name] = float(value) if is_float else value
+    if element["type"] == "polygon":
+        out["points"] = [
+            {"x": float(p["x"]), "y": float(p["y"])} for p in element["points"]
+        ]
+    return out
+
+
+def encode_elements(elements: Iterable[dict]) -> list[dict]:
+    """Encode a list of elements."""
+    return [encode_element(e) for e in elements]
+
+
+def encode_step(step: dict) -> dict:
+    """Encode a StepInstruction dict."""
+    return {
+        "step_number": step["step_number"],
+        "title": step["title"],
+        "description": step["description"],
+        "elements": encode_elements(step["elements"]),
+    }
+
+
+def encode_delta_step(step: dict) -> dict:
+    """Encode a StepDelta dict."""
+    return {
+        "step_number": step["step_number"],
+        "title": step["title"],
+        "description": step["description"],
+        "keep": step["keep"],
+        "added": encode_elements(step["added"]),
+    }
+
+
+def _fragment(obj: Any) -> bytes:
+    """Encode one element for splicing into a response."""
+    # Copy to an exact-size object: orjson over-allocates small outputs,
+    # which adds up across memoized fragments
+    return bytes(memoryview(dumps(obj)))
+
+
+def _response_parts(
+    steps: Iterable[dict],
+    elements: Callable[[dict], Iterable[bytes]],
+    metadata: dict,
+    total_steps: int,
+) -> bytes:
+    """
+    Write a ProjectionResponse from already-encoded element fragments.
+
+    References to the pieces are collected and joined once at the end, so
+    the response body is the only large allocation.
+    """
+    parts = [b'{"total_steps":%d,"steps":[' % total_steps]
+    for step_index, step in enumerate(steps):
+        head = dumps({
+            "step_number": step["step_number"],
+            "title": step["title"],
+            "description": step["description"],
+        })
+        parts.append(b"," + head[:-1] if step_index else head[:-1])
+        separator = b',"elements":['
+        for fragment in elements(step):
+            parts.append(separator)
+            parts.append(fragment)
+            separator = b","
+        parts.append(b',"elements":[]}' if separator != b"," else b"]}")
+    parts.append(b'],"metadata":')
+    parts.append(dumps(metadata))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def response_json(
+    steps: list[dict],
+    metadata: dict,
+    total_steps: int | None = None,
+) -> bytes:
+    """
+    Serialize a ProjectionResponse/CurveResponse-shaped payload.
+
+    Cumulative steps usually share element dicts with earlier steps (layer
+    replay, curve layers); each distinct dict is encoded only once.
+    """
+    memo: dict[int, bytes] = {}
+
+    def elements(step: dict) -> Iterable[bytes]:
+        for element in step["elements"]:
+            # Keyed by identity: the dicts stay alive for the whole call
+            key = id(element)
+            fragment = memo.get(key)
+            if fragment is None:
+                fragment = memo[key] = _fragment(encode_element(element))
+            yield fragment
+
+    return _response_parts(
+        steps, elements, metadata,
+        len(steps) if total_steps is None else total_steps,
+    )
+
+
+def delta_response_json(
+    base_layer: list[dict],
+    deltas: list[dict],
+    metadata: dict,
+    total_steps: int | None = None,
+) -> bytes:
+    """Serialize a ProjectionDeltaResponse/CurveDeltaResponse-shaped payload."""
+    return dumps({
+        "encoding": "delta",
+        "total_steps": len(deltas) if total_steps is None else total_steps,
+        "base_layer": encode_elements(base_layer),
+        "steps": [encode_delta_step(s) for s in deltas],
+        "metadata": metadata,
+    })
+
+
+def packed_response_json(
+    store: ElementStore,
+    steps: list[dict],
+    metadata: dict,
+    total_steps: int | None = None,
+) -> bytes:
+    """
+    Serialize packed steps (see app/engine/packed.py) as a ProjectionResponse.
+
+    Produces the same bytes as response_json() on the materialized steps,
+    but each stored element is encoded once, however many steps replay it.
+    """
+    fragments: list[bytes | None] = [None] * len(store)
+
+    def elements(step: dict) -> Iterable[bytes]:
+        for start, end in step["segments"]:
+            for index in range(start, end):
+                fragment = fragments[index]
+                if fragment is None:
+                    fragment = fragments[index] = _fragment(store.element(index))
+                yield fragment
+
+    return _response_parts(
+        steps, elements, metadata,
+        len(steps) if total_steps is None else total_steps,
+    )
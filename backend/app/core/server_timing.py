@@ -0,0 +1,116 @@
+"""
+Server-Timing instrumentation.
+
+We need to see whether a request's latency goes into geometry, building
+render elements, request validation or JSON encoding. ServerTimingMiddleware
+starts a RequestTimings (app/engine/spans.py) for every HTTP request; the
+spans recorded while handling it are sent back in a ``Server-Timing``
+header, e.g.::
+
+    Server-Timing: validate;dur=0.41, phase1;dur=0.05, render;dur=0.92,
+                   serialize;dur=0.30, compute;dur=1.61, total;dur=2.12
+
+Spans can nest (``compute`` covers the engine spans, ``render`` covers
+the layer spans), so durations do not add up to ``total``. Every request's
+spans are also folded into a process-wide TimingAggregate reported under
+/health.
+
+The middleware is only installed when ``settings.server_timing_enabled``
+is set; without it no request carries timings and every span is a no-op.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Awaitable, Callable
+
+from app.engine.spans import RequestTimings, current_timings
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def server_timing(spans: dict[str, float]) -> str:
+    """Spans as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={ms:.2f}" for name, ms in spans.items())
+
+
+class TimingAggregate:
+    """
+    Process-wide count, total and maximum of every span name, in ms.
+
+    One lock acquisition per request.
+    """
+
+    def __init__(self) -> None:
+        self._spans: dict[str, list[float]] = {}   # name -> [count, total, max]
+        self._lock = threading.Lock()
+
+    def record(self, spans: dict[str, float]) -> None:
+        with self._lock:
+            for name, ms in spans.items():
+                entry = self._spans.get(name)
+                if entry is None:
+                    self._spans[name] = [1, ms, ms]
+                else:
+                    entry[0] += 1
+                    entry[1] += ms
+                    if ms > entry[2]:
+                        entry[2] = ms
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "count": int(count),
+                    "total_ms": round(total, 3),
+                    "mean_ms": round(total / count, 3),
+                    "max_ms": round(peak, 3),
+                }
+                for name, (count, total, peak) in self._spans.items()
+            }
+
+
+timing_aggregate = TimingAggregate()
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware timing each HTTP request.
+
+    The header is written when the response starts, so a streamed body
+    reports what happened before its first chunk.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings.add("total", timings.elapsed_ms())
+                spans = dict(timings.spans)
+                timing_aggregate.record(spans)
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(spans).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
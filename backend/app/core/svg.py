@@ -0,0 +1,315 @@
+"""
+Streaming SVG writer for render instructions.
+
+Turns the element dicts the engines emit into an SVG document, one
+element at a time: each element becomes one SVG tag that is written and
+forgotten, so memory stays flat however many elements a drawing has
+(the ellipse construction can run to tens of thousands). Nothing builds
+a DOM; ``write_svg()`` is a generator of UTF-8 chunks meant to be handed
+straight to a StreamingResponse.
+
+Element mapping mirrors frontend/src/lib/canvas-renderer.ts, which in turn
+ports core.js:423-510:
+
+    line, polygon  stroke/width/dash by style (visible, hidden,
+                   construction) from DrawingConfig
+    point          filled circle + label at (x + 5, y - 5)
+    label          text
+    arc            circle (≥ 360°) or path arc, swept clockwise on screen
+    arrow          V-shaped head, 5 px at ±30°
+
+Styles are written once as CSS classes so elements only carry geometry.
+
+A document holds either one step, or every step as a layer. Engines emit
+cumulative steps, so a layer holds only what its step adds to the previous
+one. A step that drops earlier elements (Case A projectors in step 5) is
+written as a full redraw and every layer before it starts hidden; with all
+visible layers shown, the page is exactly the last step.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+from xml.sax.saxutils import escape, quoteattr
+
+from app.engine.config import DrawingConfig
+from app.services.step_delta import common_prefix
+
+SVG_MEDIA_TYPE = "image/svg+xml"
+
+# Tags per yielded chunk
+CHUNK_SIZE = 512
+
+STYLES = ("visible", "hidden", "construction")
+
+
+@dataclass(frozen=True)
+class SvgFrame:
+    """
+    Page size and the transform from engine to page coordinates.
+
+    Projection and cycloid engines draw in canvas pixels (y down), so the
+    default frame is the identity. The ellipse engine draws in math
+    coordinates (y up) around an origin the page places on screen.
+    """
+    width: float
+    height: float
+    origin_x: float = 0.0
+    origin_y: float = 0.0
+    scale: float = 1.0
+    y_up: bool = False
+
+    @property
+    def transform(self) -> str | None:
+        """SVG transform of the drawing group, or None for the identity."""
+        if not self.y_up and self.scale == 1.0 and not (self.origin_x or self.origin_y):
+            return None
+        sy = -self.scale if self.y_up else self.scale
+        return (
+            f"translate({_num(self.origin_x)} {_num(self.origin_y)}) "
+            f"scale({_num(self.scale)} {_num(sy)})"
+        )
+
+
+def _num(value: float) -> str:
+    """
+    Compact fixed-point number (three decimals, no trailing zeros).
+
+    Shared by the PDF writer, whose reals use the same format.
+    """
+    text = f"{value:.3f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+# ============================================================
+# Stylesheet
+# ============================================================
+
+def stylesheet(config: DrawingConfig) -> str:
+    """CSS classes for the line styles, arcs, arrows and text."""
+    rules = []
+    for style in STYLES:
+        color = getattr(config, f"{style}_color")
+        width = getattr(config, f"{style}_line_width")
+        dash = getattr(config, f"{style}_dash")
+        rule = f".{style}{{stroke:{color};stroke-width:{_num(width)}"
+        if dash:
+            rule += f";stroke-dasharray:{' '.join(_num(d) for d in dash)}"
+        rules.append(rule + "}")
+    # Arcs: visible colour, construction width (core.js:501-503)
+    rules.append(
+        f".arc{{stroke:{config.visible_color};"
+        f"stroke-width:{_num(config.construction_line_width)}}}"
+    )
+    rules.append(
+        f".arrow{{stroke:{config.visible_color};"
+        f"stroke-width:{_num(config.visible_line_width)}}}"
+    )
+    rules.append(
+        f"text,.point{{fill:{config.label_color};stroke:none}}"
+        f"text{{font-family:{config.font_family};"
+        f"font-size:{_num(config.label_font_size)}px}}"
+    )
+    return "".join(rules)
+
+
+# ============================================================
+# Elements
+# ============================================================
+
+def _text(x: float, y: float, text: str, y_up: bool, font_size: float | None = None) -> str:
+    """A text tag; counter-flipped in y-up frames so it reads upright."""
+    size = f' font-size="{_num(font_size)}"' if font_size is not None else ""
+    if y_up:
+        return (
+            f'<text transform="translate({_num(x)} {_num(y)}) scale(1 -1)"{size}>'
+            f"{escape(text)}</text>"
+        )
+    return f'<text x="{_num(x)}" y="{_num(y)}"{size}>{escape(text)}</text>'
+
+
+def _arc(el: dict) -> str:
+    """Canvas arc(start → end, clockwise on screen) as an SVG tag."""
+    cx, cy, r = el["center_x"], el["center_y"], el["radius"]
+    start, end = el["start_angle"], el["end_angle"]
+    sweep = end - start
+    if sweep >= 360.0:
+        return (
+            f'<circle class="arc" cx="{_num(cx)}" cy="{_num(cy)}" '
+            f'r="{_num(r)}" fill="none"/>'
+        )
+    sweep %= 360.0
+    a0 = math.radians(start)
+    a1 = math.radians(start + sweep)
+    return (
+        f'<path class="arc" fill="none" d="M{_num(cx + r * math.cos(a0))} '
+        f'{_num(cy + r * math.sin(a0))}A{_num(r)} {_num(r)} 0 '
+        f'{1 if sweep > 180.0 else 0} 1 {_num(cx + r * math.cos(a1))} '
+        f'{_num(cy + r * math.sin(a1))}"/>'
+    )
+
+
+def _arrow(el: dict, config: DrawingConfig) -> str:
+    """Two head strokes from the tip (core.js:423-435)."""
+    tx, ty = el["to_x"], el["to_y"]
+    angle = math.atan2(ty - el["from_y"], tx - el["from_x"])
+    left = angle - config.arrow_head_angle
+    right = angle + config.arrow_head_angle
+    head = config.arrow_head_length
+    return (
+        f'<path class="arrow" fill="none" d="M{_num(tx)} {_num(ty)}'
+        f'L{_num(tx - head * math.cos(left))} '
+        f'{_num(ty - head * math.sin(left))}'
+        f'M{_num(tx)} {_num(ty)}'
+        f'L{_num(tx - head * math.cos(right))} '
+        f'{_num(ty - head * math.sin(right))}"/>'
+    )
+
+
+def svg_element(element: dict, config: DrawingConfig, y_up: bool = False) -> str:
+    """
+    One render element as SVG markup.
+
+    Raises:
+        ValueError: If the element type is unknown.
+    """
+    match element["type"]:
+        case "line":
+            return (
+                f'<line class="{element["style"]}" x1="{_num(element["x1"])}" '
+                f'y1="{_num(element["y1"])}" x2="{_num(element["x2"])}" '
+                f'y2="{_num(element["y2"])}"/>'
+            )
+        case "polygon":
+            points = element["points"]
+            if len(points) < 2:
+                return ""
+            tag = "polygon" if element["closed"] else "polyline"
+            coords = " ".join(f"{_num(p['x'])},{_num(p['y'])}" for p in points)
+            return (
+                f'<{tag} class="{element["style"]}" fill="none" '
+                f'points="{coords}"/>'
+            )
+        case "point":
+            x, y = element["x"], element["y"]
+            out = (
+                f'<circle class="point" cx="{_num(x)}" cy="{_num(y)}" '
+                f'r="{_num(element["radius"] or config.point_radius)}"/>'
+            )
+            if element["label"]:
+                # Label offset (core.js:471) is in screen space
+                dy = 5.0 if y_up else -5.0
+                out += _text(x + 5.0, y + dy, element["label"], y_up)
+            return out
+        case "label":
+            font_size = element["font_size"]
+            return _text(
+                element["x"], element["y"], element["text"], y_up,
+                font_size if font_size != config.label_font_size else None,
+            )
+        case "arc":
+            return _arc(element)
+        case "arrow":
+            return _arrow(element, config)
+    raise ValueError(f"Unknown render element type: {element['type']}")
+
+
+# ============================================================
+# Layers
+# ============================================================
+
+def step_layers(steps: Sequence[dict]) -> list[tuple[int, bool]]:
+    """
+    Where each step's layer starts in its element list, and whether the
+    layer is shown.
+
+    Returns:
+        One ``(start, visible)`` per step: the layer holds
+        ``elements[start:]``. ``start`` is 0 for the first step and for
+        steps that drop elements of the previous one (full redraws);
+        layers before the last full redraw are hidden.
+    """
+    starts: list[int] = []
+    previous: Sequence[dict] = ()
+    last_redraw = 0
+    for index, step in enumerate(steps):
+        elements = step["elements"]
+        keep = common_prefix(previous, elements)
+        if keep < len(previous):
+            keep = 0
+            last_redraw = index
+        starts.append(keep)
+        previous = elements
+    return [(start, index >= last_redraw) for index, start in enumerate(starts)]
+
+
+# ============================================================
+# Document
+# ============================================================
+
+def write_svg(
+    steps: Sequence[dict],
+    frame: SvgFrame,
+    config: DrawingConfig | None = None,
+    title: str | None = None,
+) -> Iterator[bytes]:
+    """
+    Stream steps as an SVG document.
+
+    A single step is drawn as-is; several steps become one layer each
+    (see step_layers()).
+
+    Args:
+        steps: StepInstruction dicts, in order.
+        frame: Page size and engine-to-page transform.
+        config: Styles; DrawingConfig() defaults when omitted.
+        title: Document title.
+
+    Yields:
+        UTF-8 chunks of the document.
+    """
+    config = config if config is not None else DrawingConfig()
+    y_up = frame.y_up
+    buffer: list[str] = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape" '
+        f'width="{_num(frame.width)}" height="{_num(frame.height)}" '
+        f'viewBox="0 0 {_num(frame.width)} {_num(frame.height)}">',
+    ]
+    if title:
+        buffer.append(f"<title>{escape(title)}</title>")
+    buffer.append(f"<style>{escape(stylesheet(config))}</style>")
+    transform = frame.transform
+    buffer.append(f'<g transform="{transform}">' if transform else "<g>")
+
+    if len(steps) == 1:
+        layers: Iterable[tuple[dict, int, bool | None]] = [(steps[0], 0, None)]
+    else:
+        layers = (
+            (step, start, visible)
+            for step, (start, visible) in zip(steps, step_layers(steps))
+        )
+
+    for step, start, visible in layers:
+        if visible is not None:
+            hidden = "" if visible else ' style="display:none"'
+            buffer.append(
+                f'<g id="step-{step["step_number"]}" inkscape:groupmode="layer" '
+                f"inkscape:label={quoteattr(step['title'])}{hidden}>"
+            )
+            buffer.append(f"<desc>{escape(step['description'])}</desc>")
+        elements = step["elements"]
+        for index in range(start, len(elements)):
+            buffer.append(svg_element(elements[index], config, y_up))
+            if len(buffer) >= CHUNK_SIZE:
+                yield ("\n".join(buffer) + "\n").encode("utf-8")
+                buffer = []
+        if visible is not None:
+            buffer.append("</g>")
+
+    buffer.append("</g>")
+    buffer.append("</svg>")
+    yield ("\n".join(buffer) + "\n").encode("utf-8")
@@ -0,0 +1,216 @@
+"""
+Result warehouse — an indexed, memory-mapped file of response bodies.
+
+A warehouse maps canonical request keys (result_cache.canonical_key, hex
+SHA-256) to serialized response bytes. It is written once by the build
+CLI (app/services/warehouse_service.py) and then only read: the server
+maps the file and loads the index into a dict, so a lookup is one hash
+probe plus a slice of the mapping. Bodies stay in the page cache, shared
+by every worker process that maps the same file.
+
+File layout (little-endian):
+
+    header   magic, format version, entry count, index offset, meta length
+    meta     JSON: the versions and settings the keys and bodies depend on
+    bodies   response bytes, back to back
+    index    entry count × (raw 32-byte key, body offset, body length),
+             sorted by key
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO
+
+MAGIC = b"EGLABWH\x00"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQI")
+_INDEX_ENTRY = struct.Struct("<32sQI")
+
+
+class WarehouseError(ValueError):
+    """The file is not a usable warehouse (corrupt, or built for other code)."""
+
+
+# ============================================================
+# Writing
+# ============================================================
+
+class WarehouseWriter:
+    """
+    Streams bodies into a new warehouse file.
+
+    The file is written under a temporary name next to ``path`` and renamed
+    on ``close()``, so a server never maps a half-written warehouse. Use as
+    a context manager; an exception discards the file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], meta: dict[str, Any]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        self._file: BinaryIO = os.fdopen(fd, "wb")
+        self._meta = json.dumps(meta, sort_keys=True).encode("utf-8")
+        self._file.write(b"\0" * _HEADER.size)
+        self._file.write(self._meta)
+        self._offset = _HEADER.size + len(self._meta)
+        self._index: dict[bytes, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, key: str, body: bytes) -> bool:
+        """Append a body; returns False (and writes nothing) for a known key."""
+        raw = bytes.fromhex(key)
+        if raw in self._index:
+            return False
+        self._file.write(body)
+        self._index[raw] = (self._offset, len(body))
+        self._offset += len(body)
+        return True
+
+    def close(self) -> None:
+        """Write the index and header, then move the file into place."""
+        index_offset = self._offset
+        for raw in sorted(self._index):
+            self._file.write(_INDEX_ENTRY.pack(raw, *self._index[raw]))
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, len(self._index), index_offset, len(self._meta),
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def discard(self) -> None:
+        """Drop the partial file."""
+        self._file.close()
+        os.unlink(self._tmp)
+
+    def __enter__(self) -> WarehouseWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+# ============================================================
+# Reading
+# ============================================================
+
+class ResultWarehouse:
+    """
+    Read-only view of a warehouse file; empty until ``open()``.
+
+    Lookups are thread-safe: the mapping and its index are swapped as one
+    tuple, and hit/miss counters are kept under a lock like ResultCache's.
+    """
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.meta: dict[str, Any] = {}
+        self._state: tuple[mmap.mmap, dict[bytes, tuple[int, int]]] | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._state[1]) if self._state is not None else 0
+
+    def open(
+        self,
+        path: str | os.PathLike[str],
+        expect: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Map a warehouse file, replacing any open one.
+
+        Args:
+            path: The file written by WarehouseWriter.
+            expect: Meta entries that must match (e.g. versions); a file
+                built for different code would serve stale bodies.
+
+        Raises:
+            OSError: If the file cannot be read.
+            WarehouseError: If it is corrupt or ``expect`` does not match.
+        """
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            meta, index = self._parse(mapping)
+            for name, value in (expect or {}).items():
+                if meta.get(name) != value:
+                    raise WarehouseError(
+                        f"Warehouse {path} was built for {name}={meta.get(name)!r}, "
+                        f"not {value!r}"
+                    )
+        except Exception:
+            mapping.close()
+            raise
+        previous = self._state
+        self.path, self.meta = Path(path), meta
+        self._state = (mapping, index)
+        if previous is not None:
+            previous[0].close()
+
+    @staticmethod
+    def _parse(mapping: mmap.mmap) -> tuple[dict[str, Any], dict[bytes, tuple[int, int]]]:
+        if len(mapping) < _HEADER.size:
+            raise WarehouseError("Warehouse file is truncated")
+        magic, version, count, index_offset, meta_length = _HEADER.unpack_from(mapping)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise WarehouseError("Not a warehouse file (or an unsupported format version)")
+        if index_offset + count * _INDEX_ENTRY.size != len(mapping):
+            raise WarehouseError("Warehouse file is truncated")
+        meta = json.loads(mapping[_HEADER.size:_HEADER.size + meta_length])
+        index = {
+            raw: (offset, length)
+            for raw, offset, length in _INDEX_ENTRY.iter_unpack(
+                mapping[index_offset:index_offset + count * _INDEX_ENTRY.size],
+            )
+        }
+        return meta, index
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored body for a hex key, or None."""
+        state = self._state
+        if state is None:
+            return None
+        entry = state[1].get(bytes.fromhex(key))
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        offset, length = entry
+        return state[0][offset:offset + length]
+
+    def close(self) -> None:
+        """Unmap the file; lookups miss from then on."""
+        state, self._state = self._state, None
+        self.path, self.meta = None, {}
+        if state is not None:
+            state[0].close()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of warehouse counters."""
+        state = self._state
+        with self._lock:
+            return {
+                "path": str(self.path) if self.path else None,
+                "entries": len(state[1]) if state is not None else 0,
+                "bytes": len(state[0]) if state is not None else 0,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
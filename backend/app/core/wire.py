@@ -0,0 +1,328 @@
+"""
+Binary wire format for render instructions.
+
+An alternative, content-negotiated encoding of ProjectionResponse and
+CurveResponse for slow networks and low-end clients. Compared with JSON it
+drops the repeated keys, sends coordinates as Float32, interns every string
+(styles, labels, step titles) once, and stores each element once however
+many cumulative steps draw it.
+
+Clients opt in with ``Accept: application/x-eg-render``; the decoder lives
+in frontend/src/lib/wire.ts and ``decode_wire()`` below is the reference.
+
+Layout (version 1, all integers little-endian, no padding):
+
+    offset  size  field
+    0       4     magic "EGRW"
+    4       1     version (1)
+    5       1     reserved (0)
+    6       2     total_steps (u16)
+    8       4     metadata length M (u32)
+    12      M     metadata as UTF-8 JSON (same object as the JSON response)
+    ..      4     string count S, then S × (u32 byte length, UTF-8 bytes)
+    ..      4     element count E, then E records:
+                    u8 type tag (0 line, 1 polygon, 2 point, 3 label,
+                                 4 arc, 5 arrow)
+                    the model's fields in declaration order:
+                      float  → f32
+                      string → u32 string id
+                      bool   → u8
+                      points → u32 count, then count × (f32 x, f32 y)
+    ..      4     step count N, then N × (u32 step_number, u32 title id,
+                  u32 description id, u32 range count G,
+                  G × (u32 start, u32 end))
+
+A step's elements are the element records in its ranges, in order
+(``start`` inclusive, ``end`` exclusive). Field orders per tag:
+
+    0 line     x1 y1 x2 y2 style
+    1 polygon  points style closed
+    2 point    x y label radius
+    3 label    x y text font_size
+    4 arc      center_x center_y radius start_angle end_angle
+    5 arrow    from_x from_y to_x to_y
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Iterable, Sequence
+
+from app.core.serialization import dumps
+from app.engine.packed import LAYOUTS, LAYOUT_BY_TYPE, ElementLayout
+from app.services.step_delta import common_prefix
+
+WIRE_MEDIA_TYPE = "application/x-eg-render"
+WIRE_MAGIC = b"EGRW"
+WIRE_VERSION = 1
+
+_STRUCT_CODES = {"f": "f", "s": "I", "b": "B"}
+
+
+def _record_struct(layout: ElementLayout) -> struct.Struct | None:
+    """Fixed-size record format (tag + fields), or None for polygons."""
+    if any(col == "p" for _, col in layout.fields):
+        return None
+    return struct.Struct("<B" + "".join(_STRUCT_CODES[col] for _, col in layout.fields))
+
+
+_RECORDS = {layout.code: _record_struct(layout) for layout in LAYOUTS}
+
+
+# ============================================================
+# Content negotiation
+# ============================================================
+
+def accepts_wire(accept: str | None) -> bool:
+    """True if an Accept header explicitly asks for the binary format."""
+    if not accept:
+        return False
+    for item in accept.split(","):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        if media_type.lower() != WIRE_MEDIA_TYPE:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+# ============================================================
+# Step segmentation
+# ============================================================
+
+def _truncate(segments: list[tuple[int, int]], count: int) -> list[tuple[int, int]]:
+    """First ``count`` elements of a range list."""
+    out = []
+    for start, end in segments:
+        if count <= 0:
+            break
+        take = min(end - start, count)
+        out.append((start, start + take))
+        count -= take
+    return out
+
+
+def segment_steps(steps: Sequence[dict]) -> tuple[list[dict], list[dict]]:
+    """
+    Turn cumulative StepInstruction dicts into an element table + ranges.
+
+    Each step reuses the longest prefix it shares with the previous step;
+    only the remainder is added to the table.
+
+    Returns:
+        Tuple of (element table, steps with ``segments`` instead of
+        ``elements``).
+    """
+    table: list[dict] = []
+    out: list[dict] = []
+    previous: list[dict] = []
+    segments: list[tuple[int, int]] = []
+    for step in steps:
+        elements = step["elements"]
+        keep = common_prefix(previous, elements)
+        segments = _truncate(segments, keep)
+        start = len(table)
+        table.extend(elements[keep:])
+        if len(table) > start:
+            segments.append((start, len(table)))
+        out.append({
+            "step_number": step["step_number"],
+            "title": step["title"],
+            "description": step["description"],
+            "segments": tuple(segments),
+        })
+        previous = elements
+    return table, out
+
+
+# ============================================================
+# Encoder
+# ============================================================
+
+def encode_wire(
+    elements: Iterable[dict],
+    steps: Iterable[dict],
+    metadata: dict[str, Any],
+    total_steps: int,
+) -> bytes:
+    """
+    Encode an element table and segmented steps (see segment_steps()).
+
+    Raises:
+        ValueError: If an element type is unknown.
+    """
+    strings: list[str] = []
+    string_ids: dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    records = []
+    count = 0
+    for element in elements:
+        layout = LAYOUT_BY_TYPE.get(element["type"])
+        if layout is None:
+            raise ValueError(f"Unknown render element type: {element['type']}")
+        values = []
+        for name, col in layout.fields:
+            value = element[name]
+            match col:
+                case "f":
+                    values.append(value)
+                case "s":
+                    values.append(intern(value))
+                case "b":
+                    values.append(1 if value else 0)
+                case "p":
+                    # Variable-length points come first (tag, count, xy pairs);
+                    # style id and closed flag follow as a fixed tail
+                    records.append(struct.pack("<BI", layout.code, len(value)))
+                    records.append(struct.pack(
+                        f"<{2 * len(value)}f",
+                        *(c for p in value for c in (p["x"], p["y"])),
+                    ))
+        record = _RECORDS[layout.code]
+        if record is not None:
+            records.append(record.pack(layout.code, *values))
+        else:
+            # Polygon tail: style id, closed flag
+            records.append(struct.pack("<IB", *values))
+        count += 1
+
+    step_records = []
+    step_list = list(steps)
+    for step in step_list:
+        segments = step["segments"]
+        step_records.append(struct.pack(
+            "<4I", step["step_number"], intern(step["title"]),
+            intern(step["description"]), len(segments),
+        ))
+        step_records.append(struct.pack(
+            f"<{2 * len(segments)}I", *(i for seg in segments for i in seg),
+        ))
+
+    meta = dumps(metadata)
+    out = [
+        WIRE_MAGIC,
+        struct.pack("<BBHI", WIRE_VERSION, 0, total_steps, len(meta)),
+        meta,
+        struct.pack("<I", len(strings)),
+    ]
+    for text in strings:
+        encoded = text.encode("utf-8")
+        out.append(struct.pack("<I", len(encoded)))
+        out.append(encoded)
+    out.append(struct.pack("<I", count))
+    out.extend(records)
+    out.append(struct.pack("<I", len(step_list)))
+    out.extend(step_records)
+    return b"".join(out)
+
+
+def encode_wire_steps(
+    steps: Sequence[dict],
+    metadata: dict[str, Any],
+    total_steps: int | None = None,
+) -> bytes:
+    """Encode ordinary StepInstruction dicts."""
+    table, segmented = segment_steps(steps)
+    return encode_wire(
+        table, segmented, metadata,
+        len(steps) if total_steps is None else total_steps,
+    )
+
+
+# ============================================================
+# Reference decoder
+# ============================================================
+
+def decode_wire(data: bytes) -> dict[str, Any]:
+    """
+    Decode the binary format back to the JSON response shape.
+
+    Coordinates come back as Float32-rounded values.
+
+    Raises:
+        ValueError: If the data is not a wire payload of a known version.
+    """
+    view = memoryview(data)
+    if bytes(view[:4]) != WIRE_MAGIC:
+        raise ValueError("Not an EG render payload")
+    version, _, total_steps, meta_len = struct.unpack_from("<BBHI", view, 4)
+    if version != WIRE_VERSION:
+        raise ValueError(f"Unsupported wire version {version}")
+    offset = 12
+    metadata = json.loads(bytes(view[offset:offset + meta_len]).decode("utf-8"))
+    offset += meta_len
+
+    (n_strings,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    strings = []
+    for _ in range(n_strings):
+        (length,) = struct.unpack_from("<I", view, offset)
+        offset += 4
+        strings.append(bytes(view[offset:offset + length]).decode("utf-8"))
+        offset += length
+
+    (n_elements,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    elements = []
+    for _ in range(n_elements):
+        layout = LAYOUTS[view[offset]]
+        offset += 1
+        element: dict[str, Any] = {"type": layout.type}
+        for name, col in layout.fields:
+            match col:
+                case "f":
+                    (element[name],) = struct.unpack_from("<f", view, offset)
+                    offset += 4
+                case "s":
+                    (string_id,) = struct.unpack_from("<I", view, offset)
+                    element[name] = strings[string_id]
+                    offset += 4
+                case "b":
+                    element[name] = bool(view[offset])
+                    offset += 1
+                case "p":
+                    (n_points,) = struct.unpack_from("<I", view, offset)
+                    offset += 4
+                    flat = struct.unpack_from(f"<{2 * n_points}f", view, offset)
+                    offset += 8 * n_points
+                    element[name] = [
+                        {"x": flat[k], "y": flat[k + 1]}
+                        for k in range(0, len(flat), 2)
+                    ]
+        elements.append(element)
+
+    (n_steps,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    steps = []
+    for _ in range(n_steps):
+        number, title_id, description_id, n_segments = struct.unpack_from(
+            "<4I", view, offset,
+        )
+        offset += 16
+        flat = struct.unpack_from(f"<{2 * n_segments}I", view, offset)
+        offset += 8 * n_segments
+        steps.append({
+            "step_number": number,
+            "title": strings[title_id],
+            "description": strings[description_id],
+            "elements": [
+                elements[i]
+                for start, end in zip(flat[0::2], flat[1::2])
+                for i in range(start, end)
+            ],
+        })
+    return {"total_steps": total_steps, "steps": steps, "metadata": metadata}
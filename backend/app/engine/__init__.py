@@ -0,0 +1,10 @@
+"""
+Geometry engines: projection cases (cases/), curve constructions (curves/)
+and the render primitives they emit.
+"""
+
+# Version of the engine output. Bump whenever the same request would
+# render differently (geometry, step structure, element styles); it is
+# folded into HTTP ETags and the thumbnail cache key so clients and the
+# disk cache never keep drawings from older code.
+ENGINE_VERSION = 1
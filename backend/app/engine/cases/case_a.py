@@ -18,12 +18,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from app.engine.config import DrawingConfig
 from app.engine.geometry import Point, degrees_to_radians
-from app.engine.renderer import RenderBuilder
+from app.engine.phase_cache import PhaseCache, PhaseKey, phase_corners, phase_one_key
+from app.engine.renderer import RenderBuilder, select_steps
 from app.engine.solids import Solid
+from app.engine.spans import span, timed
 
 
 # ============================================================
@@ -36,7 +38,7 @@ class CaseACorners:
     Stores all computed corner positions for Case A.
 
     Direct equivalent of state.corners in core.js:26.
-    Populated during top view computation, consumed by projectors and front view.
+    Populated by the geometry stage, consumed by every drawing routine.
     """
     # Top View
     top_view: list[Point] = field(default_factory=list)
@@ -93,17 +95,26 @@ class CaseAEngine:
 
     TOTAL_STEPS = 5  # core.js:351
 
-    def __init__(self, solid: Solid, config: DrawingConfig) -> None:
+    def __init__(
+        self,
+        solid: Solid,
+        config: DrawingConfig,
+        builder: RenderBuilder | None = None,
+        phase_cache: PhaseCache | None = None,
+    ) -> None:
         self.solid = solid
         self.config = config
         self.corners = CaseACorners()
-        self.builder = RenderBuilder(config)
+        self.builder = builder if builder is not None else RenderBuilder(config)
+        self.phase_cache = phase_cache
+        self.phase_key: PhaseKey = ()
 
     def compute_all_steps(
         self,
         base_edge: float,
         axis_length: float,
         edge_angle: float,
+        steps: Iterable[int] | None = None,
     ) -> list[dict]:
         """
         Compute all 5 steps of Case A projection.
@@ -115,28 +126,74 @@ class CaseAEngine:
             base_edge: Length of one base edge.
             axis_length: Length of solid axis.
             edge_angle: Edge angle with VP in degrees.
+            steps: Step numbers to render (default: all).
 
         Returns:
-            List of StepInstruction dicts (5 steps).
+            List of StepInstruction dicts (5 steps, or the selected ones).
         """
         sides = self.solid.sides
-        edge_angle_rad = degrees_to_radians(edge_angle)
 
         # Pre-compute geometry (needed for all steps from 3 onward)
-        self._compute_top_view(base_edge, edge_angle_rad)
+        self._compute_corners(base_edge, axis_length, edge_angle)
+
+        rendered: list[dict] = []
+
+        with span("render"):
+            for step in select_steps(self.TOTAL_STEPS, steps):
+                self.builder.reset()
+                self._build_step(step, base_edge, axis_length, edge_angle, sides)
+                rendered.append(self.builder.build_step(
+                    step_number=step,
+                    title=self._step_title(step, sides),
+                    description=self._step_description(step, edge_angle, sides),
+                ))
 
-        steps: list[dict] = []
+        return rendered
+
+    def step_outline(
+        self,
+        base_edge: float,
+        axis_length: float,
+        edge_angle: float,
+    ) -> list[dict]:
+        """
+        Step numbers, titles and descriptions without any geometry.
 
-        for step in range(1, self.TOTAL_STEPS + 1):
-            self.builder.reset()
-            self._build_step(step, base_edge, axis_length, edge_angle, sides)
-            steps.append(self.builder.build_step(
-                step_number=step,
-                title=self._step_title(step, sides),
-                description=self._step_description(step, edge_angle, sides),
-            ))
+        Takes the same arguments as compute_all_steps().
+        """
+        sides = self.solid.sides
+        return [
+            {
+                "step_number": step,
+                "title": self._step_title(step, sides),
+                "description": self._step_description(step, edge_angle, sides),
+            }
+            for step in range(1, self.TOTAL_STEPS + 1)
+        ]
+
+    @timed("phase1")
+    def _compute_corners(
+        self,
+        base_edge: float,
+        axis_length: float,
+        edge_angle: float,
+    ) -> None:
+        """
+        Geometry stage: top view and front view corners.
 
-        return steps
+        Fetched from the phase cache when one is set (see phase_cache.py);
+        the cached corner set is shared and only read from here on.
+        """
+        def compute() -> CaseACorners:
+            self.corners = CaseACorners()
+            self._compute_top_view(base_edge, degrees_to_radians(edge_angle))
+            self._compute_front_view(axis_length)
+            return self.corners
+
+        self.phase_key = phase_one_key(
+            self.solid.solid_type, base_edge, axis_length, edge_angle, self.config,
+        )
+        self.corners = phase_corners(self.phase_cache, self.phase_key, compute)
 
     def _compute_top_view(self, base_edge: float, edge_angle_rad: float) -> None:
         """Pre-compute top view vertices and store in self.corners."""
@@ -158,6 +215,48 @@ class CaseAEngine:
         if self.solid.is_pyramid:
             self.corners.apex = centroid
 
+    def _compute_front_view(self, axis_length: float) -> None:
+        """
+        Pre-compute front view corners and store in self.corners.
+
+        Port of the corner construction in caseA.js:365-382 (prism) and
+        caseA.js:500-515 (pyramid). Reused by Case C as its initial FV.
+        """
+        points = self.corners.top_view
+        cfg = self.config
+
+        if self.solid.is_prism and self.corners.center:
+            self.corners.front_view_base = [
+                {
+                    "x": pt.x, "y": cfg.xy_line_y,
+                    "label": _prism_fv_base_label(i),
+                    "tv_y": pt.y,
+                }
+                for i, pt in enumerate(points)
+            ]
+            self.corners.front_view_top = [
+                {
+                    "x": pt.x, "y": cfg.xy_line_y - axis_length,
+                    "label": _prism_fv_top_label(i),
+                    "tv_y": pt.y,
+                }
+                for i, pt in enumerate(points)
+            ]
+        elif self.solid.is_pyramid and self.corners.apex:
+            self.corners.front_view_base = [
+                {
+                    "x": pt.x, "y": cfg.xy_line_y,
+                    "label": _pyramid_fv_base_label(i),
+                    "tv_y": pt.y,
+                }
+                for i, pt in enumerate(points)
+            ]
+            self.corners.front_view_apex = {
+                "x": self.corners.apex.x,
+                "y": cfg.xy_line_y - axis_length,
+                "label": "o'",
+            }
+
     def _build_step(
         self,
         step: int,
@@ -376,25 +475,9 @@ class CaseAEngine:
 
         center_y = center.y
 
-        # Build FV corners (caseA.js:365-382)
-        base_corners = []
-        top_corners = []
-        for i in range(n):
-            pt = points[i]
-            base_corners.append({
-                "x": pt.x, "y": cfg.xy_line_y,
-                "label": _prism_fv_base_label(i),
-                "tv_y": pt.y,
-            })
-            top_corners.append({
-                "x": pt.x, "y": cfg.xy_line_y - axis_length,
-                "label": _prism_fv_top_label(i),
-                "tv_y": pt.y,
-            })
-
-        # Store for Case C reuse
-        self.corners.front_view_base = base_corners
-        self.corners.front_view_top = top_corners
+        # FV corners (caseA.js:365-382), built by _compute_front_view()
+        base_corners = self.corners.front_view_base
+        top_corners = self.corners.front_view_top
 
         # Visibility detection (caseA.js:388-393)
         is_hidden = [points[i].y < center_y for i in range(n)]
@@ -488,25 +571,9 @@ class CaseAEngine:
 
         center_y = apex_tv.y  # caseA.js:496
 
-        # Build FV base corners (caseA.js:500-508)
-        base_corners = []
-        for i in range(n):
-            base_corners.append({
-                "x": points[i].x, "y": cfg.xy_line_y,
-                "label": _pyramid_fv_base_label(i),
-                "tv_y": points[i].y,
-            })
-
-        # Apex in FV (caseA.js:511-515)
-        apex_fv = {
-            "x": apex_tv.x,
-            "y": cfg.xy_line_y - axis_length,
-            "label": "o'",
-        }
-
-        # Store for Case C reuse
-        self.corners.front_view_base = base_corners
-        self.corners.front_view_apex = apex_fv
+        # FV corners (caseA.js:500-515), built by _compute_front_view()
+        base_corners = self.corners.front_view_base
+        apex_fv = self.corners.front_view_apex
 
         # Visibility detection (caseA.js:522-525)
         is_hidden = [points[i].y < center_y for i in range(n)]
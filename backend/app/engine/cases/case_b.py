@@ -25,12 +25,13 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from app.engine.config import DrawingConfig
 from app.engine.geometry import Point, degrees_to_radians
-from app.engine.renderer import RenderBuilder
+from app.engine.renderer import RenderBuilder, select_steps
 from app.engine.solids import Solid
+from app.engine.spans import span
 
 
 # ============================================================
@@ -100,17 +101,23 @@ class CaseBEngine:
 
     TOTAL_STEPS = 5
 
-    def __init__(self, solid: Solid, config: DrawingConfig) -> None:
+    def __init__(
+        self,
+        solid: Solid,
+        config: DrawingConfig,
+        builder: RenderBuilder | None = None,
+    ) -> None:
         self.solid = solid
         self.config = config
         self.corners = CaseBCorners()
-        self.builder = RenderBuilder(config)
+        self.builder = builder if builder is not None else RenderBuilder(config)
 
     def compute_all_steps(
         self,
         base_edge: float,
         axis_length: float,
         edge_angle: float,
+        steps: Iterable[int] | None = None,
     ) -> list[dict]:
         """
         Compute all 5 steps of Case B projection.
@@ -119,9 +126,10 @@ class CaseBEngine:
             base_edge: Length of one base edge.
             axis_length: Length of solid axis.
             edge_angle: Edge angle with HP in degrees.
+            steps: Step numbers to render (default: all).
 
         Returns:
-            List of StepInstruction dicts (5 steps).
+            List of StepInstruction dicts (5 steps, or the selected ones).
         """
         sides = self.solid.sides
         edge_angle_rad = degrees_to_radians(edge_angle)
@@ -129,18 +137,40 @@ class CaseBEngine:
         # Pre-compute true shape polygon in FV area
         self._compute_front_view(base_edge, edge_angle_rad)
 
-        steps: list[dict] = []
+        rendered: list[dict] = []
+
+        with span("render"):
+            for step in select_steps(self.TOTAL_STEPS, steps):
+                self.builder.reset()
+                self._build_step(step, base_edge, axis_length, edge_angle, sides)
+                rendered.append(self.builder.build_step(
+                    step_number=step,
+                    title=self._step_title(step, sides),
+                    description=self._step_description(step, edge_angle, sides),
+                ))
 
-        for step in range(1, self.TOTAL_STEPS + 1):
-            self.builder.reset()
-            self._build_step(step, base_edge, axis_length, edge_angle, sides)
-            steps.append(self.builder.build_step(
-                step_number=step,
-                title=self._step_title(step, sides),
-                description=self._step_description(step, edge_angle, sides),
-            ))
+        return rendered
+
+    def step_outline(
+        self,
+        base_edge: float,
+        axis_length: float,
+        edge_angle: float,
+    ) -> list[dict]:
+        """
+        Step numbers, titles and descriptions without any geometry.
 
-        return steps
+        Takes the same arguments as compute_all_steps().
+        """
+        sides = self.solid.sides
+        return [
+            {
+                "step_number": step,
+                "title": self._step_title(step, sides),
+                "description": self._step_description(step, edge_angle, sides),
+            }
+            for step in range(1, self.TOTAL_STEPS + 1)
+        ]
 
     def _compute_front_view(self, base_edge: float, edge_angle_rad: float) -> None:
         """
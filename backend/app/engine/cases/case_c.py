@@ -17,22 +17,31 @@ Functions ported:
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
 
 from app.engine.config import DrawingConfig
 from app.engine.geometry import (
     Point,
-    convex_hull,
+    as_points_array,
     build_hull_set,
+    coincident_points,
+    convex_hull_indices,
     degrees_to_radians,
-    is_edge_on_hull,
+    get_sides_count,
+    hull_edge_mask,
+    hull_edge_mask_by_index,
     is_on_convex_hull,
-    point_in_polygon,
-    segments_intersect,
+    points_in_polygon,
+    rotate_points,
+    segments_intersect_matrix,
 )
-from app.engine.renderer import RenderBuilder
+from app.engine.phase_cache import PhaseCache, PhaseKey, phase_corners
+from app.engine.renderer import LayerCache, RenderBuilder, select_steps
 from app.engine.solids import Solid
+from app.engine.spans import span, timed
 from app.engine.cases.case_a import CaseAEngine
 
 
@@ -65,15 +74,48 @@ class CaseCEngine:
 
     Phase I (steps 1-5): Reuses CaseAEngine with auto-computed β.
     Phase II (steps 6-8): Final FV, projectors/loci, final TV.
+
+    Geometry is computed once per request — or fetched per phase from the
+    phase cache (see phase_cache.py) — and each construction is a recorded
+    layer (see LayerCache) that steps replay.
     """
 
     TOTAL_STEPS = 8  # core.js:357-358
 
-    def __init__(self, solid: Solid, config: DrawingConfig) -> None:
+    # β for resting on a base corner, by side count (caseC.js:22-28)
+    CORNER_BETA: dict[int, float] = {
+        3: 270.0,  # Triangle: vertical edge on LEFT, corner on RIGHT
+        4: 45.0,   # Square: 45°
+        5: 270.0,  # Pentagon: vertical edge on LEFT, corner on RIGHT
+        6: 0.0,    # Hexagon: horizontal edge
+    }
+
+    # Layers drawn at each step (caseC.js:47-127). Phase II steps start
+    # from the complete Phase I drawing (caseC.js:98-106).
+    STEP_LAYERS: dict[int, tuple[str, ...]] = {
+        1: ("xy",),
+        2: ("xy", "angle"),
+        3: ("xy", "initial_tv"),
+        4: ("xy", "initial_tv", "initial_projectors"),
+        5: ("xy", "initial_tv", "initial_fv"),
+        6: ("xy", "initial_tv", "initial_fv", "final_fv"),
+        7: ("xy", "initial_tv", "initial_fv", "final_fv", "loci"),
+        8: ("xy", "initial_tv", "initial_fv", "final_fv", "loci", "final_tv"),
+    }
+
+    def __init__(
+        self,
+        solid: Solid,
+        config: DrawingConfig,
+        builder: RenderBuilder | None = None,
+        phase_cache: PhaseCache | None = None,
+    ) -> None:
         self.solid = solid
         self.config = config
         self.corners = CaseCCorners()
-        self.builder = RenderBuilder(config)
+        self.builder = builder if builder is not None else RenderBuilder(config)
+        self.phase_cache = phase_cache
+        self.phase_key: PhaseKey = ()
 
     @staticmethod
     def auto_compute_beta(solid_type: str, resting_on: str) -> float:
@@ -89,7 +131,6 @@ class CaseCEngine:
         Returns:
             Beta angle in degrees.
         """
-        from app.engine.geometry import get_sides_count
         sides = get_sides_count(solid_type)
 
         if resting_on == "base-edge":
@@ -97,13 +138,7 @@ class CaseCEngine:
             return 90.0
         elif resting_on == "base-corner":
             # caseC.js:22-28 — shape-specific β
-            beta_map = {
-                3: 270.0,  # Triangle: vertical edge on LEFT, corner on RIGHT
-                4: 45.0,   # Square: 45°
-                5: 270.0,  # Pentagon: vertical edge on LEFT, corner on RIGHT
-                6: 0.0,    # Hexagon: horizontal edge
-            }
-            return beta_map.get(sides, 0.0)
+            return CaseCEngine.CORNER_BETA.get(sides, 0.0)
 
         # Default (caseC.js:31)
         return 90.0
@@ -115,6 +150,7 @@ class CaseCEngine:
         edge_angle: float,
         axis_angle_hp: float,
         resting_on: str,
+        steps: Iterable[int] | None = None,
     ) -> list[dict]:
         """
         Compute all 8 steps of Case C projection.
@@ -127,148 +163,99 @@ class CaseCEngine:
             edge_angle: Original edge angle (saved/restored per caseC.js:43,131).
             axis_angle_hp: Axis inclination with HP in degrees.
             resting_on: Resting condition ('base-edge' or 'base-corner').
+            steps: Step numbers to render (default: all).
 
         Returns:
-            List of StepInstruction dicts (8 steps).
+            List of StepInstruction dicts (8 steps, or the selected ones).
         """
         # Auto-compute β for Phase I (caseC.js:43-44)
         beta = self.auto_compute_beta(self.solid.solid_type, resting_on)
 
-        # Create CaseA engine for Phase I
-        case_a = CaseAEngine(self.solid, self.config)
-        edge_angle_rad = degrees_to_radians(beta)
-        case_a._compute_top_view(base_edge, edge_angle_rad)
-
-        steps: list[dict] = []
-
-        for step in range(1, self.TOTAL_STEPS + 1):
-            self.builder.reset()
-
-            if step <= 5:
-                # Phase I: reuse Case A (caseC.js:47-93)
-                self._build_phase1_step(
-                    step, case_a, base_edge, axis_length, beta, resting_on,
-                )
-            else:
-                # Phase II: draw all Phase I first (caseC.js:98-106)
-                self._draw_all_phase1(case_a, base_edge, axis_length, beta)
-
-                # Then add Phase II elements (caseC.js:108-127)
-                self._build_phase2_step(
-                    step, case_a, base_edge, axis_length, axis_angle_hp,
-                )
-
-            steps.append(self.builder.build_step(
-                step_number=step,
-                title=self._step_title(step, axis_angle_hp, resting_on),
-                description=self._step_description(
-                    step, beta, axis_angle_hp, resting_on,
-                ),
-            ))
+        # Geometry stage: Phase I corners from a Case A engine, then Phase II
+        case_a = CaseAEngine(self.solid, self.config, phase_cache=self.phase_cache)
+        case_a._compute_corners(base_edge, axis_length, beta)
+        self._compute_corners(case_a, base_edge, axis_angle_hp)
 
-        return steps
+        layers = self._phase_layers(case_a, axis_length, beta)
 
-    # ----------------------------------------------------------
-    # Phase I (caseC.js:47-93)
-    # ----------------------------------------------------------
+        rendered: list[dict] = []
+
+        # Render stage: replay the cached layers each step is made of
+        with span("render"):
+            for step in select_steps(self.TOTAL_STEPS, steps):
+                self.builder.reset()
+                layers.replay(self.STEP_LAYERS[step])
+                rendered.append(self.builder.build_step(
+                    step_number=step,
+                    title=self._step_title(step, axis_angle_hp, resting_on),
+                    description=self._step_description(
+                        step, beta, axis_angle_hp, resting_on,
+                    ),
+                ))
 
-    def _build_phase1_step(
+        return rendered
+
+    def step_outline(
         self,
-        step: int,
-        case_a: CaseAEngine,
         base_edge: float,
         axis_length: float,
-        beta: float,
+        edge_angle: float,
+        axis_angle_hp: float,
         resting_on: str,
-    ) -> None:
-        """Build Phase I step using Case A engine."""
-        case_a.builder = self.builder  # Share the builder
-        sides = self.solid.sides
-
-        match step:
-            case 1:  # caseC.js:51-55
-                self.builder.add_xy_line()
-            case 2:  # caseC.js:56-61
-                self.builder.add_xy_line()
-                self.builder.add_angle_indicator(beta)
-            case 3:  # caseC.js:62-68
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-            case 4:  # caseC.js:69-80
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                    case_a._add_projectors_prism(axis_length)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-                    case_a._add_projectors_pyramid(axis_length)
-            case 5:  # caseC.js:81-92
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                    case_a._add_front_view_prism(axis_length)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-                    case_a._add_front_view_pyramid(axis_length)
-
-    def _draw_all_phase1(
-        self,
-        case_a: CaseAEngine,
-        base_edge: float,
-        axis_length: float,
-        beta: float,
-    ) -> None:
-        """Draw all Phase I elements (called before every Phase II step)."""
-        case_a.builder = self.builder
-        self.builder.add_xy_line()
-        if self.solid.is_prism:
-            case_a._add_top_view_prism(beta)
-            case_a._add_front_view_prism(axis_length)
-        elif self.solid.is_pyramid:
-            case_a._add_top_view_pyramid()
-            case_a._add_front_view_pyramid(axis_length)
+    ) -> list[dict]:
+        """
+        Step numbers, titles and descriptions without any geometry.
+
+        Takes the same arguments as compute_all_steps().
+        """
+        beta = self.auto_compute_beta(self.solid.solid_type, resting_on)
+        return [
+            {
+                "step_number": step,
+                "title": self._step_title(step, axis_angle_hp, resting_on),
+                "description": self._step_description(
+                    step, beta, axis_angle_hp, resting_on,
+                ),
+            }
+            for step in range(1, self.TOTAL_STEPS + 1)
+        ]
 
     # ----------------------------------------------------------
-    # Phase II (caseC.js:96-128)
+    # Geometry (caseC.js:137-215, 553-591)
     # ----------------------------------------------------------
 
-    def _build_phase2_step(
+    @timed("phase2")
+    def _compute_corners(
         self,
-        step: int,
         case_a: CaseAEngine,
         base_edge: float,
-        axis_length: float,
         axis_angle_hp: float,
     ) -> None:
-        """Build Phase II step (steps 6-8)."""
-        match step:
-            case 6:  # caseC.js:109-113
-                self._final_fv(case_a, base_edge, axis_angle_hp)
-            case 7:  # caseC.js:114-119
-                self._final_fv(case_a, base_edge, axis_angle_hp)
-                self._projectors_and_loci(case_a)
-            case 8:  # caseC.js:120-127
-                self._final_fv(case_a, base_edge, axis_angle_hp)
-                self._projectors_and_loci(case_a)
-                self._final_tv(case_a)
+        """
+        Geometry stage for Phase II: final FV and final TV corners.
 
-    # ----------------------------------------------------------
-    # Final FV (caseC.js:137-362)
-    # ----------------------------------------------------------
+        Keyed on the Phase I key plus axis_angle_hp (base_edge is already
+        part of it); the cached corner set is shared and only read.
+        """
+        def compute() -> CaseCCorners:
+            self.corners = CaseCCorners()
+            self._compute_final_fv(case_a, base_edge, axis_angle_hp)
+            self._compute_final_tv(case_a)
+            return self.corners
+
+        self.phase_key = case_a.phase_key + ("II", axis_angle_hp)
+        self.corners = phase_corners(self.phase_cache, self.phase_key, compute)
 
-    def _final_fv(
+    def _compute_final_fv(
         self,
         case_a: CaseAEngine,
         base_edge: float,
         axis_angle_hp: float,
     ) -> None:
         """
-        Compute and render the final front view (rotated).
+        Rotate the initial FV about its pivot (caseC.js:137-215).
 
-        Direct port of drawCaseC_FinalFrontView() from caseC.js:137-362.
+        Stores the final FV corners; drawing is left to _final_fv().
         """
         theta = degrees_to_radians(axis_angle_hp)
         offset = 45.0 + 2.0 * base_edge  # caseC.js:141
@@ -292,21 +279,16 @@ class CaseCEngine:
         pivot_x = init_base[pivot_idx]["x"]
         pivot_y = init_base[pivot_idx]["y"]
 
-        def rotate_around_pivot(px: float, py: float) -> tuple[float, float]:
-            """Port of rotateAroundPivot() from caseC.js:161-172."""
-            dx = px - pivot_x
-            dy = py - pivot_y
-            cos_t = math.cos(theta)
-            sin_t = math.sin(theta)
-            return (
-                pivot_x + dx * cos_t - dy * sin_t,
-                pivot_y + dx * sin_t + dy * cos_t,
-            )
+        # Rotate every corner about the pivot in one pass — port of
+        # rotateAroundPivot() from caseC.js:161-172
+        rot_base = rotate_points(
+            as_points_array(init_base), pivot_x, pivot_y, theta,
+        ).tolist()
 
         # Compute final base corners (caseC.js:175-184)
         final_base = []
         for i in range(n):
-            rx, ry = rotate_around_pivot(init_base[i]["x"], init_base[i]["y"])
+            rx, ry = rot_base[i]
             final_base.append({
                 "x": rx + offset, "y": ry,
                 "label": f"{i + 1}₁'",
@@ -318,9 +300,12 @@ class CaseCEngine:
         final_apex = None
 
         if self.solid.is_prism and init_top:
+            rot_top = rotate_points(
+                as_points_array(init_top), pivot_x, pivot_y, theta,
+            ).tolist()
             final_top = []
             for i in range(n):
-                rx, ry = rotate_around_pivot(init_top[i]["x"], init_top[i]["y"])
+                rx, ry = rot_top[i]
                 final_top.append({
                     "x": rx + offset, "y": ry,
                     "label": f"{chr(97 + i)}₁'",
@@ -328,7 +313,9 @@ class CaseCEngine:
                 })
 
         if self.solid.is_pyramid and init_apex:
-            rx, ry = rotate_around_pivot(init_apex["x"], init_apex["y"])
+            (rx, ry), = rotate_points(
+                as_points_array([init_apex]), pivot_x, pivot_y, theta,
+            ).tolist()
             final_apex = {
                 "x": rx + offset, "y": ry,
                 "label": "o₁'",
@@ -340,6 +327,132 @@ class CaseCEngine:
         self.corners.final_fv_apex = final_apex
         self.corners.final_fv_pivot_offset = offset
 
+    def _compute_final_tv(self, case_a: CaseAEngine) -> None:
+        """
+        Intersect FV projectors with TV loci (caseC.js:553-591).
+
+        Stores the final TV corners; drawing is left to
+        _projectors_and_loci() and _final_tv().
+        """
+        init_tv = case_a.corners.top_view
+        init_apex = case_a.corners.apex
+
+        final_fv_base = self.corners.final_fv_base
+        final_fv_top = self.corners.final_fv_top
+        final_fv_apex = self.corners.final_fv_apex
+
+        if not init_tv or not final_fv_base:
+            return
+
+        n = len(init_tv)
+
+        final_tv = []
+        for i in range(n):
+            # finalTV[i].x = finalFVBase[i].x, finalTV[i].y = initTV[i].y
+            # (caseC.js:558-563)
+            final_tv.append({
+                "x": final_fv_base[i]["x"],
+                "y": init_tv[i].y,
+                "label": f"{i + 1}₁",
+                "is_base": True,
+            })
+
+        final_tv_top = None
+        final_tv_apex = None
+
+        if self.solid.is_prism and final_fv_top:
+            # caseC.js:569-578
+            final_tv_top = []
+            for i in range(n):
+                final_tv_top.append({
+                    "x": final_fv_top[i]["x"],
+                    "y": init_tv[i].y,  # Same y as base (coincide in Case A TV)
+                    "label": f"{chr(97 + i)}₁",
+                })
+
+        if self.solid.is_pyramid and final_fv_apex and init_apex:
+            # caseC.js:580-586
+            final_tv_apex = {
+                "x": final_fv_apex["x"],
+                "y": init_apex.y,
+                "label": "o₁",
+            }
+
+        # Store (caseC.js:589-591)
+        self.corners.final_tv = final_tv
+        self.corners.final_tv_top = final_tv_top
+        self.corners.final_tv_apex = final_tv_apex
+
+    # ----------------------------------------------------------
+    # Layers (caseC.js:47-127)
+    # ----------------------------------------------------------
+
+    def _phase_layers(
+        self,
+        case_a: CaseAEngine,
+        axis_length: float,
+        beta: float,
+    ) -> LayerCache:
+        """
+        Register the Phase I and Phase II constructions as layers.
+
+        Phase I reuses Case A's drawing routines with β (caseC.js:47-93);
+        Phase II adds the final FV, projectors/loci and final TV
+        (caseC.js:108-127). All corners are computed beforehand, so the
+        layers only draw.
+        """
+        case_a.builder = self.builder  # Share the builder
+        layers = LayerCache(self.builder)
+
+        def initial_tv() -> None:
+            if self.solid.is_prism:
+                case_a._add_top_view_prism(beta)
+            elif self.solid.is_pyramid:
+                case_a._add_top_view_pyramid()
+
+        def initial_projectors() -> None:
+            if self.solid.is_prism:
+                case_a._add_projectors_prism(axis_length)
+            elif self.solid.is_pyramid:
+                case_a._add_projectors_pyramid(axis_length)
+
+        def initial_fv() -> None:
+            if self.solid.is_prism:
+                case_a._add_front_view_prism(axis_length)
+            elif self.solid.is_pyramid:
+                case_a._add_front_view_pyramid(axis_length)
+
+        layers.define("xy", self.builder.add_xy_line)
+        layers.define("angle", lambda: self.builder.add_angle_indicator(beta))
+        layers.define("initial_tv", initial_tv)
+        layers.define("initial_projectors", initial_projectors)
+        layers.define("initial_fv", initial_fv)
+        layers.define("final_fv", lambda: self._final_fv(case_a))
+        layers.define("loci", lambda: self._projectors_and_loci(case_a))
+        layers.define("final_tv", lambda: self._final_tv(case_a))
+        return layers
+
+    # ----------------------------------------------------------
+    # Final FV (caseC.js:137-362)
+    # ----------------------------------------------------------
+
+    @timed("final_fv")
+    def _final_fv(self, case_a: CaseAEngine) -> None:
+        """
+        Render the final front view (rotated).
+
+        Direct port of drawCaseC_FinalFrontView() from caseC.js:137-362;
+        the corners come from _compute_final_fv().
+        """
+        final_base = self.corners.final_fv_base
+        final_top = self.corners.final_fv_top
+        final_apex = self.corners.final_fv_apex
+
+        if not final_base:
+            return
+
+        n = len(final_base)
+
         # Visibility detection: same TV-based logic (caseC.js:239-267)
         center_y = (
             case_a.corners.center.y if case_a.corners.center
@@ -479,9 +592,10 @@ class CaseCEngine:
     # Projectors and Loci (caseC.js:460-619)
     # ----------------------------------------------------------
 
+    @timed("projectors_and_loci")
     def _projectors_and_loci(self, case_a: CaseAEngine) -> None:
         """
-        Compute projectors, loci, and intersection points for final TV.
+        Render projectors, loci, and intersection points for final TV.
 
         Direct port of drawCaseC_ProjectorsAndLoci() from caseC.js:460-619.
         """
@@ -496,8 +610,6 @@ class CaseCEngine:
         if not init_tv or not final_fv_base:
             return
 
-        n = len(init_tv)
-
         # Compute extents for projector/loci lines (caseC.js:478-498)
         max_tv_y = max(pt.y for pt in init_tv)
         if init_center and init_center.y > max_tv_y:
@@ -533,43 +645,11 @@ class CaseCEngine:
         if self.solid.is_pyramid and init_apex:
             self.builder.add_line(init_apex.x, init_apex.y, max_fv_x, init_apex.y, style="construction")
 
-        # 3. Compute intersection points — final TV corners (caseC.js:553-591)
-        final_tv = []
-        for i in range(n):
-            # finalTV[i].x = finalFVBase[i].x, finalTV[i].y = initTV[i].y
-            # (caseC.js:558-563)
-            final_tv.append({
-                "x": final_fv_base[i]["x"],
-                "y": init_tv[i].y,
-                "label": f"{i + 1}₁",
-                "is_base": True,
-            })
-
-        final_tv_top = None
-        final_tv_apex = None
-
-        if self.solid.is_prism and final_fv_top:
-            # caseC.js:569-578
-            final_tv_top = []
-            for i in range(n):
-                final_tv_top.append({
-                    "x": final_fv_top[i]["x"],
-                    "y": init_tv[i].y,  # Same y as base (coincide in Case A TV)
-                    "label": f"{chr(97 + i)}₁",
-                })
-
-        if self.solid.is_pyramid and final_fv_apex and init_apex:
-            # caseC.js:580-586
-            final_tv_apex = {
-                "x": final_fv_apex["x"],
-                "y": init_apex.y,
-                "label": "o₁",
-            }
-
-        # Store (caseC.js:589-591)
-        self.corners.final_tv = final_tv
-        self.corners.final_tv_top = final_tv_top
-        self.corners.final_tv_apex = final_tv_apex
+        # 3. Intersection points — final TV corners (caseC.js:553-591),
+        # computed by _compute_final_tv()
+        final_tv = self.corners.final_tv
+        final_tv_top = self.corners.final_tv_top
+        final_tv_apex = self.corners.final_tv_apex
 
         # 4. Mark intersection points (caseC.js:593-618)
         for pt in final_tv:
@@ -586,6 +666,7 @@ class CaseCEngine:
     # Final Top View (caseC.js:624-835)
     # ----------------------------------------------------------
 
+    @timed("final_tv")
     def _final_tv(self, case_a: CaseAEngine) -> None:
         """
         Compute and render the final top view with visibility.
@@ -607,6 +688,26 @@ class CaseCEngine:
         elif self.solid.is_pyramid and final_tv_apex:
             self._final_tv_pyramid(final_tv, final_tv_apex, n)
 
+    @staticmethod
+    def _hull_edges(
+        corners: np.ndarray, hull_idx: np.ndarray, edges: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Hull-edge membership of edges given as corner index pairs.
+
+        Decided by index lookup, except for edges touching a corner that
+        coincides with another one (base and top at α = 0°): those fall
+        back to coordinate matching, like is_edge_on_hull().
+        """
+        on_hull = hull_edge_mask_by_index(edges, hull_idx)
+        fallback = coincident_points(corners)[edges].any(axis=1)
+        if fallback.any():
+            on_hull[fallback] = hull_edge_mask(
+                corners[edges[fallback, 0]], corners[edges[fallback, 1]],
+                corners[hull_idx],
+            )
+        return on_hull
+
     def _final_tv_prism(
         self,
         final_tv: list[dict],
@@ -626,17 +727,18 @@ class CaseCEngine:
         4. Longer edges → hull boundary → visible; else hidden if crosses
            top surface or 2+ adjacent hidden base edges
         """
-        # Convert to Points for geometry functions
-        all_pts_raw = (
-            [Point(p["x"], p["y"]) for p in final_tv]
-            + [Point(p["x"], p["y"]) for p in final_tv_top]
-        )
+        # Corner sets as (n, 2) arrays; edge i runs from corner i to i+1.
+        # Corner indices: base i → i, top i → n + i
+        base = as_points_array(final_tv)
+        top = as_points_array(final_tv_top)
+        base_next = np.roll(base, -1, axis=0)
+        top_next = np.roll(top, -1, axis=0)
+        corners = np.concatenate((base, top))
+        ring = np.arange(n)
+        base_edges = np.stack((ring, np.roll(ring, -1)), axis=1)
 
         # Convex hull (caseC.js:657-659)
-        hull_pts = convex_hull(all_pts_raw)
-        hull_set = build_hull_set(all_pts_raw)
-
-        top_polygon = [Point(p["x"], p["y"]) for p in final_tv_top]
+        hull_idx = convex_hull_indices(corners)
 
         # 1. Top surface edges — ALWAYS visible (caseC.js:694-699)
         for i in range(n):
@@ -647,48 +749,45 @@ class CaseCEngine:
                 style="visible",
             )
 
-        # 2. Base edges (caseC.js:703-716)
-        base_edge_hidden: list[bool] = []
+        # 2. Base edges (caseC.js:703-716) — evaluated for all edges at once.
+        # Hull boundary → always visible; otherwise hidden if the edge crosses
+        # the top surface or its midpoint lies inside the top polygon.
+        base_on_hull = self._hull_edges(corners, hull_idx, base_edges)
+        base_crosses = segments_intersect_matrix(
+            base, base_next, top, top_next,
+        ).any(axis=1)
+        mid_inside = points_in_polygon((base + base_next) / 2, top)
+        base_edge_hidden = (~base_on_hull & (base_crosses | mid_inside)).tolist()
+
         for i in range(n):
             j = (i + 1) % n
-            p_a = Point(final_tv[i]["x"], final_tv[i]["y"])
-            p_b = Point(final_tv[j]["x"], final_tv[j]["y"])
-
-            if is_edge_on_hull(p_a, p_b, hull_pts):
-                # Hull boundary → always visible (caseC.js:707-708)
-                hidden = False
-            else:
-                # Hidden if crosses top surface or midpoint inside top (caseC.js:710-711)
-                crosses = self._crosses_top_surface(p_a, p_b, top_polygon, n)
-                mid = Point((p_a.x + p_b.x) / 2, (p_a.y + p_b.y) / 2)
-                mid_inside = point_in_polygon(mid, top_polygon)
-                hidden = crosses or mid_inside
-
-            base_edge_hidden.append(hidden)
-            style = "hidden" if hidden else "visible"
-            self.builder.add_line(p_a.x, p_a.y, p_b.x, p_b.y, style=style)
+            style = "hidden" if base_edge_hidden[i] else "visible"
+            self.builder.add_line(
+                final_tv[i]["x"], final_tv[i]["y"],
+                final_tv[j]["x"], final_tv[j]["y"], style=style,
+            )
 
         # 3. Longer edges (vertical/lateral) (caseC.js:720-736)
+        # Hull boundary → always visible; otherwise hidden if the edge crosses
+        # the top surface or both adjacent base edges are hidden.
+        lateral_on_hull = self._hull_edges(
+            corners, hull_idx, np.stack((ring, ring + n), axis=1),
+        )
+        lateral_crosses = segments_intersect_matrix(
+            base, top, top, top_next,
+        ).any(axis=1)
+        hidden_arr = np.asarray(base_edge_hidden, dtype=bool)
+        both_adjacent_hidden = hidden_arr & np.roll(hidden_arr, 1)
+        lateral_hidden = (
+            ~lateral_on_hull & (lateral_crosses | both_adjacent_hidden)
+        ).tolist()
+
         for i in range(n):
-            p_a = Point(final_tv[i]["x"], final_tv[i]["y"])
-            p_b = Point(final_tv_top[i]["x"], final_tv_top[i]["y"])
-
-            if is_edge_on_hull(p_a, p_b, hull_pts):
-                # Hull boundary → always visible (caseC.js:722-723)
-                hidden = False
-            else:
-                prev_i = (i - 1 + n) % n
-                hidden_adjacent_count = 0
-                if base_edge_hidden[prev_i]:
-                    hidden_adjacent_count += 1
-                if base_edge_hidden[i]:
-                    hidden_adjacent_count += 1
-
-                crosses = self._crosses_top_surface(p_a, p_b, top_polygon, n)
-                hidden = crosses or hidden_adjacent_count >= 2
-
-            style = "hidden" if hidden else "visible"
-            self.builder.add_line(p_a.x, p_a.y, p_b.x, p_b.y, style=style)
+            style = "hidden" if lateral_hidden[i] else "visible"
+            self.builder.add_line(
+                final_tv[i]["x"], final_tv[i]["y"],
+                final_tv_top[i]["x"], final_tv_top[i]["y"], style=style,
+            )
 
         # Labels (caseC.js:738-748)
         for i in range(n):
@@ -724,28 +823,30 @@ class CaseCEngine:
             + [Point(final_tv_apex["x"], final_tv_apex["y"])]
         )
 
-        hull_pts = convex_hull(all_pts_raw)
         hull_set = build_hull_set(all_pts_raw)
 
-        # Base corner hull membership (caseC.js:771-774)
-        base_on_hull = [
-            is_on_convex_hull(Point(final_tv[i]["x"], final_tv[i]["y"]), hull_set)
-            for i in range(n)
-        ]
-
-        # Base edges (caseC.js:778-787)
-        base_edge_hidden: list[bool] = []
-        for i in range(n):
-            j = (i + 1) % n
-            p_a = Point(final_tv[i]["x"], final_tv[i]["y"])
-            p_b = Point(final_tv[j]["x"], final_tv[j]["y"])
+        # Corner indices: base i → i, apex → n
+        corners = as_points_array(all_pts_raw)
+        hull_idx = convex_hull_indices(corners)
+        ring = np.arange(n)
 
-            if is_edge_on_hull(p_a, p_b, hull_pts):
-                hidden = False
-            else:
-                hidden = not base_on_hull[i] and not base_on_hull[j]
+        # Base corner hull membership (caseC.js:771-774)
+        base_on_hull = np.fromiter(
+            (
+                is_on_convex_hull(Point(final_tv[i]["x"], final_tv[i]["y"]), hull_set)
+                for i in range(n)
+            ),
+            dtype=bool,
+            count=n,
+        )
 
-            base_edge_hidden.append(hidden)
+        # Base edges (caseC.js:778-787): hull boundary → visible, else hidden
+        # if both endpoints are off the hull
+        base_edge_on_hull = self._hull_edges(
+            corners, hull_idx, np.stack((ring, np.roll(ring, -1)), axis=1),
+        )
+        hidden_arr = ~base_edge_on_hull & ~base_on_hull & ~np.roll(base_on_hull, -1)
+        base_edge_hidden = hidden_arr.tolist()
 
         # Draw base edges (hidden first, then visible) (caseC.js:789-799)
         for render_pass in range(2):
@@ -759,26 +860,20 @@ class CaseCEngine:
                         final_tv[j]["x"], final_tv[j]["y"], style=style,
                     )
 
-        # Slant edges (caseC.js:801-821)
+        # Slant edges (caseC.js:801-821): hull boundary → visible, else hidden
+        # if both adjacent base edges are hidden
+        slant_on_hull = self._hull_edges(
+            corners, hull_idx, np.stack((ring, np.full(n, n)), axis=1),
+        )
+        slant_hidden = (
+            ~slant_on_hull & hidden_arr & np.roll(hidden_arr, 1)
+        ).tolist()
+
         for render_pass in range(2):
             draw_hidden = (render_pass == 0)
             for i in range(n):
-                p_a = Point(final_tv[i]["x"], final_tv[i]["y"])
-                apex_pt = Point(final_tv_apex["x"], final_tv_apex["y"])
-
-                if is_edge_on_hull(p_a, apex_pt, hull_pts):
-                    edge_hidden = False
-                else:
-                    prev_i = (i - 1 + n) % n
-                    hidden_adj = 0
-                    if base_edge_hidden[prev_i]:
-                        hidden_adj += 1
-                    if base_edge_hidden[i]:
-                        hidden_adj += 1
-                    edge_hidden = hidden_adj >= 2
-
-                if edge_hidden == draw_hidden:
-                    style = "hidden" if edge_hidden else "visible"
+                if slant_hidden[i] == draw_hidden:
+                    style = "hidden" if slant_hidden[i] else "visible"
                     self.builder.add_line(
                         final_tv[i]["x"], final_tv[i]["y"],
                         final_tv_apex["x"], final_tv_apex["y"], style=style,
@@ -795,24 +890,6 @@ class CaseCEngine:
             label=final_tv_apex["label"], label_offset_x=5, label_offset_y=-8,
         )
 
-    @staticmethod
-    def _crosses_top_surface(
-        p_a: Point,
-        p_b: Point,
-        top_polygon: list[Point],
-        n: int,
-    ) -> bool:
-        """
-        Check if segment (pA-pB) crosses any top-surface edge.
-
-        Port of crossesTopSurface() from caseC.js:678-686.
-        """
-        for k in range(n):
-            m = (k + 1) % n
-            if segments_intersect(p_a, p_b, top_polygon[k], top_polygon[m]):
-                return True
-        return False
-
     # ----------------------------------------------------------
     # Step metadata
     # ----------------------------------------------------------
@@ -22,22 +22,19 @@ The Phase III construction:
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
+from typing import Iterable
 
 from app.engine.config import DrawingConfig
 from app.engine.geometry import (
-    Point,
-    convex_hull,
-    build_hull_set,
+    as_points_array,
     degrees_to_radians,
-    is_edge_on_hull,
-    is_on_convex_hull,
-    point_in_polygon,
-    segments_intersect,
+    rotate_points,
 )
-from app.engine.renderer import RenderBuilder
+from app.engine.phase_cache import PhaseCache, PhaseKey, phase_corners
+from app.engine.renderer import RenderBuilder, select_steps
 from app.engine.solids import Solid
+from app.engine.spans import span, timed
 from app.engine.cases.case_a import CaseAEngine
 from app.engine.cases.case_c import CaseCEngine
 
@@ -71,15 +68,37 @@ class CaseDEngine:
     Phase I (steps 1-5):   Reuses CaseAEngine with auto-computed β.
     Phase II (steps 6-8):  Reuses CaseCEngine logic for HP inclination.
     Phase III (steps 9-11): VP inclination — rotates TV, projects to FV.
+
+    Phase I + II layers come from CaseCEngine; Phase III adds three more
+    layers to the same cache, so nothing is recomputed per step. Each
+    phase's corners go through the phase cache (see phase_cache.py), so a
+    change to axis_angle_vp alone only recomputes Phase III.
     """
 
     TOTAL_STEPS = 11
 
-    def __init__(self, solid: Solid, config: DrawingConfig) -> None:
+    # Layers drawn at each step. Phase III steps start from the complete
+    # Phase I + II drawing.
+    STEP_LAYERS: dict[int, tuple[str, ...]] = {
+        **CaseCEngine.STEP_LAYERS,
+        9: CaseCEngine.STEP_LAYERS[8] + ("phase3_tv",),
+        10: CaseCEngine.STEP_LAYERS[8] + ("phase3_tv", "phase3_loci"),
+        11: CaseCEngine.STEP_LAYERS[8] + ("phase3_tv", "phase3_loci", "phase3_fv"),
+    }
+
+    def __init__(
+        self,
+        solid: Solid,
+        config: DrawingConfig,
+        builder: RenderBuilder | None = None,
+        phase_cache: PhaseCache | None = None,
+    ) -> None:
         self.solid = solid
         self.config = config
         self.corners = CaseDCorners()
-        self.builder = RenderBuilder(config)
+        self.builder = builder if builder is not None else RenderBuilder(config)
+        self.phase_cache = phase_cache
+        self.phase_key: PhaseKey = ()
         # Sub-engines for delegation
         self._case_c: CaseCEngine | None = None
         self._case_a: CaseAEngine | None = None
@@ -92,6 +111,7 @@ class CaseDEngine:
         axis_angle_hp: float,
         axis_angle_vp: float,
         resting_on: str,
+        steps: Iterable[int] | None = None,
     ) -> list[dict]:
         """
         Compute all 11 steps of Case D projection.
@@ -103,191 +123,92 @@ class CaseDEngine:
             axis_angle_hp: Axis angle with HP in degrees (α).
             axis_angle_vp: Axis angle with VP in degrees (φ).
             resting_on: Resting condition ('base-edge' or 'base-corner').
+            steps: Step numbers to render (default: all).
 
         Returns:
-            List of StepInstruction dicts (11 steps).
+            List of StepInstruction dicts (11 steps, or the selected ones).
         """
         # --- Phase I + II: delegate to CaseCEngine ---
         # CaseC handles steps 1-8 (Phase I = Case A steps 1-5, Phase II = steps 6-8)
-        self._case_c = CaseCEngine(self.solid, self.config)
+        self._case_c = CaseCEngine(self.solid, self.config, phase_cache=self.phase_cache)
         beta = CaseCEngine.auto_compute_beta(self.solid.solid_type, resting_on)
 
-        # Create Case A engine for Phase I geometry
-        self._case_a = CaseAEngine(self.solid, self.config)
-        edge_angle_rad = degrees_to_radians(beta)
-        self._case_a._compute_top_view(base_edge, edge_angle_rad)
-
-        steps: list[dict] = []
-
-        for step in range(1, self.TOTAL_STEPS + 1):
-            self.builder.reset()
-
-            if step <= 5:
-                # Phase I: Case A initial position
-                self._build_phase1_step(step, base_edge, axis_length, beta)
-            elif step <= 8:
-                # Phase II: Case C rotation (HP angle)
-                self._draw_all_phase1(base_edge, axis_length, beta)
-                self._build_phase2_step(
-                    step, base_edge, axis_length, axis_angle_hp,
-                )
-            else:
-                # Phase III: VP angle rotation
-                self._draw_all_phases12(
-                    base_edge, axis_length, beta, axis_angle_hp,
-                )
-                self._build_phase3_step(
-                    step, base_edge, axis_length,
-                    axis_angle_hp, axis_angle_vp,
-                )
-
-            steps.append(self.builder.build_step(
-                step_number=step,
-                title=self._step_title(step),
-                description=self._step_description(
-                    step, beta, axis_angle_hp, axis_angle_vp, resting_on,
-                ),
-            ))
-
-        return steps
-
-    # ----------------------------------------------------------
-    # Phase I (Steps 1-5): delegate to Case A
-    # ----------------------------------------------------------
-
-    def _build_phase1_step(
-        self,
-        step: int,
-        base_edge: float,
-        axis_length: float,
-        beta: float,
-    ) -> None:
-        """Build Phase I step using Case A engine."""
-        case_a = self._case_a
-        if not case_a:
-            return
-        case_a.builder = self.builder
-
-        match step:
-            case 1:
-                self.builder.add_xy_line()
-            case 2:
-                self.builder.add_xy_line()
-                self.builder.add_angle_indicator(beta)
-            case 3:
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-            case 4:
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                    case_a._add_projectors_prism(axis_length)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-                    case_a._add_projectors_pyramid(axis_length)
-            case 5:
-                self.builder.add_xy_line()
-                if self.solid.is_prism:
-                    case_a._add_top_view_prism(beta)
-                    case_a._add_front_view_prism(axis_length)
-                elif self.solid.is_pyramid:
-                    case_a._add_top_view_pyramid()
-                    case_a._add_front_view_pyramid(axis_length)
-
-    def _draw_all_phase1(
-        self,
-        base_edge: float,
-        axis_length: float,
-        beta: float,
-    ) -> None:
-        """Draw all Phase I elements."""
-        case_a = self._case_a
-        if not case_a:
-            return
-        case_a.builder = self.builder
-        self.builder.add_xy_line()
-        if self.solid.is_prism:
-            case_a._add_top_view_prism(beta)
-            case_a._add_front_view_prism(axis_length)
-        elif self.solid.is_pyramid:
-            case_a._add_top_view_pyramid()
-            case_a._add_front_view_pyramid(axis_length)
-
-    # ----------------------------------------------------------
-    # Phase II (Steps 6-8): delegate to Case C geometry
-    # ----------------------------------------------------------
-
-    def _build_phase2_step(
+        # Geometry stage: Phase I (Case A), Phase II (Case C), Phase III
+        self._case_a = CaseAEngine(self.solid, self.config, phase_cache=self.phase_cache)
+        self._case_a._compute_corners(base_edge, axis_length, beta)
+        self._case_c._compute_corners(self._case_a, base_edge, axis_angle_hp)
+        self._compute_corners(axis_angle_vp, base_edge)
+
+        # Phase I + II layers from Case C, plus Phase III
+        self._case_c.builder = self.builder
+        layers = self._case_c._phase_layers(self._case_a, axis_length, beta)
+        layers.define("phase3_tv", self._draw_phase3_tv_simple)
+        layers.define("phase3_loci", self._phase3_projectors_and_loci)
+        layers.define("phase3_fv", self._phase3_final_fv)
+
+        rendered: list[dict] = []
+
+        # Render stage: replay the cached layers each step is made of
+        with span("render"):
+            for step in select_steps(self.TOTAL_STEPS, steps):
+                self.builder.reset()
+                layers.replay(self.STEP_LAYERS[step])
+                rendered.append(self.builder.build_step(
+                    step_number=step,
+                    title=self._step_title(step),
+                    description=self._step_description(
+                        step, beta, axis_angle_hp, axis_angle_vp, resting_on,
+                    ),
+                ))
+
+        return rendered
+
+    def step_outline(
         self,
-        step: int,
         base_edge: float,
         axis_length: float,
+        edge_angle: float,
         axis_angle_hp: float,
-    ) -> None:
-        """Build Phase II step using Case C sub-engine."""
-        case_c = self._case_c
-        case_a = self._case_a
-        if not case_c or not case_a:
-            return
-        case_c.builder = self.builder
-
-        match step:
-            case 6:
-                case_c._final_fv(case_a, base_edge, axis_angle_hp)
-            case 7:
-                case_c._final_fv(case_a, base_edge, axis_angle_hp)
-                case_c._projectors_and_loci(case_a)
-            case 8:
-                case_c._final_fv(case_a, base_edge, axis_angle_hp)
-                case_c._projectors_and_loci(case_a)
-                case_c._final_tv(case_a)
-
-    def _draw_all_phases12(
-        self,
-        base_edge: float,
-        axis_length: float,
-        beta: float,
-        axis_angle_hp: float,
-    ) -> None:
-        """Draw all Phase I + Phase II elements."""
-        self._draw_all_phase1(base_edge, axis_length, beta)
-
-        case_c = self._case_c
-        case_a = self._case_a
-        if not case_c or not case_a:
-            return
-        case_c.builder = self.builder
+        axis_angle_vp: float,
+        resting_on: str,
+    ) -> list[dict]:
+        """
+        Step numbers, titles and descriptions without any geometry.
 
-        case_c._final_fv(case_a, base_edge, axis_angle_hp)
-        case_c._projectors_and_loci(case_a)
-        case_c._final_tv(case_a)
+        Takes the same arguments as compute_all_steps().
+        """
+        beta = CaseCEngine.auto_compute_beta(self.solid.solid_type, resting_on)
+        return [
+            {
+                "step_number": step,
+                "title": self._step_title(step),
+                "description": self._step_description(
+                    step, beta, axis_angle_hp, axis_angle_vp, resting_on,
+                ),
+            }
+            for step in range(1, self.TOTAL_STEPS + 1)
+        ]
 
     # ----------------------------------------------------------
     # Phase III (Steps 9-11): VP rotation
     # ----------------------------------------------------------
 
-    def _build_phase3_step(
-        self,
-        step: int,
-        base_edge: float,
-        axis_length: float,
-        axis_angle_hp: float,
-        axis_angle_vp: float,
-    ) -> None:
-        """Build Phase III step (VP angle rotation)."""
-        match step:
-            case 9:
-                self._rotate_tv_for_vp(axis_angle_vp, base_edge)
-            case 10:
-                self._rotate_tv_for_vp(axis_angle_vp, base_edge)
-                self._phase3_projectors_and_loci()
-            case 11:
-                self._rotate_tv_for_vp(axis_angle_vp, base_edge)
-                self._phase3_projectors_and_loci()
-                self._phase3_final_fv()
+    @timed("phase3")
+    def _compute_corners(self, axis_angle_vp: float, base_edge: float) -> None:
+        """
+        Geometry stage for Phase III: rotated TV and final FV corners.
+
+        Keyed on the Phase II key plus axis_angle_vp; the cached corner
+        set is shared and only read.
+        """
+        def compute() -> CaseDCorners:
+            self.corners = CaseDCorners()
+            self._rotate_tv_for_vp(axis_angle_vp, base_edge)
+            self._compute_phase3_fv()
+            return self.corners
+
+        self.phase_key = self._case_c.phase_key + ("III", axis_angle_vp)
+        self.corners = phase_corners(self.phase_cache, self.phase_key, compute)
 
     def _rotate_tv_for_vp(self, axis_angle_vp: float, base_edge: float) -> None:
         """
@@ -322,22 +243,17 @@ class CaseDEngine:
         pivot_x = phase2_tv[pivot_idx]["x"]
         pivot_y = phase2_tv[pivot_idx]["y"]
 
-        def rotate_around_pivot(px: float, py: float) -> tuple[float, float]:
-            dx = px - pivot_x
-            dy = py - pivot_y
-            cos_p = math.cos(phi)
-            sin_p = math.sin(phi)
-            return (
-                pivot_x + dx * cos_p - dy * sin_p,
-                pivot_y + dx * sin_p + dy * cos_p,
-            )
+        def rotate_about_pivot(corners: list[dict]) -> list[list[float]]:
+            """Rotate a whole corner set about the pivot in one pass."""
+            return rotate_points(
+                as_points_array(corners), pivot_x, pivot_y, phi,
+            ).tolist()
 
         # Rotate base corners
+        rot_base = rotate_about_pivot(phase2_tv)
         phase3_tv = []
         for i in range(n):
-            rx, ry = rotate_around_pivot(
-                phase2_tv[i]["x"], phase2_tv[i]["y"],
-            )
+            rx, ry = rot_base[i]
             phase3_tv.append({
                 "x": rx + offset, "y": ry,
                 "label": f"{i + 1}₂",
@@ -349,11 +265,10 @@ class CaseDEngine:
         phase3_tv_apex = None
 
         if self.solid.is_prism and phase2_tv_top:
+            rot_top = rotate_about_pivot(phase2_tv_top)
             phase3_tv_top = []
             for i in range(n):
-                rx, ry = rotate_around_pivot(
-                    phase2_tv_top[i]["x"], phase2_tv_top[i]["y"],
-                )
+                rx, ry = rot_top[i]
                 phase3_tv_top.append({
                     "x": rx + offset, "y": ry,
                     "label": f"{chr(97 + i)}₂",
@@ -361,9 +276,7 @@ class CaseDEngine:
                 })
 
         if self.solid.is_pyramid and phase2_tv_apex:
-            rx, ry = rotate_around_pivot(
-                phase2_tv_apex["x"], phase2_tv_apex["y"],
-            )
+            (rx, ry), = rotate_about_pivot([phase2_tv_apex])
             phase3_tv_apex = {
                 "x": rx + offset, "y": ry,
                 "label": "o₂",
@@ -375,11 +288,12 @@ class CaseDEngine:
         self.corners.phase3_tv_top = phase3_tv_top
         self.corners.phase3_tv_apex = phase3_tv_apex
 
-        # Draw the rotated TV polygon (all visible for now — final visibility at Step 11)
-        self._draw_phase3_tv_simple()
-
     def _draw_phase3_tv_simple(self) -> None:
-        """Draw Phase III TV with simple visibility (all edges visible initially)."""
+        """
+        Draw the rotated Phase III TV.
+
+        All edges are visible for now — final visibility comes at Step 11.
+        """
         phase3_tv = self.corners.phase3_tv
         phase3_tv_top = self.corners.phase3_tv_top
         phase3_tv_apex = self.corners.phase3_tv_apex
@@ -455,9 +369,65 @@ class CaseDEngine:
                 label_offset_x=5, label_offset_y=-8,
             )
 
+    def _compute_phase3_fv(self) -> None:
+        """
+        Intersect Phase III projectors with Phase II loci.
+
+        Phase III FV corner[i] = (phase3_tv[i].x, phase2_fv[i].y).
+        """
+        case_c = self._case_c
+        if not case_c:
+            return
+
+        phase3_tv = self.corners.phase3_tv
+        phase3_tv_top = self.corners.phase3_tv_top
+        phase3_tv_apex = self.corners.phase3_tv_apex
+
+        phase2_fv_base = case_c.corners.final_fv_base
+        phase2_fv_top = case_c.corners.final_fv_top
+        phase2_fv_apex = case_c.corners.final_fv_apex
+
+        if not phase3_tv or not phase2_fv_base:
+            return
+
+        n = len(phase3_tv)
+
+        # FV corner[i] = (phase3_tv[i].x, phase2_fv_base[i].y)
+        phase3_fv_base = []
+        for i in range(n):
+            phase3_fv_base.append({
+                "x": phase3_tv[i]["x"],
+                "y": phase2_fv_base[i]["y"],
+                "label": f"{i + 1}₂'",
+            })
+
+        phase3_fv_top = None
+        phase3_fv_apex = None
+
+        if self.solid.is_prism and phase3_tv_top and phase2_fv_top:
+            phase3_fv_top = []
+            for i in range(n):
+                phase3_fv_top.append({
+                    "x": phase3_tv_top[i]["x"],
+                    "y": phase2_fv_top[i]["y"],
+                    "label": f"{chr(97 + i)}₂'",
+                })
+
+        if self.solid.is_pyramid and phase3_tv_apex and phase2_fv_apex:
+            phase3_fv_apex = {
+                "x": phase3_tv_apex["x"],
+                "y": phase2_fv_apex["y"],
+                "label": "o₂'",
+            }
+
+        # Store
+        self.corners.phase3_fv_base = phase3_fv_base
+        self.corners.phase3_fv_top = phase3_fv_top
+        self.corners.phase3_fv_apex = phase3_fv_apex
+
     def _phase3_projectors_and_loci(self) -> None:
         """
-        Compute Phase III projectors and loci.
+        Draw Phase III projectors and loci.
 
         Vertical projectors: from Phase III TV corners upward to FV area.
         Horizontal loci: from Phase II FV corners (final_fv_base/top/apex) rightward.
@@ -478,7 +448,6 @@ class CaseDEngine:
         if not phase3_tv or not phase2_fv_base:
             return
 
-        n = len(phase3_tv)
         cfg = self.config
 
         # Compute extents
@@ -534,39 +503,11 @@ class CaseDEngine:
                 style="construction",
             )
 
-        # 3. Compute intersection points — Phase III FV
-        # FV corner[i] = (phase3_tv[i].x, phase2_fv_base[i].y)
-        phase3_fv_base = []
-        for i in range(n):
-            phase3_fv_base.append({
-                "x": phase3_tv[i]["x"],
-                "y": phase2_fv_base[i]["y"],
-                "label": f"{i + 1}₂'",
-            })
-
-        phase3_fv_top = None
-        phase3_fv_apex = None
-
-        if self.solid.is_prism and phase3_tv_top and phase2_fv_top:
-            phase3_fv_top = []
-            for i in range(n):
-                phase3_fv_top.append({
-                    "x": phase3_tv_top[i]["x"],
-                    "y": phase2_fv_top[i]["y"],
-                    "label": f"{chr(97 + i)}₂'",
-                })
-
-        if self.solid.is_pyramid and phase3_tv_apex and phase2_fv_apex:
-            phase3_fv_apex = {
-                "x": phase3_tv_apex["x"],
-                "y": phase2_fv_apex["y"],
-                "label": "o₂'",
-            }
-
-        # Store
-        self.corners.phase3_fv_base = phase3_fv_base
-        self.corners.phase3_fv_top = phase3_fv_top
-        self.corners.phase3_fv_apex = phase3_fv_apex
+        # 3. Intersection points — Phase III FV, computed by
+        # _compute_phase3_fv()
+        phase3_fv_base = self.corners.phase3_fv_base
+        phase3_fv_top = self.corners.phase3_fv_top
+        phase3_fv_apex = self.corners.phase3_fv_apex
 
         # Mark intersection points
         for pt in phase3_fv_base:
@@ -7,6 +7,7 @@ Canvas-dependent values (xy_line_y, xy_line_start_x) are computed at
 request time based on the provided canvas dimensions.
 """
 
+import math
 from dataclasses import dataclass, field
 
 
@@ -30,6 +31,15 @@ class DrawingConfig:
     hidden_line_width: float = 1.0
     construction_line_width: float = 0.5
 
+    # Dash patterns (core.js:440-447); solid when empty
+    visible_dash: tuple[float, ...] = ()
+    hidden_dash: tuple[float, ...] = (5.0, 5.0)
+    construction_dash: tuple[float, ...] = (2.0, 2.0)
+
+    # Arrowhead geometry (core.js:424-434)
+    arrow_head_length: float = 5.0
+    arrow_head_angle: float = math.pi / 6
+
     # Colors (core.js:44-49)
     visible_color: str = "#0f172a"
     hidden_color: str = "#64748b"
@@ -39,6 +49,11 @@ class DrawingConfig:
 
     # Font (core.js:48)
     label_font_size: float = 12.0
+    font_family: str = (
+        "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, "
+        "'Helvetica Neue', Arial, sans-serif"
+    )
+    point_radius: float = 2.0
 
     # Canvas dimensions (set per request)
     canvas_width: float = 1200.0
@@ -15,12 +15,13 @@ Key math:
 from __future__ import annotations
 
 import math
+from typing import Iterable
 
-from app.schemas.projection import (
-    LineElement, PointElement, LabelElement, ArcElement, PolygonElement,
-    StepInstruction,
+from app.engine.elements import (
+    arc_element, label_element, line_element, point_element, polygon_element,
 )
-from app.schemas.curve_schemas import CurveResponse, CurveMetadata
+from app.engine.renderer import select_steps
+from app.schemas.curve_schemas import CurveResponse
 
 
 def compute_cycloid(
@@ -34,6 +35,24 @@ def compute_cycloid(
     Coordinate system: (0,0) at bottom-left of circle = start point.
     Y-axis points UP (standard math convention, frontend flips).
     """
+    return CurveResponse.model_validate(cycloid_payload(
+        diameter, canvas_width, canvas_height,
+    ))
+
+
+def cycloid_payload(
+    diameter: float = 100.0,
+    canvas_width: float = 1200.0,
+    canvas_height: float = 700.0,
+    steps: Iterable[int] | None = None,
+) -> dict:
+    """
+    Compute the cycloid construction as a plain CurveResponse-shaped dict.
+
+    Elements are built as dicts (app.engine.elements) rather than Pydantic
+    models; the API serializes this payload directly. With ``steps``, only
+    those steps are rendered.
+    """
     radius = diameter / 2
     circumference = math.pi * diameter
 
@@ -119,169 +138,172 @@ def compute_cycloid(
         "Step 10: Join all points with a smooth curve to complete the cycloid.",
     ]
 
-    all_steps: list[StepInstruction] = []
+    # Each step's new elements are built once, as a layer. A step is the
+    # concatenation of the layers up to it, so later steps share the
+    # element dicts of earlier ones instead of rebuilding them.
+    layers: list[list[dict]] = [[] for _ in range(10)]
+
+    # ── Step 1: Circle + center O ──
+    layer = layers[0]
+    layer.append(arc_element(
+        center_x=start_x, center_y=start_y - radius,
+        radius=radius, start_angle=0, end_angle=360,
+    ))
+    layer.append(point_element(x=start_x, y=start_y - radius, label="O"))
+
+    # ── Step 2: Circle division points ──
+    layer = layers[1]
+    for i, cp in enumerate(circle_points):
+        layer.append(point_element(x=cp["x"], y=cp["y"], label=str(i + 1)))
+
+    # ── Step 3: Baseline ──
+    layer = layers[2]
+    layer.append(line_element(
+        x1=start_x, y1=start_y,
+        x2=start_x + circumference, y2=start_y,
+        style="visible",
+    ))
+    layer.append(label_element(
+        x=start_x + circumference / 2 - 80, y=start_y + 20,
+        text=f"Baseline (πd = {circumference:.1f}mm)",
+    ))
+
+    # ── Step 4: Baseline divisions + end vertical ──
+    layer = layers[3]
+    for i, bp in enumerate(baseline_points):
+        layer.append(point_element(
+            x=bp["x"], y=bp["y"],
+            label="1" if i == 0 else f"{i}'",
+        ))
+    # Vertical line at end
+    layer.append(line_element(
+        x1=baseline_points[8]["x"], y1=baseline_points[8]["y"],
+        x2=baseline_points[8]["x"], y2=baseline_points[8]["y"] - diameter,
+        style="construction",
+    ))
+    layer.append(label_element(
+        x=baseline_points[8]["x"] + 5,
+        y=baseline_points[8]["y"] - diameter,
+        text="8'",
+    ))
+
+    # ── Step 5: Horizontal lines from upper circle points (0-3) ──
+    layer = layers[4]
+    for i in range(4):
+        layer.append(line_element(
+            x1=circle_points[i]["x"], y1=circle_points[i]["y"],
+            x2=baseline_points[8]["x"], y2=circle_points[i]["y"],
+            style="construction",
+        ))
 
-    for step_num in range(1, 11):
-        elements: list = []
+    # ── Step 6: Horizontal lines from lower circle points (4-7) ──
+    layer = layers[5]
+    for i in range(4, 8):
+        layer.append(line_element(
+            x1=circle_points[i]["x"], y1=circle_points[i]["y"],
+            x2=baseline_points[8]["x"], y2=circle_points[i]["y"],
+            style="construction",
+        ))
 
-        # ── Step 1: Circle + center O ──
-        if step_num >= 1:
-            elements.append(ArcElement(
-                center_x=start_x, center_y=start_y - radius,
-                radius=radius, start_angle=0, end_angle=360,
-            ))
-            elements.append(PointElement(x=start_x, y=start_y - radius, label="O"))
-
-        # ── Step 2: Circle division points ──
-        if step_num >= 2:
-            for i, cp in enumerate(circle_points):
-                elements.append(PointElement(x=cp["x"], y=cp["y"], label=str(i + 1)))
-
-        # ── Step 3: Baseline ──
-        if step_num >= 3:
-            elements.append(LineElement(
-                x1=start_x, y1=start_y,
-                x2=start_x + circumference, y2=start_y,
-                style="visible",
-            ))
-            elements.append(LabelElement(
-                x=start_x + circumference / 2 - 80, y=start_y + 20,
-                text=f"Baseline (πd = {circumference:.1f}mm)",
-            ))
+    # ── Step 7: Vertical lines + centers O1-O8 ──
+    layer = layers[6]
+    for i in range(1, 9):
+        x = baseline_points[i]["x"]
+        layer.append(line_element(
+            x1=x, y1=start_y,
+            x2=x, y2=start_y - diameter,
+            style="construction",
+        ))
+        layer.append(point_element(
+            x=centers[i]["x"], y=centers[i]["y"],
+            label=f"O{i}",
+        ))
 
-        # ── Step 4: Baseline divisions + end vertical ──
-        if step_num >= 4:
-            for i, bp in enumerate(baseline_points):
-                elements.append(PointElement(
-                    x=bp["x"], y=bp["y"],
-                    label="1" if i == 0 else f"{i}'",
-                ))
-            # Vertical line at end
-            elements.append(LineElement(
-                x1=baseline_points[8]["x"], y1=baseline_points[8]["y"],
-                x2=baseline_points[8]["x"], y2=baseline_points[8]["y"] - diameter,
-                style="construction",
-            ))
-            elements.append(LabelElement(
-                x=baseline_points[8]["x"] + 5,
-                y=baseline_points[8]["y"] - diameter,
-                text="8'",
+    # ── Step 8: Arcs from O, O1, O2, O3 → points a, b, c, d ──
+    layer = layers[7]
+    # Point a (already on circle)
+    layer.append(point_element(
+        x=cycloid_points[0]["x"], y=cycloid_points[0]["y"],
+        label="a",
+    ))
+
+    # Points b, c, d with arcs
+    for pt_idx, center_idx in [(1, 1), (2, 2), (3, 3)]:
+        if pt_idx < len(cycloid_points):
+            pt = cycloid_points[pt_idx]
+            c = centers[center_idx]
+            angle = math.atan2(pt["y"] - c["y"], pt["x"] - c["x"])
+            layer.append(arc_element(
+                center_x=c["x"], center_y=c["y"],
+                radius=radius,
+                start_angle=math.degrees(angle) - 30,
+                end_angle=math.degrees(angle) + 30,
             ))
-
-        # ── Step 5: Horizontal lines from upper circle points (0-3) ──
-        if step_num >= 5:
-            for i in range(4):
-                elements.append(LineElement(
-                    x1=circle_points[i]["x"], y1=circle_points[i]["y"],
-                    x2=baseline_points[8]["x"], y2=circle_points[i]["y"],
-                    style="construction",
-                ))
-
-        # ── Step 6: Horizontal lines from lower circle points (4-7) ──
-        if step_num >= 6:
-            for i in range(4, 8):
-                elements.append(LineElement(
-                    x1=circle_points[i]["x"], y1=circle_points[i]["y"],
-                    x2=baseline_points[8]["x"], y2=circle_points[i]["y"],
-                    style="construction",
-                ))
-
-        # ── Step 7: Vertical lines + centers O1-O8 ──
-        if step_num >= 7:
-            for i in range(1, 9):
-                x = baseline_points[i]["x"]
-                elements.append(LineElement(
-                    x1=x, y1=start_y,
-                    x2=x, y2=start_y - diameter,
-                    style="construction",
-                ))
-                elements.append(PointElement(
-                    x=centers[i]["x"], y=centers[i]["y"],
-                    label=f"O{i}",
-                ))
-
-        # ── Step 8: Arcs from O, O1, O2, O3 → points a, b, c, d ──
-        if step_num >= 8:
-            # Point a (already on circle)
-            elements.append(PointElement(
-                x=cycloid_points[0]["x"], y=cycloid_points[0]["y"],
-                label="a",
+            layer.append(point_element(
+                x=pt["x"], y=pt["y"], label=pt["label"],
             ))
 
-            # Points b, c, d with arcs
-            for pt_idx, center_idx in [(1, 1), (2, 2), (3, 3)]:
-                if pt_idx < len(cycloid_points):
-                    pt = cycloid_points[pt_idx]
-                    c = centers[center_idx]
-                    angle = math.atan2(pt["y"] - c["y"], pt["x"] - c["x"])
-                    elements.append(ArcElement(
-                        center_x=c["x"], center_y=c["y"],
-                        radius=radius,
-                        start_angle=math.degrees(angle) - 30,
-                        end_angle=math.degrees(angle) + 30,
-                    ))
-                    elements.append(PointElement(
-                        x=pt["x"], y=pt["y"], label=pt["label"],
-                    ))
-
-        # ── Step 9: Arcs from O4-O8 → points e, f, g, h, i ──
-        if step_num >= 9:
-            # Point e (top, from O4)
-            e_pt = cycloid_points[4]
-            elements.append(ArcElement(
-                center_x=centers[4]["x"], center_y=centers[4]["y"],
-                radius=radius,
-                start_angle=-90 - 30, end_angle=-90 + 30,
-            ))
-            elements.append(PointElement(x=e_pt["x"], y=e_pt["y"], label="e"))
-
-            # Points f, g, h (from O5, O6, O7)
-            for pt_idx, center_idx in [(5, 5), (6, 6), (7, 7)]:
-                if pt_idx < len(cycloid_points):
-                    pt = cycloid_points[pt_idx]
-                    c = centers[center_idx]
-                    angle = math.atan2(pt["y"] - c["y"], pt["x"] - c["x"])
-                    elements.append(ArcElement(
-                        center_x=c["x"], center_y=c["y"],
-                        radius=radius,
-                        start_angle=math.degrees(angle) - 30,
-                        end_angle=math.degrees(angle) + 30,
-                    ))
-                    elements.append(PointElement(
-                        x=pt["x"], y=pt["y"], label=pt["label"],
-                    ))
-
-            # Point i (bottom, from O8)
-            i_pt = cycloid_points[-1]
-            elements.append(ArcElement(
-                center_x=centers[8]["x"], center_y=centers[8]["y"],
+    # ── Step 9: Arcs from O4-O8 → points e, f, g, h, i ──
+    layer = layers[8]
+    # Point e (top, from O4)
+    e_pt = cycloid_points[4]
+    layer.append(arc_element(
+        center_x=centers[4]["x"], center_y=centers[4]["y"],
+        radius=radius,
+        start_angle=-90 - 30, end_angle=-90 + 30,
+    ))
+    layer.append(point_element(x=e_pt["x"], y=e_pt["y"], label="e"))
+
+    # Points f, g, h (from O5, O6, O7)
+    for pt_idx, center_idx in [(5, 5), (6, 6), (7, 7)]:
+        if pt_idx < len(cycloid_points):
+            pt = cycloid_points[pt_idx]
+            c = centers[center_idx]
+            angle = math.atan2(pt["y"] - c["y"], pt["x"] - c["x"])
+            layer.append(arc_element(
+                center_x=c["x"], center_y=c["y"],
                 radius=radius,
-                start_angle=90 - 30, end_angle=90 + 30,
+                start_angle=math.degrees(angle) - 30,
+                end_angle=math.degrees(angle) + 30,
             ))
-            elements.append(PointElement(x=i_pt["x"], y=i_pt["y"], label="i"))
-
-        # ── Step 10: Smooth curve through all cycloid points ──
-        if step_num >= 10:
-            curve_pts = [{"x": p["x"], "y": p["y"]} for p in cycloid_points]
-            elements.append(PolygonElement(points=curve_pts, style="visible", closed=False))
-            elements.append(LabelElement(
-                x=(cycloid_points[0]["x"] + cycloid_points[-1]["x"]) / 2 - 50,
-                y=(cycloid_points[0]["y"] + cycloid_points[4]["y"]) / 2 - 20,
-                text="Cycloid Curve (Complete)",
-                font_size=14,
+            layer.append(point_element(
+                x=pt["x"], y=pt["y"], label=pt["label"],
             ))
 
-        all_steps.append(StepInstruction(
+    # Point i (bottom, from O8)
+    i_pt = cycloid_points[-1]
+    layer.append(arc_element(
+        center_x=centers[8]["x"], center_y=centers[8]["y"],
+        radius=radius,
+        start_angle=90 - 30, end_angle=90 + 30,
+    ))
+    layer.append(point_element(x=i_pt["x"], y=i_pt["y"], label="i"))
+
+    # ── Step 10: Smooth curve through all cycloid points ──
+    layer = layers[9]
+    curve_pts = [{"x": p["x"], "y": p["y"]} for p in cycloid_points]
+    layer.append(polygon_element(points=curve_pts, style="visible", closed=False))
+    layer.append(label_element(
+        x=(cycloid_points[0]["x"] + cycloid_points[-1]["x"]) / 2 - 50,
+        y=(cycloid_points[0]["y"] + cycloid_points[4]["y"]) / 2 - 20,
+        text="Cycloid Curve (Complete)",
+        font_size=14,
+    ))
+
+    all_steps = [
+        dict(
             step_number=step_num,
             title=f"Step {step_num}",
             description=step_texts[step_num - 1],
-            elements=elements,
-        ))
+            elements=[el for layer in layers[:step_num] for el in layer],
+        )
+        for step_num in select_steps(10, steps)
+    ]
 
-    return CurveResponse(
+    return dict(
         total_steps=10,
         steps=all_steps,
-        metadata=CurveMetadata(
+        metadata=dict(
             curve_type="cycloid",
             parameters={
                 "diameter": diameter,
@@ -9,17 +9,28 @@ Key math:
   - V': x=V.x, y=focus_dist - V.x
   - Vertical lines at 0.5mm spacing from V
   - Arc intersection: sqrt(dist² - (focus_dist - x)²)
+
+The construction lines are evaluated as NumPy arrays (construction_lines);
+only the highlighted ones become per-line dicts.
+
+Tolerance mode (``tolerance=...``) skips the unhighlighted lines and samples
+the curve adaptively, so cost and response size follow the tolerance
+rather than the line count.
 """
 
 from __future__ import annotations
 
 import math
+from typing import Iterable
 
-from app.schemas.projection import (
-    LineElement, PointElement, LabelElement, ArcElement, ArrowElement, PolygonElement,
-    StepInstruction,
+import numpy as np
+
+from app.engine.elements import (
+    arc_element, arrow_element, label_element, line_element, point_element,
+    polygon_element,
 )
-from app.schemas.curve_schemas import CurveResponse, CurveMetadata
+from app.engine.renderer import select_steps
+from app.schemas.curve_schemas import CurveResponse
 
 
 def parse_eccentricity(ecc_str: str) -> float:
@@ -35,22 +46,189 @@ def parse_eccentricity(ecc_str: str) -> float:
     return float(ecc_str)
 
 
+# ============================================================
+# Construction Lines
+# ============================================================
+
+LINE_SPACING = 0.5     # mm between vertical construction lines
+HIGHLIGHT_EVERY = 20   # every 20th line is drawn and labelled
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def construction_lines(
+    indices: np.ndarray,
+    x_v: float,
+    vp: dict,
+    focus_dist: float,
+) -> dict[str, np.ndarray]:
+    """
+    Vertical construction lines and their arc intersections, as arrays.
+
+    The arc from F with radius equal to the line's height on the slant line
+    A→V' meets line ``i`` at ±sqrt(dist² - (focus_dist - x)²). Every line is
+    independent, so the whole set is evaluated in one pass; the expressions
+    match the legacy per-line loop, so results are bit-for-bit identical.
+
+    Args:
+        indices: Line numbers (1-based, increasing).
+
+    Returns:
+        Dict of equal-length arrays: ``i``, ``x``, ``y_min``, ``y_max``,
+        ``hit`` (the arc reaches the line), ``y0`` (intersection height,
+        0 where not hit) and ``highlight`` (every 20th line).
+    """
+    x = x_v + indices * LINE_SPACING
+    if abs(vp["x"]) > 1e-9:
+        y_val = x / vp["x"] * vp["y"]
+    else:
+        y_val = np.zeros_like(x)
+    above = y_val >= 0
+    # float_power goes through C pow() like Python's ``** 2``; NumPy's ``** 2``
+    # is a plain square, which can differ in the last bit
+    eq = y_val * y_val - np.float_power(focus_dist - x, 2)
+    hit = eq >= 0
+    return {
+        "i": indices,
+        "x": x,
+        "y_min": np.where(above, -80.0, y_val - 2.0),
+        "y_max": np.where(above, y_val + 2.0, 80.0),
+        "hit": hit,
+        "y0": np.sqrt(np.where(hit, eq, 0.0)),
+        "highlight": indices % HIGHLIGHT_EVERY == 0,
+    }
+
+
+def highlighted_lines(lines: dict[str, np.ndarray]) -> list[dict]:
+    """Per-line dicts (labels, arc points) for the highlighted lines only."""
+    mask = lines["highlight"]
+    out = []
+    for i, x_val, y_min, y_max, hit, y0 in zip(
+        lines["i"][mask].tolist(),
+        lines["x"][mask].tolist(),
+        lines["y_min"][mask].tolist(),
+        lines["y_max"][mask].tolist(),
+        lines["hit"][mask].tolist(),
+        lines["y0"][mask].tolist(),
+    ):
+        letter_index = i // HIGHLIGHT_EVERY - 1
+        if letter_index < len(LETTERS):
+            axis_label = LETTERS[letter_index]
+        else:
+            axis_label = f"L{i}"
+        arcs = []
+        if hit:
+            if y0 == 0:
+                arcs.append({"x": x_val, "y": 0.0, "label": f'{i}"'})
+            else:
+                arcs.append({"x": x_val, "y": y0, "label": f'{i}"'})
+                arcs.append({"x": x_val, "y": -y0, "label": f'{i}~'})
+        out.append({
+            "i": i, "x_val": x_val, "y_min": y_min, "y_max": y_max,
+            "axis_label": axis_label, "slant_label": axis_label + "'",
+            "arcs": arcs,
+        })
+    return out
+
+
+def _points(xs: np.ndarray, ys: np.ndarray) -> list[dict]:
+    return [{"x": x, "y": y} for x, y in zip(xs.tolist(), ys.tolist())]
+
+
+# ============================================================
+# Adaptive Curve Sampling
+# ============================================================
+
+MAX_SUBDIVISION_DEPTH = 20
+
+
+def sample_conic(
+    focus_dist: float,
+    e: float,
+    x_start: float,
+    x_stop: float,
+    tolerance: float,
+) -> list[tuple[float, float]]:
+    """
+    Sample the upper branch of the conic between two abscissae.
+
+    The conic with directrix x=0, focus (focus_dist, 0) and eccentricity e
+    is y = sqrt((e·x)² - (focus_dist - x)²). Intervals are halved until the
+    curve's midpoint lies within ``tolerance`` of the chord, so flat
+    stretches get few points and the vertex (vertical tangent) gets many.
+
+    Returns:
+        (x, y) points in increasing x, starting at ``x_start``.
+    """
+    def y_at(x: float) -> float:
+        return math.sqrt(max(0.0, (e * x) ** 2 - (focus_dist - x) ** 2))
+
+    def deviation(x0: float, y0: float, x1: float, y1: float) -> float:
+        xm = (x0 + x1) / 2
+        ym = y_at(xm)
+        dx, dy = x1 - x0, y1 - y0
+        return abs(dx * (ym - y0) - dy * (xm - x0)) / math.hypot(dx, dy)
+
+    points = [(x_start, y_at(x_start))]
+    # Depth-first over (x0, y0, x1, y1, depth); right halves are pushed
+    # first so points come out in increasing x
+    stack = [(x_start, points[0][1], x_stop, y_at(x_stop), 0)]
+    while stack:
+        x0, y0, x1, y1, depth = stack.pop()
+        if depth < MAX_SUBDIVISION_DEPTH and deviation(x0, y0, x1, y1) > tolerance:
+            xm = (x0 + x1) / 2
+            ym = y_at(xm)
+            stack.append((xm, ym, x1, y1, depth + 1))
+            stack.append((x0, y0, xm, ym, depth + 1))
+        else:
+            points.append((x1, y1))
+    return points
+
+
 def compute_ellipse(
     focus_dist: float = 80.0,
     eccentricity_str: str = "3/5",
     canvas_width: float = 1200.0,
     canvas_height: float = 700.0,
+    tolerance: float | None = None,
 ) -> CurveResponse:
     """
     Compute all 11 steps of the focus-directrix conic construction.
 
     Returns cumulative RenderElement arrays for each step.
     """
+    return CurveResponse.model_validate(ellipse_payload(
+        focus_dist, eccentricity_str, canvas_width, canvas_height,
+        tolerance=tolerance,
+    ))
+
+
+def ellipse_payload(
+    focus_dist: float = 80.0,
+    eccentricity_str: str = "3/5",
+    canvas_width: float = 1200.0,
+    canvas_height: float = 700.0,
+    steps: Iterable[int] | None = None,
+    tolerance: float | None = None,
+) -> dict:
+    """
+    Compute the conic construction as a plain CurveResponse-shaped dict.
+
+    Elements are built as dicts (app.engine.elements) rather than Pydantic
+    models; the API serializes this payload directly. With ``steps``, only
+    those steps are rendered.
+
+    By default the curve is traced through every 0.5 mm construction line,
+    as the legacy page does. With ``tolerance`` (mm), only the highlighted
+    lines are computed and the curve polyline is sampled adaptively so that
+    no chord strays further than ``tolerance`` from the true conic.
+    """
     e = parse_eccentricity(eccentricity_str)
 
     # Validate eccentricity range
     if e <= 0:
         raise ValueError("Eccentricity must be positive")
+    if tolerance is not None and tolerance <= 0:
+        raise ValueError("Tolerance must be positive")
     if 0.8 < e < 1.0:
         e = 0.85  # Matches legacy: values between 0.8-1 cause overflow
 
@@ -69,51 +247,30 @@ def compute_ellipse(
     x_ext = dx * factor
     y_ext = dy * factor
 
-    # ── Define vertical lines ──
-    line_data = []
-    letter_count = 0
-    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-    for i in range(1, max_lines + 1):
-        x_val = x_v + i * 0.5
-        t = x_val / vp["x"] if abs(vp["x"]) > 1e-9 else 0.0
-        y_val = t * vp["y"]
-        y_min = -80.0 if y_val >= 0 else y_val - 2.0
-        y_max = y_val + 2.0 if y_val >= 0 else 80.0
-
-        is_20th = (i % 20 == 0)
-        axis_label = ""
-        slant_label = ""
-        if is_20th:
-            if letter_count < len(letters):
-                axis_label = letters[letter_count]
-                slant_label = letters[letter_count] + "'"
-            else:
-                axis_label = f"L{i}"
-                slant_label = f"L{i}'"
-            letter_count += 1
-
-        line_data.append({
-            "i": i, "x_val": x_val, "y_min": y_min, "y_max": y_max,
-            "is_20th": is_20th, "axis_label": axis_label,
-            "slant_label": slant_label, "arcs": [],
-        })
-
-    # ── Compute arc intersections ──
-    for obj in line_data:
-        x_val = obj["x_val"]
-        t = x_val / vp["x"] if abs(vp["x"]) > 1e-9 else 0.0
-        y_val = t * vp["y"]
-        dist = abs(y_val)
-        eq = dist * dist - (focus_dist - x_val) ** 2
-        if eq < 0:
-            continue
-        y0 = math.sqrt(eq)
-        if y0 == 0:
-            obj["arcs"].append({"x": x_val, "y": 0.0, "label": f'{obj["i"]}"'})
-        else:
-            obj["arcs"].append({"x": x_val, "y": y0, "label": f'{obj["i"]}"'})
-            obj["arcs"].append({"x": x_val, "y": -y0, "label": f'{obj["i"]}~'})
+    # ── Vertical lines and arc intersections ──
+    if tolerance is None:
+        indices = np.arange(1, max_lines + 1)
+    else:
+        # Only the highlighted lines are ever drawn; the curve itself is
+        # sampled adaptively below instead of through every line
+        indices = np.arange(HIGHLIGHT_EVERY, max_lines + 1, HIGHLIGHT_EVERY)
+    lines = construction_lines(indices, x_v, vp, focus_dist)
+    line_data = highlighted_lines(lines)
+
+    # ── Curve polylines (above / below the axis, without V) ──
+    if tolerance is None:
+        # Lines are in increasing x, so the points come out sorted
+        hit = lines["hit"]
+        below = hit & (lines["y0"] != 0)
+        pts_above = _points(lines["x"][hit], lines["y0"][hit])
+        pts_below = _points(lines["x"][below], -lines["y0"][below])
+    else:
+        x_stop = x_v + max_lines * LINE_SPACING
+        if e < 1:
+            x_stop = min(x_stop, focus_dist / (1 - e))  # far vertex
+        samples = sample_conic(focus_dist, e, x_v, x_stop, tolerance)[1:]
+        pts_above = [{"x": x, "y": y} for x, y in samples]
+        pts_below = [{"x": x, "y": -y} for x, y in samples]
 
     # ── Build step instructions (cumulative) ──
     step_texts = [
@@ -131,130 +288,119 @@ def compute_ellipse(
         "11) Done. Press Reset to start again.",
     ]
 
-    all_steps: list[StepInstruction] = []
-
-    for step_num in range(1, 12):
-        elements: list = []
-
-        # Step 1: Directrix
-        if step_num >= 1:
-            elements.append(LineElement(x1=0, y1=-100, x2=0, y2=100, style="construction"))
-            elements.append(PointElement(x=0, y=100, label="D"))
-            elements.append(PointElement(x=0, y=-100, label="D'"))
-
-        # Step 2: Axis line
-        if step_num >= 2:
-            elements.append(PointElement(x=0, y=0, label="A"))
-            elements.append(LineElement(x1=0, y1=0, x2=250, y2=0, style="construction"))
-
-        # Step 3: Focus F + dimension
-        if step_num >= 3:
-            elements.append(PointElement(x=focus_dist, y=0, label="F"))
-            # Dimension line for AF
-            elements.append(LineElement(x1=0, y1=-15, x2=focus_dist, y2=-15, style="construction"))
-            elements.append(LineElement(x1=0, y1=0, x2=0, y2=-15, style="construction"))
-            elements.append(LineElement(x1=focus_dist, y1=0, x2=focus_dist, y2=-15, style="construction"))
-            elements.append(ArrowElement(from_x=focus_dist, from_y=-15, to_x=0, to_y=-15))
-            elements.append(ArrowElement(from_x=0, from_y=-15, to_x=focus_dist, to_y=-15))
-            elements.append(LabelElement(x=focus_dist / 2, y=-20, text=f"{focus_dist:.0f} mm"))
-
-        # Step 4: Vertex V
-        if step_num >= 4:
-            elements.append(PointElement(x=v["x"], y=v["y"], label="V"))
-
-        # Step 5: V→V' and slant extension
-        if step_num >= 5:
-            elements.append(LineElement(x1=v["x"], y1=0, x2=vp["x"], y2=vp["y"], style="construction"))
-            elements.append(PointElement(x=vp["x"], y=vp["y"], label="V'"))
-            elements.append(LineElement(x1=0, y1=0, x2=x_ext, y2=y_ext, style="construction"))
-
-        # Step 6: Vertical construction lines
-        if step_num >= 6:
-            for obj in line_data:
-                if obj["is_20th"]:
-                    elements.append(LineElement(
-                        x1=obj["x_val"], y1=obj["y_min"],
-                        x2=obj["x_val"], y2=obj["y_max"],
-                        style="construction",
-                    ))
-                    elements.append(PointElement(x=obj["x_val"], y=0, label=obj["axis_label"]))
-                    t = obj["x_val"] / vp["x"] if abs(vp["x"]) > 1e-9 else 0
-                    y_val = t * vp["y"]
-                    elements.append(PointElement(x=obj["x_val"], y=y_val, label=obj["slant_label"]))
-
-        # Step 7-8: Arc intersections
-        if step_num >= 7:
-            for obj in line_data:
-                if not obj["arcs"]:
-                    continue
-                x_val = obj["x_val"]
-                t = x_val / vp["x"] if abs(vp["x"]) > 1e-9 else 0
-                y_val = t * vp["y"]
-                dist = abs(y_val)
-
-                for arc_pt in obj["arcs"]:
-                    angle = math.atan2(arc_pt["y"], arc_pt["x"] - focus_dist)
-                    d_spread = 5.0  # degrees
-                    if obj["is_20th"]:
-                        elements.append(ArcElement(
-                            center_x=focus_dist, center_y=0,
-                            radius=dist,
-                            start_angle=math.degrees(angle) - d_spread,
-                            end_angle=math.degrees(angle) + d_spread,
-                        ))
-                    if obj["is_20th"]:
-                        elements.append(PointElement(
-                            x=arc_pt["x"], y=arc_pt["y"],
-                            label=arc_pt["label"],
-                        ))
-
-        # Step 10+: Final shape polyline
-        if step_num >= 10:
-            pts_above = []
-            pts_below = []
-            for obj in line_data:
-                for p in obj["arcs"]:
-                    if p["label"].endswith("~"):
-                        pts_below.append(p)
-                    else:
-                        pts_above.append(p)
-
-            pts_above.sort(key=lambda p: p["x"])
-            pts_below.sort(key=lambda p: p["x"])
-
-            # Top polyline: V → above points
-            if pts_above:
-                top_pts = [{"x": v["x"], "y": v["y"]}] + [{"x": p["x"], "y": p["y"]} for p in pts_above]
-                elements.append(PolygonElement(points=top_pts, style="visible", closed=False))
-
-            # Bottom polyline: V → below points
-            if pts_below:
-                bot_pts = [{"x": v["x"], "y": v["y"]}] + [{"x": p["x"], "y": p["y"]} for p in pts_below]
-                elements.append(PolygonElement(points=bot_pts, style="visible", closed=False))
-
-            # Re-add dimension
-            elements.append(LineElement(x1=0, y1=-15, x2=focus_dist, y2=-15, style="construction"))
-            elements.append(ArrowElement(from_x=focus_dist, from_y=-15, to_x=0, to_y=-15))
-            elements.append(ArrowElement(from_x=0, from_y=-15, to_x=focus_dist, to_y=-15))
-            elements.append(LabelElement(x=focus_dist / 2, y=-20, text=f"{focus_dist:.0f} mm"))
-
-        all_steps.append(StepInstruction(
+    # Each step's new elements are built once, as a layer. A step is the
+    # concatenation of the layers up to it, so later steps share the
+    # element dicts of earlier ones instead of rebuilding them.
+    layers: list[list[dict]] = [[] for _ in range(11)]
+
+    # Step 1: Directrix
+    layer = layers[0]
+    layer.append(line_element(x1=0, y1=-100, x2=0, y2=100, style="construction"))
+    layer.append(point_element(x=0, y=100, label="D"))
+    layer.append(point_element(x=0, y=-100, label="D'"))
+
+    # Step 2: Axis line
+    layer = layers[1]
+    layer.append(point_element(x=0, y=0, label="A"))
+    layer.append(line_element(x1=0, y1=0, x2=250, y2=0, style="construction"))
+
+    # Step 3: Focus F + dimension
+    layer = layers[2]
+    layer.append(point_element(x=focus_dist, y=0, label="F"))
+    # Dimension line for AF
+    layer.append(line_element(x1=0, y1=-15, x2=focus_dist, y2=-15, style="construction"))
+    layer.append(line_element(x1=0, y1=0, x2=0, y2=-15, style="construction"))
+    layer.append(line_element(x1=focus_dist, y1=0, x2=focus_dist, y2=-15, style="construction"))
+    layer.append(arrow_element(from_x=focus_dist, from_y=-15, to_x=0, to_y=-15))
+    layer.append(arrow_element(from_x=0, from_y=-15, to_x=focus_dist, to_y=-15))
+    layer.append(label_element(x=focus_dist / 2, y=-20, text=f"{focus_dist:.0f} mm"))
+
+    # Step 4: Vertex V
+    layer = layers[3]
+    layer.append(point_element(x=v["x"], y=v["y"], label="V"))
+
+    # Step 5: V→V' and slant extension
+    layer = layers[4]
+    layer.append(line_element(x1=v["x"], y1=0, x2=vp["x"], y2=vp["y"], style="construction"))
+    layer.append(point_element(x=vp["x"], y=vp["y"], label="V'"))
+    layer.append(line_element(x1=0, y1=0, x2=x_ext, y2=y_ext, style="construction"))
+
+    # Step 6: Vertical construction lines
+    layer = layers[5]
+    for obj in line_data:
+        layer.append(line_element(
+            x1=obj["x_val"], y1=obj["y_min"],
+            x2=obj["x_val"], y2=obj["y_max"],
+            style="construction",
+        ))
+        layer.append(point_element(x=obj["x_val"], y=0, label=obj["axis_label"]))
+        t = obj["x_val"] / vp["x"] if abs(vp["x"]) > 1e-9 else 0
+        y_val = t * vp["y"]
+        layer.append(point_element(x=obj["x_val"], y=y_val, label=obj["slant_label"]))
+
+    # Step 7-8: Arc intersections
+    layer = layers[6]
+    for obj in line_data:
+        if not obj["arcs"]:
+            continue
+        x_val = obj["x_val"]
+        t = x_val / vp["x"] if abs(vp["x"]) > 1e-9 else 0
+        y_val = t * vp["y"]
+        dist = abs(y_val)
+
+        for arc_pt in obj["arcs"]:
+            angle = math.atan2(arc_pt["y"], arc_pt["x"] - focus_dist)
+            d_spread = 5.0  # degrees
+            layer.append(arc_element(
+                center_x=focus_dist, center_y=0,
+                radius=dist,
+                start_angle=math.degrees(angle) - d_spread,
+                end_angle=math.degrees(angle) + d_spread,
+            ))
+            layer.append(point_element(
+                x=arc_pt["x"], y=arc_pt["y"],
+                label=arc_pt["label"],
+            ))
+
+    # Step 10+: Final shape polyline
+    layer = layers[9]
+    # Top polyline: V → above points
+    if pts_above:
+        top_pts = [{"x": v["x"], "y": v["y"]}] + [{"x": p["x"], "y": p["y"]} for p in pts_above]
+        layer.append(polygon_element(points=top_pts, style="visible", closed=False))
+
+    # Bottom polyline: V → below points
+    if pts_below:
+        bot_pts = [{"x": v["x"], "y": v["y"]}] + [{"x": p["x"], "y": p["y"]} for p in pts_below]
+        layer.append(polygon_element(points=bot_pts, style="visible", closed=False))
+
+    # Re-add dimension
+    layer.append(line_element(x1=0, y1=-15, x2=focus_dist, y2=-15, style="construction"))
+    layer.append(arrow_element(from_x=focus_dist, from_y=-15, to_x=0, to_y=-15))
+    layer.append(arrow_element(from_x=0, from_y=-15, to_x=focus_dist, to_y=-15))
+    layer.append(label_element(x=focus_dist / 2, y=-20, text=f"{focus_dist:.0f} mm"))
+
+    all_steps = [
+        dict(
             step_number=step_num,
             title=f"Step {step_num}",
             description=step_texts[step_num] if step_num < len(step_texts) else "Done.",
-            elements=elements,
-        ))
+            elements=[el for layer in layers[:step_num] for el in layer],
+        )
+        for step_num in select_steps(11, steps)
+    ]
 
-    return CurveResponse(
+    return dict(
         total_steps=11,
         steps=all_steps,
-        metadata=CurveMetadata(
+        metadata=dict(
             curve_type="ellipse" if e < 1 else ("parabola" if abs(e - 1) < 0.001 else "hyperbola"),
             parameters={
                 "focus_dist": focus_dist,
                 "eccentricity": e,
                 "vertex_x": round(x_v, 2),
-                "max_lines": max_lines,
+                "max_lines": float(max_lines),
+                **({} if tolerance is None else {"tolerance": tolerance}),
             },
         ),
     )
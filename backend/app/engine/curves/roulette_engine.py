@@ -0,0 +1,462 @@
+"""
+Roulette Engine — Cycloid, Epicycloid, Hypocycloid and Involute.
+
+Generalizes cycloid_engine.py (8 divisions, point-by-point arc
+intersections) to an N-division construction for the whole roulette
+family. All construction points are evaluated as NumPy arrays; Python
+only loops to emit render elements. Produces 10 cumulative steps with the
+same structure as the cycloid construction:
+
+  1 generating circle   2 divide it      3 directing line/arc
+  4 divide that         5-6 loci of the division points
+  7 centres (tangent lines for the involute)
+  8-9 arcs marking the curve points     10 join them
+
+Key math (math frame, y up; r generating radius, R directing radius,
+φ = 2πk/N the rolling angle after k divisions, θ = rφ/R):
+  - Cycloid:     C = (rφ, r),                     P = C - r(sin φ, cos φ)
+  - Epicycloid:  C = (R+r)(sin(θ0+θ), cos(θ0+θ)), P = C - r(sin(θ0+θ+φ), cos(θ0+θ+φ))
+  - Hypocycloid: C = (R-r)(sin(θ0+θ), cos(θ0+θ)), P = C + r(sin(θ0+θ-φ), cos(θ0+θ-φ))
+  - Involute:    T = (0, r) - r(sin φ, cos φ),    P = T + rφ(cos φ, -sin φ)
+
+Division point k of the generating circle is P_k's mirror image about
+the line of centres, so it lies on the same line/arc as P_k (step 5-6).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+from app.engine.elements import (
+    arc_element, label_element, line_element, point_element, polyline_element,
+)
+from app.engine.renderer import select_steps
+
+ROULETTE_KINDS = ("cycloid", "epicycloid", "hypocycloid", "involute")
+
+TOTAL_STEPS = 10
+MIN_DIVISIONS = 4
+MAX_DIVISIONS = 720
+# The final curve gets at least this many segments; it still passes
+# exactly through every construction point
+MIN_CURVE_SEGMENTS = 240
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# Start point of the construction, screen coordinates (y down) — same
+# placement as cycloid_engine.py
+START_X = 150.0
+START_Y = 350.0
+
+
+# ============================================================
+# Construction Geometry (math frame, y up)
+# ============================================================
+
+def _rolled(
+    kind: str,
+    phi: np.ndarray,
+    r: float,
+    big_r: float,
+    theta0: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Centre (or tangent point) and tracing point after rolling by ``phi``.
+
+    Returns:
+        Tuple of (cx, cy, px, py) arrays.
+    """
+    match kind:
+        case "cycloid":
+            cx = r * phi
+            cy = np.full_like(phi, r)
+            return cx, cy, cx - r * np.sin(phi), cy - r * np.cos(phi)
+        case "epicycloid":
+            theta = theta0 + r * phi / big_r
+            cx = (big_r + r) * np.sin(theta)
+            cy = (big_r + r) * np.cos(theta)
+            return cx, cy, cx - r * np.sin(theta + phi), cy - r * np.cos(theta + phi)
+        case "hypocycloid":
+            theta = theta0 + r * phi / big_r
+            cx = (big_r - r) * np.sin(theta)
+            cy = (big_r - r) * np.cos(theta)
+            return cx, cy, cx + r * np.sin(theta - phi), cy + r * np.cos(theta - phi)
+        case "involute":
+            tx = -r * np.sin(phi)
+            ty = r - r * np.cos(phi)
+            return tx, ty, tx + r * phi * np.cos(phi), ty - r * phi * np.sin(phi)
+    raise ValueError(f"Unknown roulette kind: {kind}")
+
+
+def _division_points(
+    kind: str,
+    phi: np.ndarray,
+    r: float,
+    big_r: float,
+    theta0: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Division points of the generating circle in its starting position."""
+    match kind:
+        case "cycloid":
+            return r * np.sin(phi), r - r * np.cos(phi)
+        case "epicycloid":
+            c = big_r + r
+            return (
+                c * math.sin(theta0) - r * np.sin(theta0 - phi),
+                c * math.cos(theta0) - r * np.cos(theta0 - phi),
+            )
+        case "hypocycloid":
+            c = big_r - r
+            return (
+                c * math.sin(theta0) + r * np.sin(theta0 + phi),
+                c * math.cos(theta0) + r * np.cos(theta0 + phi),
+            )
+        case _:  # involute: the tangent points themselves
+            cx, cy, _, _ = _rolled(kind, phi, r, big_r, theta0)
+            return cx, cy
+
+
+def _canvas_angle(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Canvas angle (degrees, y down) of math-frame vectors."""
+    return np.degrees(np.arctan2(-y, x))
+
+
+# ============================================================
+# Payload
+# ============================================================
+
+def roulette_payload(
+    kind: str = "cycloid",
+    diameter: float = 100.0,
+    divisions: int = 12,
+    base_diameter: float = 300.0,
+    canvas_width: float = 1200.0,
+    canvas_height: float = 700.0,
+    steps: Iterable[int] | None = None,
+) -> dict:
+    """
+    Compute a roulette construction as a plain CurveResponse-shaped dict.
+
+    Args:
+        kind: "cycloid", "epicycloid", "hypocycloid" or "involute".
+        diameter: Generating circle diameter (the involute's base circle).
+        divisions: Number of equal divisions N of the generating circle.
+        base_diameter: Directing circle diameter (epi-/hypocycloid only).
+        steps: Render only these steps (all by default).
+
+    Raises:
+        ValueError: If the kind or the dimensions are invalid.
+    """
+    if kind not in ROULETTE_KINDS:
+        raise ValueError(f"Unknown roulette kind: {kind}")
+    if not MIN_DIVISIONS <= divisions <= MAX_DIVISIONS:
+        raise ValueError(
+            f"divisions must be between {MIN_DIVISIONS} and {MAX_DIVISIONS}"
+        )
+    if kind == "epicycloid" and base_diameter < diameter:
+        raise ValueError("Epicycloid directing circle must be at least as large as the rolling circle")
+    if kind == "hypocycloid" and base_diameter <= diameter:
+        raise ValueError("Hypocycloid directing circle must be larger than the rolling circle")
+
+    n = divisions
+    half = n // 2
+    r = diameter / 2
+    big_r = base_diameter / 2
+    circumference = math.pi * diameter
+    rolling = kind in ("epicycloid", "hypocycloid")
+    sweep = circumference / big_r if rolling else 0.0   # directing arc angle
+    theta0 = -sweep / 2                                 # centre it on the top
+
+    # Screen placement: math (x, y) → (origin_x + x, origin_y - y)
+    if rolling:
+        origin_x, origin_y = canvas_width / 2, START_Y + big_r
+    else:
+        origin_x, origin_y = START_X, START_Y
+
+    def sx(x):
+        return origin_x + x
+
+    def sy(y):
+        return origin_y - y
+
+    k = np.arange(n + 1)
+    phi = 2 * np.pi * k / n
+    cx, cy, px, py = _rolled(kind, phi, r, big_r, theta0)
+    dx, dy = _division_points(kind, phi[:n], r, big_r, theta0)
+
+    # Directing line / arc and its N + 1 division points
+    if rolling:
+        dir_angle = theta0 + sweep * k / n
+        bx, by = big_r * np.sin(dir_angle), big_r * np.cos(dir_angle)
+    else:
+        bx, by = circumference * k / n, np.zeros(n + 1)
+
+    # Everything the element loops need, as plain floats
+    cx_s, cy_s = sx(cx).tolist(), sy(cy).tolist()
+    px_s, py_s = sx(px).tolist(), sy(py).tolist()
+    dx_s, dy_s = sx(dx).tolist(), sy(dy).tolist()
+    bx_s, by_s = sx(bx).tolist(), sy(by).tolist()
+    # Arcs from each centre (tangent point) through its curve point
+    arc_mid = _canvas_angle(px - cx, py - cy).tolist()
+    if kind == "involute":
+        arc_radius = (r * phi).tolist()
+        spread = 10.0
+    else:
+        arc_radius = [r] * (n + 1)
+        spread = 30.0
+    labels = list(LETTERS[:n + 1]) if n + 1 <= len(LETTERS) else [f"P{i}" for i in range(n + 1)]
+
+    # Generating circle in its starting position
+    c0x, c0y = cx_s[0], cy_s[0]
+    if kind == "involute":
+        c0x, c0y = sx(0.0), sy(r)
+
+    # Dense curve through the construction points
+    oversample = max(1, math.ceil(MIN_CURVE_SEGMENTS / n))
+    _, _, curve_x, curve_y = _rolled(
+        kind, np.linspace(0.0, 2 * np.pi, n * oversample + 1), r, big_r, theta0,
+    )
+
+    name = kind.capitalize()
+    step_texts = _step_texts(kind, n, half, labels)
+
+    layers: list[list[dict]] = [[] for _ in range(TOTAL_STEPS)]
+
+    # ── Step 1: Generating circle + centre O ──
+    layer = layers[0]
+    layer.append(arc_element(center_x=c0x, center_y=c0y, radius=r, start_angle=0, end_angle=360))
+    layer.append(point_element(x=c0x, y=c0y, label="O"))
+    if rolling:
+        layer.append(point_element(x=sx(0.0), y=sy(0.0), label="C"))
+
+    # ── Step 2: Circle division points ──
+    layer = layers[1]
+    for i, (x, y) in enumerate(zip(dx_s, dy_s)):
+        layer.append(point_element(x=x, y=y, label=str(i + 1)))
+
+    # ── Step 3: Directing line / arc of length πd ──
+    layer = layers[2]
+    if rolling:
+        angles = _canvas_angle(bx[[0, -1]], by[[0, -1]]).tolist()
+        layer.append(arc_element(
+            center_x=sx(0.0), center_y=sy(0.0), radius=big_r,
+            start_angle=angles[0], end_angle=angles[0] + math.degrees(sweep),
+        ))
+        layer.append(label_element(
+            x=sx(0.0) - 80, y=sy(big_r) - 2 * r - 30,
+            text=f"Directing arc (πd = {circumference:.1f}mm, R = {big_r:g}mm)",
+        ))
+    else:
+        layer.append(line_element(
+            x1=bx_s[0], y1=by_s[0], x2=bx_s[-1], y2=by_s[-1], style="visible",
+        ))
+        layer.append(label_element(
+            x=START_X + circumference / 2 - 80, y=START_Y + 20,
+            text=f"Baseline (πd = {circumference:.1f}mm)",
+        ))
+
+    # ── Step 4: Directing divisions + end line ──
+    layer = layers[3]
+    for i, (x, y) in enumerate(zip(bx_s, by_s)):
+        layer.append(point_element(x=x, y=y, label="1" if i == 0 else f"{i}'"))
+    if kind != "involute":
+        # Normal at the end of the directing line, one diameter long
+        ex, ey = _normal_end(kind, bx[-1], by[-1], big_r, diameter)
+        layer.append(line_element(
+            x1=bx_s[-1], y1=by_s[-1], x2=sx(ex), y2=sy(ey), style="construction",
+        ))
+        layer.append(label_element(x=sx(ex) + 5, y=sy(ey), text=f"{n}'"))
+
+    # ── Steps 5-6: Loci of the division points ──
+    for layer, indices in ((layers[4], range(half)), (layers[5], range(half, n))):
+        for i in indices:
+            layer.extend(_division_locus(
+                kind, i, dx, dy, dx_s, dy_s, bx, by, c0x, c0y, sx, sy,
+            ))
+
+    # ── Step 7: Centres O1..ON (tangents for the involute) ──
+    layer = layers[6]
+    if kind == "involute":
+        for i in range(1, n + 1):
+            length = arc_radius[i] + circumference / n
+            ux, uy = math.cos(phi[i]), -math.sin(phi[i])
+            layer.append(line_element(
+                x1=cx_s[i], y1=cy_s[i],
+                x2=sx(float(cx[i]) + length * ux), y2=sy(float(cy[i]) + length * uy),
+                style="construction",
+            ))
+    else:
+        if rolling:
+            locus = big_r + r if kind == "epicycloid" else big_r - r
+            angles = _canvas_angle(bx[[0, -1]], by[[0, -1]]).tolist()
+            layer.append(arc_element(
+                center_x=sx(0.0), center_y=sy(0.0), radius=locus,
+                start_angle=angles[0], end_angle=angles[0] + math.degrees(sweep),
+            ))
+        for i in range(1, n + 1):
+            ex, ey = _normal_end(kind, bx[i], by[i], big_r, diameter)
+            layer.append(line_element(
+                x1=bx_s[i], y1=by_s[i], x2=sx(ex), y2=sy(ey), style="construction",
+            ))
+            layer.append(point_element(x=cx_s[i], y=cy_s[i], label=f"O{i}"))
+
+    # ── Steps 8-9: Arcs from the centres mark the curve points ──
+    for layer, indices in ((layers[7], range(half)), (layers[8], range(half, n + 1))):
+        for i in indices:
+            if i > 0:
+                layer.append(arc_element(
+                    center_x=cx_s[i], center_y=cy_s[i],
+                    radius=arc_radius[i],
+                    start_angle=arc_mid[i] - spread,
+                    end_angle=arc_mid[i] + spread,
+                ))
+            layer.append(point_element(x=px_s[i], y=py_s[i], label=labels[i]))
+
+    # ── Step 10: Smooth curve through all points ──
+    layer = layers[9]
+    layer.append(polyline_element(sx(curve_x).tolist(), sy(curve_y).tolist(), style="visible"))
+    layer.append(label_element(
+        x=(min(px_s) + max(px_s)) / 2 - 50,
+        y=(min(py_s) + max(py_s)) / 2 - 20,
+        text=f"{name} Curve (Complete)",
+        font_size=14,
+    ))
+
+    all_steps = [
+        dict(
+            step_number=step_num,
+            title=f"Step {step_num}",
+            description=step_texts[step_num - 1],
+            elements=[el for layer in layers[:step_num] for el in layer],
+        )
+        for step_num in select_steps(TOTAL_STEPS, steps)
+    ]
+
+    parameters: dict[str, float | str] = {
+        "diameter": diameter,
+        "radius": r,
+        "divisions": float(n),
+        "circumference": round(circumference, 2),
+    }
+    if rolling:
+        parameters["base_diameter"] = base_diameter
+    return dict(
+        total_steps=TOTAL_STEPS,
+        steps=all_steps,
+        metadata=dict(curve_type=kind, parameters=parameters),
+    )
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def _normal_end(
+    kind: str,
+    x: float,
+    y: float,
+    big_r: float,
+    length: float,
+) -> tuple[float, float]:
+    """End of the normal to the directing line/arc at (x, y), on the curve side."""
+    x, y = float(x), float(y)
+    match kind:
+        case "epicycloid":
+            scale = (big_r + length) / big_r
+            return x * scale, y * scale
+        case "hypocycloid":
+            scale = (big_r - length) / big_r
+            return x * scale, y * scale
+        case _:
+            return x, y + length
+
+
+def _division_locus(
+    kind: str,
+    i: int,
+    dx: np.ndarray,
+    dy: np.ndarray,
+    dx_s: list[float],
+    dy_s: list[float],
+    bx: np.ndarray,
+    by: np.ndarray,
+    c0x: float,
+    c0y: float,
+    sx,
+    sy,
+) -> list[dict]:
+    """
+    Path of division point ``i`` while rolling: a line parallel to the
+    baseline (cycloid), an arc concentric with the directing circle
+    (epi-/hypocycloid) or the radius to the tangent point (involute).
+    """
+    match kind:
+        case "cycloid":
+            return [line_element(
+                x1=dx_s[i], y1=dy_s[i], x2=sx(float(bx[-1])), y2=dy_s[i],
+                style="construction",
+            )]
+        case "involute":
+            return [line_element(
+                x1=c0x, y1=c0y, x2=dx_s[i], y2=dy_s[i], style="construction",
+            )]
+    radius = math.hypot(float(dx[i]), float(dy[i]))
+    start = math.degrees(math.atan2(-float(dy[i]), float(dx[i])))
+    end = math.degrees(math.atan2(-float(by[-1]), float(bx[-1])))
+    if end < start:
+        end += 360.0
+    return [arc_element(
+        center_x=sx(0.0), center_y=sy(0.0), radius=radius,
+        start_angle=start, end_angle=end,
+    )]
+
+
+def _step_texts(kind: str, n: int, half: int, labels: list[str]) -> list[str]:
+    """Step descriptions for a construction with ``n`` divisions."""
+    first_half = f"{labels[0]}-{labels[half - 1]}"
+    second_half = f"{labels[half]}-{labels[n]}"
+    texts = [
+        "Step 1: Draw the generating circle of given diameter and mark the center as O.",
+        f"Step 2: Divide the circle into {n} equal parts and name each division (1-{n}).",
+    ]
+    match kind:
+        case "cycloid":
+            texts += [
+                "Step 3: Draw a baseline from point 1 for length = circumference of the circle.",
+                f"Step 4: Divide the baseline into {n} equal parts. Draw a vertical line at the end point with height = diameter.",
+                f"Step 5: Draw lines parallel to the baseline from circle points 1-{half}.",
+                f"Step 6: Continue the parallel lines from circle points {half + 1}-{n}.",
+                f"Step 7: Draw vertical lines from the baseline divisions. Mark center-line intersections as O1-O{n}.",
+            ]
+        case "epicycloid" | "hypocycloid":
+            side = "outside" if kind == "epicycloid" else "inside"
+            texts += [
+                f"Step 3: Draw the directing circle arc (rolling circle {side}) with arc length = circumference of the rolling circle.",
+                f"Step 4: Divide the directing arc into {n} equal parts. Draw the radial line at the end point.",
+                f"Step 5: Draw arcs concentric with the directing circle through circle points 1-{half}.",
+                f"Step 6: Continue the concentric arcs through circle points {half + 1}-{n}.",
+                f"Step 7: Draw the locus of the center and radial lines through the arc divisions. Mark the centers O1-O{n}.",
+            ]
+        case "involute":
+            texts += [
+                "Step 3: Draw the tangent at point 1 for length = circumference of the circle.",
+                f"Step 4: Divide the tangent into {n} equal parts.",
+                f"Step 5: Join the center O to circle points 1-{half}.",
+                f"Step 6: Join the center O to circle points {half + 1}-{n}.",
+                "Step 7: Draw tangents at the circle points, perpendicular to the radii.",
+            ]
+    if kind == "involute":
+        texts += [
+            f"Step 8: Step off 1, 2, 3... baseline divisions along the tangents to locate points {first_half}.",
+            f"Step 9: Continue along the remaining tangents to locate points {second_half}.",
+        ]
+    else:
+        texts += [
+            f"Step 8: From the centers, draw arcs of radius r to mark curve points {first_half}.",
+            f"Step 9: Continue the arcs to mark points {second_half}.",
+        ]
+    texts.append(f"Step 10: Join all points with a smooth curve to complete the {kind}.")
+    return texts
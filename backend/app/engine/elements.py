@@ -0,0 +1,191 @@
+"""
+Render element factories.
+
+Plain-dict constructors for the RenderElement union in
+app/schemas/projection.py. Engines that build elements directly (the curve
+engines) use these instead of instantiating Pydantic models: the dicts have
+exactly the shape of ``Model(...).model_dump()`` — same keys, same order,
+same defaults — but cost a single dict allocation each.
+
+The bounds helpers at the end measure element dicts, for exporters that
+fit a drawing onto a page or image.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+
+def line_element(
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    style: str = "visible",
+) -> dict:
+    """Equivalent of LineElement(...).model_dump()."""
+    return {
+        "type": "line",
+        "x1": float(x1),
+        "y1": float(y1),
+        "x2": float(x2),
+        "y2": float(y2),
+        "style": style,
+    }
+
+
+def polygon_element(
+    points: Iterable[dict],
+    style: str = "visible",
+    closed: bool = True,
+) -> dict:
+    """Equivalent of PolygonElement(...).model_dump()."""
+    return {
+        "type": "polygon",
+        "points": [{"x": float(p["x"]), "y": float(p["y"])} for p in points],
+        "style": style,
+        "closed": closed,
+    }
+
+
+def polyline_element(
+    xs: Iterable[float],
+    ys: Iterable[float],
+    style: str = "visible",
+    closed: bool = False,
+) -> dict:
+    """PolygonElement dict from separate coordinate sequences (e.g. arrays)."""
+    return {
+        "type": "polygon",
+        "points": [{"x": float(x), "y": float(y)} for x, y in zip(xs, ys)],
+        "style": style,
+        "closed": closed,
+    }
+
+
+def point_element(
+    x: float,
+    y: float,
+    label: str = "",
+    radius: float = 2.0,
+) -> dict:
+    """Equivalent of PointElement(...).model_dump()."""
+    return {
+        "type": "point",
+        "x": float(x),
+        "y": float(y),
+        "label": label,
+        "radius": float(radius),
+    }
+
+
+def label_element(
+    x: float,
+    y: float,
+    text: str,
+    font_size: float = 12.0,
+) -> dict:
+    """Equivalent of LabelElement(...).model_dump()."""
+    return {
+        "type": "label",
+        "x": float(x),
+        "y": float(y),
+        "text": text,
+        "font_size": float(font_size),
+    }
+
+
+def arc_element(
+    center_x: float,
+    center_y: float,
+    radius: float,
+    start_angle: float,
+    end_angle: float,
+) -> dict:
+    """Equivalent of ArcElement(...).model_dump()."""
+    return {
+        "type": "arc",
+        "center_x": float(center_x),
+        "center_y": float(center_y),
+        "radius": float(radius),
+        "start_angle": float(start_angle),
+        "end_angle": float(end_angle),
+    }
+
+
+def arrow_element(
+    from_x: float,
+    from_y: float,
+    to_x: float,
+    to_y: float,
+) -> dict:
+    """Equivalent of ArrowElement(...).model_dump()."""
+    return {
+        "type": "arrow",
+        "from_x": float(from_x),
+        "from_y": float(from_y),
+        "to_x": float(to_x),
+        "to_y": float(to_y),
+    }
+
+
+# Canvas region (min_x, min_y, max_x, max_y)
+Bounds = tuple[float, float, float, float]
+
+# Font size of point labels (DrawingConfig.label_font_size)
+LABEL_FONT_SIZE = 12.0
+
+
+def text_width(text: str, size: float) -> float:
+    """Rough text advance (Helvetica): about half an em per character."""
+    return len(text) * size * 0.5
+
+
+def element_bounds(elements: Iterable[dict]) -> Bounds | None:
+    """
+    Bounding box of the elements, or None if there are none. Text extents
+    are estimated (see text_width()).
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    for el in elements:
+        match el["type"]:
+            case "line":
+                xs += (el["x1"], el["x2"])
+                ys += (el["y1"], el["y2"])
+            case "polygon":
+                xs += (p["x"] for p in el["points"])
+                ys += (p["y"] for p in el["points"])
+            case "point":
+                xs.append(el["x"])
+                ys.append(el["y"])
+                if el["label"]:
+                    xs.append(el["x"] + 5 + text_width(el["label"], LABEL_FONT_SIZE))
+            case "label":
+                size = el["font_size"] or LABEL_FONT_SIZE
+                xs += (el["x"], el["x"] + text_width(el["text"], size))
+                ys += (el["y"] - size, el["y"])
+            case "arc":
+                r = el["radius"]
+                xs += (el["center_x"] - r, el["center_x"] + r)
+                ys += (el["center_y"] - r, el["center_y"] + r)
+            case "arrow":
+                xs += (el["from_x"], el["to_x"])
+                ys += (el["from_y"], el["to_y"])
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def steps_bounds(steps: Sequence[dict], pad: float = 20.0) -> Bounds:
+    """
+    Padded bounds over every step, so each step of a drawing can be shown
+    at the same scale and position.
+    """
+    found = [b for b in (element_bounds(s["elements"]) for s in steps) if b]
+    if not found:
+        return 0.0, 0.0, 1.0, 1.0
+    return (
+        min(b[0] for b in found) - pad, min(b[1] for b in found) - pad,
+        max(b[2] for b in found) + pad, max(b[3] for b in found) + pad,
+    )
@@ -7,12 +7,19 @@ Direct port of mathematical utilities from:
 
 All functions are pure — they take coordinates in, return coordinates out.
 No side effects, no canvas operations, no state mutation.
+
+The last section provides NumPy counterparts operating on (N, 2) float
+arrays, so whole corner sets can be rotated and visibility-tested in one
+call. They evaluate the same expressions in the same order as the scalar
+versions, so results are bit-for-bit identical.
 """
 
 from __future__ import annotations
 
 import math
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
+
+import numpy as np
 
 
 # ============================================================
@@ -84,6 +91,21 @@ def rotate_point(
 # Solid Utilities (core.js:550-556)
 # ============================================================
 
+# Side count by shape name; get_sides_count() looks the solid type up here
+# before falling back to the legacy substring scan
+SIDES_BY_SHAPE: dict[str, int] = {
+    "triangular": 3,
+    "square": 4,
+    "pentagonal": 5,
+    "hexagonal": 6,
+}
+_SIDES_BY_SOLID: dict[str, int] = {
+    f"{shape}-{form}": sides
+    for shape, sides in SIDES_BY_SHAPE.items()
+    for form in ("prism", "pyramid")
+}
+
+
 def get_sides_count(solid_type: str) -> int:
     """
     Get the number of sides for a solid type.
@@ -99,6 +121,9 @@ def get_sides_count(solid_type: str) -> int:
     Raises:
         ValueError: If solid type is not recognized.
     """
+    sides = _SIDES_BY_SOLID.get(solid_type)
+    if sides is not None:
+        return sides
     if "triangular" in solid_type:
         return 3
     if "square" in solid_type:
@@ -314,3 +339,255 @@ def point_in_polygon(pt: Point, polygon: list[Point]) -> bool:
             inside = not inside
         j = i
     return inside
+
+
+# ============================================================
+# Vectorized Kernels — (N, 2) float arrays
+# ============================================================
+
+def as_points_array(points: Iterable[Point] | Iterable[dict]) -> np.ndarray:
+    """
+    Convert Points, (x, y) pairs or {"x", "y"} corner dicts to an (N, 2) array.
+
+    Args:
+        points: Sequence of Point/LabeledPoint tuples, pairs or corner dicts.
+
+    Returns:
+        Array of shape (N, 2); shape (0, 2) for an empty input.
+    """
+    coords = [
+        (p["x"], p["y"]) if isinstance(p, dict) else (p[0], p[1])
+        for p in points
+    ]
+    if not coords:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.asarray(coords, dtype=np.float64)
+
+
+def rotate_points(
+    points: np.ndarray,
+    center_x: float,
+    center_y: float,
+    angle: float,
+) -> np.ndarray:
+    """
+    Rotate every point of an (N, 2) array around a pivot.
+
+    Batch counterpart of rotate_point().
+
+    Args:
+        points: Array of shape (N, 2).
+        center_x, center_y: Center of rotation.
+        angle: Rotation angle in radians.
+
+    Returns:
+        New (N, 2) array of rotated points.
+    """
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    dx = points[:, 0] - center_x
+    dy = points[:, 1] - center_y
+    out = np.empty_like(points, dtype=np.float64)
+    out[:, 0] = center_x + dx * cos_a - dy * sin_a
+    out[:, 1] = center_y + dx * sin_a + dy * cos_a
+    return out
+
+
+def _cross_2d(
+    o: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+) -> np.ndarray:
+    """Broadcast cross product of OA x OB over the leading axes."""
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (
+        a[..., 1] - o[..., 1]
+    ) * (b[..., 0] - o[..., 0])
+
+
+def segments_intersect_matrix(
+    a_start: np.ndarray,
+    a_end: np.ndarray,
+    b_start: np.ndarray,
+    b_end: np.ndarray,
+) -> np.ndarray:
+    """
+    All-pairs proper-crossing test between two segment sets.
+
+    Batch counterpart of segments_intersect(): entry [i, j] is True iff
+    segment A[i] properly crosses segment B[j].
+
+    Args:
+        a_start, a_end: (N, 2) endpoints of segment set A.
+        b_start, b_end: (M, 2) endpoints of segment set B.
+
+    Returns:
+        Boolean array of shape (N, M).
+    """
+    EPS = 1e-9
+    p1 = a_start[:, None, :]
+    p2 = a_end[:, None, :]
+    p3 = b_start[None, :, :]
+    p4 = b_end[None, :, :]
+
+    d1 = _cross_2d(p3, p4, p1)
+    d2 = _cross_2d(p3, p4, p2)
+    d3 = _cross_2d(p1, p2, p3)
+    d4 = _cross_2d(p1, p2, p4)
+
+    opposite_ab = ((d1 > EPS) & (d2 < -EPS)) | ((d1 < -EPS) & (d2 > EPS))
+    opposite_cd = ((d3 > EPS) & (d4 < -EPS)) | ((d3 < -EPS) & (d4 > EPS))
+    return opposite_ab & opposite_cd
+
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Ray-casting inside test for many points against one polygon.
+
+    Batch counterpart of point_in_polygon().
+
+    Args:
+        points: (N, 2) points to test.
+        polygon: (M, 2) ordered polygon vertices.
+
+    Returns:
+        Boolean array of shape (N,).
+    """
+    if len(polygon) == 0 or len(points) == 0:
+        return np.zeros(len(points), dtype=bool)
+
+    px = points[:, 0][:, None]
+    py = points[:, 1][:, None]
+    xi = polygon[:, 0][None, :]
+    yi = polygon[:, 1][None, :]
+    # Edge i pairs vertex i with vertex i-1 (j trails i, as in the scalar loop)
+    xj = np.roll(polygon[:, 0], 1)[None, :]
+    yj = np.roll(polygon[:, 1], 1)[None, :]
+
+    straddles = (yi > py) != (yj > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = (xj - xi) * (py - yi) / (yj - yi) + xi
+    crossings = straddles & (px < x_cross)
+    return (np.count_nonzero(crossings, axis=1) % 2) == 1
+
+
+def convex_hull_indices(points: np.ndarray) -> np.ndarray:
+    """
+    Convex hull as indices into ``points``, in CCW order.
+
+    Same monotone-chain algorithm as convex_hull(); returning indices lets
+    callers test hull membership of vertices and edges by lookup.
+
+    Args:
+        points: (N, 2) array.
+
+    Returns:
+        Integer array of hull vertex indices.
+    """
+    n = len(points)
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    if n <= 2:
+        return order
+
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+
+    def cross(o: int, a: int, b: int) -> float:
+        return (xs[a] - xs[o]) * (ys[b] - ys[o]) - (ys[a] - ys[o]) * (xs[b] - xs[o])
+
+    lower: list[int] = []
+    for i in order.tolist():
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], i) <= 0:
+            lower.pop()
+        lower.append(i)
+
+    upper: list[int] = []
+    for i in reversed(order.tolist()):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], i) <= 0:
+            upper.pop()
+        upper.append(i)
+
+    return np.asarray(lower[:-1] + upper[:-1], dtype=np.intp)
+
+
+def hull_edge_mask_by_index(
+    edges: np.ndarray,
+    hull_idx: np.ndarray,
+) -> np.ndarray:
+    """
+    Hull-edge membership via index lookup.
+
+    An edge (i, j) lies on the hull iff i and j are consecutive hull
+    vertices (in either direction).
+
+    Args:
+        edges: (E, 2) integer array of vertex index pairs.
+        hull_idx: Hull vertex indices from convex_hull_indices().
+
+    Returns:
+        Boolean array of shape (E,).
+    """
+    if len(hull_idx) < 2 or len(edges) == 0:
+        return np.zeros(len(edges), dtype=bool)
+    nxt = np.roll(hull_idx, -1)
+    hull_edges = {(int(a), int(b)) for a, b in zip(hull_idx, nxt)}
+    hull_edges |= {(b, a) for a, b in hull_edges}
+    return np.fromiter(
+        ((int(a), int(b)) in hull_edges for a, b in edges),
+        dtype=bool,
+        count=len(edges),
+    )
+
+
+def hull_edge_mask(
+    edge_starts: np.ndarray,
+    edge_ends: np.ndarray,
+    hull_pts: np.ndarray,
+    eps: float = 1.0,
+) -> np.ndarray:
+    """
+    Tolerance-based hull-edge membership for many edges at once.
+
+    Batch counterpart of is_edge_on_hull(): coordinates are matched within
+    ``eps`` so that coincident corners (e.g. base and top at α = 0°) behave
+    exactly like the scalar version.
+
+    Args:
+        edge_starts, edge_ends: (E, 2) edge endpoints.
+        hull_pts: (H, 2) ordered convex hull vertices.
+        eps: Tolerance for coordinate comparison.
+
+    Returns:
+        Boolean array of shape (E,).
+    """
+    if len(hull_pts) == 0 or len(edge_starts) == 0:
+        return np.zeros(len(edge_starts), dtype=bool)
+    hk = hull_pts[None, :, :]
+    hm = np.roll(hull_pts, -1, axis=0)[None, :, :]
+    a = edge_starts[:, None, :]
+    b = edge_ends[:, None, :]
+
+    def near(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+        return (np.abs(p - q) < eps).all(axis=-1)
+
+    forward = near(a, hk) & near(b, hm)
+    backward = near(a, hm) & near(b, hk)
+    return (forward | backward).any(axis=1)
+
+
+def coincident_points(points: np.ndarray, eps: float = 1.0) -> np.ndarray:
+    """
+    Which points lie within ``eps`` of another point.
+
+    Such points are one vertex to hull_edge_mask() but several indices
+    to convex_hull_indices(), so index lookup cannot decide their edges.
+
+    Args:
+        points: (N, 2) array.
+        eps: Tolerance for coordinate comparison, as in hull_edge_mask().
+
+    Returns:
+        Boolean array of shape (N,).
+    """
+    near = (np.abs(points[:, None, :] - points[None, :, :]) < eps).all(axis=-1)
+    np.fill_diagonal(near, False)
+    return near.any(axis=1)
@@ -0,0 +1,414 @@
+"""
+Columnar render element store.
+
+An alternative storage backend for RenderBuilder. Instead of one dict per
+primitive (with its repeated string keys), elements are appended to
+per-type typed arrays:
+
+  - Float fields (coordinates, radii, angles) → one ``array('d')`` per type
+  - String fields (styles, labels) → ids into an interned string table
+  - Polygon vertices → one shared ``array('d')`` with per-polygon offsets
+
+A step is snapshotted as a tuple of ``(start, end)`` element ranges rather
+than a copy of its element list, so replaying a cached layer (see
+LayerCache) costs O(1) regardless of how many elements it holds.
+
+The store reproduces the exact wire shape of the RenderElement models
+(``elements(...)``) and packs to a compact little-endian binary form
+(``pack()`` / ``unpack()``).
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from app.engine.config import DrawingConfig
+from app.engine.renderer import RenderBuilder
+from app.schemas.projection import (
+    ArcElement,
+    ArrowElement,
+    LabelElement,
+    LineElement,
+    PointElement,
+    PolygonElement,
+)
+
+Segment = tuple[int, int]
+
+
+# ============================================================
+# Element Layouts
+# ============================================================
+
+@dataclass(frozen=True)
+class ElementLayout:
+    """How one element type maps onto columns, derived from its model."""
+    code: int
+    type: str
+    # (field name, column) in model order; column is "f" (float),
+    # "s" (string id), "b" (bool) or "p" (polygon points)
+    fields: tuple[tuple[str, str], ...]
+
+    @property
+    def float_fields(self) -> tuple[str, ...]:
+        return tuple(name for name, col in self.fields if col == "f")
+
+
+def _layout(code: int, model: type) -> ElementLayout:
+    fields = []
+    for name, info in model.model_fields.items():
+        if name == "type":
+            continue
+        if name == "points":
+            fields.append((name, "p"))
+        elif info.annotation is float:
+            fields.append((name, "f"))
+        elif info.annotation is bool:
+            fields.append((name, "b"))
+        else:
+            fields.append((name, "s"))
+    return ElementLayout(code, model.model_fields["type"].default, tuple(fields))
+
+
+# Type codes are part of the binary format — append only
+LAYOUTS: tuple[ElementLayout, ...] = tuple(
+    _layout(code, model)
+    for code, model in enumerate((
+        LineElement, PolygonElement, PointElement,
+        LabelElement, ArcElement, ArrowElement,
+    ))
+)
+LAYOUT_BY_TYPE: dict[str, ElementLayout] = {lay.type: lay for lay in LAYOUTS}
+
+
+# ============================================================
+# Element Store
+# ============================================================
+
+class ElementTable:
+    """Typed columns for every element of one type."""
+
+    def __init__(self, layout: ElementLayout) -> None:
+        self.layout = layout
+        self.float_width = len(layout.float_fields)
+        # polygon points take two codes: offset and count
+        self.code_width = sum(
+            2 if col == "p" else 1 for _, col in layout.fields if col in "sbp"
+        )
+        self.floats = array("d")   # row-major, float_width per row
+        self.codes = array("I")    # row-major, code_width per row
+        self.count = 0
+
+
+class ElementStore:
+    """
+    Append-only columnar storage for render elements.
+
+    ``kinds[i]`` / ``rows[i]`` locate global element ``i`` in its type table.
+    """
+
+    def __init__(self) -> None:
+        self.kinds = array("B")
+        self.rows = array("I")
+        self.tables = [ElementTable(layout) for layout in LAYOUTS]
+        self.points = array("d")   # x, y pairs of every polygon
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def intern(self, text: str) -> int:
+        """Id of a string in the string table (added on first use)."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(text)
+            self._string_ids[text] = string_id
+        return string_id
+
+    def append(self, element: dict) -> int:
+        """
+        Store one element dict.
+
+        Returns:
+            The element's global index.
+
+        Raises:
+            ValueError: If the element type is unknown.
+        """
+        layout = LAYOUT_BY_TYPE.get(element["type"])
+        if layout is None:
+            raise ValueError(f"Unknown render element type: {element['type']}")
+        table = self.tables[layout.code]
+        for name, col in layout.fields:
+            value = element[name]
+            match col:
+                case "f":
+                    table.floats.append(value)
+                case "s":
+                    table.codes.append(self.intern(value))
+                case "b":
+                    table.codes.append(1 if value else 0)
+                case "p":
+                    table.codes.append(len(self.points) // 2)
+                    table.codes.append(len(value))
+                    for p in value:
+                        self.points.append(p["x"])
+                        self.points.append(p["y"])
+        index = len(self.kinds)
+        self.kinds.append(layout.code)
+        self.rows.append(table.count)
+        table.count += 1
+        return index
+
+    def element(self, index: int) -> dict:
+        """Rebuild element ``index`` in its wire shape."""
+        table = self.tables[self.kinds[index]]
+        row = self.rows[index]
+        floats = iter(table.floats[row * table.float_width:(row + 1) * table.float_width])
+        codes = iter(table.codes[row * table.code_width:(row + 1) * table.code_width])
+        out: dict = {"type": table.layout.type}
+        for name, col in table.layout.fields:
+            match col:
+                case "f":
+                    out[name] = next(floats)
+                case "s":
+                    out[name] = self.strings[next(codes)]
+                case "b":
+                    out[name] = bool(next(codes))
+                case "p":
+                    start = next(codes) * 2
+                    count = next(codes)
+                    flat = self.points[start:start + count * 2]
+                    out[name] = [
+                        {"x": flat[k], "y": flat[k + 1]}
+                        for k in range(0, len(flat), 2)
+                    ]
+        return out
+
+    def elements(self, segments: Iterable[Segment]) -> Iterator[dict]:
+        """Wire-shape dicts for the elements in the given ranges."""
+        for start, end in segments:
+            for index in range(start, end):
+                yield self.element(index)
+
+
+# ============================================================
+# Builder Backend
+# ============================================================
+
+class PackedRenderBuilder(RenderBuilder):
+    """
+    RenderBuilder that writes into an ElementStore.
+
+    ``build_step()`` returns a StepInstruction-shaped dict whose
+    ``segments`` (element ranges in ``store``) replace ``elements``;
+    recorded layers are segments too, so replaying one appends a single
+    tuple instead of copying elements.
+    """
+
+    def __init__(self, config: DrawingConfig, store: ElementStore | None = None) -> None:
+        super().__init__(config)
+        self.store = store if store is not None else ElementStore()
+        self._segments: list[Segment] = []
+        self._start = len(self.store)
+
+    def _close(self) -> None:
+        """Turn elements emitted since the last boundary into a segment."""
+        end = len(self.store)
+        if end > self._start:
+            self._segments.append((self._start, end))
+        self._start = end
+
+    def _emit(self, element: dict) -> None:
+        self.store.append(element)
+
+    def reset(self) -> None:
+        self._segments = []
+        self._start = len(self.store)
+
+    @property
+    def segments(self) -> tuple[Segment, ...]:
+        """Element ranges of the current step."""
+        self._close()
+        return tuple(self._segments)
+
+    @property
+    def elements(self) -> list[dict]:
+        return list(self.store.elements(self.segments))
+
+    def record(self, draw: Callable[[], None]) -> Segment:
+        self._close()
+        start = len(self.store)
+        draw()
+        self._start = len(self.store)
+        return (start, self._start)
+
+    def add_layer(self, layer: Segment) -> None:
+        self._close()
+        if layer[1] > layer[0]:
+            self._segments.append(layer)
+
+    def build_step(
+        self,
+        step_number: int,
+        title: str,
+        description: str,
+    ) -> dict:
+        return {
+            "step_number": step_number,
+            "title": title,
+            "description": description,
+            "segments": self.segments,
+        }
+
+
+def materialize_steps(store: ElementStore, steps: Iterable[dict]) -> list[dict]:
+    """Convert packed steps to ordinary StepInstruction dicts."""
+    return [
+        {
+            "step_number": step["step_number"],
+            "title": step["title"],
+            "description": step["description"],
+            "elements": list(store.elements(step["segments"])),
+        }
+        for step in steps
+    ]
+
+
+# ============================================================
+# Binary Form
+# ============================================================
+#
+# All integers little-endian.
+#
+#   header      b"EGPK" u16 version  u16 reserved
+#   strings     u32 count, then per string: u32 byte length + UTF-8 bytes
+#   elements    u32 count, u8 kinds[count] (padded to 4), u32 rows[count]
+#   tables      per type code: u32 rows, f64 floats[rows*fw], u32 codes[rows*cw]
+#   points      u32 count (pairs), f64 xy[count*2]
+#   steps       u32 count, then per step: u32 number, u32 title id,
+#               u32 description id, u32 segment count, u32 (start, end)*
+
+MAGIC = b"EGPK"
+VERSION = 1
+
+
+def _le(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read(typecode: str, data: memoryview, offset: int, count: int) -> tuple[array, int]:
+    values = array(typecode)
+    size = values.itemsize * count
+    values.frombytes(data[offset:offset + size])
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values, offset + size
+
+
+def pack(store: ElementStore, steps: Iterable[dict]) -> bytes:
+    """
+    Pack a store and its packed steps into the binary form.
+
+    Step titles and descriptions are interned into the store's string table.
+    """
+    steps = list(steps)
+    step_strings = [
+        (store.intern(step["title"]), store.intern(step["description"]))
+        for step in steps
+    ]
+    out = [MAGIC, struct.pack("<HH", VERSION, 0)]
+
+    out.append(struct.pack("<I", len(store.strings)))
+    for text in store.strings:
+        encoded = text.encode("utf-8")
+        out.append(struct.pack("<I", len(encoded)))
+        out.append(encoded)
+
+    count = len(store)
+    out.append(struct.pack("<I", count))
+    out.append(store.kinds.tobytes() + b"\0" * (-count % 4))
+    out.append(_le(store.rows))
+
+    for table in store.tables:
+        out.append(struct.pack("<I", table.count))
+        out.append(_le(table.floats))
+        out.append(_le(table.codes))
+
+    out.append(struct.pack("<I", len(store.points) // 2))
+    out.append(_le(store.points))
+
+    out.append(struct.pack("<I", len(steps)))
+    for step, (title_id, description_id) in zip(steps, step_strings):
+        segments = step["segments"]
+        out.append(struct.pack(
+            "<4I", step["step_number"], title_id, description_id, len(segments),
+        ))
+        out.append(struct.pack(f"<{2 * len(segments)}I", *(i for seg in segments for i in seg)))
+    return b"".join(out)
+
+
+def unpack(data: bytes) -> tuple[ElementStore, list[dict]]:
+    """
+    Inverse of pack().
+
+    Raises:
+        ValueError: If the data is not a packed drawing of a known version.
+    """
+    view = memoryview(data)
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError("Not a packed drawing")
+    version, _ = struct.unpack_from("<HH", view, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported packed drawing version {version}")
+    offset = 8
+
+    store = ElementStore()
+    (n_strings,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    for _ in range(n_strings):
+        (length,) = struct.unpack_from("<I", view, offset)
+        offset += 4
+        store.intern(bytes(view[offset:offset + length]).decode("utf-8"))
+        offset += length
+
+    (count,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    store.kinds, offset = _read("B", view, offset, count)
+    offset += -count % 4
+    store.rows, offset = _read("I", view, offset, count)
+
+    for table in store.tables:
+        (table.count,) = struct.unpack_from("<I", view, offset)
+        offset += 4
+        table.floats, offset = _read("d", view, offset, table.count * table.float_width)
+        table.codes, offset = _read("I", view, offset, table.count * table.code_width)
+
+    (n_points,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    store.points, offset = _read("d", view, offset, n_points * 2)
+
+    (n_steps,) = struct.unpack_from("<I", view, offset)
+    offset += 4
+    steps = []
+    for _ in range(n_steps):
+        number, title_id, description_id, n_segments = struct.unpack_from("<4I", view, offset)
+        offset += 16
+        flat = struct.unpack_from(f"<{2 * n_segments}I", view, offset)
+        offset += 8 * n_segments
+        steps.append({
+            "step_number": number,
+            "title": store.strings[title_id],
+            "description": store.strings[description_id],
+            "segments": tuple(zip(flat[0::2], flat[1::2])),
+        })
+    return store, steps
@@ -0,0 +1,118 @@
+"""
+Per-phase corner cache for the multi-phase cases.
+
+Case D reruns Case C's construction, which reruns Case A's. Each phase's
+corner set is a pure function of a few inputs:
+
+  Phase I   (CaseACorners): solid, base_edge, axis_length, β, XY layout
+  Phase II  (CaseCCorners): Phase I inputs + axis_angle_hp
+  Phase III (CaseDCorners): Phase II inputs + axis_angle_vp
+
+Each phase key extends its parent's key with only the parameters that
+phase adds, so changing axis_angle_vp reuses Phase I and II, and a Case C
+request warms the cache for the matching Case D.
+
+Cached corner sets are shared between requests and must be treated as
+read-only; engines only draw from them.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
+
+from app.engine.config import DrawingConfig
+
+
+T = TypeVar("T")
+
+PhaseKey = tuple[Any, ...]
+
+
+def phase_one_key(
+    solid_type: str,
+    base_edge: float,
+    axis_length: float,
+    edge_angle: float,
+    config: DrawingConfig,
+) -> PhaseKey:
+    """
+    Key of a Phase I (Case A) corner set.
+
+    The XY line position is part of the key: corners are laid out
+    relative to it, and its length differs between Case A and Case C/D.
+    """
+    return (
+        "I", solid_type, base_edge, axis_length, edge_angle,
+        config.xy_line_start_x, config.xy_line_y,
+    )
+
+
+class PhaseCache:
+    """
+    Thread-safe bounded LRU of per-phase corner sets.
+
+    Tracks hit/miss/eviction counters for monitoring.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[PhaseKey, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: PhaseKey, compute: Callable[[], T]) -> T:
+        """
+        Return the corner set stored under key, computing it on a miss.
+
+        ``compute`` runs outside the lock; two threads missing the same
+        key both compute it and the last one stored wins (the results
+        are identical).
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        if self.max_entries <= 0:
+            return value
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def phase_corners(
+    cache: PhaseCache | None,
+    key: PhaseKey,
+    compute: Callable[[], T],
+) -> T:
+    """Compute a phase's corners through ``cache`` (directly without one)."""
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, compute)
@@ -12,10 +12,38 @@ and the API response (drawing primitives).
 
 from __future__ import annotations
 
+from typing import Callable, Iterable
+
 from app.engine.config import DrawingConfig
 from app.engine.geometry import Point
 
 
+def select_steps(total_steps: int, steps: Iterable[int] | None = None) -> list[int]:
+    """
+    Resolve which steps an engine should render.
+
+    Every step is self-contained (cumulative drawing is re-emitted per
+    step), so any subset can be rendered on its own.
+
+    Args:
+        total_steps: Number of steps the case produces.
+        steps: Requested step numbers (1-based), or None for all steps.
+
+    Returns:
+        Sorted, de-duplicated step numbers.
+
+    Raises:
+        ValueError: If a requested step is out of range.
+    """
+    if steps is None:
+        return list(range(1, total_steps + 1))
+    selected = sorted(set(steps))
+    for step in selected:
+        if not 1 <= step <= total_steps:
+            raise ValueError(f"Step {step} out of range (1-{total_steps})")
+    return selected
+
+
 class RenderBuilder:
     """
     Builds render instruction elements for a single step.
@@ -41,6 +69,30 @@ class RenderBuilder:
         """Current elements list (read-only copy)."""
         return list(self._elements)
 
+    def record(self, draw: Callable[[], None]) -> tuple[dict, ...]:
+        """
+        Run a drawing callback against an empty element list.
+
+        Returns:
+            The elements ``draw`` emitted. The builder's own elements are
+            left untouched.
+        """
+        saved = self._elements
+        self._elements = []
+        try:
+            draw()
+            return tuple(self._elements)
+        finally:
+            self._elements = saved
+
+    def add_layer(self, layer: Iterable[dict]) -> None:
+        """Append previously recorded elements."""
+        self._elements.extend(layer)
+
+    def _emit(self, element: dict) -> None:
+        """Store one element (the hook storage backends override)."""
+        self._elements.append(element)
+
     # ----------------------------------------------------------
     # XY Line (core.js:395-421)
     # ----------------------------------------------------------
@@ -59,7 +111,7 @@ class RenderBuilder:
         y = cfg.xy_line_y
 
         # Main XY line (core.js:405-408)
-        self._elements.append({
+        self._emit({
             "type": "line",
             "x1": start_x,
             "y1": y,
@@ -69,14 +121,14 @@ class RenderBuilder:
         })
 
         # Labels (core.js:411-414)
-        self._elements.append({
+        self._emit({
             "type": "label",
             "x": start_x - 15,
             "y": y + 5,
             "text": "X",
             "font_size": cfg.label_font_size,
         })
-        self._elements.append({
+        self._emit({
             "type": "label",
             "x": end_x + 10,
             "y": y + 5,
@@ -85,14 +137,14 @@ class RenderBuilder:
         })
 
         # Arrow indicators (core.js:417-418)
-        self._elements.append({
+        self._emit({
             "type": "arrow",
             "from_x": start_x,
             "from_y": y,
             "to_x": start_x - 10,
             "to_y": y,
         })
-        self._elements.append({
+        self._emit({
             "type": "arrow",
             "from_x": end_x,
             "from_y": y,
@@ -118,7 +170,7 @@ class RenderBuilder:
         Port of drawLine() from core.js:437-460.
         Style can be 'visible', 'hidden', or 'construction'.
         """
-        self._elements.append({
+        self._emit({
             "type": "line",
             "x1": x1,
             "y1": y1,
@@ -145,7 +197,7 @@ class RenderBuilder:
         Port of drawPoint() from core.js:462-475.
         Default label offset is +5x, -5y (above-right).
         """
-        self._elements.append({
+        self._emit({
             "type": "point",
             "x": x,
             "y": y,
@@ -153,7 +205,7 @@ class RenderBuilder:
             "radius": 2.0,
         })
         if label:
-            self._elements.append({
+            self._emit({
                 "type": "label",
                 "x": x + label_offset_x,
                 "y": y + label_offset_y,
@@ -172,7 +224,7 @@ class RenderBuilder:
         closed: bool = True,
     ) -> None:
         """Add a polygon element from a list of Points."""
-        self._elements.append({
+        self._emit({
             "type": "polygon",
             "points": [{"x": p.x, "y": p.y} for p in points],
             "style": style,
@@ -197,7 +249,7 @@ class RenderBuilder:
         Port of drawAngleArc() from core.js:499-510.
         Angles are in degrees.
         """
-        self._elements.append({
+        self._emit({
             "type": "arc",
             "center_x": center_x,
             "center_y": center_y,
@@ -222,7 +274,7 @@ class RenderBuilder:
 
         Port of drawArrow() from core.js:423-435.
         """
-        self._elements.append({
+        self._emit({
             "type": "arrow",
             "from_x": from_x,
             "from_y": from_y,
@@ -245,14 +297,14 @@ class RenderBuilder:
         note_x = cfg.xy_line_start_x + cfg.xy_line_length + 20
         note_y = cfg.xy_line_y + 30
 
-        self._elements.append({
+        self._emit({
             "type": "label",
             "x": note_x,
             "y": note_y,
             "text": f"Edge angle β = {edge_angle}°",
             "font_size": cfg.label_font_size,
         })
-        self._elements.append({
+        self._emit({
             "type": "label",
             "x": note_x,
             "y": note_y + 15,
@@ -281,3 +333,46 @@ class RenderBuilder:
             "description": description,
             "elements": list(self._elements),
         }
+
+
+# ============================================================
+# Layer Cache
+# ============================================================
+
+class LayerCache:
+    """
+    Compute-once store of recorded drawing layers.
+
+    Multi-phase cases (C, D) redraw earlier phases at every later step.
+    Each construction (initial TV, final FV, ...) is registered here as a
+    named layer: the first request runs its drawing routine once and
+    records the emitted elements; every step after that replays the
+    recorded primitives.
+
+    Usage:
+        layers = LayerCache(builder)
+        layers.define("xy", builder.add_xy_line)
+        layers.replay(("xy",))
+    """
+
+    def __init__(self, builder: RenderBuilder) -> None:
+        self.builder = builder
+        self._draw: dict[str, Callable[[], None]] = {}
+        self._layers: dict[str, tuple[dict, ...]] = {}
+
+    def define(self, name: str, draw: Callable[[], None]) -> None:
+        """Register a layer's drawing routine."""
+        self._draw[name] = draw
+
+    def get(self, name: str) -> tuple[dict, ...]:
+        """Recorded elements of a layer, drawing it (once) if needed."""
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = self.builder.record(self._draw[name])
+            self._layers[name] = layer
+        return layer
+
+    def replay(self, names: Iterable[str]) -> None:
+        """Add layers, in order, to the builder's current step."""
+        for name in names:
+            self.builder.add_layer(self.get(name))
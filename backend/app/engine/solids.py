@@ -3,15 +3,86 @@ Solid type definitions and base vertex generation.
 
 Provides the Solid abstraction and the edge-walking polygon vertex
 generation algorithm ported from caseA.js:80-101.
+
+The walk only depends on the side count, so it is done once per polygon
+at unit edge length (POLYGON_TABLES); a solid's base vertices are then a
+scale-rotate-translate of the cached offsets.
 """
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 
 from app.engine.geometry import Point, degrees_to_radians, get_sides_count
 
 
+# ============================================================
+# Unit Polygon Tables
+# ============================================================
+
+@dataclass(frozen=True)
+class PolygonTable:
+    """
+    A regular polygon with unit edge length, first vertex at the origin
+    and first edge along +x.
+    """
+    sides: int
+    # Vertex offsets from the first vertex, in edge-walk order
+    offsets: tuple[tuple[float, float], ...]
+    centroid: tuple[float, float]
+    circumradius: float
+
+
+def _unit_polygon(sides: int) -> PolygonTable:
+    """Edge-walk a unit polygon (caseA.js:80-101 with base_edge = 1)."""
+    # Interior angle of regular polygon (caseA.js:81, 186)
+    interior_angle_rad = degrees_to_radians(180.0 - 360.0 / sides)
+    x = y = angle = 0.0
+    offsets = [(0.0, 0.0)]
+    for _ in range(1, sides):
+        x += math.cos(angle)
+        y += math.sin(angle)
+        offsets.append((x, y))
+        angle += math.pi - interior_angle_rad  # External angle
+    return PolygonTable(
+        sides=sides,
+        offsets=tuple(offsets),
+        centroid=(
+            sum(p[0] for p in offsets) / sides,
+            sum(p[1] for p in offsets) / sides,
+        ),
+        circumradius=1.0 / (2.0 * math.sin(math.pi / sides)),
+    )
+
+
+# One table per supported solid base (triangle to hexagon)
+POLYGON_TABLES: dict[int, PolygonTable] = {n: _unit_polygon(n) for n in range(3, 7)}
+
+
+def polygon_table(sides: int) -> PolygonTable:
+    """
+    Unit table for any regular n-gon, built on first use.
+
+    Large side counts serve as circle approximations: scale the offsets by
+    ``radius / table.circumradius`` for a circle of the given radius.
+
+    Raises:
+        ValueError: If ``sides`` is less than 3.
+    """
+    table = POLYGON_TABLES.get(sides)
+    if table is None:
+        if sides < 3:
+            raise ValueError(f"A polygon needs at least 3 sides, got {sides}")
+        table = POLYGON_TABLES[sides] = _unit_polygon(sides)
+    return table
+
+
+# ============================================================
+# Solid
+# ============================================================
+
+
 class Solid:
     """
     Represents a geometric solid (prism or pyramid) for projection computation.
@@ -22,6 +93,7 @@ class Solid:
     def __init__(self, solid_type: str) -> None:
         self.solid_type = solid_type
         self.sides = get_sides_count(solid_type)
+        self.polygon = polygon_table(self.sides)
         self._is_prism = "prism" in solid_type
         self._is_pyramid = "pyramid" in solid_type
 
@@ -47,12 +119,15 @@ class Solid:
           - caseA.js:80-101 (drawCaseA_TopViewPrism)
           - caseA.js:184-205 (drawCaseA_TopViewPyramid)
 
-        The algorithm:
+        The walk is precomputed at unit scale (POLYGON_TABLES):
         1. Start at (start_x, start_y) with direction = edge_angle_rad
         2. Walk along each edge for `base_edge` length
         3. At each vertex, turn by the exterior angle (π - interior_angle)
         4. Interior angle = 180° - 360°/sides
 
+        so each vertex is the unit offset rotated by edge_angle_rad,
+        scaled by base_edge and translated to the start point.
+
         Args:
             start_x, start_y: Starting vertex position.
             base_edge: Length of each base edge.
@@ -61,26 +136,17 @@ class Solid:
         Returns:
             Tuple of (vertices list, centroid point).
         """
-        sides = self.sides
-
-        # Interior angle of regular polygon (caseA.js:81, 186)
-        interior_angle_rad = degrees_to_radians(180.0 - 360.0 / sides)
-
-        # Generate vertices by edge-walking (caseA.js:92-101)
-        points: list[Point] = [Point(start_x, start_y)]
-        current_x = start_x
-        current_y = start_y
-        current_angle = edge_angle_rad
-
-        for _ in range(1, sides):
-            current_x += base_edge * math.cos(current_angle)
-            current_y += base_edge * math.sin(current_angle)
-            points.append(Point(current_x, current_y))
-            current_angle += math.pi - interior_angle_rad  # External angle
-
-        # Compute centroid (caseA.js:103-110)
-        center_x = sum(p.x for p in points) / len(points)
-        center_y = sum(p.y for p in points) / len(points)
-        centroid = Point(center_x, center_y)
-
+        table = self.polygon
+        cos_a = base_edge * math.cos(edge_angle_rad)
+        sin_a = base_edge * math.sin(edge_angle_rad)
+        points = [
+            Point(start_x + ox * cos_a - oy * sin_a, start_y + ox * sin_a + oy * cos_a)
+            for ox, oy in table.offsets
+        ]
+        cx, cy = table.centroid
+        centroid = Point(start_x + cx * cos_a - cy * sin_a, start_y + cx * sin_a + cy * cos_a)
         return points, centroid
+
+    def circumradius(self, base_edge: float) -> float:
+        """Radius of the base polygon's circumscribed circle."""
+        return base_edge * self.polygon.circumradius
@@ -0,0 +1,108 @@
+"""
+Timing spans for the geometry engine and the layers around it.
+
+A request that is being timed carries a RequestTimings in a context
+variable (set by app/core/server_timing.py). Code marks the work it does
+with ``span(name)`` or ``@timed(name)``; durations of spans with the same
+name are summed. Threads of the compute executor inherit the request's
+context, so engine spans recorded there land on the same request.
+
+When no request is being timed, a span is one context variable lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestTimings:
+    """Summed span durations of one request, in ms, in first-seen order."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.spans: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, duration_ms: float) -> None:
+        """Add time to a span (spans may be recorded from worker threads)."""
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + duration_ms
+
+    def elapsed_ms(self) -> float:
+        """Time since the request started."""
+        return (time.perf_counter() - self.start) * 1000.0
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "eg_request_timings", default=None,
+)
+
+
+class _Span:
+    """Context manager adding its duration to a request's timings."""
+
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings: RequestTimings, name: str) -> None:
+        self.timings = timings
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self.timings.add(self.name, (time.perf_counter() - self.start) * 1000.0)
+
+
+class _NoSpan:
+    """Shared do-nothing span for requests that are not timed."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str) -> _Span | _NoSpan:
+    """Time a block: ``with span("render"): ...``."""
+    timings = current_timings.get()
+    if timings is None:
+        return _NO_SPAN
+    return _Span(timings, name)
+
+
+def timed(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of span()."""
+    def decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> T:
+            timings = current_timings.get()
+            if timings is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timings.add(name, (time.perf_counter() - start) * 1000.0)
+        return wrapper
+    return decorate
+
+
+def mark(name: str) -> None:
+    """Record the time from the start of the request to now as a span."""
+    timings = current_timings.get()
+    if timings is not None:
+        timings.add(name, timings.elapsed_ms())
@@ -6,11 +6,47 @@ All projection logic runs server-side; the frontend receives pre-computed
 render instructions (pixel coordinates + drawing primitives) as JSON.
 """
 
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api.v1 import projections, curves
+from app.core.coalesce import request_coalescer
+from app.core.executor import compute_executor
+from app.core.metrics import (
+    PROMETHEUS_MEDIA_TYPE, MetricsMiddleware, registry, requests_in_flight,
+)
+from app.core.server_timing import ServerTimingMiddleware, timing_aggregate
+from app.services.projection_service import (
+    phase_cache, result_cache, result_warehouse, warehouse_meta,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan — maps the result warehouse (if configured) on
+    startup; shuts down compute worker pools and unmaps it on exit.
+    """
+    if settings.warehouse_path:
+        try:
+            result_warehouse.open(settings.warehouse_path, expect=warehouse_meta())
+            logger.info(
+                "Result warehouse %s: %d entries",
+                settings.warehouse_path, len(result_warehouse),
+            )
+        except (OSError, ValueError) as e:
+            # Serve everything live rather than refuse to start
+            logger.warning("Result warehouse not loaded: %s", e)
+    yield
+    compute_executor.shutdown()
+    result_warehouse.close()
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -20,6 +56,7 @@ app = FastAPI(
         "Computes orthographic projections of solids and returns render "
         "instructions for frontend canvas rendering."
     ),
+    lifespan=lifespan,
 )
 
 # CORS middleware — allows frontend to communicate with this API
@@ -31,6 +68,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Server-Timing: outermost, so "total" covers the whole request
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
+
 # Register API routers
 app.include_router(
     projections.router,
@@ -52,4 +96,62 @@ async def health_check():
         "status": "healthy",
         "service": settings.app_name,
         "version": settings.app_version,
+        "result_cache": result_cache.stats(),
+        "phase_cache": phase_cache.stats(),
+        "result_warehouse": result_warehouse.stats(),
+        "executor": compute_executor.stats(),
+        "coalescer": request_coalescer.stats(),
+        "timings": timing_aggregate.stats(),
     }
+
+
+def runtime_metrics() -> dict:
+    """
+    Metric families read from the caches, coalescer and executor at
+    scrape time (they keep their own counters).
+    """
+    caches = {"result": result_cache.stats(), "phase": phase_cache.stats()}
+    entries = {name: stats["entries"] for name, stats in caches.items()}
+    entries["warehouse"] = len(result_warehouse)
+    coalescer = request_coalescer.stats()
+    limiters = compute_executor.stats()["endpoints"]
+    return {
+        "eg_lab_cache_hits_total": ("counter", "Cache hits.", [
+            ("", {"cache": name}, stats["hits"]) for name, stats in caches.items()
+        ]),
+        "eg_lab_cache_misses_total": ("counter", "Cache misses.", [
+            ("", {"cache": name}, stats["misses"]) for name, stats in caches.items()
+        ]),
+        "eg_lab_cache_entries": ("gauge", "Entries held by each cache.", [
+            ("", {"cache": name}, count) for name, count in entries.items()
+        ]),
+        "eg_lab_coalesced_requests_total": (
+            "counter", "Requests that shared an identical in-flight computation.",
+            [("", {}, coalescer["coalesced"])],
+        ),
+        "eg_lab_executor_in_flight": (
+            "gauge", "Computations running on the executor, by endpoint.",
+            [("", {"endpoint": name}, s["in_flight"]) for name, s in limiters.items()],
+        ),
+        "eg_lab_executor_queue_depth": (
+            "gauge", "Computations waiting for an executor slot, by endpoint.",
+            [("", {"endpoint": name}, s["waiting"]) for name, s in limiters.items()],
+        ),
+        "eg_lab_executor_rejected_total": (
+            "counter", "Computations rejected with 503, by endpoint.",
+            [("", {"endpoint": name}, s["rejected"]) for name, s in limiters.items()],
+        ),
+        "eg_lab_http_requests_in_flight": (
+            "gauge", "HTTP requests being handled.", [("", {}, requests_in_flight())],
+        ),
+    }
+
+
+registry.add_collector(runtime_metrics)
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", tags=["system"], include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus scrape endpoint (text exposition format 0.0.4)."""
+        return Response(content=registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -7,11 +7,13 @@ Each curve engine returns a CurveResponse containing cumulative step instruction
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from app.schemas.projection import (
     LineElement, PolygonElement, PointElement, LabelElement, ArcElement, ArrowElement,
-    StepInstruction,
+    ComputeQueryOptions, StepDelta, StepInstruction,
 )
 
 
@@ -31,6 +33,16 @@ class EllipseRequest(BaseModel):
         default="3/5",
         description="Eccentricity as decimal or fraction (e.g. '0.6' or '3/5')",
     )
+    tolerance: float | None = Field(
+        default=None,
+        gt=0,
+        le=10,
+        description=(
+            "Maximum distance (mm) between the curve polyline and the true "
+            "conic. When set, the curve is sampled adaptively and only the "
+            "highlighted construction lines are computed."
+        ),
+    )
     canvas_width: float = Field(default=1200.0, gt=0)
     canvas_height: float = Field(default=700.0, gt=0)
 
@@ -51,6 +63,78 @@ class CycloidRequest(BaseModel):
     canvas_height: float = Field(default=700.0, gt=0)
 
 
+# ============================================================
+# Roulette Request (cycloid family)
+# ============================================================
+
+class RouletteRequest(BaseModel):
+    """Request for an N-division roulette construction."""
+    kind: Literal["cycloid", "epicycloid", "hypocycloid", "involute"] = Field(
+        default="cycloid",
+        description="Curve to construct",
+    )
+    diameter: float = Field(
+        default=100.0,
+        gt=20,
+        le=200,
+        description="Diameter of the generating circle (involute: base circle) in mm",
+    )
+    divisions: int = Field(
+        default=12,
+        ge=4,
+        le=720,
+        description="Number of equal divisions of the generating circle",
+    )
+    base_diameter: float = Field(
+        default=300.0,
+        gt=0,
+        le=2000,
+        description="Diameter of the directing circle in mm (epicycloid/hypocycloid)",
+    )
+    canvas_width: float = Field(default=1200.0, gt=0)
+    canvas_height: float = Field(default=700.0, gt=0)
+
+
+# ============================================================
+# SVG Export Queries (request fields as GET query parameters)
+# ============================================================
+
+class _ExportStep(BaseModel):
+    step: int | None = Field(
+        default=None,
+        ge=1,
+        description="Export only this step (1-based); all steps as layers by default",
+    )
+
+
+class EllipseExportQuery(EllipseRequest, _ExportStep):
+    """EllipseRequest as GET query parameters, plus the step to export."""
+
+
+class CycloidExportQuery(CycloidRequest, _ExportStep):
+    """CycloidRequest as GET query parameters, plus the step to export."""
+
+
+class RouletteExportQuery(RouletteRequest, _ExportStep):
+    """RouletteRequest as GET query parameters, plus the step to export."""
+
+
+# ============================================================
+# Compute Queries (GET variants of the compute endpoints)
+# ============================================================
+
+class EllipseComputeQuery(EllipseRequest, ComputeQueryOptions):
+    """EllipseRequest as GET query parameters, plus the response options."""
+
+
+class CycloidComputeQuery(CycloidRequest, ComputeQueryOptions):
+    """CycloidRequest as GET query parameters, plus the response options."""
+
+
+class RouletteComputeQuery(RouletteRequest, ComputeQueryOptions):
+    """RouletteRequest as GET query parameters, plus the response options."""
+
+
 # ============================================================
 # Shared Response (same structure as ProjectionResponse)
 # ============================================================
@@ -69,3 +153,14 @@ class CurveResponse(BaseModel):
     total_steps: int = Field(..., ge=0)
     steps: list[StepInstruction]
     metadata: CurveMetadata
+
+
+class CurveDeltaResponse(BaseModel):
+    """Delta-encoded curve result — same layout as ProjectionDeltaResponse."""
+    encoding: Literal["delta"] = "delta"
+    total_steps: int = Field(..., ge=0)
+    base_layer: list[
+        LineElement | PolygonElement | PointElement | LabelElement | ArcElement | ArrowElement
+    ]
+    steps: list[StepDelta]
+    metadata: CurveMetadata
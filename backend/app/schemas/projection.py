@@ -44,6 +44,24 @@ class RestingOn(str, Enum):
     BASE_CORNER = "base-corner"
 
 
+class StepEncoding(str, Enum):
+    """How step elements are encoded in the response."""
+    FULL = "full"    # Every step repeats all cumulative elements
+    DELTA = "delta"  # Every step carries only what changed from the previous step
+
+
+class DrawingFrame(str, Enum):
+    """Coordinate frame of the render elements."""
+    CANVAS = "canvas"        # Canvas pixels, laid out for canvas_width × canvas_height
+    CANONICAL = "canonical"  # Origin at the middle of the XY line; canvas size unused
+
+
+class PdfLayout(str, Enum):
+    """How a PDF export lays out the steps of a problem."""
+    PAGES = "pages"  # One step per page
+    TILED = "tiled"  # Every step of a problem on one sheet
+
+
 # ============================================================
 # Request
 # ============================================================
@@ -107,6 +125,50 @@ class ProjectionRequest(BaseModel):
         gt=0,
         description="Available canvas height in pixels",
     )
+    frame: DrawingFrame = Field(
+        default=DrawingFrame.CANVAS,
+        description=(
+            "'canvas' (pixel coordinates for this canvas size) or 'canonical' "
+            "(canvas-independent; the client applies metadata.placement)"
+        ),
+    )
+
+
+class ProjectionExportQuery(ProjectionRequest):
+    """ProjectionRequest as GET query parameters, plus the step to export."""
+    step: int | None = Field(
+        default=None,
+        ge=1,
+        description="Export only this step (1-based); all steps as layers by default",
+    )
+
+
+class ComputeQueryOptions(BaseModel):
+    """Response-shaping query parameters of the GET compute endpoints."""
+    encoding: StepEncoding = Field(
+        default=StepEncoding.FULL,
+        description="'full' (cumulative steps) or 'delta' (per-step changes)",
+    )
+    step: int | None = Field(default=None, ge=1, description="Render only this step (1-based)")
+    steps: list[int] | None = Field(
+        default=None,
+        description="Render only these steps, e.g. ?steps=3&steps=4",
+    )
+
+
+class ProjectionComputeQuery(ProjectionRequest, ComputeQueryOptions):
+    """ProjectionRequest as GET query parameters, plus the response options."""
+
+
+class ProjectionThumbnailQuery(ProjectionRequest):
+    """ProjectionRequest as GET query parameters, plus the thumbnail size."""
+    width: int = Field(default=320, ge=16, le=1024, description="Image width in pixels")
+    height: int = Field(default=180, ge=16, le=1024, description="Image height in pixels")
+    step: int | None = Field(
+        default=None,
+        ge=1,
+        description="Draw this step (1-based); the finished drawing by default",
+    )
 
 
 # ============================================================
@@ -200,11 +262,24 @@ class SolidProperties(BaseModel):
     circumradius: float | None = None
 
 
+class FramePlacement(BaseModel):
+    """
+    Where drawing (0, 0) goes on the client's canvas, as fractions of its
+    width and height: the client draws under translate(anchor_x × W,
+    anchor_y × H). Canvas-frame coordinates are already placed (0, 0);
+    canonical ones reproduce the canvas layout at (0.5, 0.5).
+    """
+    frame: DrawingFrame = DrawingFrame.CANVAS
+    anchor_x: float = 0.0
+    anchor_y: float = 0.0
+
+
 class ProjectionMetadata(BaseModel):
     """Metadata about the computation result."""
     computed_beta: float | None = None
     computed_xy_length: float
     solid_properties: SolidProperties
+    placement: FramePlacement = Field(default_factory=FramePlacement)
 
 
 class ProjectionResponse(BaseModel):
@@ -217,3 +292,103 @@ class ProjectionResponse(BaseModel):
     total_steps: int = Field(..., ge=0)
     steps: list[StepInstruction]
     metadata: ProjectionMetadata
+
+
+# ============================================================
+# Step Outline (metadata only)
+# ============================================================
+
+class StepOutline(BaseModel):
+    """Title and description of one step, without render elements."""
+    step_number: int = Field(..., ge=1)
+    title: str
+    description: str
+
+
+class ProjectionOutline(BaseModel):
+    """
+    Step list and metadata for a request, with no geometry computed.
+
+    The frontend uses it to lay out step navigation, then fetches the
+    render elements one step at a time (``/compute?step=N``).
+    """
+    total_steps: int = Field(..., ge=0)
+    steps: list[StepOutline]
+    metadata: ProjectionMetadata
+
+
+# ============================================================
+# Delta-encoded Response (StepEncoding.DELTA)
+# ============================================================
+
+class StepDelta(BaseModel):
+    """
+    One step expressed relative to the previous step.
+
+    The client rebuilds the full element list of this step as
+    ``previous[:keep] + added``, where ``previous`` is the element list of
+    the preceding step (or the shared ``base_layer`` for the first step).
+    Elements dropped from the tail of the previous step are thereby removed.
+    """
+    step_number: int = Field(..., ge=1)
+    title: str
+    description: str
+    keep: int = Field(..., ge=0)
+    added: list[
+        LineElement | PolygonElement | PointElement | LabelElement | ArcElement | ArrowElement
+    ]
+
+
+class ProjectionDeltaResponse(BaseModel):
+    """
+    Delta-encoded projection result.
+
+    ``base_layer`` holds the elements shared by every step (e.g. the XY line);
+    each step then carries only the elements added since the previous step.
+    """
+    encoding: Literal["delta"] = "delta"
+    total_steps: int = Field(..., ge=0)
+    base_layer: list[
+        LineElement | PolygonElement | PointElement | LabelElement | ArcElement | ArrowElement
+    ]
+    steps: list[StepDelta]
+    metadata: ProjectionMetadata
+
+
+# ============================================================
+# Batch Request / Response
+# ============================================================
+
+class ProjectionBatchRequest(BaseModel):
+    """
+    A whole problem set computed in one call.
+
+    Identical requests are computed once; results come back in the order
+    the requests were given.
+    """
+    requests: list[ProjectionRequest] = Field(
+        ..., min_length=1, max_length=256,
+        description="Projection requests to compute (1-256)",
+    )
+
+
+class BatchItemResult(BaseModel):
+    """
+    Outcome of one request in a batch.
+
+    Failures are reported inline (``status="error"`` with the HTTP status
+    the single-request endpoint would have returned) instead of failing
+    the whole batch.
+    """
+    index: int = Field(..., ge=0, description="Position in the submitted list")
+    status: Literal["ok", "error"]
+    status_code: int = 200
+    detail: str | None = None
+    result: ProjectionResponse | ProjectionDeltaResponse | None = None
+
+
+class ProjectionBatchResponse(BaseModel):
+    """Results of a batch, in request order."""
+    total_items: int = Field(..., ge=0)
+    unique_items: int = Field(..., ge=0)
+    items: list[BatchItemResult]
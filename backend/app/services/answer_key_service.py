@@ -0,0 +1,179 @@
+"""
+Answer Key Service — PDF export of one projection or a whole problem set.
+
+Each problem is computed and laid out (app/core/pdf.py) on the process
+pool of the compute executor: ``render_problem`` is module-level, takes the
+validated request and returns compressed page content streams, so only the
+request and the page bytes cross the process boundary. Problems run in
+parallel; pages are assembled into the document in request order.
+
+Every page is timed in the worker. The timings come back with the
+document (``AnswerKeyResult.timings``) and the endpoints report them in a
+``Server-Timing`` header.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from app.config import settings
+from app.core.executor import ExecutorSaturated, Pool, compute_executor
+from app.core.pdf import PdfDocument, page_message, page_step, page_tiled
+from app.engine.elements import steps_bounds
+from app.schemas.projection import PdfLayout, ProjectionRequest
+from app.services.projection_service import ProjectionService
+
+
+# ============================================================
+# Problem Rendering (runs on worker processes)
+# ============================================================
+
+@dataclass
+class RenderedProblem:
+    """Compressed page contents of one problem, with timings in ms."""
+    pages: list[bytes]
+    engine_ms: float
+    page_ms: list[float]
+
+
+def problem_title(request: ProjectionRequest, number: int | None = None) -> str:
+    """
+    Heading for a problem, e.g. 'Problem 3: Hexagonal prism, Case C (...)'
+    with its parameters; the 'Problem N: ' prefix only when numbered.
+    """
+    solid = request.solid_type.value.replace("-", " ").capitalize()
+    title = f"{solid}, Case {request.case_type.value}"
+    if number is not None:
+        title = f"Problem {number}: {title}"
+    details = [f"base edge {request.base_edge:g}", f"axis {request.axis_length:g}"]
+    match request.case_type.value:
+        case "A" | "B":
+            details.append(f"edge angle {request.edge_angle:g}°")
+        case "C":
+            details.append(f"axis to HP {request.axis_angle_hp:g}°")
+            details.append(f"resting on {request.resting_on.value.replace('-', ' ')}")
+        case "D":
+            details.append(f"axis to HP {request.axis_angle_hp:g}°")
+            details.append(f"axis to VP {request.axis_angle_vp:g}°")
+            details.append(f"resting on {request.resting_on.value.replace('-', ' ')}")
+    return f"{title} ({', '.join(details)})"
+
+
+def render_problem(
+    request: ProjectionRequest,
+    layout: PdfLayout,
+    title: str,
+) -> RenderedProblem:
+    """
+    Compute a projection and lay its steps out as PDF pages.
+
+    All pages of a problem share one scale, fitted to the union of the
+    step drawings.
+    """
+    start = time.perf_counter()
+    steps, config = ProjectionService().render_steps(request)
+    bounds = steps_bounds(steps)
+    engine_ms = (time.perf_counter() - start) * 1000.0
+
+    pages: list[bytes] = []
+    page_ms: list[float] = []
+    if layout == PdfLayout.TILED:
+        start = time.perf_counter()
+        pages.append(page_tiled(title, steps, bounds, config))
+        page_ms.append((time.perf_counter() - start) * 1000.0)
+    else:
+        for step in steps:
+            start = time.perf_counter()
+            pages.append(page_step(title, step, bounds, config))
+            page_ms.append((time.perf_counter() - start) * 1000.0)
+    return RenderedProblem(pages=pages, engine_ms=engine_ms, page_ms=page_ms)
+
+
+# ============================================================
+# Answer Key
+# ============================================================
+
+@dataclass(frozen=True)
+class PageTiming:
+    """Time spent on one part of the document, in ms."""
+    name: str
+    duration_ms: float
+
+
+@dataclass
+class AnswerKeyResult:
+    """The assembled PDF and where the time went."""
+    pdf: bytes
+    page_count: int
+    timings: list[PageTiming]
+
+    def server_timing(self) -> str:
+        """Timings as a Server-Timing header value."""
+        return ", ".join(f"{t.name};dur={t.duration_ms:.2f}" for t in self.timings)
+
+
+@dataclass
+class AnswerKey:
+    """A list of projection problems rendered into one PDF."""
+    requests: list[ProjectionRequest]
+    layout: PdfLayout = PdfLayout.PAGES
+    title: str = "Answer Key"
+
+    def _title(self, index: int) -> str:
+        number = index + 1 if len(self.requests) > 1 else None
+        return problem_title(self.requests[index], number)
+
+    async def _render(
+        self, index: int, semaphore: asyncio.Semaphore,
+    ) -> RenderedProblem:
+        """
+        Render one problem; failures become a page saying why.
+
+        Raises:
+            ExecutorSaturated: If the pool's queue is full (the whole key
+                fails with 503 rather than shipping holes).
+        """
+        title = self._title(index)
+        try:
+            async with semaphore:
+                return await compute_executor.run(
+                    "projections-pdf", Pool.PROCESS,
+                    render_problem, self.requests[index], self.layout, title,
+                )
+        except ExecutorSaturated:
+            raise
+        except Exception as e:
+            start = time.perf_counter()
+            page = page_message(title, f"This problem could not be computed: {e}")
+            return RenderedProblem(
+                pages=[page], engine_ms=0.0,
+                page_ms=[(time.perf_counter() - start) * 1000.0],
+            )
+
+    async def render(self) -> AnswerKeyResult:
+        """Render every problem in parallel and assemble them in order."""
+        # Same bound as batches: a long key queues here, not on the limiter
+        semaphore = asyncio.Semaphore(max(1, settings.batch_max_parallel))
+        tasks = [
+            asyncio.ensure_future(self._render(index, semaphore))
+            for index in range(len(self.requests))
+        ]
+        try:
+            problems = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        start = time.perf_counter()
+        document = PdfDocument(self.title)
+        timings: list[PageTiming] = []
+        for number, problem in enumerate(problems, start=1):
+            timings.append(PageTiming(f"p{number}-engine", problem.engine_ms))
+            for content, duration in zip(problem.pages, problem.page_ms):
+                document.add_page(content)
+                timings.append(PageTiming(f"page{len(document.pages)}", duration))
+        pdf = document.to_bytes()
+        timings.append(PageTiming("assemble", (time.perf_counter() - start) * 1000.0))
+        return AnswerKeyResult(pdf=pdf, page_count=len(document.pages), timings=timings)
@@ -0,0 +1,171 @@
+"""
+Batch Service — compute a whole problem set in one call.
+
+Instructors generate answer keys for an assignment (every solid × case ×
+a few angle variants) in one go. Rather than hundreds of sequential
+round-trips, the batch endpoint hands the list to this module, which:
+
+  - Deduplicates identical requests by their canonical cache key
+  - Serves what it can from the result cache
+  - Shares computations already in flight for other requests
+  - Computes the remaining unique requests in parallel on the process pool
+  - Reports per-item failures inline instead of failing the batch
+
+Results are spliced together as serialized bytes; nothing is re-parsed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from app.config import settings
+from app.core.coalesce import request_coalescer
+from app.core.executor import ExecutorSaturated, Pool, compute_executor
+from app.core.serialization import dumps
+from app.schemas.projection import ProjectionRequest, StepEncoding
+from app.services.projection_service import ProjectionService, projection_json
+
+
+# ============================================================
+# Item Encoding
+# ============================================================
+
+def ok_item_json(index: int, body: bytes) -> bytes:
+    """Serialize a successful BatchItemResult around an already-encoded body."""
+    return (
+        b'{"index":%d,"status":"ok","status_code":200,"detail":null,"result":'
+        % index
+    ) + body + b"}"
+
+
+def error_item_json(index: int, status_code: int, detail: str) -> bytes:
+    """Serialize a failed BatchItemResult."""
+    return dumps({
+        "index": index,
+        "status": "error",
+        "status_code": status_code,
+        "detail": detail,
+        "result": None,
+    })
+
+
+# ============================================================
+# Batch
+# ============================================================
+
+@dataclass
+class BatchOutcome:
+    """Result of one unique request, shared by all its duplicates."""
+    key: str
+    indices: list[int]
+    body: bytes | None = None
+    status_code: int = 200
+    detail: str | None = None
+
+    def items_json(self) -> list[tuple[int, bytes]]:
+        """(index, serialized item) for every position this request occupies."""
+        if self.body is not None:
+            return [(i, ok_item_json(i, self.body)) for i in self.indices]
+        return [
+            (i, error_item_json(i, self.status_code, self.detail or ""))
+            for i in self.indices
+        ]
+
+
+@dataclass
+class ProjectionBatch:
+    """
+    A deduplicated batch of projection requests.
+
+    ``groups`` maps each canonical key to the positions it occupies in the
+    submitted list, in first-seen order.
+    """
+    requests: list[ProjectionRequest]
+    encoding: StepEncoding = StepEncoding.FULL
+    groups: dict[str, list[int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for index, request in enumerate(self.requests):
+            key = ProjectionService.cache_key(request, self.encoding)
+            self.groups.setdefault(key, []).append(index)
+
+    @property
+    def total_items(self) -> int:
+        return len(self.requests)
+
+    @property
+    def unique_items(self) -> int:
+        return len(self.groups)
+
+    async def _compute(
+        self, key: str, indices: list[int], semaphore: asyncio.Semaphore,
+    ) -> BatchOutcome:
+        """Compute (or fetch) one unique request, capturing its error if any."""
+        outcome = BatchOutcome(key=key, indices=indices)
+        request = self.requests[indices[0]]
+        service = ProjectionService()
+
+        async def compute() -> bytes:
+            body = await compute_executor.run(
+                "projections-batch", Pool.PROCESS,
+                projection_json, request, self.encoding,
+            )
+            service.store(cache_key, body)
+            return body
+
+        try:
+            # Take the batch slot before joining the coalescer, so other
+            # requests only ever share work that is actually running and
+            # never queue behind this batch's semaphore
+            async with semaphore:
+                cache_key, body = service.lookup(request, self.encoding)
+                if body is None:
+                    body = await request_coalescer.run(key, compute)
+            outcome.body = body
+        except ExecutorSaturated as e:
+            outcome.status_code, outcome.detail = 503, str(e)
+        except ValueError as e:
+            outcome.status_code, outcome.detail = 422, str(e)
+        except Exception as e:
+            outcome.status_code = 500
+            outcome.detail = f"Projection computation failed: {str(e)}"
+        return outcome
+
+    def _tasks(self) -> list[asyncio.Task[BatchOutcome]]:
+        # Bound how many items one batch keeps on the pool, so a large batch
+        # queues here instead of overflowing the executor's limiter queue.
+        semaphore = asyncio.Semaphore(max(1, settings.batch_max_parallel))
+        return [
+            asyncio.ensure_future(self._compute(key, indices, semaphore))
+            for key, indices in self.groups.items()
+        ]
+
+    async def as_completed(self) -> AsyncIterator[BatchOutcome]:
+        """Yield outcomes as each unique request finishes."""
+        tasks = self._tasks()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client went away mid-stream: don't keep computing for nobody
+            for task in tasks:
+                task.cancel()
+
+    async def response_json(self) -> bytes:
+        """Compute everything and return a ProjectionBatchResponse in request order."""
+        items: list[bytes | None] = [None] * self.total_items
+        async for outcome in self.as_completed():
+            for index, item in outcome.items_json():
+                items[index] = item
+        return (
+            b'{"total_items":%d,"unique_items":%d,"items":['
+            % (self.total_items, self.unique_items)
+        ) + b",".join(items) + b"]}"
+
+    async def ndjson(self) -> AsyncIterator[bytes]:
+        """Stream one BatchItemResult per line, in completion order."""
+        async for outcome in self.as_completed():
+            for _, item in outcome.items_json():
+                yield item + b"\n"
@@ -0,0 +1,188 @@
+"""
+Curve Service — serialization entry points for the curve engines.
+
+Wraps the curve engines into functions that take the validated request
+and return serialized JSON bytes. They are module-level so they can be
+shipped to a worker process (see app.core.executor); only the request and
+the response bytes cross the process boundary.
+
+The ``*_svg`` functions return a streaming SVG writer (app/core/svg.py)
+over the computed payload. The writer is a generator and cannot leave the
+process that made it, so those run on the thread pool.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from app.config import settings
+from app.core.serialization import delta_response_json, response_json
+from app.core.svg import SvgFrame, write_svg
+from app.core.wire import encode_wire_steps
+from app.engine.curves.cycloid_engine import cycloid_payload
+from app.engine.curves.ellipse_engine import ellipse_payload
+from app.engine.curves.roulette_engine import roulette_payload
+from app.schemas.curve_schemas import CycloidRequest, EllipseRequest, RouletteRequest
+from app.schemas.projection import StepEncoding
+from app.services.result_cache import canonical_key
+from app.services.step_delta import delta_encode_steps
+
+# The ellipse page draws in math coordinates: origin at 10% across and
+# half-way down, y up, zoomed 2.5× (frontend lab/curves/ellipse/page.tsx)
+ELLIPSE_ORIGIN = (0.1, 0.5)
+ELLIPSE_SCALE = 2.5
+
+
+def curve_key(
+    curve: str,
+    request: EllipseRequest | CycloidRequest | RouletteRequest,
+    encoding: StepEncoding = StepEncoding.FULL,
+    steps: list[int] | None = None,
+    binary: bool = False,
+) -> str:
+    """Canonical hash of a curve request and its response options."""
+    variant: dict[str, Any] = {"encoding": encoding.value}
+    if steps is not None:
+        variant["steps"] = sorted(set(steps))
+    if binary:
+        variant["format"] = "wire"
+    return canonical_key(
+        curve, request,
+        precision=settings.result_cache_float_precision,
+        **variant,
+    )
+
+
+def curve_json(
+    payload: dict,
+    encoding: StepEncoding = StepEncoding.FULL,
+    binary: bool = False,
+) -> bytes:
+    """
+    Serialize a curve engine payload with the requested step encoding.
+
+    With ``binary``, the payload is written in the wire format
+    (app/core/wire.py), which always shares elements between steps.
+    """
+    if binary:
+        return encode_wire_steps(
+            payload["steps"], payload["metadata"], payload["total_steps"],
+        )
+    if encoding == StepEncoding.DELTA:
+        base_layer, deltas = delta_encode_steps(payload["steps"])
+        return delta_response_json(
+            base_layer, deltas, payload["metadata"], payload["total_steps"],
+        )
+    return response_json(payload["steps"], payload["metadata"], payload["total_steps"])
+
+
+def ellipse_json(
+    request: EllipseRequest,
+    encoding: StepEncoding = StepEncoding.FULL,
+    steps: list[int] | None = None,
+    binary: bool = False,
+) -> bytes:
+    """Compute the focus-directrix conic and return serialized bytes."""
+    payload = ellipse_payload(
+        focus_dist=request.focus_dist,
+        eccentricity_str=request.eccentricity,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=steps,
+        tolerance=request.tolerance,
+    )
+    return curve_json(payload, encoding, binary)
+
+
+def cycloid_json(
+    request: CycloidRequest,
+    encoding: StepEncoding = StepEncoding.FULL,
+    steps: list[int] | None = None,
+    binary: bool = False,
+) -> bytes:
+    """Compute the cycloid construction and return serialized bytes."""
+    payload = cycloid_payload(
+        diameter=request.diameter,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=steps,
+    )
+    return curve_json(payload, encoding, binary)
+
+
+def roulette_json(
+    request: RouletteRequest,
+    encoding: StepEncoding = StepEncoding.FULL,
+    steps: list[int] | None = None,
+    binary: bool = False,
+) -> bytes:
+    """Compute an N-division roulette construction and return serialized bytes."""
+    payload = roulette_payload(
+        kind=request.kind,
+        diameter=request.diameter,
+        divisions=request.divisions,
+        base_diameter=request.base_diameter,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=steps,
+    )
+    return curve_json(payload, encoding, binary)
+
+
+# ============================================================
+# SVG export
+# ============================================================
+
+def curve_svg(payload: dict, frame: SvgFrame) -> Iterator[bytes]:
+    """Streaming SVG writer for a curve engine payload."""
+    title = payload["metadata"]["curve_type"].replace("_", " ").capitalize()
+    return write_svg(payload["steps"], frame, title=title)
+
+
+def _step_selection(step: int | None) -> list[int] | None:
+    return None if step is None else [step]
+
+
+def ellipse_svg(request: EllipseRequest, step: int | None = None) -> Iterator[bytes]:
+    """Compute the focus-directrix conic and return an SVG writer."""
+    payload = ellipse_payload(
+        focus_dist=request.focus_dist,
+        eccentricity_str=request.eccentricity,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=_step_selection(step),
+        tolerance=request.tolerance,
+    )
+    frame = SvgFrame(
+        request.canvas_width, request.canvas_height,
+        origin_x=request.canvas_width * ELLIPSE_ORIGIN[0],
+        origin_y=request.canvas_height * ELLIPSE_ORIGIN[1],
+        scale=ELLIPSE_SCALE,
+        y_up=True,
+    )
+    return curve_svg(payload, frame)
+
+
+def cycloid_svg(request: CycloidRequest, step: int | None = None) -> Iterator[bytes]:
+    """Compute the cycloid construction and return an SVG writer."""
+    payload = cycloid_payload(
+        diameter=request.diameter,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=_step_selection(step),
+    )
+    return curve_svg(payload, SvgFrame(request.canvas_width, request.canvas_height))
+
+
+def roulette_svg(request: RouletteRequest, step: int | None = None) -> Iterator[bytes]:
+    """Compute an N-division roulette construction and return an SVG writer."""
+    payload = roulette_payload(
+        kind=request.kind,
+        diameter=request.diameter,
+        divisions=request.divisions,
+        base_diameter=request.base_diameter,
+        canvas_width=request.canvas_width,
+        canvas_height=request.canvas_height,
+        steps=_step_selection(step),
+    )
+    return curve_svg(payload, SvgFrame(request.canvas_width, request.canvas_height))
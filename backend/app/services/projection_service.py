@@ -12,19 +12,72 @@ Ports the orchestration logic from:
 
 from __future__ import annotations
 
+from typing import Any, Iterable, Iterator
+
+from app.config import settings
+from app.core.metrics import render_elements
+from app.core.serialization import (
+    delta_response_json, packed_response_json, response_json,
+)
+from app.core.svg import SvgFrame, write_svg
+from app.core.warehouse import ResultWarehouse
+from app.core.wire import encode_wire
+from app.engine import ENGINE_VERSION
 from app.engine.config import DrawingConfig
+from app.engine.packed import PackedRenderBuilder
+from app.engine.phase_cache import PhaseCache
 from app.engine.solids import Solid
+from app.engine.spans import span
 from app.engine.cases.case_a import CaseAEngine
 from app.engine.cases.case_b import CaseBEngine
 from app.engine.cases.case_c import CaseCEngine
 from app.engine.cases.case_d import CaseDEngine
 from app.schemas.projection import (
+    DrawingFrame,
+    FramePlacement,
+    ProjectionDeltaResponse,
     ProjectionMetadata,
+    ProjectionOutline,
     ProjectionRequest,
     ProjectionResponse,
     SolidProperties,
+    StepEncoding,
+)
+from app.services.result_cache import ResultCache, canonical_key
+from app.services.step_delta import delta_encode_steps
+
+
+CaseEngine = CaseAEngine | CaseBEngine | CaseCEngine | CaseDEngine
+
+# Request fields a canonical-frame response does not depend on
+CANVAS_FIELDS = frozenset({"canvas_width", "canvas_height"})
+
+
+# Process-wide cache of serialized responses (see result_cache.py)
+result_cache = ResultCache(
+    max_entries=settings.result_cache_max_entries,
+    ttl_seconds=settings.result_cache_ttl_seconds,
 )
 
+# Process-wide cache of per-phase corner sets (see app/engine/phase_cache.py)
+phase_cache = PhaseCache(max_entries=settings.phase_cache_max_entries)
+
+# Precomputed responses for a parameter grid (see app/core/warehouse.py);
+# empty unless a warehouse file is opened at startup
+result_warehouse = ResultWarehouse()
+
+
+def warehouse_meta() -> dict[str, Any]:
+    """
+    What warehouse keys and bodies depend on. A warehouse is only opened
+    when its recorded values match the running code and settings.
+    """
+    return {
+        "app_version": settings.app_version,
+        "engine_version": ENGINE_VERSION,
+        "float_precision": settings.result_cache_float_precision,
+    }
+
 
 class ProjectionService:
     """
@@ -39,60 +92,296 @@ class ProjectionService:
 
         Port of generateProjection() from core.js:297-326.
         """
+        steps, metadata, total_steps = self._compute_steps(request)
+        return ProjectionResponse(
+            total_steps=total_steps,
+            steps=steps,
+            metadata=metadata,
+        )
+
+    def compute_delta(self, request: ProjectionRequest) -> ProjectionDeltaResponse:
+        """
+        Compute projection and return delta-encoded steps.
+
+        Same geometry as compute(); each step carries only the elements
+        added relative to the previous step (see step_delta.py).
+        """
+        steps, metadata, total_steps = self._compute_steps(request)
+        base_layer, deltas = delta_encode_steps(steps)
+        return ProjectionDeltaResponse(
+            total_steps=total_steps,
+            base_layer=base_layer,
+            steps=deltas,
+            metadata=metadata,
+        )
+
+    def compute_json(
+        self,
+        request: ProjectionRequest,
+        encoding: StepEncoding = StepEncoding.FULL,
+        steps: list[int] | None = None,
+    ) -> bytes:
+        """
+        Compute projection and return the serialized JSON response.
+
+        Results are cached by a canonical hash of the request, so a hit
+        bypasses both the geometry engine and Pydantic serialization.
+        """
+        key, body = self.lookup(request, encoding, steps)
+        if body is None:
+            body = self.render_json(request, encoding, steps)
+            self.store(key, body)
+        return body
+
+    def lookup(
+        self,
+        request: ProjectionRequest,
+        encoding: StepEncoding = StepEncoding.FULL,
+        steps: list[int] | None = None,
+        binary: bool = False,
+    ) -> tuple[str | None, bytes | None]:
+        """
+        Look up a precomputed (warehouse) or cached response.
+
+        Returns:
+            Tuple of (cache key, cached bytes). The key is None when the
+            cache is disabled; the bytes are None on a miss.
+        """
+        if not settings.result_cache_enabled and not len(result_warehouse):
+            return None, None
+        key = self.cache_key(request, encoding, steps, binary)
+        body = result_warehouse.get(key)
+        if not settings.result_cache_enabled:
+            return None, body
+        return key, body if body is not None else result_cache.get(key)
+
+    @staticmethod
+    def cache_key(
+        request: ProjectionRequest,
+        encoding: StepEncoding = StepEncoding.FULL,
+        steps: list[int] | None = None,
+        binary: bool = False,
+    ) -> str:
+        """
+        Canonical hash of a request (also used to deduplicate batches).
+
+        Canonical-frame requests leave the canvas size out, so every
+        window size shares one entry.
+        """
+        variant: dict[str, Any] = {"encoding": encoding.value}
+        if steps is not None:
+            variant["steps"] = sorted(set(steps))
+        if binary:
+            variant["format"] = "wire"
+        return canonical_key(
+            "projection", request,
+            precision=settings.result_cache_float_precision,
+            exclude=CANVAS_FIELDS if request.frame == DrawingFrame.CANONICAL else None,
+            **variant,
+        )
+
+    @staticmethod
+    def store(key: str | None, body: bytes) -> None:
+        """Store serialized bytes under a key returned by lookup()."""
+        if key is not None:
+            result_cache.put(key, body)
+
+    def render_json(
+        self,
+        request: ProjectionRequest,
+        encoding: StepEncoding = StepEncoding.FULL,
+        steps: list[int] | None = None,
+    ) -> bytes:
+        """
+        Run the engine and serialize the response (no caching).
+
+        Engine output is written straight to JSON bytes through the typed
+        element encoder — no Pydantic validation of our own output. With
+        ``steps``, only those steps are rendered; ``total_steps`` still
+        reports the full count.
+        """
+        if encoding == StepEncoding.FULL and settings.packed_render_store:
+            # Columnar backend: layers replay as element ranges and each
+            # element is encoded once
+            engine, params, metadata = self._prepare(request, packed=True)
+            rendered = engine.compute_all_steps(**params, steps=steps)
+            self._observe_elements(request, len(engine.builder.store))
+            with span("serialize"):
+                return packed_response_json(
+                    engine.builder.store, rendered,
+                    metadata.model_dump(), engine.TOTAL_STEPS,
+                )
+        rendered, metadata, total_steps = self._compute_steps(request, steps)
+        self._observe_elements(request, sum(len(step["elements"]) for step in rendered))
+        with span("serialize"):
+            if encoding == StepEncoding.DELTA:
+                base_layer, deltas = delta_encode_steps(rendered)
+                return delta_response_json(
+                    base_layer, deltas, metadata.model_dump(), total_steps,
+                )
+            return response_json(rendered, metadata.model_dump(), total_steps)
+
+    def render_wire(
+        self,
+        request: ProjectionRequest,
+        steps: list[int] | None = None,
+    ) -> bytes:
+        """
+        Run the engine and encode the binary wire format (no caching).
+
+        The packed backend already shares layers between steps, so its
+        element table and ranges are written out directly (app/core/wire.py).
+        """
+        engine, params, metadata = self._prepare(request, packed=True)
+        rendered = engine.compute_all_steps(**params, steps=steps)
+        store = engine.builder.store
+        self._observe_elements(request, len(store))
+        with span("serialize"):
+            return encode_wire(
+                store.elements([(0, len(store))]), rendered,
+                metadata.model_dump(), engine.TOTAL_STEPS,
+            )
+
+    @staticmethod
+    def _observe_elements(request: ProjectionRequest, count: int) -> None:
+        """
+        Record how many render elements a computation built (the packed
+        store shares layers, so it counts each element once).
+        """
+        render_elements.observe(
+            count, request.case_type.value, request.solid_type.value,
+        )
+
+    def render_svg(
+        self,
+        request: ProjectionRequest,
+        step: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Run the engine and return a streaming SVG writer (no caching).
+
+        The geometry is computed here; the returned iterator only formats
+        it (app/core/svg.py), so the caller can run this on the executor
+        and stream the document afterwards. ``step`` selects one step;
+        by default every step is written as a layer.
+        """
+        rendered, config = self.render_steps(
+            request, None if step is None else [step],
+        )
+        title = (
+            f"{request.solid_type.value.replace('-', ' ').capitalize()}"
+            f" — Case {request.case_type.value}"
+        )
+        width, height = request.canvas_width, request.canvas_height
+        if request.frame == DrawingFrame.CANONICAL:
+            frame = SvgFrame(width, height, origin_x=width / 2, origin_y=height / 2)
+        else:
+            frame = SvgFrame(width, height)
+        return write_svg(rendered, frame, config, title)
+
+    def render_steps(
+        self,
+        request: ProjectionRequest,
+        steps: Iterable[int] | None = None,
+    ) -> tuple[list[dict], DrawingConfig]:
+        """
+        Run the engine for the document exporters (SVG, PDF).
+
+        Returns:
+            Tuple of (rendered step dicts, the drawing config they use).
+        """
+        engine, params, _ = self._prepare(request)
+        return engine.compute_all_steps(**params, steps=steps), engine.config
+
+    def outline(self, request: ProjectionRequest) -> ProjectionOutline:
+        """
+        Step titles and metadata without running any geometry.
+
+        Lets the frontend lay out its step navigation before (or instead
+        of) fetching every step.
+        """
+        engine, params, metadata = self._prepare(request)
+        outline = engine.step_outline(**params)
+        return ProjectionOutline(
+            total_steps=engine.TOTAL_STEPS,
+            steps=outline,
+            metadata=metadata,
+        )
+
+    def _compute_steps(
+        self,
+        request: ProjectionRequest,
+        steps: Iterable[int] | None = None,
+    ) -> tuple[list[dict], ProjectionMetadata, int]:
+        """
+        Run the selected engine.
+
+        Returns:
+            Tuple of (rendered step dicts, metadata, total step count). Only
+            the requested steps are rendered; the total always counts all.
+        """
+        engine, params, metadata = self._prepare(request)
+        rendered = engine.compute_all_steps(**params, steps=steps)
+        return rendered, metadata, engine.TOTAL_STEPS
+
+    def _prepare(
+        self, request: ProjectionRequest, packed: bool = False,
+    ) -> tuple[CaseEngine, dict[str, Any], ProjectionMetadata]:
+        """
+        Select the engine and its arguments, and build the metadata.
+
+        With ``packed``, the engine renders into a columnar ElementStore
+        (app/engine/packed.py) instead of element dicts.
+        """
         # Create solid and config
         solid = Solid(request.solid_type.value)
         config = DrawingConfig()
 
-        # Set up canvas dimensions
-        config.setup_canvas(request.canvas_width, request.canvas_height)
+        # Set up canvas dimensions. The canonical frame lays out on a
+        # zero-size canvas, which puts (0, 0) at the middle of the XY line;
+        # every other layout is that drawing translated by the canvas centre
+        if request.frame == DrawingFrame.CANONICAL:
+            config.setup_canvas(0.0, 0.0)
+            placement = FramePlacement(frame=DrawingFrame.CANONICAL, anchor_x=0.5, anchor_y=0.5)
+        else:
+            config.setup_canvas(request.canvas_width, request.canvas_height)
+            placement = FramePlacement()
 
         # Set up XY line length based on case type (core.js:310-315)
         config.setup_xy_line_length(request.case_type.value, request.axis_length)
 
-        # Select and run engine
+        builder = PackedRenderBuilder(config) if packed else None
+        corners = phase_cache if settings.phase_cache_enabled else None
+
+        # Select engine
         case_type = request.case_type.value
         computed_beta: float | None = None
+        params: dict[str, Any] = {
+            "base_edge": request.base_edge,
+            "axis_length": request.axis_length,
+            "edge_angle": request.edge_angle,
+        }
 
         match case_type:
             case "A":
-                engine = CaseAEngine(solid, config)
-                steps = engine.compute_all_steps(
-                    base_edge=request.base_edge,
-                    axis_length=request.axis_length,
-                    edge_angle=request.edge_angle,
-                )
+                engine = CaseAEngine(solid, config, builder, corners)
 
             case "B":
-                engine = CaseBEngine(solid, config)
-                steps = engine.compute_all_steps(
-                    base_edge=request.base_edge,
-                    axis_length=request.axis_length,
-                    edge_angle=request.edge_angle,
-                )
+                engine = CaseBEngine(solid, config, builder)
 
             case "C":
                 computed_beta = CaseCEngine.auto_compute_beta(
                     request.solid_type.value, request.resting_on.value,
                 )
-                engine = CaseCEngine(solid, config)
-                steps = engine.compute_all_steps(
-                    base_edge=request.base_edge,
-                    axis_length=request.axis_length,
-                    edge_angle=request.edge_angle,
-                    axis_angle_hp=request.axis_angle_hp,
-                    resting_on=request.resting_on.value,
-                )
+                engine = CaseCEngine(solid, config, builder, corners)
+                params["axis_angle_hp"] = request.axis_angle_hp
+                params["resting_on"] = request.resting_on.value
 
             case "D":
-                engine = CaseDEngine(solid, config)
-                steps = engine.compute_all_steps(
-                    base_edge=request.base_edge,
-                    axis_length=request.axis_length,
-                    edge_angle=request.edge_angle,
-                    axis_angle_hp=request.axis_angle_hp,
-                    axis_angle_vp=request.axis_angle_vp,
-                    resting_on=request.resting_on.value,
-                )
+                engine = CaseDEngine(solid, config, builder, corners)
+                params["axis_angle_hp"] = request.axis_angle_hp
+                params["axis_angle_vp"] = request.axis_angle_vp
+                params["resting_on"] = request.resting_on.value
 
             case _:
                 raise ValueError(f"Unknown case type: {case_type}")
@@ -105,11 +394,21 @@ class ProjectionService:
                 sides=solid.sides,
                 is_prism=solid.is_prism,
                 is_pyramid=solid.is_pyramid,
+                circumradius=solid.circumradius(request.base_edge),
             ),
+            placement=placement,
         )
 
-        return ProjectionResponse(
-            total_steps=len(steps),
-            steps=steps,
-            metadata=metadata,
-        )
+        return engine, params, metadata
+
+
+def projection_json(
+    request: ProjectionRequest,
+    encoding: StepEncoding = StepEncoding.FULL,
+    steps: list[int] | None = None,
+) -> bytes:
+    """
+    Module-level render_json() — picklable, so batch items can run on
+    the process pool of the compute executor.
+    """
+    return ProjectionService().render_json(request, encoding, steps)
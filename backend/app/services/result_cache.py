@@ -0,0 +1,130 @@
+"""
+Content-addressed result cache.
+
+Compute responses are deterministic functions of the request, and a lab
+session submits the same handful of parameter sets over and over. This
+module keeps fully serialized response bytes in a bounded LRU with a TTL,
+keyed on a canonical hash of the normalized request, so a hit skips both
+the geometry engine and Pydantic serialization.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+
+def _quantize(value: Any, precision: int) -> Any:
+    """Round floats (recursively) so equivalent requests hash identically."""
+    if isinstance(value, float):
+        # "+ 0.0" folds -0.0 into 0.0
+        return round(value, precision) + 0.0
+    if isinstance(value, dict):
+        return {k: _quantize(v, precision) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_quantize(v, precision) for v in value]
+    return value
+
+
+def canonical_key(
+    namespace: str,
+    request: BaseModel,
+    precision: int = 3,
+    exclude: Iterable[str] | None = None,
+    **variant: Any,
+) -> str:
+    """
+    Build a canonical hash for a request.
+
+    Args:
+        namespace: Endpoint family (e.g. 'projection', 'ellipse').
+        request: Validated request model.
+        precision: Decimal places kept for float fields.
+        exclude: Request fields the response does not depend on.
+        **variant: Extra response-shaping options (e.g. encoding='delta').
+
+    Returns:
+        Hex SHA-256 digest of the normalized request.
+    """
+    payload = {
+        "ns": namespace,
+        "request": _quantize(
+            request.model_dump(mode="json", exclude=set(exclude) if exclude else None),
+            precision,
+        ),
+        "variant": _quantize(variant, precision),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe bounded LRU cache with per-entry TTL.
+
+    Stores serialized response bytes. Tracks hit/miss/eviction counters
+    for monitoring.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 900.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Return cached bytes for key, or None on miss/expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store bytes under key, evicting least-recently-used entries."""
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,112 @@
+"""
+Delta step encoding.
+
+Engines emit cumulative steps: step N repeats every element of steps
+1..N-1, so the payload grows quadratically with the step count. This
+module rewrites a list of cumulative steps into a shared base layer plus
+per-step deltas:
+
+    base_layer = longest prefix common to every step
+    step.keep  = length of the prefix shared with the previous step
+    step.added = elements after that prefix
+
+The client reconstructs step N as ``previous[:keep] + added``. Because
+engines redraw each step from scratch in a fixed order, shared elements
+always form a prefix, so the encoding is exact (including elements that
+disappear between steps, e.g. Case A projectors in step 5).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+
+def _element(element: Any) -> Any:
+    """Return a plain-dict view of an element (engine dict or Pydantic model)."""
+    if isinstance(element, dict):
+        return element
+    return element.model_dump()
+
+
+def _step(step: Any) -> dict:
+    """Return a plain-dict view of a step (engine dict or StepInstruction)."""
+    if isinstance(step, dict):
+        return step
+    return {
+        "step_number": step.step_number,
+        "title": step.title,
+        "description": step.description,
+        "elements": step.elements,
+    }
+
+
+def common_prefix(a: Sequence[Any], b: Sequence[Any]) -> int:
+    """
+    Length of the longest common prefix of two element lists.
+
+    The one "keep vs. redraw" rule between consecutive steps, shared by
+    delta encoding, the wire format and SVG layers.
+    """
+    limit = min(len(a), len(b))
+    k = 0
+    while k < limit and (a[k] is b[k] or a[k] == b[k]):
+        k += 1
+    return k
+
+
+def delta_encode_steps(steps: Sequence[Any]) -> tuple[list, list[dict]]:
+    """
+    Convert cumulative steps into a base layer and per-step deltas.
+
+    Args:
+        steps: Cumulative StepInstruction dicts (or models), in order.
+
+    Returns:
+        Tuple of (base_layer elements, list of StepDelta dicts).
+    """
+    plain = [_step(s) for s in steps]
+    if not plain:
+        return [], []
+
+    element_lists = [[_element(e) for e in s["elements"]] for s in plain]
+
+    # Shared base layer — prefix common to every step
+    base_len = len(element_lists[0])
+    for elements in element_lists[1:]:
+        base_len = common_prefix(element_lists[0][:base_len], elements)
+    base_layer = element_lists[0][:base_len]
+
+    deltas: list[dict] = []
+    previous: Sequence[Any] = base_layer
+    for step, elements in zip(plain, element_lists):
+        keep = common_prefix(previous, elements)
+        deltas.append({
+            "step_number": step["step_number"],
+            "title": step["title"],
+            "description": step["description"],
+            "keep": keep,
+            "added": elements[keep:],
+        })
+        previous = elements
+
+    return base_layer, deltas
+
+
+def expand_delta_steps(base_layer: Sequence[Any], deltas: Sequence[dict]) -> list[dict]:
+    """
+    Inverse of delta_encode_steps() — rebuild cumulative steps.
+
+    Mirrors what the client does; used by tests and server-side exporters.
+    """
+    steps: list[dict] = []
+    previous: list = list(base_layer)
+    for delta in deltas:
+        elements = previous[:delta["keep"]] + list(delta["added"])
+        steps.append({
+            "step_number": delta["step_number"],
+            "title": delta["title"],
+            "description": delta["description"],
+            "elements": elements,
+        })
+        previous = elements
+    return steps
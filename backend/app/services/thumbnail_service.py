@@ -0,0 +1,131 @@
+"""
+Thumbnail Service — PNG previews of projections, cached on disk.
+
+A thumbnail is a pure function of the request, its size and the drawn
+step, so it is stored under a canonical hash of exactly those
+(result_cache.canonical_key) plus the engine and rasterizer versions.
+The same hash is the thumbnail's ETag: a browser revalidating with
+``If-None-Match`` gets a 304 without the cache even being read.
+
+Files live at ``<dir>/<key[:2]>/<key>.png`` and are written to a temporary
+name and renamed, so concurrent workers never read a partial file and
+the cache survives restarts. There is no eviction; the key space is small
+(solid × case × parameters × size) and the directory can be cleared at
+any time.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from app.config import settings
+from app.core.raster import rasterize
+from app.engine import ENGINE_VERSION
+from app.engine.elements import steps_bounds
+from app.schemas.projection import DrawingFrame, ProjectionRequest
+from app.services.projection_service import CANVAS_FIELDS, ProjectionService
+from app.services.result_cache import canonical_key
+
+# Bump when the rasterizer output changes, so stale files are not served
+RASTER_VERSION = 1
+
+
+def thumbnail_key(
+    request: ProjectionRequest,
+    width: int,
+    height: int,
+    step: int | None = None,
+) -> str:
+    """
+    Canonical hash of a thumbnail (request, size, step and versions).
+
+    The image is fitted to the drawing, which the canvas size and frame
+    only translate, so those are left out.
+    """
+    return canonical_key(
+        "thumbnail", request,
+        precision=settings.result_cache_float_precision,
+        exclude=CANVAS_FIELDS | {"frame"},
+        width=width, height=height, step=step,
+        engine=ENGINE_VERSION, raster=RASTER_VERSION,
+    )
+
+
+def thumbnail_etag(key: str) -> str:
+    """Strong ETag for a thumbnail key."""
+    return f'"{key}"'
+
+
+def render_thumbnail(
+    request: ProjectionRequest,
+    width: int,
+    height: int,
+    step: int | None = None,
+) -> bytes:
+    """
+    Run the engine and rasterize one step as a PNG (no caching).
+
+    The drawing is fitted to its own bounds, so the solid fills the image.
+    ``step`` defaults to the last step (the finished drawing).
+
+    Raises:
+        ValueError: If the step is out of range.
+    """
+    rendered, config = ProjectionService().render_steps(
+        request.model_copy(update={"frame": DrawingFrame.CANONICAL}),
+        None if step is None else [step],
+    )
+    last = rendered[-1]
+    bounds = steps_bounds([last], pad=10.0)
+    return rasterize(last["elements"], bounds, width, height, config).to_png()
+
+
+class ThumbnailCache:
+    """
+    Content-addressed PNG files in a directory.
+
+    Reads and writes are plain file operations; a failed write is ignored
+    (the thumbnail is simply rendered again next time).
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+
+    def path(self, key: str) -> Path:
+        """Where the file for a key lives."""
+        return self.directory / key[:2] / f"{key}.png"
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored PNG, or None on a miss."""
+        try:
+            return self.path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a PNG atomically (temporary file, then rename)."""
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+
+def _cache_dir() -> Path:
+    if settings.thumbnail_cache_dir:
+        return Path(settings.thumbnail_cache_dir)
+    return Path(tempfile.gettempdir()) / "eg-lab-thumbnails"
+
+
+# Process-wide thumbnail cache; None when disabled
+thumbnail_cache = ThumbnailCache(_cache_dir()) if settings.thumbnail_cache_enabled else None
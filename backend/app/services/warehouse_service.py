@@ -0,0 +1,277 @@
+"""
+Warehouse Service — precompute a grid of projection responses.
+
+Student inputs cluster on a small discrete grid (every solid and case,
+both resting conditions, angles in round steps, the default edge and axis
+lengths). This module enumerates such a grid, renders every request
+through ProjectionService on a process pool, and writes the bodies to a
+warehouse file (app/core/warehouse.py) under the same canonical keys the
+result cache uses. A server started with ``EG_LAB_WAREHOUSE_PATH``
+pointing at the file answers matching requests without computing; misses
+fall through to the live engine as before.
+
+Usage:
+
+    python -m app.services.warehouse_service build warehouse.bin \\
+        [--grid grid.json] [--jobs 4]
+    python -m app.services.warehouse_service info warehouse.bin
+
+A grid file is a JSON object with any of the WarehouseGrid fields. Value
+lists can be given literally or as {"start": 0, "stop": 90, "step": 5}
+(stop inclusive).
+
+Keys cover the whole request, including fields a case does not use, so
+the grid fixes those at the frontend's defaults. Canonical-frame keys
+leave out the canvas size; canvas-frame requests are only stored for the
+grid's ``canvas_sizes``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Iterator, Sequence
+
+from pydantic import ValidationError
+
+from app.core.warehouse import ResultWarehouse, WarehouseWriter
+from app.schemas.projection import (
+    CaseType, DrawingFrame, ProjectionRequest, RestingOn, SolidType, StepEncoding,
+)
+from app.services.projection_service import ProjectionService, warehouse_meta
+
+
+def _degrees(start: int, stop: int, step: int) -> list[float]:
+    return [float(a) for a in range(start, stop + 1, step)]
+
+
+@dataclass
+class WarehouseGrid:
+    """
+    The parameter grid to precompute.
+
+    Each case varies only the angles it uses (A/B: edge angle; C: axis to
+    HP and resting condition; D: both axis angles and resting condition);
+    the other fields keep their request defaults.
+    """
+    solid_types: list[SolidType] = field(default_factory=lambda: list(SolidType))
+    case_types: list[CaseType] = field(default_factory=lambda: list(CaseType))
+    resting_on: list[RestingOn] = field(default_factory=lambda: list(RestingOn))
+    base_edges: list[float] = field(default_factory=lambda: [40.0])
+    axis_lengths: list[float] = field(default_factory=lambda: [80.0])
+    edge_angles: list[float] = field(default_factory=lambda: _degrees(0, 90, 15))
+    axis_angles_hp: list[float] = field(default_factory=lambda: _degrees(0, 90, 15))
+    axis_angles_vp: list[float] = field(default_factory=lambda: _degrees(0, 90, 15))
+    frames: list[DrawingFrame] = field(default_factory=lambda: [DrawingFrame.CANONICAL])
+    canvas_sizes: list[tuple[float, float]] = field(default_factory=lambda: [(1200.0, 700.0)])
+    encodings: list[StepEncoding] = field(default_factory=lambda: [StepEncoding.FULL])
+    wire: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WarehouseGrid:
+        """
+        Build a grid from a JSON object.
+
+        Raises:
+            ValueError: If a field is unknown or a value is invalid.
+        """
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown grid fields: {', '.join(sorted(unknown))}")
+        values: dict[str, Any] = {}
+        for name, value in data.items():
+            if isinstance(value, dict):
+                value = [
+                    float(v)
+                    for v in range(int(value["start"]), int(value["stop"]) + 1, int(value["step"]))
+                ]
+            match name:
+                case "solid_types":
+                    value = [SolidType(v) for v in value]
+                case "case_types":
+                    value = [CaseType(v) for v in value]
+                case "resting_on":
+                    value = [RestingOn(v) for v in value]
+                case "encodings":
+                    value = [StepEncoding(v) for v in value]
+                case "frames":
+                    value = [DrawingFrame(v) for v in value]
+                case "canvas_sizes":
+                    value = [(float(w), float(h)) for w, h in value]
+                case "wire":
+                    value = bool(value)
+                case _:
+                    value = [float(v) for v in value]
+            values[name] = value
+        return cls(**values)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The grid as JSON-serializable data (recorded in the warehouse)."""
+        return json.loads(json.dumps(asdict(self)))
+
+    def _case_params(self, case_type: CaseType) -> Iterator[dict[str, Any]]:
+        match case_type:
+            case CaseType.A | CaseType.B:
+                for angle in self.edge_angles:
+                    yield {"edge_angle": angle}
+            case CaseType.C:
+                for hp, resting in itertools.product(self.axis_angles_hp, self.resting_on):
+                    yield {"axis_angle_hp": hp, "resting_on": resting}
+            case CaseType.D:
+                for hp, vp, resting in itertools.product(
+                    self.axis_angles_hp, self.axis_angles_vp, self.resting_on,
+                ):
+                    yield {"axis_angle_hp": hp, "axis_angle_vp": vp, "resting_on": resting}
+
+    def requests(self) -> Iterator[ProjectionRequest]:
+        """Every valid request of the grid."""
+        # The canvas size only matters in the canvas frame
+        layouts = [
+            (frame, size)
+            for frame in self.frames
+            for size in (self.canvas_sizes if frame == DrawingFrame.CANVAS else [(1200.0, 700.0)])
+        ]
+        for solid, case, edge, axis, (frame, (width, height)) in itertools.product(
+            self.solid_types, self.case_types, self.base_edges,
+            self.axis_lengths, layouts,
+        ):
+            for params in self._case_params(case):
+                try:
+                    yield ProjectionRequest(
+                        solid_type=solid, case_type=case, base_edge=edge,
+                        axis_length=axis, canvas_width=width, canvas_height=height,
+                        frame=frame, **params,
+                    )
+                except ValidationError:
+                    continue
+
+    def variants(self) -> list[tuple[StepEncoding, bool]]:
+        """(encoding, binary) pairs stored per request."""
+        variants = [(encoding, False) for encoding in self.encodings]
+        if self.wire:
+            variants.append((StepEncoding.FULL, True))
+        return variants
+
+
+# ============================================================
+# Build
+# ============================================================
+
+def render_entries(
+    request: ProjectionRequest,
+    variants: list[tuple[StepEncoding, bool]],
+) -> list[tuple[str, bytes]]:
+    """
+    Render one request in every variant, as (cache key, body) pairs.
+
+    Module-level so it can run on worker processes. A request the engine
+    rejects (ValueError) yields no entries; it stays a live-compute miss.
+    """
+    service = ProjectionService()
+    entries = []
+    for encoding, binary in variants:
+        key = service.cache_key(request, encoding, None, binary)
+        try:
+            body = (
+                service.render_wire(request) if binary
+                else service.render_json(request, encoding)
+            )
+        except ValueError:
+            return []
+        entries.append((key, body))
+    return entries
+
+
+@dataclass
+class WarehouseBuild:
+    """Outcome of a build."""
+    requests: int
+    skipped: int
+    entries: int
+    bytes: int
+    seconds: float
+
+
+def build_warehouse(path: str, grid: WarehouseGrid, jobs: int = 1) -> WarehouseBuild:
+    """
+    Render the grid and write it to a warehouse file at ``path``.
+
+    Requests are rendered on ``jobs`` worker processes (in this process
+    when 1) and written in grid order.
+    """
+    start = time.perf_counter()
+    requests = list(grid.requests())
+    variants = grid.variants()
+    meta = {**warehouse_meta(), "grid": grid.to_dict()}
+    skipped = size = 0
+    with WarehouseWriter(path, meta) as writer:
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = pool.map(
+                    render_entries, requests, itertools.repeat(variants),
+                    chunksize=max(1, len(requests) // (jobs * 8)),
+                )
+                for entries in results:
+                    skipped += not entries
+                    for key, body in entries:
+                        size += len(body) if writer.add(key, body) else 0
+        else:
+            for request in requests:
+                entries = render_entries(request, variants)
+                skipped += not entries
+                for key, body in entries:
+                    size += len(body) if writer.add(key, body) else 0
+        count = len(writer)
+    return WarehouseBuild(
+        requests=len(requests), skipped=skipped, entries=count, bytes=size,
+        seconds=time.perf_counter() - start,
+    )
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.warehouse_service",
+        description="Precompute projection responses into a warehouse file.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="render a parameter grid into a warehouse")
+    build.add_argument("path", help="warehouse file to write")
+    build.add_argument("--grid", help="JSON file with WarehouseGrid fields")
+    build.add_argument("--jobs", type=int, default=1, help="worker processes")
+    info = commands.add_parser("info", help="describe a warehouse file")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        warehouse = ResultWarehouse()
+        warehouse.open(args.path)
+        print(json.dumps({**warehouse.stats(), "meta": warehouse.meta}, indent=2))
+        warehouse.close()
+        return 0
+
+    grid = WarehouseGrid()
+    if args.grid:
+        with open(args.grid, encoding="utf-8") as f:
+            grid = WarehouseGrid.from_dict(json.load(f))
+    result = build_warehouse(args.path, grid, max(1, args.jobs))
+    print(
+        f"{result.entries} entries ({result.bytes / 1e6:.1f} MB) from "
+        f"{result.requests} requests, {result.skipped} skipped, "
+        f"in {result.seconds:.1f} s -> {args.path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Integration tests for the Curves API.
+
+Tests the ellipse, cycloid and roulette compute endpoints.
+"""
+
+from xml.etree import ElementTree
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.step_delta import expand_delta_steps
+
+client = TestClient(app)
+
+
+# ============================================================
+# Ellipse
+# ============================================================
+
+class TestEllipse:
+    def test_default_ellipse(self):
+        response = client.post("/api/v1/curves/ellipse/compute", json={})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_steps"] == 11
+        assert data["metadata"]["curve_type"] == "ellipse"
+
+    def test_delta_encoding_roundtrip(self):
+        body = {"focus_dist": 60, "eccentricity": "3/2"}
+        full = client.post("/api/v1/curves/ellipse/compute", json=body).json()
+        delta = client.post(
+            "/api/v1/curves/ellipse/compute?encoding=delta", json=body,
+        ).json()
+        assert delta["encoding"] == "delta"
+        assert expand_delta_steps(delta["base_layer"], delta["steps"]) == full["steps"]
+
+    def test_single_step(self):
+        full = client.post("/api/v1/curves/ellipse/compute", json={}).json()
+        one = client.post("/api/v1/curves/ellipse/compute?step=7", json={}).json()
+        assert one["total_steps"] == 11
+        assert one["steps"] == [full["steps"][6]]
+
+    def test_tolerance_mode(self):
+        fixed = client.post("/api/v1/curves/ellipse/compute", json={})
+        adaptive = client.post(
+            "/api/v1/curves/ellipse/compute", json={"tolerance": 0.5},
+        )
+        assert adaptive.status_code == 200
+        assert adaptive.json()["metadata"]["parameters"]["tolerance"] == 0.5
+        assert len(adaptive.content) < len(fixed.content)
+
+
+# ============================================================
+# Cycloid
+# ============================================================
+
+class TestCycloid:
+    def test_default_cycloid(self):
+        response = client.post("/api/v1/curves/cycloid/compute", json={})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_steps"] == 10
+        assert data["metadata"]["curve_type"] == "cycloid"
+
+    def test_delta_encoding_roundtrip(self):
+        full = client.post("/api/v1/curves/cycloid/compute", json={}).json()
+        delta = client.post(
+            "/api/v1/curves/cycloid/compute?encoding=delta", json={},
+        ).json()
+        assert expand_delta_steps(delta["base_layer"], delta["steps"]) == full["steps"]
+        # Cycloid steps only ever append — nothing is dropped
+        assert all(s["keep"] >= 2 for s in delta["steps"])
+
+
+# ============================================================
+# Roulette
+# ============================================================
+
+class TestRoulette:
+    def test_epicycloid(self):
+        response = client.post(
+            "/api/v1/curves/roulette/compute",
+            json={"kind": "epicycloid", "divisions": 36, "base_diameter": 400},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_steps"] == 10
+        assert data["metadata"]["curve_type"] == "epicycloid"
+
+    def test_invalid_geometry(self):
+        response = client.post(
+            "/api/v1/curves/roulette/compute",
+            json={"kind": "hypocycloid", "diameter": 100, "base_diameter": 80},
+        )
+        assert response.status_code == 422
+
+
+# ============================================================
+# HTTP Caching (GET compute)
+# ============================================================
+
+class TestConditionalGet:
+    def test_get_matches_post(self):
+        body = {"kind": "epicycloid", "diameter": 50, "divisions": 24}
+        post = client.post("/api/v1/curves/roulette/compute?encoding=delta", json=body)
+        get = client.get(
+            "/api/v1/curves/roulette/compute", params={**body, "encoding": "delta"},
+        )
+        assert get.status_code == 200
+        assert get.content == post.content
+        assert get.headers["etag"].startswith('"')
+
+    def test_if_none_match_is_304(self):
+        params = {"focus_dist": 60, "eccentricity": "3/2", "step": 4}
+        etag = client.get("/api/v1/curves/ellipse/compute", params=params).headers["etag"]
+        response = client.get(
+            "/api/v1/curves/ellipse/compute", params=params,
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        other = client.get(
+            "/api/v1/curves/cycloid/compute", params={"diameter": 50},
+            headers={"If-None-Match": etag},
+        )
+        assert other.status_code == 200
+        assert other.headers["etag"] != etag
+
+
+# ============================================================
+# SVG Export
+# ============================================================
+
+class TestSvgExport:
+    def test_get_each_curve(self):
+        for curve in ("ellipse", "cycloid", "roulette"):
+            response = client.get(f"/api/v1/curves/{curve}/export.svg")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "image/svg+xml"
+            ElementTree.fromstring(response.content)
+
+    def test_post_ellipse_step_is_y_up(self):
+        response = client.post(
+            "/api/v1/curves/ellipse/export.svg?step=11", json={"eccentricity": "3/2"},
+        )
+        assert response.status_code == 200
+        root = ElementTree.fromstring(response.content)
+        group = root.find("{http://www.w3.org/2000/svg}g")
+        assert "scale(2.5 -2.5)" in group.get("transform")
+
+    def test_invalid_request(self):
+        response = client.get(
+            "/api/v1/curves/roulette/export.svg",
+            params={"kind": "hypocycloid", "diameter": 100, "base_diameter": 80},
+        )
+        assert response.status_code == 422
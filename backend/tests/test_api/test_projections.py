@@ -5,10 +5,18 @@ Tests the full request → response flow for all case types.
 Uses FastAPI's TestClient for synchronous testing.
 """
 
+import json
+import re
+from xml.etree import ElementTree
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import settings
+from app.core.executor import compute_executor
+from app.core.wire import decode_wire
 from app.main import app
+from app.services.step_delta import expand_delta_steps
 
 client = TestClient(app)
 
@@ -67,6 +75,8 @@ class TestCaseA:
         assert meta["solid_properties"]["sides"] == 6
         assert meta["solid_properties"]["is_prism"] is True
         assert meta["solid_properties"]["is_pyramid"] is False
+        # Hexagon circumradius equals the edge length
+        assert meta["solid_properties"]["circumradius"] == pytest.approx(40)
 
     def test_square_pyramid(self):
         """Case A with square pyramid."""
@@ -206,6 +216,444 @@ class TestStubs:
         assert data["total_steps"] == 8
 
 
+# ============================================================
+# Delta Encoding
+# ============================================================
+
+class TestDeltaEncoding:
+    PAYLOAD = {
+        "solid_type": "hexagonal-prism",
+        "case_type": "D",
+        "base_edge": 40,
+        "axis_length": 80,
+        "axis_angle_hp": 45,
+        "axis_angle_vp": 30,
+        "resting_on": "base-edge",
+    }
+
+    def test_delta_expands_to_full_steps(self):
+        """Rebuilding delta steps must give exactly the cumulative steps."""
+        full = client.post("/api/v1/projections/compute", json=self.PAYLOAD).json()
+        response = client.post(
+            "/api/v1/projections/compute?encoding=delta", json=self.PAYLOAD,
+        )
+        assert response.status_code == 200
+        delta = response.json()
+        assert delta["encoding"] == "delta"
+        assert delta["total_steps"] == full["total_steps"]
+        assert expand_delta_steps(delta["base_layer"], delta["steps"]) == full["steps"]
+
+    def test_delta_is_smaller(self):
+        full = client.post("/api/v1/projections/compute", json=self.PAYLOAD)
+        delta = client.post(
+            "/api/v1/projections/compute?encoding=delta", json=self.PAYLOAD,
+        )
+        assert len(delta.content) * 3 < len(full.content)
+
+    def test_base_layer_is_xy_line(self):
+        """The XY line is common to every step, so it forms the base layer."""
+        delta = client.post(
+            "/api/v1/projections/compute?encoding=delta", json=self.PAYLOAD,
+        ).json()
+        assert len(delta["base_layer"]) == 5
+        assert delta["steps"][0]["keep"] == 5
+        assert delta["steps"][0]["added"] == []
+
+    def test_case_a_step5_drops_projectors(self):
+        """Case A step 5 does not repeat step 4 projectors — keep truncates."""
+        payload = {"solid_type": "square-prism", "case_type": "A"}
+        full = client.post("/api/v1/projections/compute", json=payload).json()
+        delta = client.post(
+            "/api/v1/projections/compute?encoding=delta", json=payload,
+        ).json()
+        assert delta["steps"][4]["keep"] < len(full["steps"][3]["elements"])
+        assert expand_delta_steps(delta["base_layer"], delta["steps"]) == full["steps"]
+
+
+# ============================================================
+# Step Selection / Outline
+# ============================================================
+
+class TestStepSelection:
+    PAYLOAD = {
+        "solid_type": "pentagonal-pyramid",
+        "case_type": "D",
+        "axis_angle_hp": 40,
+        "axis_angle_vp": 35,
+    }
+
+    def test_single_step_matches_full(self):
+        full = client.post("/api/v1/projections/compute", json=self.PAYLOAD).json()
+        one = client.post(
+            "/api/v1/projections/compute?step=10", json=self.PAYLOAD,
+        ).json()
+        assert one["total_steps"] == full["total_steps"]
+        assert one["steps"] == [full["steps"][9]]
+
+    def test_multiple_steps(self):
+        response = client.post(
+            "/api/v1/projections/compute?steps=3&steps=1&step=3",
+            json=self.PAYLOAD,
+        )
+        assert [s["step_number"] for s in response.json()["steps"]] == [1, 3]
+
+    def test_step_out_of_range(self):
+        response = client.post(
+            "/api/v1/projections/compute?step=12", json=self.PAYLOAD,
+        )
+        assert response.status_code == 422
+
+    def test_wire_format(self):
+        response = client.post(
+            "/api/v1/projections/compute?step=4",
+            json=self.PAYLOAD,
+            headers={"Accept": "application/x-eg-render"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-eg-render"
+        assert "Accept" in response.headers["vary"]
+        decoded = decode_wire(response.content)
+        assert [s["step_number"] for s in decoded["steps"]] == [4]
+
+    def test_outline(self):
+        full = client.post("/api/v1/projections/compute", json=self.PAYLOAD).json()
+        outline = client.post("/api/v1/projections/outline", json=self.PAYLOAD).json()
+        assert outline["total_steps"] == full["total_steps"]
+        assert outline["metadata"] == full["metadata"]
+        assert [s["title"] for s in outline["steps"]] == [
+            s["title"] for s in full["steps"]
+        ]
+        assert "elements" not in outline["steps"][0]
+
+
+# ============================================================
+# Batch
+# ============================================================
+
+class TestBatch:
+    REQUESTS = [
+        {"solid_type": "hexagonal-prism", "case_type": "A"},
+        {"solid_type": "square-pyramid", "case_type": "B", "edge_angle": 45},
+        {"solid_type": "hexagonal-prism", "case_type": "A"},
+    ]
+
+    def test_results_in_order_and_deduplicated(self):
+        response = client.post(
+            "/api/v1/projections/compute-batch", json={"requests": self.REQUESTS},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_items"] == 3
+        assert data["unique_items"] == 2
+        assert [item["index"] for item in data["items"]] == [0, 1, 2]
+        for item, request in zip(data["items"], self.REQUESTS):
+            assert item["status"] == "ok"
+            single = client.post("/api/v1/projections/compute", json=request)
+            assert item["result"] == single.json()
+
+    def test_ndjson_stream(self):
+        response = client.post(
+            "/api/v1/projections/compute-batch?stream=true&encoding=delta",
+            json={"requests": self.REQUESTS},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        items = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(item["index"] for item in items) == [0, 1, 2]
+        assert all(item["result"]["encoding"] == "delta" for item in items)
+
+    def test_item_error_is_inline(self, monkeypatch):
+        """A failing item reports its status code without failing the batch."""
+        from app.core.executor import compute_executor
+        from app.services import batch_service
+
+        original = batch_service.projection_json
+
+        def render(request, encoding):
+            if request.case_type.value == "B":
+                raise ValueError("bad item")
+            return original(request, encoding)
+
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        monkeypatch.setattr(compute_executor, "process_workers", 0)
+        monkeypatch.setattr(batch_service, "projection_json", render)
+        data = client.post(
+            "/api/v1/projections/compute-batch", json={"requests": self.REQUESTS},
+        ).json()
+        statuses = [(item["status"], item["status_code"]) for item in data["items"]]
+        assert statuses == [("ok", 200), ("error", 422), ("ok", 200)]
+        assert data["items"][1]["detail"] == "bad item"
+
+    def test_empty_batch_rejected(self):
+        response = client.post(
+            "/api/v1/projections/compute-batch", json={"requests": []},
+        )
+        assert response.status_code == 422
+
+    async def test_disconnect_stops_pending_items(self, monkeypatch):
+        """Items still queued when the client goes away never reach the pool."""
+        import asyncio
+
+        from app.schemas.projection import ProjectionRequest
+        from app.services.batch_service import ProjectionBatch
+
+        started = finished = 0
+
+        async def run(endpoint, pool, fn, *args):
+            nonlocal started, finished
+            started += 1
+            await asyncio.sleep(0.05)
+            finished += 1
+            return b"{}"
+
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        monkeypatch.setattr(settings, "batch_max_parallel", 4)
+        monkeypatch.setattr(compute_executor, "run", run)
+        batch = ProjectionBatch([
+            ProjectionRequest(solid_type="hexagonal-prism", case_type="A", base_edge=10 + i)
+            for i in range(40)
+        ])
+        stream = batch.as_completed()
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.2)
+        # Only the first round and the items already holding a slot when
+        # the client left ever start, and those are cancelled
+        assert started <= 2 * settings.batch_max_parallel
+        assert finished < started
+
+
+# ============================================================
+# SVG Export
+# ============================================================
+
+class TestSvgExport:
+    def test_get_all_steps_as_layers(self):
+        response = client.get(
+            "/api/v1/projections/export.svg",
+            params={"solid_type": "hexagonal-prism", "case_type": "A"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert 'filename="hexagonal-prism-case-a.svg"' in response.headers["content-disposition"]
+        root = ElementTree.fromstring(response.content)
+        assert root.get("viewBox") == "0 0 1200 700"
+        assert len(root.findall("{http://www.w3.org/2000/svg}g/{http://www.w3.org/2000/svg}g")) == 5
+
+    def test_post_single_step(self):
+        response = client.post(
+            "/api/v1/projections/export.svg?step=2",
+            json={"solid_type": "square-pyramid", "case_type": "C"},
+        )
+        assert response.status_code == 200
+        root = ElementTree.fromstring(response.content)
+        assert root.find("{http://www.w3.org/2000/svg}g/{http://www.w3.org/2000/svg}g") is None
+
+    def test_step_out_of_range(self):
+        response = client.get(
+            "/api/v1/projections/export.svg",
+            params={"solid_type": "square-pyramid", "case_type": "A", "step": 9},
+        )
+        assert response.status_code == 422
+
+
+# ============================================================
+# Canonical Frame
+# ============================================================
+
+def _translated(element: dict, dx: float, dy: float) -> dict:
+    element = dict(element)
+    for x, y in (("x", "y"), ("x1", "y1"), ("x2", "y2"), ("center_x", "center_y"),
+                 ("from_x", "from_y"), ("to_x", "to_y")):
+        if x in element:
+            element[x] += dx
+            element[y] += dy
+    if "points" in element:
+        element["points"] = [{"x": p["x"] + dx, "y": p["y"] + dy} for p in element["points"]]
+    return element
+
+
+class TestCanonicalFrame:
+    @pytest.mark.parametrize("case_type", ["A", "B", "C", "D"])
+    def test_placement_reproduces_canvas_layout(self, case_type):
+        payload = {"solid_type": "pentagonal-pyramid", "case_type": case_type,
+                   "canvas_width": 913, "canvas_height": 577}
+        canvas = client.post("/api/v1/projections/compute", json=payload).json()
+        canonical = client.post(
+            "/api/v1/projections/compute", json={**payload, "frame": "canonical"},
+        ).json()
+        placement = canonical["metadata"]["placement"]
+        assert placement == {"frame": "canonical", "anchor_x": 0.5, "anchor_y": 0.5}
+        dx, dy = placement["anchor_x"] * 913, placement["anchor_y"] * 577
+        for a, b in zip(canvas["steps"], canonical["steps"]):
+            assert len(a["elements"]) == len(b["elements"])
+            for expected, element in zip(a["elements"], b["elements"]):
+                placed = _translated(element, dx, dy)
+                if "points" in expected:
+                    assert [v for p in placed.pop("points") for v in (p["x"], p["y"])] == (
+                        pytest.approx([v for p in expected["points"] for v in (p["x"], p["y"])], abs=1e-9)
+                    )
+                    expected = {k: v for k, v in expected.items() if k != "points"}
+                assert placed == pytest.approx(expected, abs=1e-9)
+
+    def test_canvas_size_does_not_split_the_cache(self, monkeypatch):
+        from app.services.projection_service import ProjectionService
+
+        calls = []
+        original = ProjectionService.render_json
+
+        def render(self, *args):
+            calls.append(args)
+            return original(self, *args)
+
+        monkeypatch.setattr(ProjectionService, "render_json", render)
+        for width in (1001, 1002, 1003):
+            response = client.post("/api/v1/projections/compute", json={
+                "solid_type": "square-prism", "case_type": "B", "edge_angle": 17,
+                "frame": "canonical", "canvas_width": width,
+            })
+            assert response.status_code == 200
+        assert len(calls) == 1
+
+
+# ============================================================
+# HTTP Caching (GET compute)
+# ============================================================
+
+class TestConditionalGet:
+    PARAMS = {"solid_type": "hexagonal-prism", "case_type": "A"}
+
+    def test_get_matches_post(self):
+        post = client.post("/api/v1/projections/compute?steps=2&steps=3", json=self.PARAMS)
+        get = client.get(
+            "/api/v1/projections/compute", params={**self.PARAMS, "steps": [2, 3]},
+        )
+        assert get.status_code == 200
+        assert get.content == post.content
+        assert get.headers["cache-control"] == "public, max-age=300, s-maxage=3600"
+        assert "etag" not in post.headers
+
+    def test_if_none_match_is_304(self):
+        etag = client.get("/api/v1/projections/compute", params=self.PARAMS).headers["etag"]
+        response = client.get(
+            "/api/v1/projections/compute", params=self.PARAMS,
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert "Accept" in response.headers["vary"]
+
+    def test_etag_varies_with_options_and_versions(self, monkeypatch):
+        from app.api.v1 import params
+
+        def etag(extra=None, headers=None):
+            return client.get(
+                "/api/v1/projections/compute",
+                params={**self.PARAMS, **(extra or {})}, headers=headers,
+            ).headers["etag"]
+
+        base = etag()
+        assert etag() == base
+        assert etag({"base_edge": 41}) != base
+        assert etag({"encoding": "delta"}) != base
+        assert etag(headers={"Accept": "application/x-eg-render"}) != base
+        monkeypatch.setattr(settings, "app_version", "9.9.9")
+        bumped = etag()
+        assert bumped != base
+        monkeypatch.setattr(params, "ENGINE_VERSION", params.ENGINE_VERSION + 1)
+        assert etag() not in (base, bumped)
+
+
+# ============================================================
+# PNG Thumbnails
+# ============================================================
+
+class TestThumbnail:
+    PARAMS = {"solid_type": "pentagonal-pyramid", "case_type": "C", "width": 200, "height": 120}
+
+    @pytest.fixture(autouse=True)
+    def disk_cache(self, monkeypatch, tmp_path):
+        from app.api.v1 import projections
+        from app.services.thumbnail_service import ThumbnailCache
+
+        cache = ThumbnailCache(tmp_path)
+        monkeypatch.setattr(projections, "thumbnail_cache", cache)
+        return cache
+
+    def test_png_is_cached_on_disk(self, disk_cache):
+        response = client.get("/api/v1/projections/thumbnail.png", params=self.PARAMS)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["cache-control"] == "public, no-cache"
+        key = response.headers["etag"].strip('"')
+        assert disk_cache.get(key) == response.content
+
+    def test_if_none_match_revalidates(self):
+        etag = client.get("/api/v1/projections/thumbnail.png", params=self.PARAMS).headers["etag"]
+        response = client.get(
+            "/api/v1/projections/thumbnail.png",
+            params=self.PARAMS,
+            headers={"If-None-Match": f'"other", W/{etag}'},
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_size_and_step_change_the_etag(self):
+        etags = {
+            client.get(
+                "/api/v1/projections/thumbnail.png", params={**self.PARAMS, **extra},
+            ).headers["etag"]
+            for extra in ({}, {"width": 201}, {"step": 2})
+        }
+        assert len(etags) == 3
+
+    def test_step_out_of_range(self):
+        response = client.get(
+            "/api/v1/projections/thumbnail.png", params={**self.PARAMS, "step": 99},
+        )
+        assert response.status_code == 422
+
+
+# ============================================================
+# PDF Export
+# ============================================================
+
+class TestPdfExport:
+    def test_single_projection(self):
+        response = client.post(
+            "/api/v1/projections/export.pdf",
+            json={"solid_type": "hexagonal-prism", "case_type": "A"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF-")
+        assert response.headers["x-page-count"] == "5"
+        assert "page5;dur=" in response.headers["server-timing"]
+
+    def test_answer_key_in_order(self, monkeypatch):
+        """Problems keep their order; a failing one gets an explanation page."""
+        from app.services import answer_key_service
+
+        original = answer_key_service.render_problem
+
+        def render(request, layout, title):
+            if request.case_type.value == "B":
+                raise ValueError("bad problem")
+            return original(request, layout, title)
+
+        monkeypatch.setattr(answer_key_service, "render_problem", render)
+        monkeypatch.setattr(compute_executor, "process_workers", 0)
+        response = client.post(
+            "/api/v1/projections/answer-key.pdf?layout=tiled&title=Set%201",
+            json={"requests": TestBatch.REQUESTS},
+        )
+        assert response.status_code == 200
+        assert response.headers["x-page-count"] == "3"
+        timing = response.headers["server-timing"]
+        assert [name for name in re.findall(r"(p\d)-engine", timing)] == ["p1", "p2", "p3"]
+
+
 # ============================================================
 # Validation
 # ============================================================
@@ -0,0 +1,103 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.coalesce import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    async def test_concurrent_identical_requests_share_one_computation(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def compute() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return b"body"
+
+        bodies = await asyncio.gather(*(coalescer.run("k", compute) for _ in range(5)))
+        assert bodies == [b"body"] * 5
+        assert calls == 1
+        assert coalescer.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+    async def test_distinct_keys_and_later_requests_compute_again(self):
+        coalescer = RequestCoalescer()
+
+        async def compute() -> bytes:
+            await asyncio.sleep(0)
+            return b"x"
+
+        await asyncio.gather(coalescer.run("a", compute), coalescer.run("b", compute))
+        await coalescer.run("a", compute)
+        assert coalescer.stats()["leaders"] == 3
+        assert coalescer.stats()["coalesced"] == 0
+
+    async def test_failure_reaches_every_waiter(self):
+        coalescer = RequestCoalescer()
+
+        async def compute() -> bytes:
+            await asyncio.sleep(0.01)
+            raise ValueError("bad request")
+
+        results = await asyncio.gather(
+            coalescer.run("k", compute), coalescer.run("k", compute),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_follower_does_not_cancel_leader(self):
+        coalescer = RequestCoalescer()
+
+        async def compute() -> bytes:
+            await asyncio.sleep(0.02)
+            return b"done"
+
+        leader = asyncio.ensure_future(coalescer.run("k", compute))
+        follower = asyncio.ensure_future(coalescer.run("k", compute))
+        await asyncio.sleep(0)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        assert await leader == b"done"
+
+    async def test_last_waiter_leaving_cancels_computation(self):
+        coalescer = RequestCoalescer()
+        cancelled = asyncio.Event()
+
+        async def compute() -> bytes:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return b"late"
+
+        waiters = [asyncio.ensure_future(coalescer.run("k", compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 0.5)
+        assert coalescer.stats()["in_flight"] == 0
+
+        async def quick() -> bytes:
+            return b"fresh"
+
+        assert await coalescer.run("k", quick) == b"fresh"
+
+    async def test_disabled_runs_every_request(self):
+        coalescer = RequestCoalescer(enabled=False)
+        calls = 0
+
+        async def compute() -> bytes:
+            nonlocal calls
+            calls += 1
+            return b""
+
+        await asyncio.gather(coalescer.run("k", compute), coalescer.run("k", compute))
+        assert calls == 2
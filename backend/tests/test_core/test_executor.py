@@ -0,0 +1,50 @@
+"""
+Unit tests for the compute executor (thread/process pools + back-pressure).
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.executor import ComputeExecutor, ExecutorSaturated, Pool
+
+
+def _slow_square(x: int) -> int:
+    time.sleep(0.05)
+    return x * x
+
+
+class TestComputeExecutor:
+    async def test_runs_on_thread_pool(self):
+        executor = ComputeExecutor(thread_workers=2, process_workers=0)
+        try:
+            assert await executor.run("t", Pool.THREAD, _slow_square, 7) == 49
+        finally:
+            executor.shutdown()
+
+    async def test_process_pool_falls_back_to_threads(self):
+        """process_workers=0 routes PROCESS work onto the thread pool."""
+        executor = ComputeExecutor(thread_workers=1, process_workers=0)
+        try:
+            assert await executor.run("p", Pool.PROCESS, _slow_square, 3) == 9
+        finally:
+            executor.shutdown()
+
+    async def test_saturation_rejects_with_retry_after(self):
+        executor = ComputeExecutor(
+            thread_workers=1, process_workers=0,
+            max_concurrency=1, max_queue=1, retry_after_seconds=5,
+        )
+        try:
+            running = asyncio.ensure_future(executor.run("s", Pool.THREAD, _slow_square, 1))
+            queued = asyncio.ensure_future(executor.run("s", Pool.THREAD, _slow_square, 2))
+            await asyncio.sleep(0.01)
+            with pytest.raises(ExecutorSaturated) as info:
+                await executor.run("s", Pool.THREAD, _slow_square, 3)
+            assert info.value.retry_after == 5
+            assert await running == 1
+            assert await queued == 4
+            assert executor.stats()["endpoints"]["s"]["rejected"] == 1
+        finally:
+            executor.shutdown()
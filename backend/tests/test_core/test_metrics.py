@@ -0,0 +1,69 @@
+"""
+Unit tests for the Prometheus metrics registry and /metrics endpoint.
+"""
+
+import threading
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import MetricsRegistry
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestRegistry:
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("t_seconds", "Test.", ("endpoint",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value, "/a")
+        text = registry.render()
+        assert 't_seconds_bucket{endpoint="/a",le="0.1"} 1' in text
+        assert 't_seconds_bucket{endpoint="/a",le="1"} 2' in text
+        assert 't_seconds_bucket{endpoint="/a",le="+Inf"} 3' in text
+        assert 't_seconds_count{endpoint="/a"} 3' in text
+        assert "# TYPE t_seconds histogram" in text
+
+    def test_counter_sums_thread_shards(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("t_total", "Test.", ("kind",))
+
+        def work():
+            for _ in range(1000):
+                counter.inc("x")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert 't_total{kind="x"} 4000' in registry.render()
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("t_total", "Test.", ("path",)).inc('a"b\\')
+        assert 't_total{path="a\\"b\\\\"} 1' in registry.render()
+
+
+class TestMetricsEndpoint:
+    def test_scrape_reports_labeled_compute(self):
+        client.post("/api/v1/projections/compute", json={
+            "solid_type": "triangular-pyramid", "case_type": "C",
+        })
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        labels = 'endpoint="/api/v1/projections/compute",case_type="C",solid_type="triangular-pyramid"'
+        assert f"eg_lab_request_duration_seconds_count{{{labels}}}" in text
+        assert f"eg_lab_response_size_bytes_count{{{labels}}}" in text
+        for family in (
+            "eg_lab_render_elements", "eg_lab_cache_hits_total",
+            "eg_lab_executor_queue_depth", "eg_lab_http_requests_in_flight",
+        ):
+            assert f"# TYPE {family} " in text
+
+    def test_unknown_paths_share_one_label(self):
+        client.get("/no/such/path")
+        assert 'eg_lab_responses_total{endpoint="unmatched",status="404"}' in client.get("/metrics").text
@@ -0,0 +1,99 @@
+"""
+Unit tests for the PDF writer and answer-key layout.
+
+There is no PDF reader among the dependencies, so documents are checked
+structurally: every xref offset points at its object and every content
+stream inflates.
+"""
+
+import re
+import zlib
+
+import pytest
+
+from app.core.pdf import PdfDocument, page_message, page_step, page_tiled
+from app.engine.config import DrawingConfig
+from app.engine.elements import (
+    arc_element, element_bounds, label_element, line_element, steps_bounds,
+)
+from app.schemas.projection import PdfLayout, ProjectionRequest
+from app.services.answer_key_service import problem_title, render_problem
+from app.services.projection_service import ProjectionService
+
+
+def check_structure(pdf: bytes) -> list[bytes]:
+    """Validate the xref table; return the inflated content streams."""
+    assert pdf.startswith(b"%PDF-1.4")
+    assert pdf.rstrip().endswith(b"%%EOF")
+    startxref = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+    assert pdf[startxref:].startswith(b"xref")
+    offsets = [int(o) for o in re.findall(rb"(\d{10}) 00000 n ", pdf)]
+    for number, offset in enumerate(offsets, start=1):
+        assert pdf[offset:].startswith(b"%d 0 obj" % number)
+    return [
+        zlib.decompress(stream)
+        for stream in re.findall(rb"stream\n(.*?)\nendstream", pdf, re.S)
+    ]
+
+
+def _steps(case_type="A"):
+    request = ProjectionRequest(solid_type="hexagonal-prism", case_type=case_type)
+    steps, _ = ProjectionService().render_steps(request)
+    return request, steps
+
+
+class TestBounds:
+    def test_geometry_and_text(self):
+        bounds = element_bounds([
+            line_element(0, 0, 100, 50),
+            arc_element(200, 0, 10, 0, 90),
+            label_element(0, 80, "abcd", font_size=10),
+        ])
+        assert bounds == (0, -10, 210, 80)
+
+    def test_empty(self):
+        assert element_bounds([]) is None
+        assert steps_bounds([{"elements": []}]) == (0.0, 0.0, 1.0, 1.0)
+
+
+class TestDocument:
+    def test_one_page_per_step(self):
+        request, steps = _steps()
+        bounds = steps_bounds(steps)
+        document = PdfDocument("Key")
+        for step in steps:
+            document.add_page(page_step("Title", step, bounds, DrawingConfig()))
+        streams = check_structure(document.to_bytes())
+        assert len(streams) == len(steps)
+        assert b"(Title) Tj" in streams[0]
+
+    def test_tiled_sheet_has_every_step(self):
+        _, steps = _steps("D")
+        content = zlib.decompress(
+            page_tiled("Title", steps, steps_bounds(steps), DrawingConfig()),
+        )
+        # One clipped drawing box per step
+        assert content.count(b"re W n") == len(steps)
+
+    def test_text_is_winansi(self):
+        content = zlib.decompress(page_message("β (α)", "θ ≤ 90°"))
+        assert b"(beta \\(alpha\\)) Tj" in content
+        assert b"(theta <= 90\xb0) Tj" in content
+
+
+class TestAnswerKey:
+    @pytest.mark.parametrize("layout,pages", [(PdfLayout.PAGES, 11), (PdfLayout.TILED, 1)])
+    def test_render_problem(self, layout, pages):
+        request = ProjectionRequest(
+            solid_type="square-pyramid", case_type="D", axis_angle_vp=30,
+        )
+        problem = render_problem(request, layout, problem_title(request, 2))
+        assert len(problem.pages) == len(problem.page_ms) == pages
+        assert all(ms >= 0 for ms in problem.page_ms)
+
+    def test_problem_title(self):
+        request = ProjectionRequest(solid_type="hexagonal-prism", case_type="C")
+        assert problem_title(request, 3) == (
+            "Problem 3: Hexagonal prism, Case C "
+            "(base edge 40, axis 80, axis to HP 45°, resting on base edge)"
+        )
@@ -0,0 +1,101 @@
+"""
+Unit tests for the NumPy rasterizer and PNG encoder.
+
+PNGs are decoded back with zlib so pixels can be checked without an
+imaging library.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from app.core.raster import PNG_SIGNATURE, Raster, encode_png, rasterize
+from app.engine.elements import line_element
+from app.schemas.projection import ProjectionRequest
+from app.services.thumbnail_service import (
+    ThumbnailCache, render_thumbnail, thumbnail_key,
+)
+
+BLACK = np.zeros(3, dtype=np.float32)
+
+
+def decode_png(png: bytes) -> np.ndarray:
+    """Decode an 8-bit RGB, unfiltered PNG as written by encode_png."""
+    assert png.startswith(PNG_SIGNATURE)
+    width, height = struct.unpack(">II", png[16:24])
+    idat = png.index(b"IDAT")
+    length = struct.unpack(">I", png[idat - 4:idat])[0]
+    raw = np.frombuffer(zlib.decompress(png[idat + 4:idat + 4 + length]), dtype=np.uint8)
+    rows = raw.reshape(height, 1 + width * 3)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+class TestPng:
+    def test_round_trip(self):
+        pixels = np.random.default_rng(0).integers(0, 256, (7, 5, 3), dtype=np.uint8)
+        assert np.array_equal(decode_png(encode_png(pixels)), pixels)
+
+    def test_chunk_crcs(self):
+        png = encode_png(np.zeros((2, 2, 3), dtype=np.uint8))
+        pos = len(PNG_SIGNATURE)
+        while pos < len(png):
+            length = struct.unpack(">I", png[pos:pos + 4])[0]
+            body = png[pos + 4:pos + 8 + length]
+            assert struct.unpack(">I", png[pos + 8 + length:pos + 12 + length])[0] == zlib.crc32(body)
+            pos += 12 + length
+        assert pos == len(png)
+
+
+class TestRaster:
+    def test_line_is_antialiased(self):
+        raster = Raster(20, 10)
+        # Centre line 0.5 px off the pixel grid: rows 4 and 5 share the ink
+        raster.line(0, 5, 20, 5, BLACK, width=1.0)
+        column = raster.pixels[:, 10, 0]
+        assert column[4] == pytest.approx(0.5) and column[5] == pytest.approx(0.5)
+        assert column[0] == 1.0 and column[9] == 1.0
+
+    def test_dashes_leave_gaps(self):
+        raster = Raster(40, 4)
+        raster.line(0, 2, 40, 2, BLACK, width=2.0, dash=(5.0, 5.0))
+        row = raster.pixels[1, :, 0]
+        assert row[2] == 0.0 and row[7] == 1.0 and row[12] == 0.0
+
+    def test_partial_ring_is_masked(self):
+        raster = Raster(40, 40)
+        raster.ring(20, 20, 10, BLACK, width=2.0, start=0.0, sweep=90.0)
+        assert raster.pixels[29, 20, 0] < 0.5   # 90° (below centre, y down)
+        assert raster.pixels[10, 20, 0] == 1.0  # 270°
+
+    def test_rasterize_fits_bounds(self):
+        raster = rasterize([line_element(0, 0, 100, 100)], (0, 0, 100, 100), 50, 50)
+        assert raster.pixels[0, 0, 0] < 0.5 and raster.pixels[49, 49, 0] < 0.5
+
+
+class TestThumbnail:
+    REQUEST = ProjectionRequest(solid_type="hexagonal-prism", case_type="D")
+
+    def test_render(self):
+        pixels = decode_png(render_thumbnail(self.REQUEST, 160, 90))
+        assert pixels.shape == (90, 160, 3)
+        assert (pixels < 128).any() and (pixels == 255).any()
+
+    def test_key_covers_size_and_step(self):
+        keys = {
+            thumbnail_key(self.REQUEST, 160, 90),
+            thumbnail_key(self.REQUEST, 90, 160),
+            thumbnail_key(self.REQUEST, 160, 90, step=3),
+        }
+        assert len(keys) == 3
+
+    def test_disk_cache(self, tmp_path):
+        cache = ThumbnailCache(tmp_path)
+        key = thumbnail_key(self.REQUEST, 160, 90)
+        assert cache.get(key) is None
+        cache.put(key, b"png")
+        assert cache.get(key) == b"png"
+        assert cache.path(key).parent.name == key[:2]
+        assert [p.name for p in cache.path(key).parent.iterdir()] == [f"{key}.png"]
@@ -0,0 +1,70 @@
+"""
+Unit tests for the fast JSON serialization path.
+
+The typed encoder must produce exactly what Pydantic would for the same
+engine output.
+"""
+
+import json
+
+import pytest
+
+from app.core.serialization import encode_element, response_json
+from app.engine.curves.cycloid_engine import compute_cycloid, cycloid_payload
+from app.engine.curves.ellipse_engine import compute_ellipse, ellipse_payload
+from app.schemas.projection import ProjectionRequest, StepEncoding
+from app.services.curve_service import curve_json
+from app.services.projection_service import ProjectionService
+
+
+@pytest.mark.parametrize("solid_type,case_type", [
+    ("hexagonal-prism", "A"),
+    ("square-pyramid", "B"),
+    ("pentagonal-prism", "C"),
+    ("triangular-pyramid", "D"),
+])
+def test_projection_matches_pydantic(solid_type, case_type):
+    request = ProjectionRequest(solid_type=solid_type, case_type=case_type)
+    service = ProjectionService()
+    fast = json.loads(service.render_json(request))
+    assert fast == service.compute(request).model_dump(mode="json")
+
+    fast_delta = json.loads(service.render_json(request, StepEncoding.DELTA))
+    assert fast_delta == service.compute_delta(request).model_dump(mode="json")
+
+
+def test_curves_match_pydantic():
+    assert json.loads(curve_json(ellipse_payload())) == compute_ellipse().model_dump(mode="json")
+    assert json.loads(curve_json(cycloid_payload())) == compute_cycloid().model_dump(mode="json")
+
+
+def test_curve_steps_share_layers():
+    steps = ellipse_payload()["steps"]
+    for earlier, later in zip(steps, steps[1:]):
+        prefix = later["elements"][:len(earlier["elements"])]
+        assert all(a is b for a, b in zip(prefix, earlier["elements"]))
+
+
+def test_shared_elements_encoded_like_copies():
+    shared = {"type": "point", "x": 1, "y": 2, "label": "A", "radius": 3}
+    steps = [
+        {"step_number": n, "title": "t", "description": "d",
+         "elements": [shared] * n}
+        for n in (0, 1, 2)
+    ]
+    copies = [dict(s, elements=[dict(e) for e in s["elements"]]) for s in steps]
+    assert response_json(steps, {}) == response_json(copies, {})
+    assert json.loads(response_json(steps, {}))["steps"][0]["elements"] == []
+
+
+def test_encode_element_coerces_floats():
+    encoded = encode_element({
+        "type": "arc", "center_x": 1, "center_y": 2, "radius": 20,
+        "start_angle": 0, "end_angle": 30,
+    })
+    assert all(isinstance(encoded[k], float) for k in encoded if k != "type")
+
+
+def test_encode_element_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        encode_element({"type": "spline"})
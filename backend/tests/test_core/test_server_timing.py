@@ -0,0 +1,68 @@
+"""
+Unit tests for timing spans and the Server-Timing middleware.
+"""
+
+import re
+
+from fastapi.testclient import TestClient
+
+from app.core.server_timing import TimingAggregate, server_timing
+from app.engine.spans import RequestTimings, current_timings, span, timed
+from app.main import app
+from app.services.projection_service import result_cache
+
+client = TestClient(app)
+
+
+@timed("work")
+def _work() -> int:
+    return 42
+
+
+class TestSpans:
+    def test_untimed_spans_do_nothing(self):
+        with span("render"):
+            pass
+        assert _work() == 42
+        assert current_timings.get() is None
+
+    def test_spans_with_the_same_name_are_summed(self):
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            for _ in range(3):
+                with span("render"):
+                    pass
+            _work()
+        finally:
+            current_timings.reset(token)
+        assert list(timings.spans) == ["render", "work"]
+        assert re.fullmatch(r"render;dur=\d+\.\d\d, work;dur=\d+\.\d\d", server_timing(timings.spans))
+
+
+class TestTimingAggregate:
+    def test_count_total_max(self):
+        aggregate = TimingAggregate()
+        aggregate.record({"render": 1.0, "total": 3.0})
+        aggregate.record({"render": 2.0})
+        stats = aggregate.stats()
+        assert stats["render"] == {"count": 2, "total_ms": 3.0, "mean_ms": 1.5, "max_ms": 2.0}
+        assert stats["total"]["count"] == 1
+
+
+class TestServerTimingHeader:
+    def test_compute_reports_engine_phases(self):
+        result_cache.clear()
+        response = client.post(
+            "/api/v1/projections/compute",
+            json={"solid_type": "square-pyramid", "case_type": "D", "axis_angle_vp": 33},
+        )
+        assert response.status_code == 200
+        names = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+        for name in ("validate", "phase1", "phase2", "phase3", "final_tv", "render", "serialize"):
+            assert name in names
+        assert names[-1] == "total"
+
+    def test_health_reports_aggregates(self):
+        client.get("/health")
+        assert "total" in client.get("/health").json()["timings"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for the streaming SVG writer.
+
+With every visible layer shown, an all-steps document must draw exactly
+the elements of the last step.
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app.core.svg import SvgFrame, step_layers, svg_element, write_svg
+from app.engine.config import DrawingConfig
+from app.engine.curves.ellipse_engine import ellipse_payload
+from app.engine.curves.roulette_engine import roulette_payload
+from app.engine.elements import arc_element, line_element, point_element
+from app.schemas.projection import ProjectionRequest
+from app.services.projection_service import ProjectionService
+
+SVG = "{http://www.w3.org/2000/svg}"
+DRAWN = {f"{SVG}{tag}" for tag in ("line", "polygon", "polyline", "circle", "path", "text")}
+
+
+def parse(chunks) -> ET.Element:
+    return ET.fromstring(b"".join(chunks))
+
+
+def _shape(el: ET.Element) -> tuple:
+    return el.tag, el.attrib, el.text
+
+
+def _step(number, elements):
+    return {
+        "step_number": number,
+        "title": f"Step {number}",
+        "description": f"Description {number}",
+        "elements": elements,
+    }
+
+
+class TestStepLayers:
+    def test_cumulative_steps_add_to_previous(self):
+        a, b, c = (line_element(i, 0, i, 1) for i in range(3))
+        steps = [_step(1, [a]), _step(2, [a, b]), _step(3, [a, b, c])]
+        assert step_layers(steps) == [(0, True), (1, True), (2, True)]
+
+    def test_dropping_elements_redraws_and_hides_earlier_layers(self):
+        a, b, c = (line_element(i, 0, i, 1) for i in range(3))
+        steps = [_step(1, [a]), _step(2, [a, b]), _step(3, [a, c]), _step(4, [a, c, b])]
+        assert step_layers(steps) == [(0, False), (1, False), (0, True), (2, True)]
+
+
+class TestElements:
+    def test_styles_map_to_classes(self):
+        config = DrawingConfig()
+        for style in ("visible", "hidden", "construction"):
+            assert f'class="{style}"' in svg_element(line_element(0, 0, 1, 1, style), config)
+
+    def test_full_arc_is_a_circle(self):
+        markup = svg_element(arc_element(10, 20, 5, 0, 360), DrawingConfig())
+        assert markup.startswith("<circle")
+
+    def test_partial_arc_flags(self):
+        small = svg_element(arc_element(0, 0, 10, 0, 90), DrawingConfig())
+        large = svg_element(arc_element(0, 0, 10, 0, 270), DrawingConfig())
+        assert "A10 10 0 0 1 0 10" in small
+        assert "A10 10 0 1 1 0 -10" in large
+
+    def test_labels_are_escaped(self):
+        markup = svg_element(point_element(0, 0, label="A<B"), DrawingConfig())
+        assert "A&lt;B" in markup
+
+    def test_y_up_text_is_counter_flipped(self):
+        markup = svg_element(point_element(1, 2, label="P"), DrawingConfig(), y_up=True)
+        assert 'transform="translate(6 7) scale(1 -1)"' in markup
+
+
+class TestDocument:
+    @pytest.mark.parametrize("case_type", ["A", "C", "D"])
+    def test_visible_layers_draw_last_step(self, case_type):
+        request = ProjectionRequest(solid_type="hexagonal-prism", case_type=case_type)
+        service = ProjectionService()
+        steps, _, _ = service._compute_steps(request)
+        root = parse(service.render_svg(request))
+
+        layers = root.findall(f"{SVG}g/{SVG}g")
+        assert len(layers) == len(steps)
+        drawn = [
+            child
+            for layer in layers
+            if "display:none" not in layer.get("style", "")
+            for child in layer
+            if child.tag in DRAWN
+        ]
+        markup = "".join(svg_element(el, DrawingConfig()) for el in steps[-1]["elements"])
+        expected = ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg">{markup}</svg>')
+        assert [_shape(el) for el in drawn] == [_shape(el) for el in expected]
+
+    def test_single_step_has_no_layers(self):
+        step = _step(1, [line_element(0, 0, 1, 1)])
+        root = parse(write_svg([step], SvgFrame(100, 50)))
+        assert root.get("viewBox") == "0 0 100 50"
+        assert root.find(f"{SVG}g/{SVG}line") is not None
+        assert root.find(f"{SVG}g/{SVG}g") is None
+
+    def test_large_drawing_streams_in_chunks(self):
+        payload = roulette_payload("epicycloid", 100, 720, 300, 1200, 700)
+        chunks = list(write_svg(payload["steps"], SvgFrame(1200, 700)))
+        assert len(chunks) > 1
+        assert max(len(chunk) for chunk in chunks) < 256 * 1024
+        parse(chunks)
+
+    def test_y_up_frame(self):
+        payload = ellipse_payload(focus_dist=80, eccentricity_str="3/5", steps=[11])
+        frame = SvgFrame(1200, 700, 120, 350, 2.5, y_up=True)
+        root = parse(write_svg(payload["steps"], frame))
+        assert root.find(f"{SVG}g").get("transform") == "translate(120 350) scale(2.5 -2.5)"
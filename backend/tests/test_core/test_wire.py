@@ -0,0 +1,85 @@
+"""
+Unit tests for the binary wire format.
+
+Decoding a wire payload must give back the JSON response, up to Float32
+rounding of the coordinates.
+"""
+
+import json
+
+import pytest
+
+from app.core.wire import accepts_wire, decode_wire, segment_steps
+from app.engine.curves.ellipse_engine import ellipse_payload
+from app.schemas.projection import ProjectionRequest
+from app.services.curve_service import curve_json
+from app.services.projection_service import ProjectionService
+
+
+def assert_close(decoded, expected):
+    """Structural equality with Float32 tolerance on floats."""
+    if isinstance(expected, float) and not isinstance(decoded, bool):
+        assert decoded == pytest.approx(expected, rel=1e-6, abs=1e-4)
+    elif isinstance(expected, dict):
+        assert decoded.keys() == expected.keys()
+        for key in expected:
+            assert_close(decoded[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(decoded) == len(expected)
+        for a, b in zip(decoded, expected):
+            assert_close(a, b)
+    else:
+        assert decoded == expected
+
+
+@pytest.mark.parametrize("solid_type,case_type", [
+    ("hexagonal-prism", "A"),
+    ("square-pyramid", "B"),
+    ("pentagonal-prism", "C"),
+    ("triangular-pyramid", "D"),
+])
+def test_projection_roundtrip(solid_type, case_type):
+    request = ProjectionRequest(solid_type=solid_type, case_type=case_type)
+    service = ProjectionService()
+    wire = service.render_wire(request)
+    body = service.render_json(request)
+    assert len(wire) < len(body)
+    assert_close(decode_wire(wire), json.loads(body))
+
+
+def test_curve_roundtrip():
+    payload = ellipse_payload(focus_dist=60, eccentricity_str="2/3")
+    wire = curve_json(payload, binary=True)
+    assert_close(decode_wire(wire), json.loads(curve_json(payload)))
+
+
+def test_rejects_foreign_payload():
+    with pytest.raises(ValueError):
+        decode_wire(b"{}")
+
+
+class TestAcceptsWire:
+    def test_plain(self):
+        assert accepts_wire("application/x-eg-render")
+
+    def test_among_others(self):
+        assert accepts_wire("application/json;q=0.5, application/x-eg-render")
+
+    def test_refused_or_absent(self):
+        assert not accepts_wire(None)
+        assert not accepts_wire("application/json")
+        assert not accepts_wire("*/*")
+        assert not accepts_wire("application/x-eg-render;q=0")
+
+
+def test_segment_steps_shares_prefix():
+    a, b, c = ({"type": "arrow", "n": n} for n in range(3))
+    table, steps = segment_steps([
+        {"step_number": 1, "title": "", "description": "", "elements": [a, b]},
+        {"step_number": 2, "title": "", "description": "", "elements": [a, b, c]},
+        {"step_number": 3, "title": "", "description": "", "elements": [a, c]},
+    ])
+    assert table == [a, b, c, c]
+    assert [s["segments"] for s in steps] == [
+        ((0, 2),), ((0, 2), (2, 3)), ((0, 1), (3, 4)),
+    ]
@@ -0,0 +1,67 @@
+"""
+Unit tests for the ellipse engine's construction-line kernel and
+tolerance mode.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from app.engine.curves.ellipse_engine import (
+    construction_lines, ellipse_payload, highlighted_lines, sample_conic,
+)
+
+
+def _curves(payload):
+    final = payload["steps"][-1]["elements"]
+    return [el["points"] for el in final if el["type"] == "polygon"]
+
+
+def test_construction_lines_match_scalar_formula():
+    focus_dist, x_v = 80.0, 50.0
+    vp = {"x": x_v, "y": focus_dist - x_v}
+    lines = construction_lines(np.arange(1, 401), x_v, vp, focus_dist)
+    for k in (0, 19, 199, 399):
+        x = x_v + (k + 1) * 0.5
+        y_val = x / vp["x"] * vp["y"]
+        eq = y_val * y_val - (focus_dist - x) ** 2
+        assert lines["x"][k] == x
+        assert lines["hit"][k] == (eq >= 0)
+        if eq >= 0:
+            assert lines["y0"][k] == math.sqrt(eq)
+    assert [obj["axis_label"] for obj in highlighted_lines(lines)][:3] == ["A", "B", "C"]
+
+
+@pytest.mark.parametrize("eccentricity", ["3/5", "1", "3/2"])
+def test_construction_matches_fixed_mode(eccentricity):
+    fixed = ellipse_payload(eccentricity_str=eccentricity)
+    adaptive = ellipse_payload(eccentricity_str=eccentricity, tolerance=0.1)
+    for a, b in zip(fixed["steps"], adaptive["steps"]):
+        non_curve = [el for el in a["elements"] if el["type"] != "polygon"]
+        assert [el for el in b["elements"] if el["type"] != "polygon"] == non_curve
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 0.05])
+def test_sampled_curve_within_tolerance(tolerance):
+    focus_dist, e = 80.0, 0.6
+    points = sample_conic(focus_dist, e, 50.0, 200.0, tolerance)
+    xs = [x for x, _ in points]
+    assert xs == sorted(xs) and xs[0] == 50.0 and xs[-1] == 200.0
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        xm = (x0 + x1) / 2
+        ym = math.sqrt(max(0.0, (e * xm) ** 2 - (focus_dist - xm) ** 2))
+        chord_y = y0 + (y1 - y0) * (xm - x0) / (x1 - x0)
+        assert abs(ym - chord_y) * abs(x1 - x0) / math.hypot(x1 - x0, y1 - y0) <= tolerance
+
+
+def test_point_count_follows_tolerance():
+    coarse = _curves(ellipse_payload(tolerance=1.0))
+    fine = _curves(ellipse_payload(tolerance=0.01))
+    fixed = _curves(ellipse_payload())
+    assert len(coarse[0]) < len(fine[0]) < len(fixed[0])
+
+
+def test_invalid_tolerance():
+    with pytest.raises(ValueError):
+        ellipse_payload(tolerance=0)
@@ -7,23 +7,35 @@ point-in-polygon, and hull edge detection.
 """
 
 import math
+import random
+
+import numpy as np
 import pytest
 
 from app.engine.geometry import (
     Point,
+    as_points_array,
     build_hull_set,
+    coincident_points,
     convex_hull,
+    convex_hull_indices,
     degrees_to_radians,
     get_sides_count,
+    hull_edge_mask,
+    hull_edge_mask_by_index,
     is_edge_on_hull,
     is_on_convex_hull,
     is_prism,
     is_pyramid,
     point_in_polygon,
+    points_in_polygon,
     radians_to_degrees,
     rotate_point,
+    rotate_points,
     segments_intersect,
+    segments_intersect_matrix,
 )
+from app.engine.solids import Solid, polygon_table
 
 
 # ============================================================
@@ -115,6 +127,40 @@ class TestSideCount:
         assert is_pyramid("square-prism") is False
 
 
+class TestPolygonTables:
+    @pytest.mark.parametrize("solid_type", [
+        "triangular-prism", "square-pyramid", "pentagonal-prism", "hexagonal-pyramid",
+    ])
+    def test_matches_edge_walk(self, solid_type):
+        """Scaled table vertices match a direct edge walk."""
+        solid = Solid(solid_type)
+        sides = solid.sides
+        edge, angle = 37.5, degrees_to_radians(23.0)
+        points, centroid = solid.compute_base_vertices(100.0, 200.0, edge, angle)
+
+        x, y, heading = 100.0, 200.0, angle
+        for p in points:
+            assert p.x == pytest.approx(x) and p.y == pytest.approx(y)
+            x += edge * math.cos(heading)
+            y += edge * math.sin(heading)
+            heading += 2 * math.pi / sides
+        assert centroid.x == pytest.approx(sum(p.x for p in points) / sides)
+        assert centroid.y == pytest.approx(sum(p.y for p in points) / sides)
+
+    def test_circumradius(self):
+        assert Solid("square-prism").circumradius(10) == pytest.approx(10 / math.sqrt(2))
+        assert Solid("hexagonal-pyramid").circumradius(10) == pytest.approx(10)
+
+    def test_large_side_count_is_cached(self):
+        table = polygon_table(64)
+        assert polygon_table(64) is table
+        assert table.circumradius == pytest.approx(64 / (2 * math.pi), rel=1e-3)
+
+    def test_too_few_sides_raises(self):
+        with pytest.raises(ValueError):
+            polygon_table(2)
+
+
 # ============================================================
 # Convex Hull
 # ============================================================
@@ -253,3 +299,75 @@ class TestPointInPolygon:
     def test_far_outside(self):
         square = [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]
         assert point_in_polygon(Point(-10, -10), square) is False
+
+
+# ============================================================
+# Vectorized Kernels — must agree exactly with the scalar versions
+# ============================================================
+
+def _random_points(n: int, seed: int) -> list[Point]:
+    rng = random.Random(seed)
+    return [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+
+
+class TestVectorizedKernels:
+    def test_rotate_points_matches_scalar(self):
+        pts = _random_points(20, 1)
+        rotated = rotate_points(as_points_array(pts), 12.5, 40.0, 0.7)
+        for p, (x, y) in zip(pts, rotated.tolist()):
+            expected = rotate_point(p.x, p.y, 12.5, 40.0, 0.7)
+            assert (x, y) == (expected.x, expected.y)
+
+    def test_as_points_array_accepts_dicts(self):
+        arr = as_points_array([{"x": 1, "y": 2, "label": "a"}, {"x": 3, "y": 4}])
+        assert arr.shape == (2, 2)
+        assert as_points_array([]).shape == (0, 2)
+
+    def test_segments_intersect_matrix_matches_scalar(self):
+        a = _random_points(12, 2)
+        b = _random_points(10, 3)
+        matrix = segments_intersect_matrix(
+            as_points_array(a[0::2]), as_points_array(a[1::2]),
+            as_points_array(b[0::2]), as_points_array(b[1::2]),
+        )
+        for i in range(6):
+            for j in range(5):
+                assert matrix[i, j] == segments_intersect(
+                    a[2 * i], a[2 * i + 1], b[2 * j], b[2 * j + 1],
+                )
+
+    def test_points_in_polygon_matches_scalar(self):
+        polygon = [Point(10, 10), Point(90, 20), Point(70, 80), Point(30, 60)]
+        pts = _random_points(50, 4) + [Point(10, 10), Point(50, 15)]
+        inside = points_in_polygon(as_points_array(pts), as_points_array(polygon))
+        assert inside.tolist() == [point_in_polygon(p, polygon) for p in pts]
+
+    def test_convex_hull_indices_matches_scalar(self):
+        pts = _random_points(30, 5)
+        idx = convex_hull_indices(as_points_array(pts))
+        assert [pts[i] for i in idx] == convex_hull(pts)
+
+    def test_hull_edge_mask_matches_scalar(self):
+        pts = [Point(0, 0), Point(10, 0), Point(10, 10), Point(0, 10), Point(5, 5)]
+        hull = convex_hull(pts)
+        edges = [(0, 1), (1, 2), (0, 2), (4, 0), (3, 0)]
+        mask = hull_edge_mask(
+            as_points_array([pts[a] for a, _ in edges]),
+            as_points_array([pts[b] for _, b in edges]),
+            as_points_array(hull),
+        )
+        assert mask.tolist() == [
+            is_edge_on_hull(pts[a], pts[b], hull) for a, b in edges
+        ]
+
+    def test_hull_edge_mask_by_index(self):
+        pts = as_points_array([(0, 0), (10, 0), (10, 10), (0, 10), (5, 5)])
+        idx = convex_hull_indices(pts)
+        edges = np.array([(0, 1), (2, 1), (0, 2), (4, 0), (3, 0)])
+        assert hull_edge_mask_by_index(edges, idx).tolist() == [
+            True, True, False, False, True,
+        ]
+
+    def test_coincident_points(self):
+        pts = as_points_array([(0, 0), (10, 0), (0.5, 0.2), (10, 10)])
+        assert coincident_points(pts).tolist() == [True, False, True, False]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the columnar render element store.
+
+The packed backend must reproduce exactly what the dict backend emits.
+"""
+
+import pytest
+
+from app.core.serialization import packed_response_json, response_json
+from app.engine.config import DrawingConfig
+from app.engine.packed import (
+    ElementStore,
+    PackedRenderBuilder,
+    materialize_steps,
+    pack,
+    unpack,
+)
+from app.schemas.projection import ProjectionRequest
+from app.services.projection_service import ProjectionService
+
+
+def _steps(request: ProjectionRequest, packed: bool):
+    engine, params, metadata = ProjectionService()._prepare(request, packed=packed)
+    return engine, engine.compute_all_steps(**params), metadata
+
+
+@pytest.mark.parametrize("solid_type,case_type", [
+    ("hexagonal-prism", "A"),
+    ("square-pyramid", "B"),
+    ("pentagonal-prism", "C"),
+    ("triangular-pyramid", "D"),
+])
+def test_matches_dict_backend(solid_type, case_type):
+    request = ProjectionRequest(solid_type=solid_type, case_type=case_type)
+    _, expected, metadata = _steps(request, packed=False)
+    engine, steps, _ = _steps(request, packed=True)
+    store = engine.builder.store
+    assert materialize_steps(store, steps) == expected
+    assert packed_response_json(store, steps, metadata.model_dump()) == response_json(
+        expected, metadata.model_dump(),
+    )
+
+
+def test_layers_are_shared_not_copied():
+    """Case D replays Phase I/II layers — the store holds each element once."""
+    request = ProjectionRequest(solid_type="hexagonal-prism", case_type="D")
+    engine, steps, _ = _steps(request, packed=True)
+    replayed = sum(end - start for step in steps for start, end in step["segments"])
+    assert len(engine.builder.store) * 3 < replayed
+
+
+def test_pack_roundtrip():
+    request = ProjectionRequest(solid_type="square-pyramid", case_type="C")
+    engine, steps, _ = _steps(request, packed=True)
+    data = pack(engine.builder.store, steps)
+    store, unpacked = unpack(data)
+    assert materialize_steps(store, unpacked) == materialize_steps(
+        engine.builder.store, steps,
+    )
+
+
+def test_unpack_rejects_garbage():
+    with pytest.raises(ValueError):
+        unpack(b"nope")
+
+
+def test_store_interns_strings():
+    store = ElementStore()
+    for _ in range(3):
+        store.append({
+            "type": "line", "x1": 0.0, "y1": 0.0, "x2": 1.0, "y2": 1.0,
+            "style": "hidden",
+        })
+    assert store.strings == ["hidden"]
+    assert store.element(2)["style"] == "hidden"
+
+
+def test_builder_elements_view():
+    builder = PackedRenderBuilder(DrawingConfig())
+    builder.add_point(1, 2, label="a")
+    assert [e["type"] for e in builder.elements] == ["point", "label"]
+    builder.reset()
+    assert builder.elements == []
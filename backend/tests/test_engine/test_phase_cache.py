@@ -0,0 +1,62 @@
+"""
+Unit tests for the per-phase corner cache.
+"""
+
+from app.engine.cases.case_c import CaseCEngine
+from app.engine.cases.case_d import CaseDEngine
+from app.engine.config import DrawingConfig
+from app.engine.phase_cache import PhaseCache
+from app.engine.solids import Solid
+
+
+def _config() -> DrawingConfig:
+    config = DrawingConfig()
+    config.setup_canvas(1200, 700)
+    config.setup_xy_line_length("D", 60)
+    return config
+
+
+def _case_d(cache, solid="hexagonal-prism", axis_angle_vp=35.0):
+    engine = CaseDEngine(Solid(solid), _config(), phase_cache=cache)
+    steps = engine.compute_all_steps(40, 60, 30, 40, axis_angle_vp, "base-edge")
+    return engine, steps
+
+
+def test_cached_corners_render_identically():
+    cache = PhaseCache()
+    _, uncached = _case_d(None, "pentagonal-pyramid")
+    _, first = _case_d(cache, "pentagonal-pyramid")
+    _, second = _case_d(cache, "pentagonal-pyramid")
+    assert first == uncached
+    assert second == uncached
+    assert cache.stats()["hits"] == 3
+
+
+def test_vp_change_reuses_phase_one_and_two():
+    cache = PhaseCache()
+    first, _ = _case_d(cache, axis_angle_vp=35)
+    second, _ = _case_d(cache, axis_angle_vp=50)
+    assert second._case_a.corners is first._case_a.corners
+    assert second._case_c.corners is first._case_c.corners
+    assert second.corners is not first.corners
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 4
+
+
+def test_case_c_warms_case_d():
+    cache = PhaseCache()
+    CaseCEngine(Solid("square-pyramid"), _config(), phase_cache=cache).compute_all_steps(
+        40, 60, 30, 40, "base-edge",
+    )
+    _case_d(cache, "square-pyramid")
+    stats = cache.stats()
+    assert stats["hits"] == 2       # Phase I and II
+    assert stats["misses"] == 3     # Phase I and II from Case C, Phase III
+
+
+def test_lru_eviction():
+    cache = PhaseCache(max_entries=1)
+    cache.get_or_compute(("a",), lambda: 1)
+    cache.get_or_compute(("b",), lambda: 2)
+    assert cache.get_or_compute(("a",), lambda: 3) == 3
+    assert cache.stats()["evictions"] == 2
@@ -0,0 +1,54 @@
+"""
+Unit tests for the render builder, step selection and layer cache.
+"""
+
+import pytest
+
+from app.engine.config import DrawingConfig
+from app.engine.renderer import LayerCache, RenderBuilder, select_steps
+
+
+class TestSelectSteps:
+    def test_all_steps_by_default(self):
+        assert select_steps(5) == [1, 2, 3, 4, 5]
+
+    def test_sorted_and_deduplicated(self):
+        assert select_steps(8, [6, 2, 6]) == [2, 6]
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            select_steps(5, [0])
+        with pytest.raises(ValueError):
+            select_steps(5, [6])
+
+
+class TestLayerCache:
+    def _builder(self) -> RenderBuilder:
+        config = DrawingConfig()
+        config.setup_canvas(1200, 700)
+        config.setup_xy_line_length("A", 80)
+        return RenderBuilder(config)
+
+    def test_layer_drawn_once(self):
+        builder = self._builder()
+        layers = LayerCache(builder)
+        calls = []
+
+        def draw():
+            calls.append(1)
+            builder.add_line(0, 0, 1, 1)
+
+        layers.define("line", draw)
+        layers.replay(("line",))
+        first = builder.elements
+        layers.replay(("line",))
+        assert len(calls) == 1
+        assert builder.elements == first + first
+
+    def test_record_leaves_builder_untouched(self):
+        builder = self._builder()
+        builder.add_xy_line()
+        before = builder.elements
+        recorded = builder.record(lambda: builder.add_point(1, 2, label="p"))
+        assert len(recorded) == 2
+        assert builder.elements == before
@@ -0,0 +1,72 @@
+"""
+Unit tests for the roulette (cycloid family) engine.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from app.engine.curves.cycloid_engine import cycloid_payload
+from app.engine.curves.roulette_engine import _rolled, roulette_payload
+
+
+def _points(payload, step):
+    """Labelled curve points marked in steps 8-9."""
+    elements = payload["steps"][step - 1]["elements"]
+    return [el for el in elements if el["type"] == "point"]
+
+
+def test_cycloid_matches_eight_division_engine():
+    legacy = cycloid_payload()["steps"][8]["elements"]
+    general = roulette_payload("cycloid", divisions=8)["steps"][8]["elements"]
+    assert [el["type"] for el in general] == [el["type"] for el in legacy]
+    for a, b in zip(legacy, general):
+        if a["type"] == "point":
+            assert a["label"] == b["label"]
+            assert a["x"] == pytest.approx(b["x"]) and a["y"] == pytest.approx(b["y"])
+
+
+@pytest.mark.parametrize("kind", ["cycloid", "epicycloid", "hypocycloid"])
+def test_points_lie_on_rolled_circles(kind):
+    r, big_r = 40.0, 150.0
+    phi = np.linspace(0, 2 * np.pi, 97)
+    cx, cy, px, py = _rolled(kind, phi, r, big_r, -0.3)
+    assert np.allclose(np.hypot(px - cx, py - cy), r)
+    if kind != "cycloid":
+        # Same distance from the directing centre as division point k
+        # mirrored about the line of centres
+        dist = np.hypot(px, py)
+        assert dist.min() >= (big_r - 2 * r if kind == "hypocycloid" else big_r) - 1e-9
+        assert np.isclose(dist[0], big_r) and np.isclose(dist[-1], big_r)
+
+
+def test_involute_unwinds_tangent():
+    r = 30.0
+    phi = np.linspace(0, 2 * np.pi, 65)
+    tx, ty, px, py = _rolled("involute", phi, r, 0.0, 0.0)
+    assert np.allclose(np.hypot(px - tx, py - ty), r * phi)
+    # String is tangent: perpendicular to the radius at the tangent point
+    assert np.allclose((px - tx) * tx + (py - ty) * (ty - r), 0.0)
+    assert (px[-1], py[-1]) == pytest.approx((2 * math.pi * r, 0.0))
+
+
+@pytest.mark.parametrize("kind", ["cycloid", "epicycloid", "hypocycloid", "involute"])
+def test_step_structure(kind):
+    payload = roulette_payload(kind, divisions=24)
+    assert payload["total_steps"] == 10
+    labels = [p["label"] for p in _points(payload, 9)]
+    assert labels[-25:] == list("abcdefghijklmnopqrstuvwxy")
+    curve = payload["steps"][-1]["elements"][-2]
+    assert curve["type"] == "polygon" and len(curve["points"]) >= 241
+
+
+def test_many_divisions():
+    payload = roulette_payload("epicycloid", divisions=720)
+    assert len(_points(payload, 9)) > 720
+    assert payload["metadata"]["parameters"]["divisions"] == 720.0
+
+
+def test_invalid_hypocycloid():
+    with pytest.raises(ValueError):
+        roulette_payload("hypocycloid", diameter=100, base_diameter=100)
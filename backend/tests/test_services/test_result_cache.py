@@ -0,0 +1,66 @@
+"""
+Unit tests for the content-addressed result cache.
+"""
+
+import time
+
+from app.schemas.projection import ProjectionRequest
+from app.services.projection_service import ProjectionService, result_cache
+from app.services.result_cache import ResultCache, canonical_key
+
+
+class TestCanonicalKey:
+    def test_equivalent_requests_share_key(self):
+        a = ProjectionRequest(solid_type="hexagonal-prism", case_type="A", base_edge=40)
+        b = ProjectionRequest(solid_type="hexagonal-prism", case_type="A", base_edge=40.0000001)
+        assert canonical_key("projection", a) == canonical_key("projection", b)
+
+    def test_distinct_requests_differ(self):
+        a = ProjectionRequest(solid_type="hexagonal-prism", case_type="A", base_edge=40)
+        b = ProjectionRequest(solid_type="hexagonal-prism", case_type="A", base_edge=41)
+        assert canonical_key("projection", a) != canonical_key("projection", b)
+
+    def test_variant_changes_key(self):
+        a = ProjectionRequest(solid_type="square-prism", case_type="C")
+        assert (
+            canonical_key("projection", a, encoding="full")
+            != canonical_key("projection", a, encoding="delta")
+        )
+
+
+class TestResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = ResultCache(max_entries=4, ttl_seconds=60)
+        assert cache.get("k") is None
+        cache.put("k", b"v")
+        assert cache.get("k") == b"v"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")          # 'b' is now least recently used
+        cache.put("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(max_entries=2, ttl_seconds=0.01)
+        cache.put("a", b"1")
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_service_hit_returns_identical_bytes(self):
+        result_cache.clear()
+        request = ProjectionRequest(solid_type="pentagonal-pyramid", case_type="C")
+        service = ProjectionService()
+        hits = result_cache.stats()["hits"]
+        first = service.compute_json(request)
+        second = service.compute_json(request)
+        assert first is second
+        assert result_cache.stats()["hits"] == hits + 1
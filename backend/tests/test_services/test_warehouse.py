@@ -0,0 +1,132 @@
+"""
+Tests for the result warehouse: file format, grid enumeration, and
+serving precomputed bodies through ProjectionService.lookup().
+"""
+
+import pytest
+
+from app.core.warehouse import ResultWarehouse, WarehouseError, WarehouseWriter
+from app.schemas.projection import (
+    CaseType, DrawingFrame, ProjectionRequest, SolidType, StepEncoding,
+)
+from app.services import projection_service
+from app.services.projection_service import ProjectionService, warehouse_meta
+from app.services.warehouse_service import WarehouseGrid, build_warehouse, main
+
+KEY_A = "ab" * 32
+KEY_B = "cd" * 32
+
+
+@pytest.fixture
+def small_grid():
+    return WarehouseGrid(
+        solid_types=[SolidType.TRIANGULAR_PRISM],
+        case_types=[CaseType.A, CaseType.C],
+        edge_angles=[0.0, 30.0],
+        axis_angles_hp=[45.0],
+        encodings=[StepEncoding.FULL, StepEncoding.DELTA],
+        wire=True,
+    )
+
+
+class TestFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "w.bin"
+        with WarehouseWriter(path, {"app_version": "1"}) as writer:
+            assert writer.add(KEY_A, b"first")
+            assert writer.add(KEY_B, b"")
+            assert not writer.add(KEY_A, b"again")
+        warehouse = ResultWarehouse()
+        warehouse.open(path, expect={"app_version": "1"})
+        assert warehouse.get(KEY_A) == b"first"
+        assert warehouse.get(KEY_B) == b""
+        assert warehouse.get("00" * 32) is None
+        assert warehouse.stats()["hits"] == 2 and warehouse.stats()["misses"] == 1
+        warehouse.close()
+        assert warehouse.get(KEY_A) is None
+
+    def test_version_mismatch_is_rejected(self, tmp_path):
+        path = tmp_path / "w.bin"
+        with WarehouseWriter(path, {"engine_version": 1}) as writer:
+            writer.add(KEY_A, b"body")
+        with pytest.raises(WarehouseError, match="engine_version"):
+            ResultWarehouse().open(path, expect={"engine_version": 2})
+
+    def test_failed_build_leaves_no_file(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with WarehouseWriter(tmp_path / "w.bin", {}) as writer:
+                writer.add(KEY_A, b"body")
+                raise RuntimeError
+        assert list(tmp_path.iterdir()) == []
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "w.bin"
+        with WarehouseWriter(path, {}) as writer:
+            writer.add(KEY_A, b"body")
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(WarehouseError, match="truncated"):
+            ResultWarehouse().open(path)
+
+
+class TestGrid:
+    def test_cases_vary_only_their_angles(self, small_grid):
+        requests = list(small_grid.requests())
+        # A: 2 edge angles; C: 1 axis angle × 2 resting conditions
+        assert len(requests) == 4
+        assert {r.axis_angle_hp for r in requests if r.case_type == CaseType.A} == {45.0}
+
+    def test_canvas_sizes_only_in_canvas_frame(self, small_grid):
+        small_grid.frames = list(DrawingFrame)
+        small_grid.canvas_sizes = [(1200.0, 700.0), (800.0, 600.0)]
+        # Canonical once, canvas frame once per size
+        assert len(list(small_grid.requests())) == 4 * 3
+
+    def test_from_dict_ranges(self):
+        grid = WarehouseGrid.from_dict({
+            "case_types": ["D"],
+            "axis_angles_vp": {"start": 0, "stop": 30, "step": 10},
+            "canvas_sizes": [[800, 600]],
+        })
+        assert grid.case_types == [CaseType.D]
+        assert grid.axis_angles_vp == [0.0, 10.0, 20.0, 30.0]
+        assert grid.canvas_sizes == [(800.0, 600.0)]
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="angles"):
+            WarehouseGrid.from_dict({"angles": [1]})
+
+
+class TestServing:
+    def test_hits_match_live_compute(self, tmp_path, monkeypatch, small_grid):
+        path = tmp_path / "w.bin"
+        result = build_warehouse(str(path), small_grid)
+        assert result.entries == 4 * 3 and result.skipped == 0
+
+        warehouse = ResultWarehouse()
+        warehouse.open(path, expect=warehouse_meta())
+        monkeypatch.setattr(projection_service, "result_warehouse", warehouse)
+        service = ProjectionService()
+        # Canonical frame: any canvas size hits
+        request = ProjectionRequest(
+            solid_type="triangular-prism", case_type="C", resting_on="base-corner",
+            frame="canonical", canvas_width=801, canvas_height=333,
+        )
+        for encoding, binary in small_grid.variants():
+            _, body = service.lookup(request, encoding, binary=binary)
+            live = (
+                service.render_wire(request) if binary
+                else service.render_json(request, encoding)
+            )
+            assert body == live
+        # Outside the grid: falls through to the (empty) result cache
+        _, body = service.lookup(request.model_copy(update={"axis_angle_hp": 50.0}))
+        assert body is None
+        warehouse.close()
+
+    def test_cli(self, tmp_path, capsys):
+        grid = tmp_path / "grid.json"
+        grid.write_text('{"solid_types": ["square-prism"], "case_types": ["A"], "edge_angles": [0]}')
+        assert main(["build", str(tmp_path / "w.bin"), "--grid", str(grid)]) == 0
+        assert "1 entries" in capsys.readouterr().out
+        assert main(["info", str(tmp_path / "w.bin")]) == 0
+        assert '"entries": 1' in capsys.readouterr().out
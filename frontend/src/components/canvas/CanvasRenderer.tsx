@@ -57,7 +57,10 @@ export default function CanvasRenderer() {
             const displayWidth = canvas.width / dpr;
             const displayHeight = canvas.height / dpr;
 
-            renderStep(ctx, step, displayWidth, displayHeight, { zoom, panX, panY });
+            renderStep(
+                ctx, step, displayWidth, displayHeight, { zoom, panX, panY },
+                projectionResponse.metadata.placement,
+            );
         }
     }, [projectionResponse, currentStep, zoom, panX, panY]);
 
@@ -2,15 +2,26 @@
  * API Client — Thin fetch wrapper for the projection/curve backend.
  *
  * Communicates with:
- *   POST /api/v1/projections/compute
- *   POST /api/v1/curves/ellipse/compute
- *   POST /api/v1/curves/cycloid/compute
+ *   POST /api/v1/projections/compute (GET: cacheable variant)
+ *   POST /api/v1/projections/outline
+ *   POST /api/v1/curves/ellipse/compute (GET: cacheable variant)
+ *   POST /api/v1/curves/cycloid/compute (GET: cacheable variant)
+ *   POST /api/v1/curves/roulette/compute (GET: cacheable variant)
+ *   GET  /api/v1/projections/export.svg, /api/v1/curves/{curve}/export.svg
+ *   POST /api/v1/projections/answer-key.pdf
  *
  * The API returns pre-computed pixel coordinates and drawing instructions.
  * This client adds error handling and type safety; it performs zero geometry.
+ * The *Wire variants request the compact binary format (see lib/wire.ts).
  */
 
-import type { ProjectionRequest, ProjectionResponse, StepInstruction } from '@/types/projection';
+import type {
+    ProjectionOutline,
+    ProjectionRequest,
+    ProjectionResponse,
+    StepInstruction,
+} from '@/types/projection';
+import { WIRE_MEDIA_TYPE, decodeWire } from '@/lib/wire';
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -25,12 +36,12 @@ export interface CurveResponse {
 }
 
 /**
- * Generic fetch helper with error handling.
+ * Fetch helper with error handling.
  */
-async function apiPost<T>(url: string, body: unknown): Promise<T> {
+async function apiFetch(url: string, body: unknown, accept: string): Promise<Response> {
     const response = await fetch(url, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: { 'Content-Type': 'application/json', Accept: accept },
         body: JSON.stringify(body),
     });
 
@@ -49,9 +60,36 @@ async function apiPost<T>(url: string, body: unknown): Promise<T> {
         throw new Error(detail);
     }
 
+    return response;
+}
+
+/**
+ * GET a JSON resource through the browser HTTP cache.
+ */
+async function apiGet<T>(url: string): Promise<T> {
+    const response = await fetch(url, { headers: { Accept: 'application/json' } });
+    if (!response.ok) {
+        throw new Error(`Server error: ${response.status} ${response.statusText}`);
+    }
+    return response.json() as Promise<T>;
+}
+
+/**
+ * POST JSON and parse the JSON response.
+ */
+async function apiPost<T>(url: string, body: unknown): Promise<T> {
+    const response = await apiFetch(url, body, 'application/json');
     return response.json() as Promise<T>;
 }
 
+/**
+ * Like apiPost, but asks for the binary wire format and decodes it.
+ */
+async function apiPostWire<T>(url: string, body: unknown): Promise<T> {
+    const response = await apiFetch(url, body, WIRE_MEDIA_TYPE);
+    return decodeWire(await response.arrayBuffer()) as T;
+}
+
 /**
  * Compute projection by sending parameters to the backend engine.
  */
@@ -64,12 +102,67 @@ export async function computeProjection(
     );
 }
 
+/**
+ * computeProjection() over the binary wire format — smaller and faster to
+ * parse on slow connections and low-end devices.
+ */
+export async function computeProjectionWire(
+    request: ProjectionRequest,
+): Promise<ProjectionResponse> {
+    return apiPostWire<ProjectionResponse>(
+        `${API_BASE}/api/v1/projections/compute`,
+        request,
+    );
+}
+
+/**
+ * computeProjection() over GET, with the request in the query string. The
+ * response carries an ETag and Cache-Control, so the browser cache (and
+ * any reverse proxy) serves repeats and revalidates with a cheap 304.
+ */
+export async function computeProjectionCached(
+    request: ProjectionRequest,
+): Promise<ProjectionResponse> {
+    return apiGet<ProjectionResponse>(
+        exportUrl('/api/v1/projections/compute', request),
+    );
+}
+
+/**
+ * Compute only the given steps (1-based). `total_steps` in the response
+ * still reports the full step count.
+ */
+export async function computeProjectionSteps(
+    request: ProjectionRequest,
+    steps: number[],
+): Promise<ProjectionResponse> {
+    const query = steps.map((s) => `steps=${s}`).join('&');
+    return apiPost<ProjectionResponse>(
+        `${API_BASE}/api/v1/projections/compute?${query}`,
+        request,
+    );
+}
+
+/**
+ * Fetch step titles and metadata without computing any geometry.
+ */
+export async function fetchProjectionOutline(
+    request: ProjectionRequest,
+): Promise<ProjectionOutline> {
+    return apiPost<ProjectionOutline>(
+        `${API_BASE}/api/v1/projections/outline`,
+        request,
+    );
+}
+
 /**
  * Compute ellipse (focus-directrix conic) construction.
  */
 export async function computeEllipse(params: {
     focus_dist: number;
     eccentricity: string;
+    /** Max curve deviation in mm; enables adaptive curve sampling */
+    tolerance?: number;
 }): Promise<CurveResponse> {
     return apiPost<CurveResponse>(
         `${API_BASE}/api/v1/curves/ellipse/compute`,
@@ -89,6 +182,96 @@ export async function computeCycloid(params: {
     );
 }
 
+/**
+ * Compute an N-division cycloid, epicycloid, hypocycloid or involute.
+ */
+export async function computeRoulette(params: {
+    kind: 'cycloid' | 'epicycloid' | 'hypocycloid' | 'involute';
+    diameter: number;
+    divisions?: number;
+    base_diameter?: number;
+}): Promise<CurveResponse> {
+    return apiPost<CurveResponse>(
+        `${API_BASE}/api/v1/curves/roulette/compute`,
+        params,
+    );
+}
+
+/**
+ * Like computeRoulette() (or the other curve calls), over the cacheable
+ * GET variant of the compute endpoint.
+ */
+export async function computeCurveCached(
+    curve: 'ellipse' | 'cycloid' | 'roulette',
+    params: object,
+): Promise<CurveResponse> {
+    return apiGet<CurveResponse>(exportUrl(`/api/v1/curves/${curve}/compute`, params));
+}
+
+/**
+ * URL of a GET endpoint, with the request as query parameters.
+ */
+function exportUrl(path: string, params: object, step?: number): string {
+    const query = new URLSearchParams();
+    for (const [key, value] of Object.entries(params)) {
+        if (value !== undefined && value !== null) query.set(key, String(value));
+    }
+    if (step !== undefined) query.set('step', String(step));
+    return `${API_BASE}${path}?${query}`;
+}
+
+/**
+ * Printable SVG of a projection — one step, or every step as a layer.
+ * Suitable for an `<a href download>` link.
+ */
+export function projectionSvgUrl(request: ProjectionRequest, step?: number): string {
+    return exportUrl('/api/v1/projections/export.svg', request, step);
+}
+
+/**
+ * PNG thumbnail of a projection (the finished drawing unless `step` is
+ * given). Cached on the server and revalidated by ETag, so it is safe to
+ * use directly as an `<img src>`.
+ */
+export function projectionThumbnailUrl(
+    request: ProjectionRequest,
+    width = 320,
+    height = 180,
+    step?: number,
+): string {
+    return exportUrl('/api/v1/projections/thumbnail.png', { ...request, width, height }, step);
+}
+
+/**
+ * Printable SVG of a curve construction (same parameters as its compute call).
+ */
+export function curveSvgUrl(
+    curve: 'ellipse' | 'cycloid' | 'roulette',
+    params: object,
+    step?: number,
+): string {
+    return exportUrl(`/api/v1/curves/${curve}/export.svg`, params, step);
+}
+
+/**
+ * Render a problem set as one PDF answer key (one step per page, or every
+ * step of a problem tiled on one sheet).
+ */
+export async function fetchAnswerKeyPdf(
+    requests: ProjectionRequest[],
+    layout: 'pages' | 'tiled' = 'pages',
+    title?: string,
+): Promise<Blob> {
+    const query = new URLSearchParams({ layout });
+    if (title) query.set('title', title);
+    const response = await apiFetch(
+        `${API_BASE}/api/v1/projections/answer-key.pdf?${query}`,
+        { requests },
+        'application/pdf',
+    );
+    return response.blob();
+}
+
 /**
  * Health check — verifies the backend is reachable.
  */
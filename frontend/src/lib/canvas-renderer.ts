@@ -18,6 +18,7 @@
 import type {
     ArcElement,
     ArrowElement,
+    FramePlacement,
     LabelElement,
     LineElement,
     PointElement,
@@ -82,6 +83,8 @@ export interface CanvasTransform {
  * @param canvasWidth - Physical canvas width in pixels.
  * @param canvasHeight - Physical canvas height in pixels.
  * @param transform - Current zoom/pan state.
+ * @param placement - Where drawing (0, 0) goes (response metadata.placement);
+ *   canonical-frame responses are centred on the current canvas size.
  */
 export function renderStep(
     ctx: CanvasRenderingContext2D,
@@ -89,6 +92,7 @@ export function renderStep(
     canvasWidth: number,
     canvasHeight: number,
     transform: CanvasTransform = { zoom: 1, panX: 0, panY: 0 },
+    placement?: FramePlacement,
 ): void {
     // Clear canvas
     ctx.save();
@@ -103,6 +107,9 @@ export function renderStep(
         0, transform.zoom,
         transform.panX, transform.panY,
     );
+    if (placement) {
+        ctx.translate(placement.anchor_x * canvasWidth, placement.anchor_y * canvasHeight);
+    }
 
     // Draw all elements in order
     for (const element of step.elements) {
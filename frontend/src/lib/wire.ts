@@ -0,0 +1,133 @@
+/**
+ * Wire Decoder — reads the binary render format (application/x-eg-render).
+ *
+ * Mirrors decode_wire() in backend/app/core/wire.py, which documents the
+ * layout. In short (little-endian, no padding):
+ *
+ *   "EGRW" u8 version u8 reserved u16 total_steps
+ *   u32 M, M bytes of metadata JSON
+ *   u32 S, S × (u32 length, UTF-8 bytes)              — string table
+ *   u32 E, E × (u8 tag, fields in model order)         — element table
+ *       f32 floats, u32 string ids, u8 bools,
+ *       polygons: u32 count, count × (f32 x, f32 y)
+ *   u32 N, N × (u32 step, u32 title id, u32 description id,
+ *               u32 G, G × (u32 start, u32 end))       — step ranges
+ *
+ * Elements are decoded once and shared by every step whose ranges include
+ * them, so a cumulative step costs one array of references.
+ */
+
+import type { RenderElement, StepInstruction } from '@/types/projection';
+
+export const WIRE_MEDIA_TYPE = 'application/x-eg-render';
+
+const MAGIC = 'EGRW';
+const VERSION = 1;
+
+type Field = [name: string, kind: 'f' | 's' | 'b' | 'p'];
+
+/** Field order per type tag — must match LAYOUTS in backend/app/engine/packed.py */
+const LAYOUTS: Array<[type: RenderElement['type'], fields: Field[]]> = [
+    ['line', [['x1', 'f'], ['y1', 'f'], ['x2', 'f'], ['y2', 'f'], ['style', 's']]],
+    ['polygon', [['points', 'p'], ['style', 's'], ['closed', 'b']]],
+    ['point', [['x', 'f'], ['y', 'f'], ['label', 's'], ['radius', 'f']]],
+    ['label', [['x', 'f'], ['y', 'f'], ['text', 's'], ['font_size', 'f']]],
+    ['arc', [['center_x', 'f'], ['center_y', 'f'], ['radius', 'f'],
+        ['start_angle', 'f'], ['end_angle', 'f']]],
+    ['arrow', [['from_x', 'f'], ['from_y', 'f'], ['to_x', 'f'], ['to_y', 'f']]],
+];
+
+/** Decoded payload — same shape as the JSON response. */
+export interface WireResponse<M = unknown> {
+    total_steps: number;
+    steps: StepInstruction[];
+    metadata: M;
+}
+
+/**
+ * Decode a wire payload into the JSON response shape.
+ * Coordinates are Float32-rounded.
+ */
+export function decodeWire<M = unknown>(buffer: ArrayBuffer): WireResponse<M> {
+    const view = new DataView(buffer);
+    const bytes = new Uint8Array(buffer);
+    const utf8 = new TextDecoder();
+
+    if (utf8.decode(bytes.subarray(0, 4)) !== MAGIC) {
+        throw new Error('Not an EG render payload');
+    }
+    const version = view.getUint8(4);
+    if (version !== VERSION) {
+        throw new Error(`Unsupported wire version ${version}`);
+    }
+    const totalSteps = view.getUint16(6, true);
+    const metaLength = view.getUint32(8, true);
+    let offset = 12;
+    const metadata = JSON.parse(utf8.decode(bytes.subarray(offset, offset + metaLength))) as M;
+    offset += metaLength;
+
+    const u32 = (): number => {
+        const value = view.getUint32(offset, true);
+        offset += 4;
+        return value;
+    };
+    const f32 = (): number => {
+        const value = view.getFloat32(offset, true);
+        offset += 4;
+        return value;
+    };
+
+    const strings: string[] = [];
+    for (let i = 0, n = u32(); i < n; i++) {
+        const length = u32();
+        strings.push(utf8.decode(bytes.subarray(offset, offset + length)));
+        offset += length;
+    }
+
+    const elements: RenderElement[] = [];
+    for (let i = 0, n = u32(); i < n; i++) {
+        const [type, fields] = LAYOUTS[view.getUint8(offset)];
+        offset += 1;
+        const element: Record<string, unknown> = { type };
+        for (const [name, kind] of fields) {
+            switch (kind) {
+                case 'f':
+                    element[name] = f32();
+                    break;
+                case 's':
+                    element[name] = strings[u32()];
+                    break;
+                case 'b':
+                    element[name] = view.getUint8(offset) !== 0;
+                    offset += 1;
+                    break;
+                case 'p': {
+                    const count = u32();
+                    const points = new Array<{ x: number; y: number }>(count);
+                    for (let k = 0; k < count; k++) {
+                        points[k] = { x: f32(), y: f32() };
+                    }
+                    element[name] = points;
+                    break;
+                }
+            }
+        }
+        elements.push(element as unknown as RenderElement);
+    }
+
+    const steps: StepInstruction[] = [];
+    for (let i = 0, n = u32(); i < n; i++) {
+        const stepNumber = u32();
+        const title = strings[u32()];
+        const description = strings[u32()];
+        const stepElements: RenderElement[] = [];
+        for (let g = 0, count = u32(); g < count; g++) {
+            const start = u32();
+            const end = u32();
+            for (let k = start; k < end; k++) stepElements.push(elements[k]);
+        }
+        steps.push({ step_number: stepNumber, title, description, elements: stepElements });
+    }
+
+    return { total_steps: totalSteps, steps, metadata };
+}
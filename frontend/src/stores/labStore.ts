@@ -123,6 +123,8 @@ export const useLabStore = create<LabState>((set, get) => ({
                 resting_on: state.restingOn,
                 canvas_width: canvasWidth,
                 canvas_height: canvasHeight,
+                // Canvas-independent: resizing re-centres without recomputing
+                frame: 'canonical',
             };
 
             const response = await computeProjection(request);
@@ -121,11 +121,25 @@ export interface SolidProperties {
     circumradius: number | null;
 }
 
+/** Maps to DrawingFrame — projection.py */
+export type DrawingFrame = 'canvas' | 'canonical';
+
+/**
+ * Maps to FramePlacement — projection.py. Drawing (0, 0) goes to
+ * (anchor_x × canvas width, anchor_y × canvas height).
+ */
+export interface FramePlacement {
+    frame: DrawingFrame;
+    anchor_x: number;
+    anchor_y: number;
+}
+
 /** Maps to ProjectionMetadata — projection.py:203-207 */
 export interface ProjectionMetadata {
     computed_beta: number | null;
     computed_xy_length: number;
     solid_properties: SolidProperties;
+    placement?: FramePlacement;
 }
 
 /** Maps to ProjectionResponse — projection.py:210-219 */
@@ -135,6 +149,20 @@ export interface ProjectionResponse {
     metadata: ProjectionMetadata;
 }
 
+/** Maps to StepOutline — projection.py */
+export interface StepOutline {
+    step_number: number;
+    title: string;
+    description: string;
+}
+
+/** Maps to ProjectionOutline — projection.py (no render elements) */
+export interface ProjectionOutline {
+    total_steps: number;
+    steps: StepOutline[];
+    metadata: ProjectionMetadata;
+}
+
 // ============================================================
 // Request Type
 // ============================================================
@@ -151,6 +179,8 @@ export interface ProjectionRequest {
     resting_on: RestingOn;
     canvas_width: number;
     canvas_height: number;
+    /** 'canonical': canvas-independent coordinates, placed by metadata.placement */
+    frame?: DrawingFrame;
 }
 
 // ============================================================